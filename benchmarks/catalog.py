@@ -54,6 +54,11 @@ class Flow:
 
     `setup`, when present, establishes the expected prior state before the
     measurement and raises if the fixture is not in it.
+
+    `counters`, when present, returns counts of work the measured region caused
+    outside the database, such as requests to a translation service. It is read
+    after the measurement is closed, and its counts are reported beside the
+    query count and held to the same rule: every repetition must agree.
     """
 
     name: str
@@ -66,6 +71,7 @@ class Flow:
     workload_unit: str | None = None
     scale_points: tuple[ScalePoint, ...] = ()
     setup: Callable[[Any, str | None], None] | None = None
+    counters: Callable[[Any, str | None], dict[str, int]] | None = None
 
     def sizes(self):
         """The size labels this flow expands to. A flow without scale points
@@ -1151,6 +1157,387 @@ EDIT_TRANSLATION_GET = Flow(
 )
 
 
+# ---------------------------------------------------------------------------
+# Machine translation
+#
+# These flows call a translation service. They send real HTTP requests, through
+# the product's translator classes, to the local stand-in in
+# translation_service.py, and report what reached it as counters: the query
+# count says what a flow cost the database, the counters what it cost the
+# provider.
+# ---------------------------------------------------------------------------
+
+
+def _stand_in_translators(url):
+    """The translator settings for each stand-in, pointed at `url`.
+
+    Both keep translations in the machine translation cache, so the flows pay
+    for reading and writing it, as a site with the cache turned on would.
+    """
+    return {
+        "deepl": {
+            "CLASS": "benchmarks.translation_service.StandInDeepLTranslator",
+            "OPTIONS": {
+                "AUTH_KEY": "benchmark",
+                "STAND_IN_URL": url,
+                "CACHE": {},
+            },
+        },
+        "libretranslate": {
+            "CLASS": "benchmarks.translation_service.StandInLibreTranslator",
+            "OPTIONS": {
+                "LIBRETRANSLATE_URL": url,
+                "API_KEY": "benchmark",
+                "CACHE": {},
+            },
+        },
+    }
+
+
+def _use_translation_service(ctx, translator):
+    """Start the stand-in, and make `translator` the configured one.
+
+    The settings override stays enabled for the rest of the child process,
+    which is this one execution.
+    """
+    from django.test import override_settings
+
+    from benchmarks.translation_service import TranslationService
+
+    service = TranslationService()
+    config = _stand_in_translators(service.start())[translator]
+    override_settings(WAGTAILLOCALIZE_MACHINE_TRANSLATOR=config).enable()
+
+    ctx.translation_service = service
+    return config
+
+
+def _translation_service_counters(ctx, size):
+    return ctx.translation_service.counters()
+
+
+def _string_translations(source, locale):
+    """Each of the source's string segments, paired with its translation into
+    `locale` or None."""
+    from wagtail_localize.models import StringSegment, StringTranslation
+
+    segments = list(
+        StringSegment.objects.filter(source=source)
+        .select_related("string")
+        .order_by("order")
+    )
+    translations = {
+        (translation.translation_of_id, translation.context_id): translation
+        for translation in StringTranslation.objects.filter(
+            locale=locale,
+            translation_of_id__in=[segment.string_id for segment in segments],
+        )
+    }
+    return [
+        (segment, translations.get((segment.string_id, segment.context_id)))
+        for segment in segments
+    ]
+
+
+def _check_untranslated(source, locale):
+    """Raise unless none of the source's string segments is translated yet, so
+    every one of them is left for the translation service."""
+    translated = [
+        segment.order
+        for segment, translation in _string_translations(source, locale)
+        if translation is not None
+    ]
+    if translated:
+        raise RuntimeError(
+            f"the segments at {translated} are already translated into "
+            f"{locale}, so they would not be sent to the translation service."
+        )
+
+
+def _check_machine_translated(source, locale, tool_name):
+    """Check every string segment carries the stand-in's translation.
+
+    Compared with what the stand-in returns for the segment's own source text,
+    so a translation saved against the wrong segment fails too. Returns the
+    number of segments, which is the workload these flows declare.
+    """
+    from benchmarks.translation_service import stand_in_translation
+    from wagtail_localize.models import StringTranslation
+
+    pairs = _string_translations(source, locale)
+    for segment, translation in pairs:
+        if translation is None:
+            raise RuntimeError(
+                f"the segment at {segment.order} was not translated into {locale}."
+            )
+        if (
+            translation.translation_type != StringTranslation.TRANSLATION_TYPE_MACHINE
+            or translation.tool_name != tool_name
+        ):
+            raise RuntimeError(
+                f"the segment at {segment.order} was translated by "
+                f"{translation.tool_name!r} ({translation.translation_type}), "
+                f"not machine translated by {tool_name}."
+            )
+        expected = stand_in_translation(segment.string.data, locale.language_code)
+        if translation.data != expected:
+            raise RuntimeError(
+                f"the segment at {segment.order} holds {translation.data!r}, not "
+                f"the stand-in's {expected!r}."
+            )
+
+    return len(pairs)
+
+
+def _machine_translate_translation(ctx, size):
+    """The Translation this size machine translates."""
+    if size == "small":
+        return ctx.existing_page_translation
+    return ctx.heavy_page_translation
+
+
+def _machine_translate_setup(ctx, size):
+    """Configure DeepL, and assert the translation has everything left to do."""
+    translation = _machine_translate_translation(ctx, size)
+    _use_translation_service(ctx, "deepl")
+    _check_untranslated(translation.source, translation.target_locale)
+
+
+def _machine_translate_cached_setup(ctx, size):
+    """As machine_translate_post, but with every string already in the cache.
+
+    The cache is filled by a translator of its own, so the one the view builds
+    starts as cold as in machine_translate_post, and the requests that filled
+    it are forgotten before the measurement.
+    """
+    from django.utils.module_loading import import_string
+
+    from wagtail_localize.strings import StringValue
+
+    translation = _machine_translate_translation(ctx, size)
+    source, locale = translation.source, translation.target_locale
+    config = _use_translation_service(ctx, "deepl")
+    _check_untranslated(source, locale)
+
+    strings = {
+        StringValue(segment.string.data)
+        for segment, _translation in _string_translations(source, locale)
+    }
+    translator = import_string(config["CLASS"])(config["OPTIONS"])
+    translator.get_translations(source.locale, locale, strings)
+
+    cached = translator.get_cache_entries(source.locale, locale).count()
+    if cached != len(strings):
+        raise RuntimeError(
+            f"the cache holds {cached} translations for {len(strings)} strings, "
+            f"so some of them would still be sent to the translation service."
+        )
+    ctx.translation_service.reset()
+
+
+def _machine_translate_run(ctx, size):
+    """POST the machine translate action, and return the response unexamined."""
+    from django.urls import reverse
+
+    return ctx.client.post(
+        reverse(
+            "wagtail_localize:machine_translate",
+            args=[_machine_translate_translation(ctx, size).id],
+        )
+    )
+
+
+def _machine_translate_verify(ctx, size, response):
+    """Check every segment was saved with the stand-in's translation."""
+    if response.status_code != 302:
+        raise RuntimeError(
+            f"the machine translate view returned {response.status_code}, not a "
+            f"redirect"
+        )
+
+    translation = _machine_translate_translation(ctx, size)
+    return _check_machine_translated(
+        translation.source, translation.target_locale, "DeepL"
+    )
+
+
+MACHINE_TRANSLATE_SCALE_POINTS = (
+    ScalePoint(
+        label="small",
+        why="An ordinary page: one string, so the fixed cost dominates.",
+        expected_workload=1,
+    ),
+    ScalePoint(
+        label="large",
+        why=(
+            "The StreamField-heavy page, whose strings still fit in one DeepL "
+            "request, so the per-segment database cost separates from the "
+            "per-request cost."
+        ),
+        expected_workload=41,
+    ),
+)
+
+
+MACHINE_TRANSLATE_POST = Flow(
+    name="machine_translate_post",
+    group="editing",
+    why=(
+        "Machine translating a translation from the editor, with the "
+        "translation cache turned on but empty: every string is sent to the "
+        "translation service and written to the cache."
+    ),
+    entrypoint="machine_translate -> apply_machine_translation",
+    covers=(
+        "get_segments_to_machine_translate",
+        "apply_translation_memory",
+        "BaseMachineTranslator.get_translations and the CACHE option",
+        "DeepL request batching over the stand-in service",
+        "save_machine_translations",
+    ),
+    workload_unit="machine_translated_segments",
+    scale_points=MACHINE_TRANSLATE_SCALE_POINTS,
+    setup=_machine_translate_setup,
+    run=_machine_translate_run,
+    verify=_machine_translate_verify,
+    counters=_translation_service_counters,
+)
+
+
+MACHINE_TRANSLATE_POST_CACHED = Flow(
+    name="machine_translate_post_cached",
+    group="editing",
+    why=(
+        "The same action with every string already in the translation cache, "
+        "so the difference from machine_translate_post is what the cache saves "
+        "in requests and costs in queries."
+    ),
+    entrypoint="machine_translate -> apply_machine_translation",
+    covers=(
+        "BaseMachineTranslator.get_cached_translations",
+        "save_machine_translations",
+    ),
+    workload_unit="machine_translated_segments",
+    scale_points=MACHINE_TRANSLATE_SCALE_POINTS,
+    setup=_machine_translate_cached_setup,
+    run=_machine_translate_run,
+    verify=_machine_translate_verify,
+    counters=_translation_service_counters,
+)
+
+
+# ---------------------------------------------------------------------------
+# update_translations_post_machine_translate
+# ---------------------------------------------------------------------------
+
+
+def _updated_body(page):
+    return f"<p>Updated body text for {page.slug}, waiting to be translated.</p>"
+
+
+def _update_machine_translate_setup(ctx, size):
+    """Configure LibreTranslate and change the source's translatable text.
+
+    Unlike the publish flow's marker, the change goes in a translatable field:
+    it has to become a new segment for the update to machine translate.
+    """
+    page, source = _update_source(size, ctx)
+    french = ctx.locales["fr"]
+    _use_translation_service(ctx, "libretranslate")
+
+    enabled = _enabled_translations(source)
+    if [translation.target_locale_id for translation in enabled] != [french.id]:
+        raise RuntimeError(
+            "this flow measures updating exactly one translation, into French."
+        )
+    _check_untranslated(source, french)
+
+    page.test_richtextfield = _updated_body(page)
+    page.save_revision().publish()
+
+
+def _update_machine_translate_run(ctx, size):
+    """POST the update form with machine translation and publish."""
+    from django.urls import reverse
+
+    _page, source = _update_source(size, ctx)
+    return ctx.client.post(
+        reverse("wagtail_localize:update_translations", args=[source.id]),
+        {"publish_translations": "on", "use_machine_translation": "on"},
+    )
+
+
+def _update_machine_translate_verify(ctx, size, response):
+    """Check the changed text was machine translated and published."""
+    from benchmarks.translation_service import stand_in_translation
+    from wagtail_localize.models import String
+
+    if response.status_code != 302:
+        raise RuntimeError(
+            f"the update view returned {response.status_code}, not a redirect"
+        )
+
+    page, source = _update_source(size, ctx)
+    french = ctx.locales["fr"]
+    source.refresh_from_db()
+
+    updated = String.objects.filter(
+        segments__source=source, data__startswith="Updated body text"
+    ).first()
+    if updated is None:
+        raise RuntimeError("the source's segments do not include the changed text.")
+
+    translated = _check_machine_translated(source, french, "LibreTranslate")
+
+    target = page.get_translation(french).specific
+    expected = stand_in_translation(updated.data, french.language_code)
+    if not target.live or expected not in target.test_richtextfield:
+        raise RuntimeError(
+            f"the French target carries {target.test_richtextfield!r}, not the "
+            f"published translation {expected!r}."
+        )
+
+    return translated
+
+
+UPDATE_TRANSLATIONS_POST_MACHINE_TRANSLATE = Flow(
+    name="update_translations_post_machine_translate",
+    group="updating",
+    why=(
+        "Pushing a change out to the translations with machine translation "
+        "turned on, so the incoming strings are sent to the translation service "
+        "before the targets are published."
+    ),
+    entrypoint="UpdateTranslationsView.form_valid -> apply_machine_translations",
+    covers=(
+        "TranslationSource.update_from_db",
+        "apply_machine_translations",
+        "LibreTranslate requests over the stand-in service",
+        "Translation.save_target",
+    ),
+    workload_unit="machine_translated_segments",
+    scale_points=(
+        ScalePoint(
+            label="small",
+            why="An ordinary page whose one string changed.",
+            expected_workload=1,
+        ),
+        ScalePoint(
+            label="large",
+            why=(
+                "The StreamField-heavy page, whose untranslated blocks are "
+                "machine translated alongside the changed string."
+            ),
+            expected_workload=41,
+        ),
+    ),
+    setup=_update_machine_translate_setup,
+    run=_update_machine_translate_run,
+    verify=_update_machine_translate_verify,
+    counters=_translation_service_counters,
+)
+
+
 # ---------------------------------------------------------------------------
 # core_refresh_segments
 #
@@ -1453,8 +1840,11 @@ CATALOG = (
     SUBMIT_SNIPPET_POST,
     TRANSLATE_PAGE_SUBTREE,
     EDIT_TRANSLATION_GET,
+    MACHINE_TRANSLATE_POST,
+    MACHINE_TRANSLATE_POST_CACHED,
     UPDATE_TRANSLATIONS_GET,
     UPDATE_TRANSLATIONS_POST_PUBLISH,
+    UPDATE_TRANSLATIONS_POST_MACHINE_TRANSLATE,
     CORE_REFRESH_SEGMENTS,
     CORE_PAGE_INDEX,
 )
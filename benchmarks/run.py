@@ -68,7 +68,7 @@ RESULT_PREFIX = "WL_BENCHMARK_RESULT="
 
 # Bump when the shape of the --json file changes, so a reader can tell whether
 # it understands a file before trusting it.
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 3
 
 # What every repetition of one (flow, size) has to agree on. Time is expected to
 # move between repetitions; these are not. A flow whose measurement moves is a
@@ -78,6 +78,7 @@ STABLE_ACROSS_REPETITIONS = (
     "workload_unit",
     "expected_workload",
     "observed_workload",
+    "counters",
 )
 
 
@@ -196,6 +197,7 @@ def run_in_child(name, size):
         artifacts = flow.run(ctx, size)
         seconds = perf_counter() - started
 
+    counters = flow.counters(ctx, size) if flow.counters else {}
     observed = flow.verify(ctx, size, artifacts)
 
     # Comparing here rather than inside each verify() means no flow can forget
@@ -219,6 +221,7 @@ def run_in_child(name, size):
                 "observed_workload": observed,
                 "expected_workload": point.expected_workload if point else None,
                 "workload_unit": flow.workload_unit,
+                "counters": counters,
             }
         )
     )
@@ -319,6 +322,7 @@ def execute(name, size, template, directory, index, token):
             "workload_unit": payload["workload_unit"],
             "expected_workload": payload["expected_workload"],
             "observed_workload": payload["observed_workload"],
+            "counters": payload["counters"],
             "pid": payload["pid"],
             "database": payload["database"],
         }
@@ -372,6 +376,7 @@ def _aggregate(name, size, results):
         "workload_unit": first["workload_unit"],
         "expected_workload": first["expected_workload"],
         "observed_workload": first["observed_workload"],
+        "counters": first["counters"],
         "seconds_median": statistics.median(seconds),
         "seconds_min": min(seconds),
         "seconds_max": max(seconds),
@@ -502,6 +507,7 @@ def _public_result(result):
             "workload_unit": None,
             "expected_workload": None,
             "observed_workload": None,
+            "counters": None,
             "seconds_median": None,
             "seconds_min": None,
             "seconds_max": None,
@@ -515,6 +521,7 @@ def _public_result(result):
         "workload_unit": result["workload_unit"],
         "expected_workload": result["expected_workload"],
         "observed_workload": result["observed_workload"],
+        "counters": result["counters"],
         # Microseconds: finer than anything this measurement can distinguish,
         # and it keeps the file readable.
         "seconds_median": round(result["seconds_median"], 6),
@@ -619,6 +626,8 @@ def report(result):
             f"  {result['observed_workload']} {result['workload_unit']}"
             f" (expected {result['expected_workload']})"
         )
+    for counter, value in result["counters"].items():
+        line += f"  {value} {counter}"
     print(line)
     return True
 
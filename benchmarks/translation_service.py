@@ -0,0 +1,168 @@
+"""A local stand-in for the machine translation services the benchmarks call.
+
+The machine translation flows send real HTTP requests, through the product's
+own translator classes and their pooled sessions, to a server on the loopback
+interface instead of to DeepL or LibreTranslate. That keeps them runnable
+without network access or an API key, and makes the provider's side of the
+measurement deterministic: every response takes the same configured latency,
+and every request is counted, so a change to batching or caching shows up as a
+number rather than as a guess.
+
+The server answers the two request formats the translators send:
+
+    POST /v2/translate   DeepL: form-encoded `text` fields, one per string
+    POST /translate      LibreTranslate: a JSON body with a `q` list
+
+and "translates" each string by prefixing the target language, so a result can
+be checked without knowing anything but the source text.
+
+The translator classes import wagtail_localize, so the catalog imports this
+module inside its functions only.
+"""
+
+import json
+import os
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from wagtail_localize.machine_translators.deepl import DeepLTranslator
+from wagtail_localize.machine_translators.libretranslate import LibreTranslator
+
+
+# The env var that overrides the latency of every response, in seconds. Timings
+# from runs with different latencies are not comparable; query and request
+# counts are.
+LATENCY_ENV_VAR = "WL_BENCHMARK_TRANSLATION_LATENCY"
+
+# A round trip to a hosted translation API, roughly. Large enough that time
+# spent waiting on the provider is visible next to time spent in the database.
+DEFAULT_LATENCY = 0.05
+
+
+def stand_in_translation(text, target_language):
+    """What the stand-in returns for `text`, so verification can predict it."""
+    return f"[{target_language.lower()}] {text}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, so a pooled session reuses its connection as it would against
+    # the real service.
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if self.path == "/v2/translate":
+            form = parse_qs(body.decode())
+            texts = form.get("text", [])
+            target = form["target_lang"][0]
+            payload = {
+                "translations": [
+                    {
+                        "detected_source_language": form["source_lang"][0],
+                        "text": stand_in_translation(text, target),
+                    }
+                    for text in texts
+                ]
+            }
+        elif self.path == "/translate":
+            data = json.loads(body)
+            texts = data["q"] if isinstance(data["q"], list) else [data["q"]]
+            payload = {
+                "translatedText": [
+                    stand_in_translation(text, data["target"]) for text in texts
+                ]
+            }
+        else:
+            self.send_error(404)
+            return
+
+        self.server.service.record(len(texts))
+
+        content = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        # The child's output is the harness's channel; request logs would be
+        # noise in it.
+        pass
+
+
+class TranslationService:
+    """A stand-in translation service, serving from a daemon thread.
+
+    The server lives as long as the child process that started it, so there is
+    nothing to stop: each execution gets its own process and its own server.
+    """
+
+    def __init__(self, latency=None):
+        if latency is None:
+            latency = float(os.environ.get(LATENCY_ENV_VAR, DEFAULT_LATENCY))
+        self.latency = latency
+        self.requests = 0
+        self.strings = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start(self):
+        """Start serving on a free loopback port, and return the base URL."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.service = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, strings):
+        # Simulate the provider's latency before answering, outside the lock so
+        # concurrent requests wait concurrently, as they would against the
+        # real service.
+        time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            self.strings += strings
+
+    def reset(self):
+        """Forget the requests seen so far, e.g. the ones setup sent."""
+        with self._lock:
+            self.requests = 0
+            self.strings = 0
+
+    def counters(self):
+        with self._lock:
+            return {
+                "provider_requests": self.requests,
+                "provider_strings": self.strings,
+            }
+
+
+class StandInSessionMixin:
+    def get_session(self):
+        session = super().get_session()
+        # Never route the loopback requests through a proxy from the environment.
+        session.trust_env = False
+        return session
+
+
+# The product's translators, pointed at the stand-in. Only the endpoint and the
+# session's proxy handling change: request building, batching, caching,
+# retries and response parsing are the product's own, which is what the flows
+# measure.
+class StandInDeepLTranslator(StandInSessionMixin, DeepLTranslator):
+    def get_api_endpoint(self):
+        return self.options["STAND_IN_URL"] + "/v2/translate"
+
+
+class StandInLibreTranslator(StandInSessionMixin, LibreTranslator):
+    pass
@@ -0,0 +1,69 @@
+"""
+Inline codes, which stand for the tags in strings when they're exported to XLIFF and TMX files.
+
+Both formats write the tags of a string, such as the ``<a id="a1">`` placeholders of links, as
+inline codes around or between its text, and turn the codes back into the same tags on import.
+"""
+
+import html
+
+from bs4 import BeautifulSoup, NavigableString
+
+
+def walk_inline_tags(data, handler):
+    """
+    Walks through the text and tags of the HTML of a string, in order.
+
+    Args:
+        data (str): The HTML of the string.
+        handler: An object with the following methods, which are called as they're found:
+
+            - ``text(text)``: For text between the tags.
+            - ``empty(tag)``: For elements without contents, such as ``<br/>``.
+            - ``start(start_tag, end_tag, name)``: Before the contents of other elements.
+            - ``end()``: After the contents of the element that was last started.
+    """
+
+    def walk(element):
+        for child in element.children:
+            if isinstance(child, NavigableString):
+                handler.text(str(child))
+                continue
+
+            rendered = str(child)
+            if child.is_empty_element:
+                handler.empty(rendered)
+                continue
+
+            end_tag = f"</{child.name}>"
+            start_tag = rendered[
+                : len(rendered) - len(child.decode_contents()) - len(end_tag)
+            ]
+            handler.start(start_tag, end_tag, child.name)
+            walk(child)
+            handler.end()
+
+    walk(BeautifulSoup(data, "html.parser"))
+
+
+def read_inline_codes(element, read_code):
+    """
+    Returns the contents of an element with inline codes as the HTML of a string.
+
+    Args:
+        element (xml.etree.ElementTree.Element): The element.
+        read_code (callable): Called with each child element. Returns the HTML of the tags the
+            code stands for, or None for elements that only mark up their contents, which are
+            read as they are.
+
+    Returns:
+        str: The HTML of the string.
+    """
+    parts = [html.escape(element.text or "", quote=False)]
+
+    for child in element:
+        code = read_code(child)
+        parts.append(read_inline_codes(child, read_code) if code is None else code)
+        parts.append(html.escape(child.tail or "", quote=False))
+
+    return "".join(parts)
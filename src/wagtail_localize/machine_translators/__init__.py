@@ -1,14 +1,38 @@
+import json
+import threading
+
 from django.conf import settings
 from django.utils.module_loading import import_string
 
+from .base import _normalize_option
+
+
+# The translator built from the current settings, keyed by a fingerprint of the settings
+_translator_cache = {}
+_translator_cache_lock = threading.Lock()
+
 
 def get_machine_translator():
+    """
+    Returns the machine translator that is configured in ``WAGTAILLOCALIZE_MACHINE_TRANSLATOR``.
+
+    The translator is created once per process and reused, so that it can keep connections to the
+    translation service open. It's recreated if the setting changes.
+    """
     config = getattr(settings, "WAGTAILLOCALIZE_MACHINE_TRANSLATOR", None)
 
     if config is None:
         return
 
-    # Raises ImportError
-    machine_translator_class = import_string(config["CLASS"])
+    fingerprint = json.dumps(_normalize_option(config), default=str)
+    with _translator_cache_lock:
+        translator = _translator_cache.get(fingerprint)
+        if translator is None:
+            # Raises ImportError
+            machine_translator_class = import_string(config["CLASS"])
+
+            translator = machine_translator_class(config.get("OPTIONS", {}))
+            _translator_cache.clear()
+            _translator_cache[fingerprint] = translator
 
-    return machine_translator_class(config.get("OPTIONS", {}))
+    return translator
@@ -1,6 +1,103 @@
+import hashlib
+import json
+import logging
+import random
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+
+from django.db import connections, router
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.functional import cached_property
+from requests.adapters import HTTPAdapter
+
+from wagtail_localize.strings import StringValue
+
+from .resilience import CircuitBreaker, TokenBucket
+
+
+logger = logging.getLogger(__name__)
+
+# The maximum number of hashes to look up in the cache in one query
+CACHE_LOOKUP_BATCH_SIZE = 500
+
+# The HTTP status codes of errors that may go away if the request is retried
+TRANSIENT_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def _normalize_option(value):
+    # Options may contain dicts with tuple keys (such as DeepL's GLOSSARY_IDS), which JSON can't encode
+    if isinstance(value, dict):
+        return sorted(
+            (repr(key), _normalize_option(item)) for key, item in value.items()
+        )
+    if isinstance(value, list | tuple | set | frozenset):
+        return [_normalize_option(item) for item in value]
+    return value
+
+
+class MachineTranslationError(Exception):
+    """
+    Raised when some of the requests to a machine translator failed.
+
+    Attributes:
+        errors (list[tuple[list[StringValue], Exception]]): The strings of each request that failed,
+            with the exception it raised.
+        translations (dict[StringValue, StringValue]): The translations from the requests that
+            succeeded.
+    """
+
+    def __init__(self, errors, translations):
+        self.errors = errors
+        self.translations = translations
+        super().__init__(
+            f"{len(errors)} machine translation request(s) failed: "
+            + "; ".join(str(error) for _strings, error in errors)
+        )
+
+
 class BaseMachineTranslator:
     display_name = "Unknown"
 
+    # Options that don't affect the translations, so changing them doesn't invalidate cached translations
+    cache_ignored_options = {
+        "CACHE",
+        "TIMEOUT",
+        "MAX_STRINGS_PER_REQUEST",
+        "MAX_BYTES_PER_REQUEST",
+        "MAX_CONCURRENT_REQUESTS",
+        "POOL_SIZE",
+        "RATE_LIMIT",
+        "RETRY_ATTEMPTS",
+        "RETRY_BACKOFF",
+        "MAX_RETRY_BACKOFF",
+        "CIRCUIT_BREAKER",
+    }
+
+    # The limits of the translation service on the number of strings, and their total size in
+    # bytes, in each request. Larger batches are split up. None means unlimited
+    max_strings_per_request = None
+    max_bytes_per_request = None
+
+    # The maximum number of requests to send at once
+    max_concurrent_requests = 4
+
+    # The number of times to retry a request that failed with a transient error, and the number of
+    # seconds to wait before the first retry. The wait doubles after each retry
+    retry_attempts = 3
+    retry_backoff = 1
+    max_retry_backoff = 30
+
+    # The minimum number of seconds between evictions of expired or excess cached translations
+    cache_eviction_interval = 3600
+
+    # The time.monotonic() of the last eviction in this process
+    cache_evicted_at = None
+
     def __init__(self, options):
         self.options = options
 
@@ -9,3 +106,490 @@ class BaseMachineTranslator:
 
     def can_translate(self, source_locale, target_locale):
         return False
+
+    def get_options_fingerprint(self):
+        """
+        Returns a hash of the options that affect the translations this translator makes.
+        """
+        options = {
+            key: value
+            for key, value in self.options.items()
+            if key not in self.cache_ignored_options
+        }
+        return hashlib.sha256(
+            json.dumps(_normalize_option(options), default=str).encode()
+        ).hexdigest()
+
+    def is_transient_error(self, error):
+        """
+        Returns True if a request that raised the given error may succeed if it's retried.
+        """
+        if isinstance(error, requests.Timeout | requests.ConnectionError):
+            return True
+
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in TRANSIENT_STATUS_CODES
+
+        return False
+
+    def get_retry_delay(self, error, attempt):
+        """
+        Returns the number of seconds to wait before retrying a request that failed.
+
+        The delay grows exponentially with each attempt, with some jitter so that requests that
+        failed at the same time aren't retried at the same time. The ``Retry-After`` header of the
+        response is respected, up to the ``MAX_RETRY_BACKOFF`` option.
+        """
+        backoff = self.options.get("RETRY_BACKOFF", self.retry_backoff)
+        max_backoff = self.options.get("MAX_RETRY_BACKOFF", self.max_retry_backoff)
+        delay = min(backoff * 2**attempt, max_backoff)
+        # Jitter doesn't need to be cryptographically secure
+        delay *= 0.5 + random.random() / 2  # noqa: S311
+
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("Retry-After", 0))
+            except (TypeError, ValueError):
+                # Retry-After can also be an HTTP date, which isn't worth parsing
+                retry_after = 0
+            delay = max(delay, min(retry_after, max_backoff))
+
+        return delay
+
+    def get_resilience_key(self):
+        # Include the credentials so translators using different accounts are limited separately
+        options_hash = hashlib.sha256(
+            json.dumps(_normalize_option(self.options), default=str).encode()
+        ).hexdigest()
+        return f"wagtail_localize:machine_translator:{type(self).__module__}.{type(self).__qualname__}:{options_hash}"
+
+    @cached_property
+    def rate_limiter(self):
+        """
+        The rate limiter configured with the ``RATE_LIMIT`` option, or None.
+        """
+        options = self.options.get("RATE_LIMIT")
+        if options is None:
+            return
+
+        return TokenBucket(
+            f"{self.get_resilience_key()}:rate_limit",
+            options["REQUESTS"],
+            period=options.get("PERIOD", 1),
+            burst=options.get("BURST"),
+            cache=options.get("CACHE", "default"),
+        )
+
+    @cached_property
+    def circuit_breaker(self):
+        """
+        The circuit breaker configured with the ``CIRCUIT_BREAKER`` option, or None.
+        """
+        options = self.options.get("CIRCUIT_BREAKER")
+        if options is None:
+            return
+
+        return CircuitBreaker(
+            f"{self.get_resilience_key()}:circuit_breaker",
+            failures=options.get("FAILURES", 5),
+            reset_timeout=options.get("RESET_TIMEOUT", 60),
+            cache=options.get("CACHE", "default"),
+        )
+
+    def send_request(self, source_locale, target_locale, strings):
+        """
+        Translates a batch of strings with `translate`, within the rate limit, retrying transient
+        errors, and failing fast while the circuit breaker is open.
+
+        Raises:
+            MachineTranslatorUnavailable: If the circuit breaker is open, or the rate limit
+                wouldn't allow the request soon enough.
+        """
+        retries = self.options.get("RETRY_ATTEMPTS", self.retry_attempts)
+        attempt = 0
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.check()
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(
+                    max_wait=self.options["RATE_LIMIT"].get("MAX_WAIT", 30)
+                )
+
+            try:
+                translations = self.translate(source_locale, target_locale, strings)
+            except Exception as e:
+                if not self.is_transient_error(e):
+                    raise
+
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+
+                if attempt >= retries:
+                    raise
+
+                delay = self.get_retry_delay(e, attempt)
+                logger.info(
+                    "Request to %s failed, retrying in %.1f seconds: %s",
+                    self.display_name,
+                    delay,
+                    e,
+                )
+                time.sleep(delay)
+                attempt += 1
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+
+                return translations
+
+    def get_chunks(self, strings):
+        """
+        Splits the strings into batches that fit within the limits of the translation service.
+
+        The limits can be overridden with the ``MAX_STRINGS_PER_REQUEST`` and
+        ``MAX_BYTES_PER_REQUEST`` options. Strings that are larger than the byte limit on their
+        own are sent in a batch by themselves.
+
+        Yields:
+            list[StringValue]: Batches of strings, in their original order.
+        """
+        max_strings = self.options.get(
+            "MAX_STRINGS_PER_REQUEST", self.max_strings_per_request
+        )
+        max_bytes = self.options.get(
+            "MAX_BYTES_PER_REQUEST", self.max_bytes_per_request
+        )
+
+        chunk = []
+        chunk_bytes = 0
+        for string in strings:
+            string_bytes = len(string.data.encode())
+            if chunk and (
+                (max_strings is not None and len(chunk) >= max_strings)
+                or (max_bytes is not None and chunk_bytes + string_bytes > max_bytes)
+            ):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+
+            chunk.append(string)
+            chunk_bytes += string_bytes
+
+        if chunk:
+            yield chunk
+
+    def get_max_concurrent_requests(self):
+        """
+        Returns the maximum number of requests to send to the translation service at once, from
+        the ``MAX_CONCURRENT_REQUESTS`` option.
+        """
+        return self.options.get("MAX_CONCURRENT_REQUESTS", self.max_concurrent_requests)
+
+    def submit_chunks(self, executor, source_locale, target_locale, strings):
+        """
+        Submits requests to translate the strings to the given executor, in batches that fit
+        within the limits of the translation service.
+
+        Requests for several translations can be submitted to the same executor, so they share
+        its limit on concurrent requests. Pass the result to `collect_chunks` to get the
+        translations.
+
+        Returns:
+            list[tuple[list[StringValue], Future]]: Each batch of strings, with the future of its
+                request.
+        """
+        return [
+            (
+                chunk,
+                executor.submit(self.send_request, source_locale, target_locale, chunk),
+            )
+            for chunk in self.get_chunks(strings)
+        ]
+
+    def collect_chunks(self, submitted):
+        """
+        Waits for the requests returned by `submit_chunks`, and combines their translations.
+
+        Raises:
+            MachineTranslationError: If any of the batches failed. The translations from the other
+                batches are available on the exception.
+        """
+        # Reassemble the results in the original order
+        translations = {}
+        errors = []
+        for chunk, future in submitted:
+            error = future.exception()
+            if error is None:
+                translations.update(future.result())
+            else:
+                logger.warning(
+                    "Failed to translate %d strings with %s",
+                    len(chunk),
+                    self.display_name,
+                    exc_info=error,
+                )
+                errors.append((chunk, error))
+
+        if errors:
+            raise MachineTranslationError(errors, translations)
+
+        return translations
+
+    def translate_in_chunks(self, source_locale, target_locale, strings):
+        """
+        Translates the strings with `send_request`, in batches that fit within the limits of the
+        translation service.
+
+        The batches are sent at the same time, up to the ``MAX_CONCURRENT_REQUESTS`` option.
+
+        Raises:
+            MachineTranslationError: If any of the batches failed. The translations from the other
+                batches are available on the exception.
+        """
+        chunks = list(self.get_chunks(strings))
+        if len(chunks) <= 1:
+            chunk = chunks[0] if chunks else []
+            try:
+                return self.send_request(source_locale, target_locale, chunk)
+            except Exception as e:
+                logger.warning(
+                    "Failed to translate %d strings with %s",
+                    len(chunk),
+                    self.display_name,
+                    exc_info=e,
+                )
+                raise MachineTranslationError([(chunk, e)], {}) from e
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(chunks), self.get_max_concurrent_requests()),
+            thread_name_prefix="wagtail_localize_mt",
+        ) as executor:
+            submitted = self.submit_chunks(
+                executor, source_locale, target_locale, strings
+            )
+
+        return self.collect_chunks(submitted)
+
+    def get_translations(self, source_locale, target_locale, strings):
+        """
+        Translates the given strings, reusing cached translations if the ``CACHE`` option is set.
+
+        Only the strings that aren't in the cache are passed to `translate`, and their translations
+        are added to the cache. Large batches of strings are split up and translated concurrently,
+        see `translate_in_chunks`.
+
+        Args:
+            source_locale (Locale): The locale of the strings.
+            target_locale (Locale): The locale to translate the strings into.
+            strings (iterable of StringValue): The strings to translate.
+
+        Returns:
+            dict[StringValue, StringValue]: The translations, keyed by the source strings. Strings
+                the translator couldn't translate may be missing, or have a value of None.
+
+        Raises:
+            MachineTranslationError: If any of the requests to the translation service failed.
+        """
+        translations, misses = self.get_cached_translations(
+            source_locale, target_locale, strings
+        )
+        if not misses:
+            return translations
+
+        try:
+            new_translations = self.translate_in_chunks(
+                source_locale, target_locale, misses
+            )
+        except MachineTranslationError as e:
+            # Keep the translations from the requests that succeeded
+            self.cache_translations(source_locale, target_locale, e.translations)
+            e.translations = {**translations, **e.translations}
+            raise
+
+        self.cache_translations(source_locale, target_locale, new_translations)
+        translations.update(new_translations)
+        return translations
+
+    def get_cached_translations(self, source_locale, target_locale, strings):
+        """
+        Looks up the given strings in the cache, if the ``CACHE`` option is set.
+
+        Returns:
+            tuple[dict[StringValue, StringValue], list[StringValue]]: A two-tuple of the cached
+                translations, keyed by their source strings, and the strings that weren't found.
+        """
+        cache_options = self.options.get("CACHE")
+        if cache_options is None:
+            return {}, list(strings)
+
+        from wagtail_localize.models import String
+
+        data_hashes = {string: String._get_data_hash(string.data) for string in strings}
+
+        now = timezone.now()
+        entries = self.get_cache_entries(source_locale, target_locale)
+        ttl = cache_options.get("TTL")
+        if ttl is not None:
+            entries = entries.filter(created_at__gt=now - timedelta(seconds=ttl))
+
+        unique_hashes = list(set(data_hashes.values()))
+        cached = {}
+        for i in range(0, len(unique_hashes), CACHE_LOOKUP_BATCH_SIZE):
+            cached.update(
+                entries.filter(
+                    data_hash__in=unique_hashes[i : i + CACHE_LOOKUP_BATCH_SIZE]
+                ).values_list("data_hash", "data")
+            )
+
+        if cached:
+            entries.filter(data_hash__in=list(cached)).update(last_used_at=now)
+
+        translations = {
+            string: StringValue(cached[data_hash])
+            for string, data_hash in data_hashes.items()
+            if data_hash in cached
+        }
+        misses = [
+            string
+            for string, data_hash in data_hashes.items()
+            if data_hash not in cached
+        ]
+        return translations, misses
+
+    def get_cache_entries(self, source_locale, target_locale):
+        from wagtail_localize.models import CachedMachineTranslation
+
+        return CachedMachineTranslation.objects.filter(
+            translator=f"{type(self).__module__}.{type(self).__qualname__}",
+            options_fingerprint=self.get_options_fingerprint(),
+            source_locale=source_locale,
+            target_locale=target_locale,
+        )
+
+    def cache_translations(self, source_locale, target_locale, translations):
+        """
+        Adds the given translations to the cache, if the ``CACHE`` option is set.
+        """
+        cache_options = self.options.get("CACHE")
+        if cache_options is None:
+            return
+
+        from wagtail_localize.models import CachedMachineTranslation, String
+
+        now = timezone.now()
+        entries = [
+            CachedMachineTranslation(
+                translator=f"{type(self).__module__}.{type(self).__qualname__}",
+                options_fingerprint=self.get_options_fingerprint(),
+                source_locale=source_locale,
+                target_locale=target_locale,
+                data_hash=String._get_data_hash(string.data),
+                data=translation.data,
+                created_at=now,
+                last_used_at=now,
+            )
+            for string, translation in translations.items()
+            if translation is not None and translation.data is not None
+        ]
+        update_fields = ["data", "created_at", "last_used_at"]
+
+        features = connections[router.db_for_write(CachedMachineTranslation)].features
+        if features.supports_update_conflicts_with_target:
+            CachedMachineTranslation.objects.bulk_create(
+                entries,
+                update_conflicts=True,
+                unique_fields=[
+                    "translator",
+                    "options_fingerprint",
+                    "source_locale",
+                    "target_locale",
+                    "data_hash",
+                ],
+                update_fields=update_fields,
+            )
+        elif features.supports_update_conflicts:
+            # MySQL and MariaDB update the row that conflicts on any unique key, and don't
+            # accept the fields to match on
+            CachedMachineTranslation.objects.bulk_create(
+                entries, update_conflicts=True, update_fields=update_fields
+            )
+        else:
+            # Update the entries that are already cached, and add the others
+            existing = dict(
+                self.get_cache_entries(source_locale, target_locale)
+                .filter(data_hash__in=[entry.data_hash for entry in entries])
+                .values_list("data_hash", "pk")
+            )
+            for entry in entries:
+                entry.pk = existing.get(entry.data_hash)
+
+            CachedMachineTranslation.objects.bulk_update(
+                [entry for entry in entries if entry.pk is not None], update_fields
+            )
+            CachedMachineTranslation.objects.bulk_create(
+                [entry for entry in entries if entry.pk is None],
+                ignore_conflicts=True,
+            )
+
+        # Eviction scans the whole cache, so it's only done occasionally
+        interval = cache_options.get("EVICTION_INTERVAL", self.cache_eviction_interval)
+        if (
+            self.cache_evicted_at is None
+            or time.monotonic() - self.cache_evicted_at >= interval
+        ):
+            self.cache_evicted_at = time.monotonic()
+            self.evict_cached_translations(cache_options, now)
+
+    def evict_cached_translations(self, cache_options, now):
+        """
+        Deletes cached translations that are older than the ``TTL`` option, and the least
+        recently used ones beyond the ``MAX_ENTRIES`` option.
+        """
+        from wagtail_localize.models import CachedMachineTranslation
+
+        ttl = cache_options.get("TTL")
+        if ttl is not None:
+            CachedMachineTranslation.objects.filter(
+                created_at__lte=now - timedelta(seconds=ttl)
+            ).delete()
+
+        max_entries = cache_options.get("MAX_ENTRIES")
+        if max_entries is not None:
+            # Find the most recently used entry that doesn't fit
+            cutoff = (
+                CachedMachineTranslation.objects.order_by("-last_used_at", "-pk")
+                .values_list("last_used_at", "pk")[max_entries : max_entries + 1]
+                .first()
+            )
+            if cutoff is not None:
+                last_used_at, pk = cutoff
+                CachedMachineTranslation.objects.filter(
+                    Q(last_used_at__lt=last_used_at)
+                    | Q(last_used_at=last_used_at, pk__lte=pk)
+                ).delete()
+
+
+class HTTPSessionMixin:
+    """
+    Gives a machine translator a pooled `requests.Session`, so connections to the translation
+    service are kept alive and reused by later requests.
+
+    The number of connections to keep open can be changed with the ``POOL_SIZE`` option.
+    """
+
+    pool_size = 10
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.session = self.get_session()
+
+    def get_session(self):
+        pool_size = self.options.get("POOL_SIZE", self.pool_size)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
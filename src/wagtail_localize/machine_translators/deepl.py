@@ -1,10 +1,8 @@
 import warnings
 
-import requests
-
 from wagtail_localize.strings import StringValue
 
-from .base import BaseMachineTranslator
+from .base import BaseMachineTranslator, HTTPSessionMixin
 
 
 SUPPORTED_FORMALITY_OPTIONS = {"default", "prefer_less", "prefer_more"}
@@ -20,8 +18,14 @@ def language_code(code, *, is_target=False):
     return upper_code.split("-")[0]
 
 
-class DeepLTranslator(BaseMachineTranslator):
+class DeepLTranslator(HTTPSessionMixin, BaseMachineTranslator):
     display_name = "DeepL"
+    cache_ignored_options = BaseMachineTranslator.cache_ignored_options | {"AUTH_KEY"}
+
+    # DeepL accepts up to 50 texts, and a request body of up to 128 KiB. Leave room for the
+    # form encoding, which can triple the size of non-ASCII text
+    max_strings_per_request = 50
+    max_bytes_per_request = 40 * 1024
 
     def get_api_endpoint(self):
         if self.options.get("AUTH_KEY", "").endswith(":fx"):
@@ -65,12 +69,13 @@ class DeepLTranslator(BaseMachineTranslator):
         }
 
     def translate(self, source_locale, target_locale, strings):
-        response = requests.post(
+        response = self.session.post(
             self.get_api_endpoint(),
             self.get_parameters(source_locale, target_locale, strings),
             timeout=int(self.options.get("TIMEOUT", 30)),
             headers=self.get_headers(),
         )
+        response.raise_for_status()
 
         return {
             string: StringValue(translation["text"])
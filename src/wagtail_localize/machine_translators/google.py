@@ -1,4 +1,5 @@
 from django.utils.functional import cached_property
+from google.api_core import exceptions as google_exceptions
 from google.cloud import translate
 from google.oauth2 import service_account
 
@@ -9,6 +10,14 @@ from .base import BaseMachineTranslator
 
 class GoogleCloudTranslator(BaseMachineTranslator):
     display_name = "Google Translate"
+    cache_ignored_options = BaseMachineTranslator.cache_ignored_options | {
+        "CREDENTIALS",
+        "CREDENTIALS_PATH",
+    }
+
+    # Google accepts up to 1024 strings per request, and recommends a total of under 30,000 code points
+    max_strings_per_request = 1024
+    max_bytes_per_request = 30000
 
     @cached_property
     def client(self):
@@ -48,5 +57,15 @@ class GoogleCloudTranslator(BaseMachineTranslator):
             for string, translation in zip(strings, response.translations, strict=True)
         }
 
+    def is_transient_error(self, error):
+        return isinstance(
+            error,
+            google_exceptions.TooManyRequests
+            | google_exceptions.InternalServerError
+            | google_exceptions.ServiceUnavailable
+            | google_exceptions.GatewayTimeout
+            | google_exceptions.DeadlineExceeded,
+        ) or super().is_transient_error(error)
+
     def can_translate(self, source_locale, target_locale):
         return source_locale.language_code != target_locale.language_code
@@ -1,12 +1,13 @@
 import json
 
-import requests
-
-from wagtail_localize.machine_translators.base import BaseMachineTranslator
+from wagtail_localize.machine_translators.base import (
+    BaseMachineTranslator,
+    HTTPSessionMixin,
+)
 from wagtail_localize.strings import StringValue
 
 
-class LibreTranslator(BaseMachineTranslator):
+class LibreTranslator(HTTPSessionMixin, BaseMachineTranslator):
     """
     A machine translator that uses the LibreTranslate API.
 
@@ -15,6 +16,7 @@ class LibreTranslator(BaseMachineTranslator):
     """
 
     display_name = "LibreTranslate"
+    cache_ignored_options = BaseMachineTranslator.cache_ignored_options | {"API_KEY"}
 
     def get_api_endpoint(self):
         return self.options["LIBRETRANSLATE_URL"]
@@ -27,7 +29,7 @@ class LibreTranslator(BaseMachineTranslator):
 
     def translate(self, source_locale, target_locale, strings):
         translations = [item.data for item in list(strings)]
-        response = requests.post(
+        response = self.session.post(
             self.get_api_endpoint() + "/translate",
             data=json.dumps(
                 {
@@ -0,0 +1,156 @@
+import contextlib
+import time
+import uuid
+
+from django.core.cache import caches
+
+
+class MachineTranslatorUnavailable(Exception):
+    """
+    Raised instead of sending a request to a translation service that is known to be failing, or
+    when waiting for the rate limit would take too long.
+    """
+
+
+@contextlib.contextmanager
+def cache_lock(cache, key, timeout=5, poll_interval=0.01):
+    """
+    A lock that is shared between processes through the cache.
+
+    `cache.add` is atomic on the cache backends that are shared between processes, so only one
+    process can hold the lock at a time. The lock expires after ``timeout`` seconds in case the
+    process holding it dies.
+    """
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + timeout
+    while not cache.add(key, token, timeout):
+        if time.monotonic() > deadline:
+            # The lock was probably left behind, take it over
+            cache.set(key, token, timeout)
+            break
+        time.sleep(poll_interval)
+
+    try:
+        yield
+    finally:
+        if cache.get(key) == token:
+            cache.delete(key)
+
+
+class TokenBucket:
+    """
+    A token bucket rate limiter, with its state kept in the cache so every process that sends
+    requests to the same translation service shares it.
+
+    Args:
+        key (str): The cache key to keep the state of the bucket in.
+        requests (float): The number of requests allowed in each period.
+        period (float): The length of the period, in seconds.
+        burst (int, optional): The number of requests that can be sent at once after the bucket
+            has filled up. Defaults to ``requests``.
+        cache (str, optional): The alias of the cache to use.
+    """
+
+    def __init__(self, key, requests, period=1, burst=None, cache="default"):
+        self.key = key
+        self.rate = requests / period
+        self.capacity = max(burst or requests, 1)
+        self.cache_alias = cache
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def try_acquire(self):
+        """
+        Takes a token from the bucket if there is one.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the number of seconds until one is available.
+        """
+        with cache_lock(self.cache, f"{self.key}:lock"):
+            now = time.time()
+            tokens, updated_at = self.cache.get(self.key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated_at) * self.rate)
+
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0
+            else:
+                wait = (1 - tokens) / self.rate
+
+            # Keep the state until the bucket would have filled up again
+            self.cache.set(self.key, (tokens, now), int(self.capacity / self.rate) + 1)
+            return wait
+
+    def acquire(self, max_wait):
+        """
+        Waits for a token.
+
+        Raises:
+            MachineTranslatorUnavailable: If a token won't be available within ``max_wait`` seconds.
+        """
+        deadline = time.monotonic() + max_wait
+        while wait := self.try_acquire():
+            if time.monotonic() + wait > deadline:
+                raise MachineTranslatorUnavailable(
+                    "Rate limit exceeded, try again later"
+                )
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a translation service after it fails several times in a row, so they fail
+    fast instead of waiting for it to time out. The state is kept in the cache so it's shared by
+    every process.
+
+    After ``reset_timeout`` seconds, requests are let through again. The breaker closes once one
+    of them succeeds, and opens for another ``reset_timeout`` seconds as soon as one fails.
+
+    Args:
+        key (str): The prefix of the cache keys to keep the state of the breaker in.
+        failures (int): The number of failures in a row that opens the breaker.
+        reset_timeout (float): The number of seconds to stop sending requests for.
+        cache (str, optional): The alias of the cache to use.
+    """
+
+    def __init__(self, key, failures=5, reset_timeout=60, cache="default"):
+        self.failures_key = f"{key}:failures"
+        self.open_until_key = f"{key}:open_until"
+        self.max_failures = failures
+        self.reset_timeout = reset_timeout
+        self.cache_alias = cache
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def check(self):
+        """
+        Raises:
+            MachineTranslatorUnavailable: If the breaker is open.
+        """
+        open_until = self.cache.get(self.open_until_key)
+        if open_until is not None and time.time() < open_until:
+            raise MachineTranslatorUnavailable(
+                "The translation service is failing, try again later"
+            )
+
+    def record_success(self):
+        self.cache.delete_many([self.failures_key, self.open_until_key])
+
+    def record_failure(self):
+        self.cache.add(self.failures_key, 0, None)
+        try:
+            failures = self.cache.incr(self.failures_key)
+        except ValueError:
+            # The key was deleted by a success in another process
+            return
+
+        if failures >= self.max_failures:
+            self.cache.set(
+                self.open_until_key,
+                time.time() + self.reset_timeout,
+                int(self.reset_timeout) + 1,
+            )
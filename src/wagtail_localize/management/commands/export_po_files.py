@@ -0,0 +1,87 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+
+from wagtail_localize.po_archive import export_po_archive
+from wagtail_localize.views.report import (
+    TranslationsReportFilterSet,
+    get_translations_report_queryset,
+)
+
+
+class Command(BaseCommand):
+    help = "Exports a ZIP archive with a PO file for each enabled translation, optionally filtered like the translations report."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The file to write the archive to.")
+        parser.add_argument(
+            "--source-locale",
+            help="Only export translations from this language code.",
+        )
+        parser.add_argument(
+            "--target-locale",
+            help="Only export translations into this language code.",
+        )
+        parser.add_argument(
+            "--content-type",
+            help="Only export translations of this model and its subclasses, as app_label.model_name.",
+        )
+        parser.add_argument(
+            "--waiting-for-translation",
+            action="store_true",
+            help="Only export translations that have strings left to translate.",
+        )
+        parser.add_argument(
+            "--delta",
+            action="store_true",
+            help="Only export the strings that have changed since each translation's last delta export, and the strings that haven't been translated yet.",
+        )
+
+    def handle(self, **options):
+        data = {
+            "source_locale": options["source_locale"],
+            "target_locale": options["target_locale"],
+        }
+
+        if options["content_type"]:
+            try:
+                app_label, model_name = options["content_type"].lower().split(".")
+                content_type = ContentType.objects.get_by_natural_key(
+                    app_label, model_name
+                )
+            except (ValueError, ContentType.DoesNotExist) as e:
+                raise CommandError(
+                    f"Unknown content type '{options['content_type']}'"
+                ) from e
+            data["content_type"] = content_type.id
+
+        if options["waiting_for_translation"]:
+            data["waiting_for_translation"] = True
+
+        filters = TranslationsReportFilterSet(
+            {key: value for key, value in data.items() if value is not None},
+            queryset=get_translations_report_queryset(),
+        )
+        if not filters.is_valid():
+            raise CommandError(filters.errors.as_text())
+
+        translations = (
+            filters.qs.filter(enabled=True)
+            .select_related("source", "target_locale")
+            .iterator()
+        )
+
+        count = 0
+
+        def counted(translations):
+            nonlocal count
+            for translation in translations:
+                count += 1
+                yield translation
+
+        with open(options["path"], "wb") as f:
+            f.writelines(
+                export_po_archive(counted(translations), delta=options["delta"])
+            )
+
+        if options["verbosity"] > 0:
+            self.stdout.write(f"Exported {count} PO files to {options['path']}")
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+from wagtail.models import Locale
+
+from wagtail_localize.tmx import export_tmx, parse_date_filter
+
+
+class Command(BaseCommand):
+    help = "Exports the translation memory as a TMX file, with each distinct translation of a string that doesn't have an error."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The file to write the TMX file to.")
+        parser.add_argument(
+            "--source-locale",
+            help="Only export translations of strings in this language code.",
+        )
+        parser.add_argument(
+            "--target-locale",
+            help="Only export translations into this language code.",
+        )
+        parser.add_argument(
+            "--since",
+            type=parse_date_filter,
+            help="Only export translations that were updated at or after this date or time, in ISO 8601 format.",
+        )
+        parser.add_argument(
+            "--until",
+            type=parse_date_filter,
+            help="Only export translations that were updated before this date or time, in ISO 8601 format.",
+        )
+
+    def get_locale(self, language_code):
+        if not language_code:
+            return None
+
+        try:
+            return Locale.objects.get(language_code=language_code)
+        except Locale.DoesNotExist as e:
+            raise CommandError(f"Unknown locale '{language_code}'") from e
+
+    def handle(self, **options):
+        # Look the locales up first, so the file isn't created if one of them doesn't exist
+        source_locale = self.get_locale(options["source_locale"])
+        target_locale = self.get_locale(options["target_locale"])
+
+        with open(options["path"], "w", encoding="utf-8") as f:
+            f.writelines(
+                export_tmx(
+                    source_locale=source_locale,
+                    target_locale=target_locale,
+                    since=options["since"],
+                    until=options["until"],
+                )
+            )
+
+        if options["verbosity"] > 0:
+            self.stdout.write(f"Exported the translation memory to {options['path']}")
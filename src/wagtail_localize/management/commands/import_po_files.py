@@ -0,0 +1,37 @@
+import zipfile
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from wagtail_localize.po_archive import import_po_archive
+
+
+class Command(BaseCommand):
+    help = "Imports a ZIP archive of PO files, such as one made by export_po_files. Each file is imported into the translation it was exported for."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The archive to import.")
+        parser.add_argument(
+            "--user",
+            help="The username of the user to record as the translator.",
+        )
+
+    def handle(self, **options):
+        user = None
+        if options["user"]:
+            User = get_user_model()
+            try:
+                user = User.objects.get_by_natural_key(options["user"])
+            except User.DoesNotExist as e:
+                raise CommandError(f"Unknown user '{options['user']}'") from e
+
+        try:
+            result = import_po_archive(options["path"], user=user)
+        except zipfile.BadZipFile as e:
+            raise CommandError(f"{options['path']} isn't a valid ZIP file") from e
+
+        for filename, error in result.errors:
+            self.stderr.write(f"{filename}: {error}")
+
+        if options["verbosity"] > 0:
+            self.stdout.write(f"Imported {len(result.imported)} PO files")
@@ -0,0 +1,86 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from wagtail.models import Locale
+
+from wagtail_localize.tmx import (
+    IMPORT_BATCH_SIZE,
+    InvalidTMXFile,
+    import_tmx,
+    parse_date_filter,
+)
+
+
+class Command(BaseCommand):
+    help = "Imports the translation units of a TMX file, such as one made by export_translation_memory, into the translation memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The TMX file to import.")
+        parser.add_argument(
+            "--source-locale",
+            help="Only import translations of strings in this language code.",
+        )
+        parser.add_argument(
+            "--target-locale",
+            help="Only import translations into this language code.",
+        )
+        parser.add_argument(
+            "--since",
+            type=parse_date_filter,
+            help="Only import translation units that were changed at or after this date or time, in ISO 8601 format.",
+        )
+        parser.add_argument(
+            "--until",
+            type=parse_date_filter,
+            help="Only import translation units that were changed before this date or time, in ISO 8601 format.",
+        )
+        parser.add_argument(
+            "--user",
+            help="The username of the user to record as the translator.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="The number of translation units to import at once.",
+        )
+
+    def get_locale(self, language_code):
+        if not language_code:
+            return None
+
+        try:
+            return Locale.objects.get(language_code=language_code)
+        except Locale.DoesNotExist as e:
+            raise CommandError(f"Unknown locale '{language_code}'") from e
+
+    def handle(self, **options):
+        user = None
+        if options["user"]:
+            User = get_user_model()
+            try:
+                user = User.objects.get_by_natural_key(options["user"])
+            except User.DoesNotExist as e:
+                raise CommandError(f"Unknown user '{options['user']}'") from e
+
+        source_locale = self.get_locale(options["source_locale"])
+        target_locale = self.get_locale(options["target_locale"])
+
+        try:
+            with open(options["path"], "rb") as f:
+                result = import_tmx(
+                    f,
+                    source_locale=source_locale,
+                    target_locale=target_locale,
+                    since=options["since"],
+                    until=options["until"],
+                    user=user,
+                    batch_size=options["batch_size"],
+                )
+        except InvalidTMXFile as e:
+            raise CommandError(f"{options['path']} isn't a valid TMX file") from e
+
+        if options["verbosity"] > 0:
+            self.stdout.write(
+                f"Imported {result.created} new and {result.updated} changed translations "
+                f"({result.unchanged} unchanged, {result.skipped} skipped)"
+            )
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from wagtail_localize.models import StringTranslation
+from wagtail_localize.translation_memory import index_translations
+
+
+class Command(BaseCommand):
+    help = "Adds existing translations to the fuzzy translation memory index. Translations that are already indexed are skipped."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of strings to index at once.",
+        )
+
+    def handle(self, **options):
+        batch_size = options["batch_size"]
+        batch = []
+        total = 0
+
+        for string_and_locale in (
+            StringTranslation.objects.order_by("translation_of_id", "locale_id")
+            .values_list("translation_of_id", "locale_id")
+            .distinct()
+            .iterator(chunk_size=batch_size)
+        ):
+            batch.append(string_and_locale)
+            if len(batch) >= batch_size:
+                index_translations(batch)
+                total += len(batch)
+                batch = []
+
+        if batch:
+            index_translations(batch)
+            total += len(batch)
+
+        if options["verbosity"] > 0:
+            self.stdout.write(f"Indexed {total} translated strings")
@@ -0,0 +1,67 @@
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from wagtail_localize.tasks import DatabaseJobBackend, DatabaseWorker, get_backend
+
+
+class Command(BaseCommand):
+    help = "Runs background jobs that were queued by DatabaseJobBackend. Any number of workers can be run at once."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queue",
+            help="The queue to run jobs from. Defaults to the QUEUE option of WAGTAILLOCALIZE_JOBS.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="The number of jobs to run at once. Defaults to the CONCURRENCY option of WAGTAILLOCALIZE_JOBS.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1,
+            help="The number of seconds to wait between checks for new jobs.",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once there are no more jobs to run.",
+        )
+
+    def handle(self, **options):
+        backend = get_backend()
+        if not isinstance(backend, DatabaseJobBackend):
+            raise CommandError(
+                "WAGTAILLOCALIZE_JOBS must be configured to use wagtail_localize.tasks.DatabaseJobBackend"
+            )
+
+        if options["queue"]:
+            backend.queue = options["queue"]
+
+        worker = DatabaseWorker(
+            backend,
+            concurrency=options["concurrency"],
+            poll_interval=options["poll_interval"],
+        )
+
+        # Finish the jobs that are running before exiting
+        def stop(signum, frame):
+            worker.stop()
+
+        previous_handlers = {
+            signum: signal.signal(signum, stop)
+            for signum in [signal.SIGINT, signal.SIGTERM]
+        }
+
+        if options["verbosity"] > 0:
+            self.stdout.write(
+                f"Worker {worker.name} running jobs from '{backend.queue}'"
+            )
+
+        try:
+            worker.run(burst=options["burst"])
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from wagtail_localize.models import LocalizeJob, QueuedJob
+
+
+class Command(BaseCommand):
+    help = "Deletes the records of background jobs that finished more than the given number of days ago, and the queued jobs that failed before then."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Keep the jobs that finished in this many days. Defaults to 30.",
+        )
+
+    def handle(self, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+
+        deleted, _ = LocalizeJob.objects.filter(
+            status__in=[LocalizeJob.STATUS_COMPLETED, LocalizeJob.STATUS_FAILED],
+            finished_at__lt=cutoff,
+        ).delete()
+        self.stdout.write(f"Deleted {deleted} job(s).")
+
+        # Jobs that ran out of attempts are kept in the DatabaseJobBackend queue for inspection
+        deleted, _ = QueuedJob.objects.filter(failed_at__lt=cutoff).delete()
+        self.stdout.write(f"Deleted {deleted} failed queued job(s).")
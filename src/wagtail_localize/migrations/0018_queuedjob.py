@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:46
+
+import django.utils.timezone
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize", "0017_localizejob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("queue", models.CharField(default="default", max_length=100)),
+                ("func", models.CharField(max_length=255)),
+                ("payload", models.BinaryField()),
+                ("run_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("locked_by", models.CharField(blank=True, max_length=255)),
+                ("locked_until", models.DateTimeField(null=True)),
+                ("error", models.TextField(blank=True)),
+                ("failed_at", models.DateTimeField(null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["queue", "run_at"], name="wagtail_loc_queue_91a258_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:50
+
+import django.db.models.deletion
+import django.utils.timezone
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize", "0018_queuedjob"),
+        ("wagtailcore", "0059_apply_collection_ordering"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CachedMachineTranslation",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("translator", models.CharField(max_length=255)),
+                ("options_fingerprint", models.CharField(max_length=64)),
+                ("data_hash", models.UUIDField()),
+                ("data", models.TextField()),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+                (
+                    "last_used_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+                (
+                    "source_locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.locale",
+                    ),
+                ),
+                (
+                    "target_locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.locale",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {
+                    (
+                        "translator",
+                        "options_fingerprint",
+                        "source_locale",
+                        "target_locale",
+                        "data_hash",
+                    )
+                },
+            },
+        ),
+    ]
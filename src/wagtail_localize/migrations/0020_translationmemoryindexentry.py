@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:13
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize", "0019_cachedmachinetranslation"),
+        ("wagtailcore", "0059_apply_collection_ordering"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationMemoryIndexEntry",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("band", models.PositiveSmallIntegerField()),
+                ("key", models.BigIntegerField()),
+                (
+                    "locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.locale",
+                    ),
+                ),
+                (
+                    "string",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtail_localize.string",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["locale", "key"], name="wagtail_loc_locale__843d8a_idx"
+                    )
+                ],
+                "unique_together": {("string", "locale", "band")},
+            },
+        ),
+    ]
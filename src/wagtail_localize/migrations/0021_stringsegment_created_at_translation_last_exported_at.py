@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:20
+
+import django.utils.timezone
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_localize", "0020_translationmemoryindexentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stringsegment",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="translation",
+            name="last_exported_at",
+            field=models.DateTimeField(null=True),
+        ),
+    ]
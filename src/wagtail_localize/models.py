@@ -1,15 +1,22 @@
 import json
+import operator
+import threading
 import uuid
 
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import reduce
+
 import polib
 
 from django.apps import apps
 from django.conf import settings
 from django.contrib.admin.utils import quote
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import OperationalError, models, transaction
+from django.db import OperationalError, connections, models, router, transaction
 from django.db.migrations.recorder import MigrationRecorder
 from django.db.models import (
     Case,
@@ -24,7 +31,8 @@ from django.db.models import (
     Value,
     When,
 )
-from django.db.models.functions import Coalesce
+from django.db.models.constants import OnConflict
+from django.db.models.functions import Cast, Coalesce
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.urls import reverse
@@ -64,8 +72,11 @@ from .segments import (
 )
 from .segments.extract import extract_segments
 from .segments.ingest import ingest_segments
-from .strings import StringValue, validate_translation_links
+from .strings import StringValue
 from .tasks import background
+from .translation_memory import update_index_on_commit
+from .validation import translation_validator
+from .xliff import SOURCE_FILE_ID, InvalidXLIFFFile, stream_xliff
 
 
 def pk(obj):
@@ -98,6 +109,27 @@ def pk(obj):
         return obj
 
 
+def stream_po(po, entries):
+    """
+    Yields the text of a PO file an entry at a time, so the entries don't need to be held in
+    memory.
+
+    The text is identical to ``str(po)`` after appending the entries to ``po``, as long as any
+    obsolete entries come after the others, which is where polib puts them.
+
+    Args:
+        po (polib.POFile): A POFile with the metadata of the file, and no entries.
+        entries (iterable of polib.POEntry): The entries of the file.
+
+    Yields:
+        str: The header and metadata of the file, then each entry.
+    """
+    yield str(po)
+
+    for entry in entries:
+        yield "\n" + entry.__unicode__(po.wrapwidth)
+
+
 def get_edit_url(instance):
     """
     Returns the URL of the given instance.
@@ -585,44 +617,79 @@ class TranslationSource(models.Model):
             id__in=seen_overridable_segment_ids
         ).delete()
 
-    def export_po(self):
+    def get_po_file(self):
         """
-        Exports all translatable strings from this source.
-
-        Note that because there is no target locale, all `msgstr` fields will be blank.
+        Returns an empty PO file with the metadata of an export of this source.
 
         Returns:
-            polib.POFile: A POFile object containing the source translatable strings.
+            polib.POFile: A POFile object with no entries.
         """
-        # Get messages
-        messages = []
-
-        for string_segment in (
-            StringSegment.objects.filter(source=self)
-            .order_by("order")
-            .select_related("context", "string")
-        ):
-            messages.append((string_segment.string.data, string_segment.context.path))
-
-        # Build a PO file
         po = polib.POFile(wrapwidth=200)
         po.metadata = {
             "POT-Creation-Date": str(timezone.now()),
             "MIME-Version": "1.0",
             "Content-Type": "text/plain; charset=utf-8",
         }
+        return po
 
-        for text, context in messages:
-            po.append(
-                polib.POEntry(
-                    msgid=text,
-                    msgctxt=context,
-                    msgstr="",
-                )
-            )
+    def get_po_entries(self):
+        """
+        Yields a PO entry for each translatable string in this source, in order, without loading
+        them all into memory.
+
+        Yields:
+            polib.POEntry: The entries, with a blank `msgstr`.
+        """
+        for data, path in (
+            StringSegment.objects.filter(source=self)
+            .order_by("order")
+            .values_list("string__data", "context__path")
+            .iterator()
+        ):
+            yield polib.POEntry(msgid=data, msgctxt=path, msgstr="")
+
+    def export_po(self):
+        """
+        Exports all translatable strings from this source.
 
+        Note that because there is no target locale, all `msgstr` fields will be blank.
+
+        Returns:
+            polib.POFile: A POFile object containing the source translatable strings.
+        """
+        po = self.get_po_file()
+        po.extend(self.get_po_entries())
         return po
 
+    def stream_po(self):
+        """
+        Exports all translatable strings from this source, as the text of a PO file that is
+        generated while it's being read. The text is identical to ``str(self.export_po())``.
+
+        Yields:
+            str: Parts of the PO file.
+        """
+        return stream_po(self.get_po_file(), self.get_po_entries())
+
+    def stream_xliff(self):
+        """
+        Exports all translatable strings from this source, as the text of an XLIFF 2.0 file that
+        is generated while it's being read.
+
+        Note that because there is no target locale, the units have no targets. The file can be
+        imported into any translation of this source once it's been translated.
+
+        Yields:
+            str: Parts of the XLIFF file.
+        """
+        return stream_xliff(
+            SOURCE_FILE_ID,
+            self.locale.language_code,
+            None,
+            ((entry.msgid, entry.msgctxt, "") for entry in self.get_po_entries()),
+            original=self.object_repr,
+        )
+
     def _get_segments_for_translation(self, locale, fallback=False):
         """
         Returns a list of segments that can be passed into "ingest_segments" to translate an object.
@@ -831,42 +898,40 @@ class TranslationSource(models.Model):
             # If the validation error's field matches the context of a translation,
             # set that error message on that translation.
             # TODO (someday): Add support for errors raised from streamfield
-            for field_name, errors in e.error_dict.items():
-                try:
-                    context = TranslationContext.objects.get(
-                        object=self.object, path=field_name
-                    )
-
-                except TranslationContext.DoesNotExist:
-                    # TODO (someday): How would we handle validation errors for non-translatable fields?
-                    continue
-
-                # Check for string translation
-                try:
-                    string_translation = StringTranslation.objects.get(
-                        translation_of_id__in=StringSegment.objects.filter(
-                            source=self
-                        ).values_list("string_id", flat=True),
-                        context=context,
-                        locale=locale,
-                    )
-
-                    string_translation.set_field_error(errors)
-
-                except StringTranslation.DoesNotExist:
-                    pass
-
-                # Check for segment override
-                try:
-                    segment_override = SegmentOverride.objects.get(
-                        context=context,
-                        locale=locale,
-                    )
-
-                    segment_override.set_field_error(errors)
+            # TODO (someday): How would we handle validation errors for non-translatable fields?
+            # The errors are written with one query for each model, however many fields failed
+            contexts = dict(
+                TranslationContext.objects.filter(
+                    object=self.object, path__in=e.error_dict.keys()
+                ).values_list("id", "path")
+            )
+            if contexts:
+                # TODO (someday): We currently only support one error at a time
+                field_error = Case(
+                    *(
+                        When(
+                            context_id=context_id,
+                            then=Value(e.error_dict[path][0].messages[0]),
+                        )
+                        for context_id, path in contexts.items()
+                    ),
+                    output_field=models.TextField(),
+                )
 
-                except SegmentOverride.DoesNotExist:
-                    pass
+                # Check for string translations
+                StringTranslation.objects.filter(
+                    translation_of_id__in=StringSegment.objects.filter(
+                        source=self
+                    ).values_list("string_id", flat=True),
+                    context_id__in=contexts.keys(),
+                    locale=locale,
+                ).update(has_error=True, field_error=field_error)
+
+                # Check for segment overrides
+                SegmentOverride.objects.filter(
+                    context_id__in=contexts.keys(),
+                    locale=locale,
+                ).update(has_error=True, field_error=field_error)
 
             raise
 
@@ -1064,6 +1129,8 @@ class Translation(models.Model):
         created_at (DateTimeField): The date/time the translation was started.
         translations_last_updated_at (DateTimeField): The date/time of when a translated string was last updated.
         destination_last_updated_at (DateTimeField): The date/time of when the destination object was last updated.
+        last_exported_at (DateTimeField): The date/time of when the translation was last exported as a delta PO file.
+            The next delta export includes the strings that have changed since then.
         enabled (boolean): Whether this translation is enabled or not.
     """
 
@@ -1081,8 +1148,16 @@ class Translation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     translations_last_updated_at = models.DateTimeField(null=True)
     destination_last_updated_at = models.DateTimeField(null=True)
+    last_exported_at = models.DateTimeField(null=True)
     enabled = models.BooleanField(default=True)
 
+    # The database backends that `fill_from_translation_memory` copies translations on with an
+    # INSERT ... SELECT query. The others use a bulk insert
+    INSERT_SELECT_VENDORS = {"postgresql", "sqlite"}
+
+    # The maximum number of strings to look up in one query when importing translations
+    IMPORT_LOOKUP_BATCH_SIZE = 500
+
     class Meta:
         unique_together = [
             ("source", "target_locale"),
@@ -1095,14 +1170,62 @@ class Translation(models.Model):
         """
         Fetches the translated instance from the database.
 
+        If the instance was fetched by `prefetch_target_instances`, that instance is returned.
+
         Raises:
             Model.DoesNotExist: if the translation does not exist.
 
         Returns:
             Model: The translated instance.
         """
+        if hasattr(self, "_prefetched_target_instance"):
+            if self._prefetched_target_instance is None:
+                raise (
+                    ContentType.objects.get_for_id(self.source.specific_content_type_id)
+                    .model_class()
+                    .DoesNotExist
+                )
+
+            return self._prefetched_target_instance
+
         return self.source.get_translated_instance(self.target_locale)
 
+    @classmethod
+    def prefetch_target_instances(cls, translations):
+        """
+        Fetches the translated instances of several translations, with one query for each model,
+        so `get_target_instance` doesn't query the database for each of them.
+
+        Args:
+            translations (iterable of Translation): The translations. Select their source to avoid
+                a query for each one.
+        """
+        translations_by_model = defaultdict(list)
+        for translation in translations:
+            model = ContentType.objects.get_for_id(
+                translation.source.specific_content_type_id
+            ).model_class()
+            translations_by_model[model].append(translation)
+
+        for model, model_translations in translations_by_model.items():
+            instances = {
+                (instance.translation_key, instance.locale_id): instance
+                for instance in model._base_manager.filter(
+                    translation_key__in={
+                        translation.source.object_id
+                        for translation in model_translations
+                    },
+                    locale_id__in={
+                        translation.target_locale_id
+                        for translation in model_translations
+                    },
+                )
+            }
+            for translation in model_translations:
+                translation._prefetched_target_instance = instances.get(
+                    (translation.source.object_id, translation.target_locale_id)
+                )
+
     def get_target_instance_edit_url(self):
         """
         Returns the URL to edit the target instance.
@@ -1166,33 +1289,17 @@ class Translation(models.Model):
         else:
             return _("Waiting for translations")
 
-    def export_po(self):
+    def get_po_file(self, delta=False, since=None):
         """
-        Exports all translatable strings with any translations that have already been made.
+        Returns an empty PO file with the metadata of an export of this translation.
+
+        Args:
+            delta (boolean, optional): Whether this is a delta export.
+            since (datetime, optional): The time a delta export includes the changes since.
 
         Returns:
-            polib.POFile: A POFile object containing the source translatable strings and any translations.
+            polib.POFile: A POFile object with no entries.
         """
-        # Get messages
-        messages = []
-
-        string_segments = (
-            StringSegment.objects.filter(source=self.source)
-            .order_by("order")
-            .select_related("context", "string")
-            .annotate_translation(self.target_locale, include_errors=True)
-        )
-
-        for string_segment in string_segments:
-            messages.append(
-                (
-                    string_segment.string.data,
-                    string_segment.context.path,
-                    string_segment.translation,
-                )
-            )
-
-        # Build a PO file
         po = polib.POFile(wrapwidth=200)
         po.metadata = {
             "POT-Creation-Date": str(timezone.now()),
@@ -1200,21 +1307,99 @@ class Translation(models.Model):
             "Content-Type": "text/plain; charset=utf-8",
             "X-WagtailLocalize-TranslationID": str(self.uuid),
         }
+        if delta and since is not None:
+            po.metadata["X-WagtailLocalize-ChangedSince"] = str(since)
+        return po
+
+    def get_delta_since(self, delta, since):
+        """
+        Returns the time a delta export includes the changes since, which defaults to the last
+        delta export of this translation.
+        """
+        if delta and since is None:
+            return self.last_exported_at
+
+        return since
+
+    def mark_exported(self, exported_at=None):
+        """
+        Records when this translation was exported as a delta file, so the next delta export only
+        includes the strings that have changed since then. Call it once the file has been sent.
+
+        Args:
+            exported_at (datetime, optional): When the export started. Defaults to now.
+        """
+        self.last_exported_at = exported_at or timezone.now()
+        Translation.objects.filter(pk=self.pk).update(
+            last_exported_at=self.last_exported_at
+        )
+
+    def get_segment_translations(self, delta=False, since=None):
+        """
+        Yields each translatable string with any translation that has already been made, in
+        order. The strings are read with a database cursor, so they aren't all loaded into memory.
 
-        for text, context, translation in messages:
-            po.append(
-                polib.POEntry(
-                    msgid=text,
-                    msgctxt=context,
-                    msgstr=translation or "",
+        Args:
+            delta (boolean, optional): Set to True to only yield the strings that changed after
+                `since`, and the strings that don't have a translation without errors. This is
+                done with a single query, which excludes the translated strings with an anti-join.
+            since (datetime, optional): The time to include the changed strings since. If this
+                isn't given, all strings are considered changed.
+
+        Yields:
+            tuple[str, str, str]: The source string, context path and translation. The
+            translation is blank if there isn't one yet.
+        """
+        segments = StringSegment.objects.filter(source=self.source)
+        if delta and since is not None:
+            segments = segments.filter(
+                Q(created_at__gt=since)
+                | ~Exists(
+                    StringTranslation.objects.filter(
+                        translation_of_id=OuterRef("string_id"),
+                        locale_id=self.target_locale_id,
+                        context_id=OuterRef("context_id"),
+                        has_error=False,
+                    )
                 )
             )
 
+        for data, path, translation in (
+            segments.order_by("order")
+            .annotate_translation(self.target_locale, include_errors=True)
+            .values_list("string__data", "context__path", "translation")
+            .iterator()
+        ):
+            yield data, path, translation or ""
+
+    def get_po_entries(self, delta=False, since=None):
+        """
+        Yields a PO entry for each translatable string with any translation that has already been
+        made, followed by the obsolete entries. The strings are read with a database cursor, so
+        they aren't all loaded into memory.
+
+        Args:
+            delta (boolean, optional): Set to True to only yield the entries of strings that
+                changed after `since`, or that don't have a translation without errors. Obsolete
+                entries are left out.
+            since (datetime, optional): The time to include the changed strings since.
+
+        Yields:
+            polib.POEntry: The entries.
+        """
+        for data, path, translation in self.get_segment_translations(
+            delta=delta, since=since
+        ):
+            yield polib.POEntry(msgid=data, msgctxt=path, msgstr=translation)
+
+        if delta:
+            return
+
         # Add any obsolete segments that have translations for future reference
         # We find this by looking for obsolete contexts and annotate the latest
         # translation for each one. Contexts that were never translated are
         # excluded
-        for translation in (
+        for data, path, translation in (
             StringTranslation.objects.filter(
                 context__object_id=self.source.object_id, locale=self.target_locale
             )
@@ -1223,21 +1408,208 @@ class Translation(models.Model):
                     source=self.source
                 ).values_list("string_id", flat=True)
             )
-            .select_related("translation_of", "context")
+            .values_list("translation_of__data", "context__path", "data")
             .iterator()
         ):
-            po.append(
-                polib.POEntry(
-                    msgid=translation.translation_of.data,
-                    msgstr=translation.data or "",
-                    msgctxt=translation.context.path,
-                    obsolete=True,
-                )
+            yield polib.POEntry(
+                msgid=data,
+                msgstr=translation or "",
+                msgctxt=path,
+                obsolete=True,
             )
 
+    def export_po(self, delta=False, since=None):
+        """
+        Exports all translatable strings with any translations that have already been made.
+
+        A delta export only includes the strings whose source changed since a given time, which
+        defaults to this translation's last delta export, and the strings that don't have a
+        translation without errors yet. Call `mark_exported` to record when the file was exported.
+
+        Args:
+            delta (boolean, optional): Set to True to make a delta export.
+            since (datetime, optional): The time to include the changed strings since, for a
+                delta export. Defaults to `last_exported_at`. If the translation hasn't had a delta
+                export before, all strings are included.
+
+        Returns:
+            polib.POFile: A POFile object containing the source translatable strings and any translations.
+        """
+        since = self.get_delta_since(delta, since)
+        po = self.get_po_file(delta=delta, since=since)
+        po.extend(self.get_po_entries(delta=delta, since=since))
         return po
 
-    @transaction.atomic
+    def stream_po(self, delta=False, since=None):
+        """
+        Exports all translatable strings with any translations that have already been made, as the
+        text of a PO file that is generated while it's being read. The text is identical to
+        ``str(self.export_po())``.
+
+        Takes the same arguments as `export_po`.
+
+        Yields:
+            str: Parts of the PO file.
+        """
+        since = self.get_delta_since(delta, since)
+        return stream_po(
+            self.get_po_file(delta=delta, since=since),
+            self.get_po_entries(delta=delta, since=since),
+        )
+
+    def stream_xliff(self):
+        """
+        Exports all translatable strings with any translations that have already been made, as the
+        text of an XLIFF 2.0 file that is generated while it's being read.
+
+        Unlike PO files, obsolete translations aren't included.
+
+        Yields:
+            str: Parts of the XLIFF file.
+        """
+        return stream_xliff(
+            str(self.uuid),
+            self.source.locale.language_code,
+            self.target_locale.language_code,
+            self.get_segment_translations(),
+            original=self.source.object_repr,
+        )
+
+    def fill_from_translation_memory(self, user=None):
+        """
+        Pre-fills the untranslated segments of this translation with the translations their strings
+        already have into the target locale, in other contexts.
+
+        For each string, the most recently updated manual translation without errors is copied,
+        and marked with the "Translation memory" tool name. Segments that are already translated
+        aren't changed.
+
+        The translations are copied with a single ``INSERT ... SELECT`` query where the database
+        supports it. Otherwise, they are fetched and then inserted in bulk.
+
+        Note: This doesn't update the translated object, so call `save_target` afterwards.
+
+        Args:
+            user (User, optional): The user to record as the translator.
+
+        Returns:
+            int: The number of translations that were added.
+        """
+        # The translations are read from and written to the same database, in one query if possible
+        using = router.db_for_write(StringTranslation)
+        db_connection = connections[using]
+
+        now = timezone.now()
+        segments = (
+            StringSegment.objects.using(using)
+            .filter(source_id=self.source_id)
+            .exclude(
+                Exists(
+                    StringTranslation.objects.filter(
+                        translation_of_id=OuterRef("string_id"),
+                        locale_id=self.target_locale_id,
+                        context_id=OuterRef("context_id"),
+                    )
+                )
+            )
+            .annotate(
+                translation_memory=Subquery(
+                    StringTranslation.get_translation_memory_query(
+                        OuterRef("string_id"), self.target_locale_id
+                    )
+                )
+            )
+            .filter(translation_memory__isnull=False)
+            .order_by()
+        )
+
+        if db_connection.vendor not in self.INSERT_SELECT_VENDORS:
+            string_translations = [
+                StringTranslation(
+                    translation_of_id=string_id,
+                    locale_id=self.target_locale_id,
+                    context_id=context_id,
+                    data=data,
+                    translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+                    tool_name=StringTranslation.TOOL_NAME_TRANSLATION_MEMORY,
+                    last_translated_by=user,
+                )
+                for string_id, context_id, data in segments.values_list(
+                    "string_id", "context_id", "translation_memory"
+                ).distinct()
+            ]
+            StringTranslation.objects.using(using).bulk_create(
+                string_translations, ignore_conflicts=True
+            )
+            update_index_on_commit(
+                indexed={
+                    (string_translation.translation_of_id, self.target_locale_id)
+                    for string_translation in string_translations
+                }
+            )
+            return len(string_translations)
+
+        user_field = StringTranslation._meta.get_field("last_translated_by")
+        columns = {
+            "translation_of": F("string_id"),
+            "locale": Cast(
+                Value(self.target_locale_id),
+                output_field=StringTranslation._meta.get_field("locale").target_field,
+            ),
+            "context": F("context_id"),
+            "data": F("translation_memory"),
+            "translation_type": Value(StringTranslation.TRANSLATION_TYPE_MANUAL),
+            "tool_name": Value(StringTranslation.TOOL_NAME_TRANSLATION_MEMORY),
+            "last_translated_by": Cast(
+                Value(pk(user)), output_field=user_field.target_field
+            ),
+            "created_at": Cast(Value(now), output_field=models.DateTimeField()),
+            "updated_at": Cast(Value(now), output_field=models.DateTimeField()),
+            "has_error": Value(False),
+            "field_error": Value(""),
+        }
+        select_sql, params = (
+            segments.annotate(
+                **{
+                    f"translation_memory_{name}": value
+                    for name, value in columns.items()
+                }
+            )
+            .values(*[f"translation_memory_{name}" for name in columns])
+            .distinct()
+            .query.get_compiler(using)
+            .as_sql()
+        )
+
+        fields = [StringTranslation._meta.get_field(name) for name in columns]
+        sql = "{insert} {table} ({columns}) {select} {on_conflict}".format(
+            insert=db_connection.ops.insert_statement(on_conflict=OnConflict.IGNORE),
+            table=db_connection.ops.quote_name(StringTranslation._meta.db_table),
+            columns=", ".join(
+                db_connection.ops.quote_name(field.column) for field in fields
+            ),
+            select=select_sql,
+            on_conflict=db_connection.ops.on_conflict_suffix_sql(
+                fields, OnConflict.IGNORE, None, None
+            ),
+        )
+        with db_connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            added = cursor.rowcount
+
+        if added:
+            # Strings that were already indexed for the locale are skipped
+            update_index_on_commit(
+                indexed=(
+                    (string_id, self.target_locale_id)
+                    for string_id in StringSegment.objects.using(using)
+                    .filter(source_id=self.source_id)
+                    .values_list("string_id", flat=True)
+                )
+            )
+
+        return added
+
     def import_po(
         self, po, delete=False, user=None, translation_type="manual", tool_name=""
     ):
@@ -1255,81 +1627,225 @@ class Translation(models.Model):
             list[POImportWarning]: A list of POImportWarning objects representing any non-fatal issues that were
             encountered while importing the PO file.
         """
-        seen_translation_ids = set()
-        warnings = []
-
         if "X-WagtailLocalize-TranslationID" in po.metadata and po.metadata[
             "X-WagtailLocalize-TranslationID"
         ] != str(self.uuid):
             return []
 
-        for index, entry in enumerate(po):
-            try:
-                # Filter by hash instead to avoid case sensitivity issues
-                # https://github.com/wagtail/wagtail-localize/issues/758
-                string = String.objects.get(
-                    locale_id=self.source.locale_id,
-                    data_hash=String._get_data_hash(entry.msgid),
-                )
-                context = TranslationContext.objects.get(
-                    object_id=self.source.object_id, path=entry.msgctxt
-                )
+        return self.import_translations(
+            ((entry.msgid, entry.msgctxt, entry.msgstr) for entry in po),
+            delete=delete,
+            user=user,
+            translation_type=translation_type,
+            tool_name=tool_name,
+        )
 
-                # Ignore blank strings
-                if not entry.msgstr:
-                    continue
+    def import_xliff(
+        self, xliff, delete=False, user=None, translation_type="manual", tool_name=""
+    ):
+        """
+        Imports the translations in an XLIFF 2.0 file. The file is parsed a unit at a time, but all
+        of its units are read before any are imported, so nothing is imported from a file that turns
+        out to be invalid part way through.
 
-                # Ignore if the string doesn't appear in this context, and if there is not an obsolete StringTranslation
-                if (
-                    not StringSegment.objects.filter(
-                        string=string, context=context
-                    ).exists()
-                    and not StringTranslation.objects.filter(
-                        translation_of=string, context=context
-                    ).exists()
-                ):
-                    warnings.append(
-                        StringNotUsedInContext(index, entry.msgid, entry.msgctxt)
-                    )
-                    continue
+        Args:
+            xliff (XLIFFFile): The XLIFF file, which is exported by ``stream_xliff``.
+            delete (boolean, optional): Set to True to delete any translations that do not appear in the XLIFF file.
+            user (User, optional): The user who is performing this operation. Used for logging purposes.
+            translation_type ('manual' or 'machine', optional): Whether the translation was performed by a human or machine. Defaults to 'manual'.
+            tool_name (string, optional): The name of the tool that was used to perform the translation. Defaults to ''.
 
-                string_translation, created = string.translations.get_or_create(
-                    locale_id=self.target_locale_id,
-                    context=context,
-                    defaults={
-                        "data": entry.msgstr,
-                        "updated_at": timezone.now(),
-                        "translation_type": translation_type,
-                        "tool_name": tool_name,
-                        "last_translated_by": user,
-                        "has_error": False,
-                        "field_error": "",
-                    },
+        Returns:
+            list[POImportWarning]: A list of POImportWarning objects representing any non-fatal issues that were
+            encountered while importing the XLIFF file. The index of each warning is the index of its unit.
+
+        Raises:
+            InvalidXLIFFFile: If the file was exported for a different translation, or its units
+                can't be read.
+        """
+        if xliff.file_id not in [str(self.uuid), SOURCE_FILE_ID]:
+            raise InvalidXLIFFFile(
+                _(
+                    "Cannot import XLIFF file that was created for a different translation."
                 )
+            )
 
-                seen_translation_ids.add(string_translation.id)
+        return self.import_translations(
+            xliff,
+            delete=delete,
+            user=user,
+            translation_type=translation_type,
+            tool_name=tool_name,
+        )
 
-                if not created and string_translation.data != entry.msgstr:
-                    # Update the string_translation only if it has changed
-                    string_translation.data = entry.msgstr
-                    string_translation.translation_type = translation_type
-                    string_translation.tool_name = tool_name
-                    string_translation.last_translated_by = user
-                    string_translation.updated_at = timezone.now()
-                    string_translation.has_error = False  # reset the error flag.
-                    string_translation.save()
+    @transaction.atomic
+    def import_translations(
+        self, entries, delete=False, user=None, translation_type="manual", tool_name=""
+    ):
+        """
+        Imports translations of the source strings, such as the entries of a PO file.
 
-            except TranslationContext.DoesNotExist:
-                warnings.append(UnknownContext(index, entry.msgctxt))
+        Everything the entries refer to is loaded up front with a few queries, and the translations
+        that were added or changed are written in bulk, so the number of queries doesn't grow with
+        the number of entries.
 
-            except String.DoesNotExist:
-                warnings.append(UnknownString(index, entry.msgid))
+        Args:
+            entries (iterable of tuple[str, str, str]): The source string, context path and
+                translation of each entry, in the same format as the msgid, msgctxt and msgstr of
+                a PO file entry.
+            delete (boolean, optional): Set to True to delete any translations that do not appear in the entries.
+            user (User, optional): The user who is performing this operation. Used for logging purposes.
+            translation_type ('manual' or 'machine', optional): Whether the translation was performed by a human or machine. Defaults to 'manual'.
+            tool_name (string, optional): The name of the tool that was used to perform the translation. Defaults to ''.
 
-        # Delete any translations that weren't mentioned
-        if delete:
+        Returns:
+            list[POImportWarning]: A list of POImportWarning objects representing any non-fatal issues that were
+            encountered while importing the entries. The index of each warning is the index of its entry.
+        """
+        entries = list(entries)
+        warnings = []
+
+        # Filter by hash instead to avoid case sensitivity issues
+        # https://github.com/wagtail/wagtail-localize/issues/758
+        data_hashes = list({String._get_data_hash(msgid) for msgid, _, _ in entries})
+        strings = {}
+        for i in range(0, len(data_hashes), self.IMPORT_LOOKUP_BATCH_SIZE):
+            strings.update(
+                (string.data_hash, string)
+                for string in String.objects.filter(
+                    locale_id=self.source.locale_id,
+                    data_hash__in=data_hashes[i : i + self.IMPORT_LOOKUP_BATCH_SIZE],
+                ).only("id", "data", "data_hash")
+            )
+
+        contexts = {
+            context.path: context
+            for context in TranslationContext.objects.filter(
+                object_id=self.source.object_id
+            )
+        }
+
+        # The strings that are used in each context, either by a segment or by an obsolete
+        # StringTranslation
+        used_in_context = set(
+            StringSegment.objects.filter(
+                context__object_id=self.source.object_id
+            ).values_list("string_id", "context_id")
+        )
+        used_in_context.update(
             StringTranslation.objects.filter(
-                context__object_id=self.source.object_id, locale=self.target_locale
-            ).exclude(id__in=seen_translation_ids).delete()
+                context__object_id=self.source.object_id
+            ).values_list("translation_of_id", "context_id")
+        )
+
+        string_translations = {
+            (string_translation.translation_of_id, string_translation.context_id): (
+                string_translation
+            )
+            for string_translation in StringTranslation.objects.filter(
+                context__object_id=self.source.object_id,
+                locale_id=self.target_locale_id,
+            ).select_related("context")
+        }
+
+        now = timezone.now()
+        seen = set()
+        created = {}
+        updated = {}
+        for index, (msgid, msgctxt, msgstr) in enumerate(entries):
+            string = strings.get(String._get_data_hash(msgid))
+            if string is None:
+                warnings.append(UnknownString(index, msgid))
+                continue
+
+            context = contexts.get(msgctxt)
+            if context is None:
+                warnings.append(UnknownContext(index, msgctxt))
+                continue
+
+            # Ignore blank strings
+            if not msgstr:
+                continue
+
+            # Ignore if the string doesn't appear in this context, and if there is not an obsolete StringTranslation
+            key = (string.id, context.id)
+            if key not in used_in_context:
+                warnings.append(StringNotUsedInContext(index, msgid, msgctxt))
+                continue
+
+            seen.add(key)
+            string_translation = string_translations.get(key)
+            if string_translation is None:
+                string_translation = StringTranslation(
+                    translation_of=string,
+                    locale_id=self.target_locale_id,
+                    context=context,
+                    data=msgstr,
+                    updated_at=now,
+                    translation_type=translation_type,
+                    tool_name=tool_name,
+                    last_translated_by=user,
+                    has_error=False,
+                    field_error="",
+                )
+                string_translations[key] = created[key] = string_translation
+
+            elif string_translation.data != msgstr:
+                # Update the string_translation only if it has changed
+                string_translation.data = msgstr
+                string_translation.translation_type = translation_type
+                string_translation.tool_name = tool_name
+                string_translation.last_translated_by = user
+                string_translation.updated_at = now
+                string_translation.has_error = False  # reset the error flag.
+                if key not in created:
+                    updated[key] = string_translation
+
+        # Flag invalid translations, as StringTranslation.save() does
+        changed = [*created.values(), *updated.values()]
+        source_data = {string.id: string.data for string in strings.values()}
+        verdicts = translation_validator.validate_many(
+            (source_data[string_translation.translation_of_id], string_translation.data)
+            for string_translation in changed
+        )
+        for string_translation, is_valid in zip(changed, verdicts, strict=True):
+            string_translation.has_error = not is_valid
+
+        StringTranslation.objects.bulk_create(created.values())
+        StringTranslation.objects.bulk_update(
+            updated.values(),
+            [
+                "data",
+                "translation_type",
+                "tool_name",
+                "last_translated_by",
+                "updated_at",
+                "has_error",
+            ],
+        )
+
+        update_index_on_commit(
+            indexed=[
+                (string_translation.translation_of_id, string_translation.locale_id)
+                for string_translation in changed
+            ]
+        )
+
+        with sync_page_draft_titles() as sync:
+            for string_translation in changed:
+                sync.add(string_translation)
+
+            # Delete any translations that weren't mentioned
+            if delete:
+                unseen_ids = [
+                    string_translation.id
+                    for key, string_translation in string_translations.items()
+                    if key not in seen
+                ]
+                for i in range(0, len(unseen_ids), self.IMPORT_LOOKUP_BATCH_SIZE):
+                    StringTranslation.objects.filter(
+                        id__in=unseen_ids[i : i + self.IMPORT_LOOKUP_BATCH_SIZE]
+                    ).delete()
 
         return warnings
 
@@ -1641,6 +2157,9 @@ class StringTranslation(models.Model):
         (TRANSLATION_TYPE_MACHINE, gettext_lazy("Machine")),
     ]
 
+    # The tool name of translations that were copied from another context of the same string
+    TOOL_NAME_TRANSLATION_MEMORY = "Translation memory"
+
     translation_of = models.ForeignKey(
         String, on_delete=models.CASCADE, related_name="translations"
     )
@@ -1679,21 +2198,41 @@ class StringTranslation(models.Model):
         return f"StringTranslation: {self.translation_of_id}, {self.locale_id}, {self.context_id}, {self.translation_type}"
 
     def save(self, *args, **kwargs):
-        update_fields = kwargs.get("update_fields")
-        super().save(*args, **kwargs)
-
         # Set has_error if the string is invalid.
         # Since we allow translations to be made by external tools, we need to allow invalid
         # HTML in the database so that it can be fixed in Wagtail. However, we do want to know
         # if any strings are invalid so we don't use them on a page.
+        update_fields = kwargs.get("update_fields")
         updating_data = update_fields is None or "data" in update_fields
-        if updating_data and not self.has_error:
-            try:
-                StringValue.from_translated_html(self.data)
-                validate_translation_links(self.translation_of.data, self.data)
-            except ValueError:
-                self.has_error = True
-                self.save(update_fields=["has_error"])
+        if (
+            updating_data
+            and not self.has_error
+            and not translation_validator.is_valid(self.translation_of.data, self.data)
+        ):
+            self.has_error = True
+            if update_fields is not None and "has_error" not in update_fields:
+                kwargs["update_fields"] = [*update_fields, "has_error"]
+
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def validate_data(source_data, data):
+        """
+        Checks that a translation is valid HTML, and links to the same places as its source string.
+
+        The verdict is cached, see `wagtail_localize.validation`. To check many translations at
+        once, use `translation_validator.validate_many`.
+
+        Args:
+            source_data (str): The source string.
+            data (str): The translation.
+
+        Raises:
+            ValueError: If the translation is invalid.
+        """
+        error = translation_validator.get_error(source_data, data)
+        if error is not None:
+            raise ValueError(error)
 
     @classmethod
     def from_text(cls, translation_of, locale, context, data):
@@ -1719,6 +2258,57 @@ class StringTranslation(models.Model):
 
         return segment
 
+    @classmethod
+    def get_translation_memory_query(cls, string_id, locale):
+        """
+        Returns a queryset of the data of the translation memory entry for a string, for use in a
+        subquery.
+
+        Args:
+            string_id (int | OuterRef): The ID of the String, or a reference to it from the outer query.
+            locale (Locale | int): The Locale, or ID of the Locale, of the translation.
+
+        Returns:
+            QuerySet: The data of the most recently updated manual translation without errors.
+        """
+        return (
+            cls.objects.filter(
+                translation_of_id=string_id,
+                locale_id=pk(locale),
+                translation_type=cls.TRANSLATION_TYPE_MANUAL,
+                has_error=False,
+                field_error="",
+            )
+            .order_by("-updated_at", "-pk")
+            .values("data")[:1]
+        )
+
+    @classmethod
+    def get_translation_memory(cls, string_ids, locale):
+        """
+        Finds existing human translations of the given strings into a locale, made in any context.
+
+        Translations with errors are ignored. If a string was translated in several contexts, the
+        most recently updated translation is used.
+
+        Args:
+            string_ids (iterable of int): The IDs of the Strings to look up.
+            locale (Locale | int): The Locale, or ID of the Locale, of the translations.
+
+        Returns:
+            dict[int, str]: The translations, keyed by the ID of the String they translate.
+        """
+        return dict(
+            String.objects.filter(pk__in=list(string_ids))
+            .annotate(
+                translation_memory=Subquery(
+                    cls.get_translation_memory_query(OuterRef("pk"), locale)
+                )
+            )
+            .filter(translation_memory__isnull=False)
+            .values_list("pk", "translation_memory")
+        )
+
     def set_field_error(self, error):
         """
         This sets the `has_error`/`field_error` fields to the value of the given ValidationError instance.
@@ -1747,11 +2337,9 @@ class StringTranslation(models.Model):
             return
 
         # Check for HTML validation errors
-        try:
-            StringValue.from_translated_html(self.data)
-            validate_translation_links(self.translation_of.data, self.data)
-        except ValueError as e:
-            return e.args[0]
+        error = translation_validator.get_error(self.translation_of.data, self.data)
+        if error is not None:
+            return error
 
         # Check if a database error was raised when we last attempted to publish
         if self.context is not None and self.field_error:
@@ -1780,24 +2368,175 @@ class StringTranslation(models.Model):
             )
 
 
-@receiver(post_save, sender=StringTranslation)
-def post_save_string_translation(instance, **kwargs):
-    # If the StringTranslation is for a page title, update that page's draft_title field
-    if instance.context.path == "title":
-        # Note: if this StringTranslation isn't for a page, this should do nothing
+class PageDraftTitleSync:
+    """
+    Collects the page titles that are changed by saving or deleting StringTranslations, so the
+    `draft_title` of all of the pages can be updated with one statement.
+
+    Use `sync_page_draft_titles` rather than creating this directly.
+    """
+
+    def __init__(self):
+        # The new draft title of each (context ID, locale ID), or None to reset it to the title
+        self.titles = {}
+
+        # The translation key of each context that is known to be a page title, or None if the
+        # context is known not to be one
+        self.title_contexts = {}
+
+    def add(self, string_translation, deleted=False):
+        """
+        Records the draft title that a saved or deleted StringTranslation gives its page, if it's
+        a translation of a page title.
+
+        The context isn't fetched if it's already been loaded. Otherwise, it's looked up along
+        with the other contexts when the titles are updated.
+        """
+        # Translations that aren't in a context, such as imported translation memory, are skipped
+        if string_translation.context_id is None:
+            return
+
+        context_field = StringTranslation._meta.get_field("context")
+        if context_field.is_cached(string_translation):
+            context = string_translation.context
+            self.title_contexts[context.id] = (
+                context.object_id if context.path == "title" else None
+            )
+
+        if self.title_contexts.get(string_translation.context_id, True) is None:
+            return
+
+        self.titles[(string_translation.context_id, string_translation.locale_id)] = (
+            None if deleted else string_translation.data
+        )
+
+    def get_page_titles(self):
+        """
+        Returns the new draft title of each (translation key, locale ID) of a page, or None to
+        reset it to the page's title.
+        """
+        unknown_context_ids = {
+            context_id
+            for context_id, _locale_id in self.titles
+            if context_id not in self.title_contexts
+        }
+        if unknown_context_ids:
+            title_contexts = dict(
+                TranslationContext.objects.filter(
+                    id__in=unknown_context_ids, path="title"
+                ).values_list("id", "object_id")
+            )
+            for context_id in unknown_context_ids:
+                self.title_contexts[context_id] = title_contexts.get(context_id)
+
+        return {
+            (self.title_contexts[context_id], locale_id): title
+            for (context_id, locale_id), title in self.titles.items()
+            if self.title_contexts[context_id] is not None
+        }
+
+    def update(self):
+        """
+        Updates the draft titles of the pages in one statement.
+
+        Note: if a context isn't for a page, its title does nothing.
+        """
+        page_titles = self.get_page_titles()
+        if not page_titles:
+            return
+
         Page.objects.filter(
-            translation_key=instance.context.object_id, locale_id=instance.locale_id
-        ).update(draft_title=instance.data)
+            reduce(
+                operator.or_,
+                (
+                    Q(translation_key=translation_key, locale_id=locale_id)
+                    for translation_key, locale_id in page_titles
+                ),
+            )
+        ).update(
+            draft_title=Case(
+                *(
+                    When(
+                        translation_key=translation_key,
+                        locale_id=locale_id,
+                        then=F("title") if title is None else Value(title),
+                    )
+                    for (translation_key, locale_id), title in page_titles.items()
+                ),
+                default=F("draft_title"),
+            )
+        )
+
+
+_page_draft_title_sync = threading.local()
+
+
+@contextmanager
+def sync_page_draft_titles():
+    """
+    Collects the page titles that are changed by StringTranslations that are saved or deleted
+    within the block, then updates the `draft_title` of the pages with one statement at the end
+    of the block.
+
+    Outside of these blocks, a page's draft title is updated as soon as the translation of its
+    title is saved or deleted. Use this around code that saves or deletes many StringTranslations,
+    so their page titles aren't looked up and updated one at a time. Blocks can be nested, in
+    which case the titles are updated by the outermost one.
+
+    Yields:
+        PageDraftTitleSync: The titles that will be updated.
+    """
+    sync = getattr(_page_draft_title_sync, "current", None)
+    if sync is not None:
+        yield sync
+        return
+
+    sync = _page_draft_title_sync.current = PageDraftTitleSync()
+    try:
+        yield sync
+    finally:
+        _page_draft_title_sync.current = None
+
+    # The changes are discarded if the block raised an exception
+    sync.update()
+
+
+def update_page_draft_titles(string_translations):
+    """
+    Updates the draft titles of the pages that any of the given StringTranslations are the title of.
+
+    This is called when a StringTranslation is saved. Call it after creating StringTranslations in bulk.
+    The titles are updated with one statement, at the end of the `sync_page_draft_titles` block if
+    this is called within one.
+
+    Args:
+        string_translations (iterable of StringTranslation): The translations that were saved.
+    """
+    with sync_page_draft_titles() as sync:
+        for string_translation in string_translations:
+            sync.add(string_translation)
+
+
+@receiver(post_save, sender=StringTranslation)
+def post_save_string_translation(instance, created, update_fields=None, **kwargs):
+    # Saving only the error flags, as `set_field_error` does, doesn't change the title
+    if update_fields is None or "data" in update_fields:
+        update_page_draft_titles([instance])
+
+    # The index only records which strings are translated into each locale
+    if created:
+        update_index_on_commit(
+            indexed=[(instance.translation_of_id, instance.locale_id)]
+        )
 
 
 @receiver(post_delete, sender=StringTranslation)
 def post_delete_string_translation(instance, **kwargs):
     # If the StringTranslation is for a page title, reset that page's draft title to the main title
-    if instance.context.path == "title":
-        # Note: if this StringTranslation isn't for a page, this should do nothing
-        Page.objects.filter(
-            translation_key=instance.context.object_id, locale_id=instance.locale_id
-        ).update(draft_title=F("title"))
+    with sync_page_draft_titles() as sync:
+        sync.add(instance, deleted=True)
+
+    update_index_on_commit(unindexed=[(instance.translation_of_id, instance.locale_id)])
 
 
 class Template(models.Model):
@@ -2015,12 +2754,15 @@ class StringSegment(BaseSegment):
         source (ForiegnKey[TranslationSource]): The source content that the string was extracted from.
         context (ForeignKey to TranslationContext): The context, which contains the position of the string in the source content.
         order (PositiveIntegerField): The index that this segment appears on the page.
+        created_at (DateTimeField): The date/time the segment was extracted. Segments are replaced when their string
+            or position changes, so this is when the source string last changed.
     """
 
     string = models.ForeignKey(
         String, on_delete=models.CASCADE, related_name="segments"
     )
     attrs = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
 
     objects = StringSegmentQuerySet.as_manager()
 
@@ -2246,9 +2988,10 @@ def cleanup_translation_on_delete(instance, **kwargs):
     translation_key = instance.translation_key
     locale_id = instance.locale_id
 
-    StringTranslation.objects.filter(
-        context__object_id=translation_key, locale=locale_id
-    ).delete()
+    with sync_page_draft_titles():
+        StringTranslation.objects.filter(
+            context__object_id=translation_key, locale=locale_id
+        ).delete()
     SegmentOverride.objects.filter(
         context__object__translation_key=translation_key, locale=locale_id
     ).delete()
@@ -2270,10 +3013,11 @@ def cleanup_translation_on_delete(instance, **kwargs):
         ]:
             model.objects.filter(context__object_id=translation_key).delete()
 
-        for model in [SegmentOverride, StringTranslation]:
-            model.objects.filter(
-                context__object__translation_key=translation_key
-            ).delete()
+        with sync_page_draft_titles():
+            for model in [SegmentOverride, StringTranslation]:
+                model.objects.filter(
+                    context__object__translation_key=translation_key
+                ).delete()
 
         # This will cascade to TranslationSource, TranslationLog, TranslationContext as well as any extracted segments.
         TranslatableObject.objects.filter(translation_key=translation_key).delete()
@@ -2338,13 +3082,216 @@ class LocaleSynchronization(models.Model):
     def sync_trees(self, *, page_index=None):
         from .synctree import synchronize_tree
 
-        background.enqueue(
+        # Repeated saves enqueue identical jobs, only one of them needs to run
+        background.enqueue_on_commit(
             synchronize_tree,
             args=[self.sync_from, self.locale],
             kwargs={"page_index": page_index},
+            key=f"synchronize_tree:{self.sync_from_id}:{self.locale_id}",
+            name=_("Synchronise {locale} from {sync_from}").format(
+                locale=self.locale.get_display_name(),
+                sync_from=self.sync_from.get_display_name(),
+            ),
         )
 
 
 @receiver(post_save, sender=LocaleSynchronization)
 def sync_trees_on_locale_sync_save(instance, **kwargs):
     instance.sync_trees()
+
+
+class LocalizeJob(models.Model):
+    """
+    Records the status of a background job, such as translating a page subtree or synchronising
+    a locale tree.
+
+    Jobs are recorded when they are enqueued with a name through `background.enqueue_on_commit`.
+
+    Attributes:
+        name (CharField): A description of the job to display to the user.
+        func (CharField): The dotted path of the function that the job runs.
+        key (CharField): The key that identical jobs are collapsed by, if there is one.
+        status (CharField with choices): Whether the job is queued, running, completed or failed.
+        progress_done (PositiveIntegerField): The number of items the job has processed.
+        progress_total (PositiveIntegerField): The total number of items the job has to process, if known.
+        error (TextField): The traceback of the exception that made the job fail.
+        created_at (DateTimeField): The date/time the job was enqueued.
+        started_at (DateTimeField): The date/time the job started running.
+        finished_at (DateTimeField): The date/time the job completed or failed.
+    """
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, gettext_lazy("Queued")),
+        (STATUS_RUNNING, gettext_lazy("Running")),
+        (STATUS_COMPLETED, gettext_lazy("Completed")),
+        (STATUS_FAILED, gettext_lazy("Failed")),
+    ]
+
+    name = models.CharField(max_length=255)
+    func = models.CharField(max_length=255)
+    key = models.CharField(max_length=255, blank=True)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True
+    )
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(null=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    started_at = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+
+    def __str__(self):
+        return f"LocalizeJob: {self.name}, {self.status}"
+
+    def get_progress(self):
+        """
+        Gets the current progress of the job.
+
+        While the job is running, this is read from the progress it last reported to the cache.
+
+        Returns:
+            tuple[int, int | None]: A two-tuple of integers. The number of items processed so far and the total
+                number of items, if known.
+        """
+        if self.status == self.STATUS_RUNNING:
+            from .tasks import JobProgress
+
+            progress = caches[background.cache_alias].get(
+                JobProgress.get_cache_key(self.id)
+            )
+            if progress is not None:
+                return tuple(progress)
+
+        return self.progress_done, self.progress_total
+
+    def get_duration(self):
+        """
+        Returns the time the job has been running for, or took to run.
+
+        Returns:
+            timedelta: The duration of the job.
+            None: If the job hasn't started yet.
+        """
+        if self.started_at is None:
+            return
+
+        return (self.finished_at or timezone.now()) - self.started_at
+
+
+class QueuedJob(models.Model):
+    """
+    A job waiting to be run by a `localize_worker` process.
+
+    Jobs are stored here by `DatabaseJobBackend`, and deleted once they have run successfully.
+
+    Attributes:
+        queue (CharField): The name of the queue the job was pushed to.
+        func (CharField): The dotted path of the function that the job runs.
+        payload (BinaryField): The pickled function, positional arguments and keyword arguments.
+        run_at (DateTimeField): The earliest date/time the job may be run.
+        attempts (PositiveIntegerField): The number of times a worker has claimed the job.
+        locked_by (CharField): The name of the worker that has claimed the job.
+        locked_until (DateTimeField): The date/time after which the claim expires and the job becomes
+            visible to other workers again, in case its worker has died.
+        error (TextField): The traceback of the last exception the job raised.
+        failed_at (DateTimeField): The date/time the job ran out of attempts.
+        created_at (DateTimeField): The date/time the job was enqueued.
+    """
+
+    queue = models.CharField(max_length=100, default="default")
+    func = models.CharField(max_length=255)
+    payload = models.BinaryField()
+    run_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveIntegerField(default=0)
+    locked_by = models.CharField(max_length=255, blank=True)
+    locked_until = models.DateTimeField(null=True)
+    error = models.TextField(blank=True)
+    failed_at = models.DateTimeField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["queue", "run_at"]),
+        ]
+
+    def __str__(self):
+        return f"QueuedJob: {self.func}, {self.queue}"
+
+
+class CachedMachineTranslation(models.Model):
+    """
+    A translation of a string from a machine translator, kept so the string isn't sent to the
+    translator again.
+
+    Entries are only reused by the same translator class with the same options.
+
+    Attributes:
+        translator (CharField): The dotted path of the machine translator class.
+        options_fingerprint (CharField): A hash of the translator options that affect its translations.
+        source_locale (ForeignKey to Locale): The locale of the source string.
+        target_locale (ForeignKey to Locale): The locale of the translation.
+        data_hash (UUIDField): The hash of the source string, as in `String.data_hash`.
+        data (TextField): The translated string.
+        created_at (DateTimeField): The date/time the string was translated.
+        last_used_at (DateTimeField): The date/time the translation was last used.
+    """
+
+    translator = models.CharField(max_length=255)
+    options_fingerprint = models.CharField(max_length=64)
+    source_locale = models.ForeignKey(
+        "wagtailcore.Locale", on_delete=models.CASCADE, related_name="+"
+    )
+    target_locale = models.ForeignKey(
+        "wagtailcore.Locale", on_delete=models.CASCADE, related_name="+"
+    )
+    data_hash = models.UUIDField()
+    data = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        unique_together = [
+            (
+                "translator",
+                "options_fingerprint",
+                "source_locale",
+                "target_locale",
+                "data_hash",
+            ),
+        ]
+
+    def __str__(self):
+        return f"CachedMachineTranslation: {self.target_locale_id}, {self.data_hash}"
+
+
+class TranslationMemoryIndexEntry(models.Model):
+    """
+    An entry in the fuzzy translation memory index, see `wagtail_localize.translation_memory`.
+
+    Each string that has been translated into a locale has an entry for each band of its MinHash
+    signature. Strings that share a key are likely to be similar.
+
+    Attributes:
+        string (ForeignKey to String): The source string.
+        locale (ForeignKey to Locale): A locale the string has been translated into.
+        band (PositiveSmallIntegerField): The number of the band.
+        key (BigIntegerField): The hash of the band.
+    """
+
+    string = models.ForeignKey(String, on_delete=models.CASCADE, related_name="+")
+    locale = models.ForeignKey(
+        "wagtailcore.Locale", on_delete=models.CASCADE, related_name="+"
+    )
+    band = models.PositiveSmallIntegerField()
+    key = models.BigIntegerField()
+
+    class Meta:
+        unique_together = [("string", "locale", "band")]
+        indexes = [models.Index(fields=["locale", "key"])]
+
+    def __str__(self):
+        return f"TranslationMemoryIndexEntry: {self.string_id}, {self.locale_id}, {self.band}"
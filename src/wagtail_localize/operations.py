@@ -8,6 +8,7 @@ from django.db import transaction
 from wagtail.models import DraftStateMixin, Page
 
 from wagtail_localize.models import Translation, TranslationSource
+from wagtail_localize.tasks import report_progress
 
 
 class TranslationCreator:
@@ -19,11 +20,20 @@ class TranslationCreator:
 
     This class will track the objects that have already submitted so an object doesn't
     get submitted twice.
+
+    If ``fill_from_translation_memory`` is set, new translations are pre-filled with the
+    translations their strings already have in other contexts. It defaults to the
+    ``WAGTAILLOCALIZE_FILL_FROM_TRANSLATION_MEMORY`` setting.
     """
 
-    def __init__(self, user, target_locales):
+    def __init__(self, user, target_locales, fill_from_translation_memory=None):
         self.user = user
         self.target_locales = target_locales
+        if fill_from_translation_memory is None:
+            fill_from_translation_memory = getattr(
+                settings, "WAGTAILLOCALIZE_FILL_FROM_TRANSLATION_MEMORY", False
+            )
+        self.fill_from_translation_memory = fill_from_translation_memory
         self.seen_objects = set()
         self.mappings = defaultdict(list)
 
@@ -78,6 +88,9 @@ class TranslationCreator:
 
             self.mappings[source].append(translation)
 
+            if created and self.fill_from_translation_memory:
+                translation.fill_from_translation_memory(user=self.user)
+
             # Determine whether to publish the translation.
             if getattr(settings, "WAGTAILLOCALIZE_SYNC_LIVE_STATUS_ON_TRANSLATE", True):
                 publish = getattr(instance, "live", True)
@@ -114,10 +127,16 @@ def translate_page_subtree(page_id, locales, components, user):
     page = Page.objects.get(id=page_id)
 
     translator = TranslationCreator(user, locales)
+    total = page.get_descendants().count()
+    done = 0
 
     def _walk(current_page):
+        nonlocal done
+
         for child_page in current_page.get_children():
             translator.create_translations(child_page)
+            done += 1
+            report_progress(done, total)
 
             if child_page.numchild:
                 _walk(child_page)
@@ -0,0 +1,205 @@
+import uuid
+import zipfile
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+from django.utils.translation import gettext as _
+
+from wagtail_localize.models import Translation, sync_page_draft_titles
+from wagtail_localize.pofiles import InvalidPOFile, get_po_limits, read_po
+
+
+# The number of PO files to look up translations for at once when importing an archive
+IMPORT_BATCH_SIZE = 100
+
+
+class _ArchiveStream:
+    """
+    A write-only file that hands over the data written to it, so a ZIP archive can be sent while
+    it's being written.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def get_po_archive_filename(translation):
+    """
+    Returns the name of the PO file for a translation in an archive. The files are grouped by the
+    language they're translated into.
+    """
+    return f"{translation.target_locale.language_code}/{slugify(translation.source.object_repr)}-{translation.id}.po"
+
+
+def export_po_archive(translations, delta=False):
+    """
+    Exports a PO file for each of the given translations, as a ZIP archive that is generated while
+    it's being read.
+
+    Each PO file is generated with `Translation.stream_po`, so only one is held in memory at a time,
+    and it's compressed as it's generated. For delta exports, the translations are marked as
+    exported once the whole archive has been read, so an archive that isn't read to the end
+    doesn't move the delta forward.
+
+    Args:
+        translations (iterable of Translation): The translations to export. Select their source
+            and target locale to avoid a query for each one.
+        delta (boolean, optional): Set to True to only export the strings that have changed since
+            each translation's last delta export, and the strings that haven't been translated yet.
+
+    Yields:
+        bytes: Parts of the ZIP archive.
+    """
+    stream = _ArchiveStream()
+    exported_at = timezone.now()
+    exported = []
+
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for translation in translations:
+            with archive.open(get_po_archive_filename(translation), "w") as f:
+                for chunk in translation.stream_po(delta=delta):
+                    f.write(chunk.encode("utf-8"))
+
+                    if data := stream.pop():
+                        yield data
+
+            exported.append(translation)
+
+    yield stream.pop()
+
+    if delta:
+        Translation.objects.filter(
+            pk__in=[translation.pk for translation in exported]
+        ).update(last_exported_at=exported_at)
+        for translation in exported:
+            translation.last_exported_at = exported_at
+
+
+class POArchiveImportResult:
+    """
+    The outcome of importing a ZIP archive of PO files.
+
+    Attributes:
+        imported (list of (str, Translation, list of POImportWarning)): The name of each file that
+            was imported, the translation it was imported into, and any warnings about its entries.
+        errors (list of (str, str)): The name of each file that couldn't be imported, and why.
+    """
+
+    def __init__(self):
+        self.imported = []
+        self.errors = []
+
+
+def import_po_archive(
+    archive_file, user=None, can_import=None, batch_size=IMPORT_BATCH_SIZE
+):
+    """
+    Imports the PO files in a ZIP archive, such as one made by `export_po_archive`.
+
+    Each file is imported into the translation named by its ``X-WagtailLocalize-TranslationID``
+    header, whatever the file is called. The translations are looked up for a batch of files at
+    a time, then each file is imported with `Translation.import_po`. The whole archive is
+    imported in one transaction, so nothing is saved if an import fails part way through, and the
+    draft titles of the translated pages are updated together at the end.
+
+    Files that don't end in ``.po`` are ignored.
+
+    Args:
+        archive_file (str | file): The path to the archive, or a file object.
+        user (User, optional): The user to record as the translator.
+        can_import (callable, optional): Called with each translation before importing a file into
+            it. The file is skipped if it returns False.
+        batch_size (int, optional): The number of files to look up translations for at once.
+
+    Returns:
+        POArchiveImportResult: The files that were imported, and the ones that weren't.
+
+    Raises:
+        zipfile.BadZipFile: If the archive isn't a valid ZIP file.
+    """
+    result = POArchiveImportResult()
+
+    with (
+        zipfile.ZipFile(archive_file) as archive,
+        transaction.atomic(),
+        sync_page_draft_titles(),
+    ):
+        max_size, _max_entries = get_po_limits()
+        members = [
+            info
+            for info in archive.infolist()
+            if not info.is_dir() and info.filename.lower().endswith(".po")
+        ]
+
+        for start in range(0, len(members), batch_size):
+            files = []
+            for info in members[start : start + batch_size]:
+                filename = info.filename
+
+                # Check the size before decompressing the file
+                if info.file_size > max_size:
+                    result.errors.append((filename, _("The PO file is too large.")))
+                    continue
+
+                try:
+                    with archive.open(info) as f:
+                        po = read_po(f)
+                except InvalidPOFile as e:
+                    result.errors.append((filename, str(e)))
+                    continue
+
+                try:
+                    translation_id = uuid.UUID(
+                        po.metadata.get("X-WagtailLocalize-TranslationID", "")
+                    )
+                except ValueError:
+                    result.errors.append(
+                        (filename, _("The PO file isn't for a translation."))
+                    )
+                    continue
+
+                files.append((filename, translation_id, po))
+
+            translations = Translation.objects.select_related(
+                "source", "target_locale"
+            ).in_bulk(
+                {translation_id for _filename, translation_id, _po in files},
+                field_name="uuid",
+            )
+            if can_import is not None:
+                Translation.prefetch_target_instances(translations.values())
+
+            for filename, translation_id, po in files:
+                translation = translations.get(translation_id)
+                if translation is None:
+                    result.errors.append(
+                        (filename, _("The translation doesn't exist."))
+                    )
+                    continue
+
+                if can_import is not None and not can_import(translation):
+                    result.errors.append(
+                        (
+                            filename,
+                            _("You don't have permission to edit this translation."),
+                        )
+                    )
+                    continue
+
+                warnings = translation.import_po(po, user=user, tool_name="PO File")
+                result.imported.append((filename, translation, warnings))
+
+    return result
@@ -0,0 +1,106 @@
+import codecs
+import os
+import re
+
+import polib
+
+from django.conf import settings
+from django.utils.translation import gettext as _
+
+
+# The default limits on uploaded PO files, overridden by the WAGTAILLOCALIZE_PO_MAX_SIZE and
+# WAGTAILLOCALIZE_PO_MAX_ENTRIES settings
+PO_MAX_SIZE = 10 * 1024 * 1024
+PO_MAX_ENTRIES = 50000
+
+CHARSET_RE = re.compile(rb'"?Content-Type:.+? charset=([\w_\-:\.]+)')
+
+
+class InvalidPOFile(ValueError):
+    """
+    Raised when an uploaded PO file can't be read, or is over the size or entry limits.
+    """
+
+
+def get_po_limits():
+    """
+    Returns:
+        tuple[int, int]: The maximum size of an uploaded PO file in bytes, and the maximum number
+        of entries in it.
+    """
+    return (
+        getattr(settings, "WAGTAILLOCALIZE_PO_MAX_SIZE", PO_MAX_SIZE),
+        getattr(settings, "WAGTAILLOCALIZE_PO_MAX_ENTRIES", PO_MAX_ENTRIES),
+    )
+
+
+def get_po_encoding(data):
+    """
+    Returns the encoding in the Content-Type header of a PO file, or UTF-8 if it doesn't have one.
+    """
+    match = CHARSET_RE.search(data)
+    if match:
+        encoding = match.group(1).decode("ascii")
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            pass
+        else:
+            return encoding
+
+    return "utf-8"
+
+
+def read_po(file, max_size=None, max_entries=None):
+    """
+    Parses an uploaded PO file in memory.
+
+    Note: polib.pofile accepts either a filename or contents, and reads the file if the contents
+    happen to be the path to one. So we refuse to parse contents that are the path to a file,
+    rather than writing the contents to a temporary file first.
+
+    Args:
+        file (bytes | file): The contents of the file, or a file object to read them from, such as
+            an UploadedFile.
+        max_size (int, optional): The maximum size of the file in bytes. Defaults to the
+            WAGTAILLOCALIZE_PO_MAX_SIZE setting.
+        max_entries (int, optional): The maximum number of entries in the file. Defaults to the
+            WAGTAILLOCALIZE_PO_MAX_ENTRIES setting.
+
+    Returns:
+        polib.POFile: The parsed file.
+
+    Raises:
+        InvalidPOFile: If the file isn't a valid PO file, or is over the limits.
+    """
+    default_max_size, default_max_entries = get_po_limits()
+    if max_size is None:
+        max_size = default_max_size
+    if max_entries is None:
+        max_entries = default_max_entries
+
+    # Don't read more than we need to know the file is too large
+    data = file if isinstance(file, bytes) else file.read(max_size + 1)
+
+    if len(data) > max_size:
+        raise InvalidPOFile(_("The PO file is too large."))
+
+    encoding = get_po_encoding(data)
+    try:
+        contents = data.decode(encoding)
+    except UnicodeDecodeError as e:
+        raise InvalidPOFile(_("Please upload a valid PO file.")) from e
+
+    if os.path.isfile(contents):
+        raise InvalidPOFile(_("Please upload a valid PO file."))
+
+    try:
+        po = polib.pofile(contents, encoding=encoding)
+    except (OSError, UnicodeDecodeError) as e:
+        # Annoyingly, POLib uses OSError for parser exceptions...
+        raise InvalidPOFile(_("Please upload a valid PO file.")) from e
+
+    if len(po) > max_entries:
+        raise InvalidPOFile(_("The PO file has too many entries."))
+
+    return po
@@ -172,6 +172,8 @@ export interface EditorProps {
     links: {
         downloadPofile: string;
         uploadPofile: string;
+        downloadXliff: string;
+        uploadXliff: string;
         unpublishUrl: string;
         lockUrl: string;
         unlockUrl: string;
@@ -77,6 +77,23 @@ const EditorToolbox: FunctionComponent<EditorToolboxProps> = ({
         }
     };
 
+    const uploadXliffForm = React.useRef<HTMLFormElement>(null);
+    const uploadXliffFileInput = React.useRef<HTMLInputElement>(null);
+
+    const onClickUploadXliff = () => {
+        if (uploadXliffFileInput.current) {
+            uploadXliffFileInput.current.click();
+        }
+    };
+
+    const uploadXliff = (e: React.ChangeEvent<HTMLInputElement>) => {
+        e.preventDefault();
+
+        if (uploadXliffForm.current) {
+            uploadXliffForm.current.submit();
+        }
+    };
+
     return (
         <ToolboxWrapper className="w-mt-4">
             <ToolWrapper className="w-tabs__panel">
@@ -129,6 +146,58 @@ const EditorToolbox: FunctionComponent<EditorToolboxProps> = ({
                 </form>
             </ToolWrapper>
 
+            <ToolWrapper className="w-tabs__panel">
+                <p>
+                    {gettext(
+                        'Download XLIFF file and input translations in a CAT tool'
+                    )}
+                </p>
+                <a
+                    className="button button-primary button--icon"
+                    href={links.downloadXliff}
+                    download
+                >
+                    <Icon name="download" /> {gettext('Download XLIFF file')}
+                </a>
+            </ToolWrapper>
+
+            <ToolWrapper className="w-tabs__panel">
+                <p>
+                    {gettext(
+                        'Upload translated XLIFF file to submit translations'
+                    )}
+                </p>
+                <button
+                    className="button button-primary button--icon"
+                    onClick={onClickUploadXliff}
+                >
+                    <Icon name="upload" /> {gettext('Upload XLIFF file')}
+                </button>
+                <form
+                    ref={uploadXliffForm}
+                    action={links.uploadXliff}
+                    method="post"
+                    encType="multipart/form-data"
+                >
+                    <input
+                        type="hidden"
+                        name="csrfmiddlewaretoken"
+                        value={csrfToken}
+                    />
+                    <input
+                        type="hidden"
+                        name="next"
+                        value={window.location.href}
+                    />
+                    <HiddenFileInput
+                        ref={uploadXliffFileInput}
+                        onChange={uploadXliff}
+                        type="file"
+                        name="file"
+                    />
+                </form>
+            </ToolWrapper>
+
             {machineTranslator && (
                 <ToolWrapper>
                     <p>
@@ -1,11 +1,14 @@
 import logging
 
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from django.utils.functional import cached_property
+from django.utils.translation import ngettext
 from wagtail import hooks
 from wagtail.models import Locale, Page
 
+from .tasks import background, pending_callbacks, report_progress
+
 
 logger = logging.getLogger(__name__)
 
@@ -176,8 +179,11 @@ def synchronize_tree(source_locale, target_locale, *, page_index=None):
     # Find pages that are not translated for this locale
     # This includes locales that have a placeholder, it only excludes locales that have an actual translation
     pages_not_in_locale = page_index.not_translated_into(target_locale)
+    total = len(pages_not_in_locale.pages)
+
+    for done, page in enumerate(pages_not_in_locale):
+        report_progress(done, total)
 
-    for page in pages_not_in_locale:
         # Skip pages that do not exist in the source
         if (
             source_locale.id not in page.locales
@@ -196,26 +202,123 @@ def synchronize_tree(source_locale, target_locale, *, page_index=None):
                 target_locale, copy_parents=True, alias=True
             )
 
+    report_progress(total, total)
+
 
 def create_aliases_for_new_page(page):
-    # Check if the source tree needs to be synchronised into any other trees
+    """
+    Creates aliases of the given page in every locale that is synchronised from its locale.
+
+    Args:
+        page (Page): The newly created page.
+    """
+    create_aliases_for_new_pages([page.id])
+
+
+def create_aliases_for_new_pages(page_ids):
+    """
+    Creates aliases of the given pages in every locale that is synchronised from their locales.
+
+    This follows chained synchronisations (for example, fr syncs from en and fr-CA syncs from fr),
+    skips any locale that already has a version of the page and processes pages in tree order, so a
+    parent created in the same batch is aliased before its children. When a locale is skipped, the
+    locales that are synchronised from it are still aliased from its existing version of the page.
+
+    Note: Pages are passed by ID since this function may be called with an async worker.
+
+    Args:
+        page_ids (list[int]): The IDs of the newly created pages.
+    """
     from .models import LocaleSynchronization
 
-    locales_to_sync_to = Locale.objects.filter(
-        id__in=(
-            LocaleSynchronization.objects.filter(
-                sync_from_id=page.locale_id
-            ).values_list("locale_id", flat=True)
-        )
-    )
+    # Map each locale to the locales that are synchronised from it
+    sync_targets = defaultdict(list)
+    for sync_from_id, locale_id in LocaleSynchronization.objects.values_list(
+        "sync_from_id", "locale_id"
+    ):
+        sync_targets[sync_from_id].append(locale_id)
 
-    # Create aliases in all those locales
-    for locale in locales_to_sync_to:
-        new_alias = page.copy_for_translation(locale, copy_parents=True, alias=True)
+    if not sync_targets:
+        return
 
-        create_aliases_for_new_page(new_alias)
+    # Deleted pages are skipped. This can happen if the transaction that created them was rolled back
+    pages = list(Page.objects.filter(id__in=page_ids).order_by("path").specific())
+    if not pages:
+        return
+
+    locales = Locale.objects.in_bulk(
+        {locale_id for locale_ids in sync_targets.values() for locale_id in locale_ids}
+    )
+
+    # Track which locales each page exists in, so we never alias a page twice
+    existing = {
+        (translation_key, locale_id): page_id
+        for page_id, translation_key, locale_id in Page.objects.filter(
+            translation_key__in={page.translation_key for page in pages}
+        ).values_list("id", "translation_key", "locale_id")
+    }
+
+    # Breadth-first, so each level of a chained synchronisation is created before the next
+    queue = deque(pages)
+    queued = {(page.translation_key, page.locale_id) for page in pages}
+    while queue:
+        page = queue.popleft()
+
+        for locale_id in sync_targets.get(page.locale_id, []):
+            key = (page.translation_key, locale_id)
+            if key in queued:
+                continue
+
+            queued.add(key)
+            if key in existing:
+                # The locale already has the page, but the locales synchronised from it may not
+                queue.append(Page.objects.get(id=existing[key]).specific)
+                continue
+
+            new_alias = page.copy_for_translation(
+                locales[locale_id], copy_parents=True, alias=True
+            )
+            existing[key] = new_alias.id
+            queue.append(new_alias)
+            report_progress(len(existing))
 
 
 @hooks.register("after_create_page")
 def after_create_page(request, page):
-    create_aliases_for_new_page(page)
+    # Creating aliases can be slow when there are many synchronised locales, so do it in the background.
+    # Pages created in the same transaction are collected and aliased by a single job once it commits.
+    key = pending_callbacks.get_savepoint_key("create_aliases_for_new_pages")
+    callback = pending_callbacks.get(key)
+    if callback is not None:
+        callback.page_ids.append(page.id)
+        callback.locale_ids.add(page.locale_id)
+        return
+
+    page_ids = [page.id]
+    locale_ids = {page.locale_id}
+
+    def callback():
+        from .models import LocaleSynchronization
+
+        pending_callbacks.discard(key)
+
+        # Don't record a job for pages whose locales aren't synchronised to any other locale
+        if not LocaleSynchronization.objects.filter(
+            sync_from_id__in=locale_ids
+        ).exists():
+            return
+
+        background.enqueue_on_commit(
+            create_aliases_for_new_pages,
+            [page_ids],
+            {},
+            name=ngettext(
+                "Create aliases for {count} new page",
+                "Create aliases for {count} new pages",
+                len(page_ids),
+            ).format(count=len(page_ids)),
+        )
+
+    callback.page_ids = page_ids
+    callback.locale_ids = locale_ids
+    pending_callbacks.on_commit(key, callback)
@@ -1,24 +1,301 @@
 # This file contains a very lightweight implementation of RFC 72: Background workers (https://github.com/wagtail/rfcs/pull/72)
 # This is only to be used by Wagtail Localize and will be replaced with the full Wagtail implementation later
 
+import atexit
+import logging
+import os
+import pickle
+import socket
+import threading
+import time
+import traceback
+import uuid
+import weakref
+
 from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextvars import ContextVar
+from datetime import timedelta
 from typing import Any
 
 from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections, connections, router, transaction
+from django.db.models import F, Q
+from django.utils import timezone
 from django.utils.module_loading import import_string
 from typing_extensions import ParamSpec
 
 
+logger = logging.getLogger(__name__)
+
 P = ParamSpec("P")
 
 
+class PendingCallbacks:
+    """
+    Tracks the callbacks that are waiting for the transaction in this thread to be committed, by
+    key, so work that is requested several times in a transaction can be collected into one.
+
+    Callbacks are only referenced weakly. Django drops the callbacks of a transaction or savepoint
+    that is rolled back, which frees them, so a rolled back callback is never returned.
+    """
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def get(self, key):
+        """
+        Returns the callback that is waiting under the given key, or None if there isn't one.
+        """
+        ref = self.local.__dict__.get(key)
+        return ref() if ref is not None else None
+
+    def get_savepoint_key(self, name):
+        """
+        Returns a key for collecting work under the given name in the current savepoint.
+
+        Work is collected separately for each savepoint, so the work of a savepoint that is rolled
+        back is dropped along with its callback. Atomic blocks that don't create a savepoint share
+        the key of the block around them.
+        """
+        savepoint_ids = [
+            sid for sid in transaction.get_connection().savepoint_ids if sid is not None
+        ]
+        return f"{name}:{','.join(savepoint_ids)}"
+
+    def on_commit(self, key, callback):
+        """
+        Registers a callback with `transaction.on_commit` under the given key. The callback must
+        call `discard` with the key when it runs.
+        """
+        if transaction.get_connection().in_atomic_block:
+            self.local.__dict__[key] = weakref.ref(callback)
+
+        transaction.on_commit(callback)
+
+    def discard(self, key):
+        self.local.__dict__.pop(key, None)
+
+
+pending_callbacks = PendingCallbacks()
+
+
+class JobProgress:
+    """
+    Tracks the progress of the tracked job that is currently running.
+
+    Progress is shared through the cache, so that it's visible while the job's own transaction is
+    still open. When the job isn't in a transaction, it's also written to the job's row, so that
+    it's visible to processes that don't share the cache.
+    """
+
+    # The minimum number of seconds between cache writes
+    interval = 1
+
+    def __init__(self, cache_alias, job_id):
+        self.cache_alias = cache_alias
+        self.job_id = job_id
+        self.done = 0
+        self.total = None
+        self.last_written_at = None
+
+    @staticmethod
+    def get_cache_key(job_id):
+        return f"wagtail_localize:job-progress:{job_id}"
+
+    def update(self, done, total=None):
+        self.done = done
+        if total is not None:
+            self.total = total
+
+        now = time.monotonic()
+        if (
+            self.last_written_at is None
+            or now - self.last_written_at >= self.interval
+            or self.done == self.total
+        ):
+            self.last_written_at = now
+            caches[self.cache_alias].set(
+                self.get_cache_key(self.job_id), (self.done, self.total), timeout=3600
+            )
+
+            from .models import LocalizeJob
+
+            using = router.db_for_write(LocalizeJob)
+            if not transaction.get_connection(using).in_atomic_block:
+                LocalizeJob.objects.using(using).filter(id=self.job_id).update(
+                    progress_done=self.done, progress_total=self.total
+                )
+
+
+_current_job_progress: ContextVar[JobProgress | None] = ContextVar(
+    "wagtail_localize_job_progress", default=None
+)
+
+
+def report_progress(done: int, total: int | None = None):
+    """
+    Reports the progress of the background job that is currently running.
+
+    This does nothing if it isn't called from a tracked job, so it's safe to call from code that
+    may also run in a request.
+
+    Args:
+        done (int): The number of items that have been processed so far.
+        total (int, optional): The total number of items to process, if it's known.
+    """
+    progress = _current_job_progress.get()
+    if progress is not None:
+        progress.update(done, total)
+
+
+def run_tracked_job(
+    cache_alias: str,
+    job_id: int,
+    func: Callable[P, Any],
+    args: P.args,
+    kwargs: P.kwargs,
+):
+    """
+    Runs a job that was enqueued with a name, recording its status in its `LocalizeJob`.
+    """
+    from .models import LocalizeJob
+
+    jobs = LocalizeJob.objects.filter(id=job_id)
+    jobs.update(status=LocalizeJob.STATUS_RUNNING, started_at=timezone.now())
+
+    progress = JobProgress(cache_alias, job_id)
+    token = _current_job_progress.set(progress)
+    try:
+        result = func(*args, **kwargs)
+    except Exception:
+        jobs.update(
+            status=LocalizeJob.STATUS_FAILED,
+            error=traceback.format_exc(),
+            progress_done=progress.done,
+            progress_total=progress.total,
+            finished_at=timezone.now(),
+        )
+        raise
+    else:
+        jobs.update(
+            status=LocalizeJob.STATUS_COMPLETED,
+            progress_done=progress.done,
+            progress_total=progress.total,
+            finished_at=timezone.now(),
+        )
+        return result
+    finally:
+        _current_job_progress.reset(token)
+        caches[cache_alias].delete(JobProgress.get_cache_key(job_id))
+
+
 class BaseJobBackend:
+    # The number of seconds to hold back jobs that were enqueued with a key. Identical jobs that are
+    # enqueued during this time are collapsed into the held one
+    debounce = 0
+
+    # The cache used to track held jobs
+    cache_alias = "default"
+
     def __init__(self, options):
-        pass
+        self.debounce = options.get("DEBOUNCE", self.debounce)
+        self.cache_alias = options.get("CACHE", self.cache_alias)
+
+        if type(self).enqueue_in is BaseJobBackend.enqueue_in:
+            # Jobs can't be held back, so there's nothing to collapse them into
+            self.debounce = 0
 
     def enqueue(self, func: Callable[P, Any], args: P.args, kwargs: P.kwargs):
         raise NotImplementedError()
 
+    def enqueue_in(
+        self, delay: float, func: Callable[P, Any], args: P.args, kwargs: P.kwargs
+    ):
+        """
+        Enqueues a job to be run after `delay` seconds.
+
+        Backends that can't delay jobs run them straight away.
+        """
+        self.enqueue(func, args, kwargs)
+
+    def enqueue_on_commit(
+        self,
+        func: Callable[P, Any],
+        args: P.args,
+        kwargs: P.kwargs,
+        *,
+        key: str | None = None,
+        name: str | None = None,
+    ):
+        """
+        Enqueues a job once the current transaction is committed, or straight away if there is no
+        transaction.
+
+        Jobs that are enqueued with the same key are collapsed into one while they are waiting for
+        the transaction to commit. With the ``DEBOUNCE`` option, keyed jobs are then held back for
+        that many seconds, and identical jobs that are enqueued in the meantime are collapsed into
+        the held one. A key must identify everything the job does, for example:
+        ``f"synchronize_tree:{source.id}:{target.id}"``.
+
+        If a name is given, the job's status and progress are recorded in a `LocalizeJob`.
+        """
+        if key is not None and pending_callbacks.get(f"job:{key}") is not None:
+            # An identical job is already waiting for this transaction to commit
+            return
+
+        def callback():
+            if key is not None:
+                pending_callbacks.discard(f"job:{key}")
+
+            self._enqueue_now(func, args, kwargs, key=key, name=name)
+
+        if key is not None:
+            pending_callbacks.on_commit(f"job:{key}", callback)
+        else:
+            transaction.on_commit(callback)
+
+    def _enqueue_now(self, func, args, kwargs, *, key, name):
+        if key is None or not self.debounce:
+            self._enqueue_tracked(0, func, args, kwargs, key=key, name=name)
+            return
+
+        # Only enqueue the job if an identical one isn't already being held back. The marker
+        # expires when the held job is due, so it's never left behind by a job that ran elsewhere
+        held_key = f"wagtail_localize:job:{key}"
+        cache = caches[self.cache_alias]
+        if not cache.add(held_key, True, timeout=self.debounce):
+            return
+
+        try:
+            self._enqueue_tracked(self.debounce, func, args, kwargs, key=key, name=name)
+        except Exception:
+            cache.delete(held_key)
+            raise
+
+    def _enqueue_tracked(self, delay, func, args, kwargs, *, key, name):
+        if name is not None:
+            from .models import LocalizeJob
+
+            job = LocalizeJob.objects.create(
+                name=name[:255],
+                func=f"{func.__module__}.{func.__qualname__}"[:255],
+                key=(key or "")[:255],
+            )
+            func, args, kwargs = (
+                run_tracked_job,
+                [self.cache_alias, job.id, func, list(args), dict(kwargs)],
+                {},
+            )
+
+        self.enqueue_in(delay, func, args, kwargs)
+
 
 class ImmediateBackend(BaseJobBackend):
     def enqueue(self, func: Callable[P, Any], args: P.args, kwargs: P.kwargs):
@@ -29,11 +306,361 @@ class DjangoRQJobBackend(BaseJobBackend):
     def __init__(self, options):
         import django_rq
 
+        super().__init__(options)
         self.queue = django_rq.get_queue(options.get("QUEUE", "default"))
 
     def enqueue(self, func: Callable[P, Any], args: P.args, kwargs: P.kwargs):
         self.queue.enqueue(func, *args, **kwargs)
 
+    def enqueue_in(
+        self, delay: float, func: Callable[P, Any], args: P.args, kwargs: P.kwargs
+    ):
+        # Note: delayed jobs require the RQ scheduler to be running
+        if delay:
+            self.queue.enqueue_in(timedelta(seconds=delay), func, *args, **kwargs)
+        else:
+            self.queue.enqueue(func, *args, **kwargs)
+
+
+def run_job(func: Callable[P, Any], args: P.args, kwargs: P.kwargs):
+    """
+    Runs a job in a pool worker.
+
+    Database connections are cleaned up before and after the job, the same way Django does around
+    each request, so a long-lived worker never holds on to a stale or broken connection.
+    """
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        # Nothing waits on the result, so log errors here or they would be lost with the future
+        logger.exception("Background job %r failed", func)
+        raise
+    finally:
+        close_old_connections()
+
+
+class PoolBackend(BaseJobBackend):
+    """
+    Base class for backends that run jobs on a local pool of workers.
+
+    On interpreter exit, the pool waits for queued jobs to finish.
+    """
+
+    default_max_workers = None
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.max_workers = options.get("MAX_WORKERS", self.default_max_workers)
+        self.executor = self.get_executor(options)
+        atexit.register(self.shutdown)
+
+    def get_executor(self, options):
+        raise NotImplementedError()
+
+    def enqueue(self, func: Callable[P, Any], args: P.args, kwargs: P.kwargs):
+        self.executor.submit(run_job, func, list(args), dict(kwargs))
+
+    def enqueue_in(
+        self, delay: float, func: Callable[P, Any], args: P.args, kwargs: P.kwargs
+    ):
+        if delay:
+            threading.Timer(delay, self.enqueue, [func, args, kwargs]).start()
+        else:
+            self.enqueue(func, args, kwargs)
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+
+class ThreadPoolBackend(PoolBackend):
+    """
+    Runs jobs on a pool of threads in the web server process.
+    """
+
+    default_max_workers = 2
+
+    def get_executor(self, options):
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="wagtail_localize",
+        )
+
+
+# Database connections inherited by forked worker processes
+_inherited_connections = []
+
+
+def init_worker_process():
+    import django
+
+    django.setup()
+
+    # A forked worker inherits the parent's database connections. Replace them without closing, as
+    # closing (or garbage collecting) them would terminate the parent's sessions too.
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is not None:
+            _inherited_connections.append(connection.connection)
+            connection.connection = None
+
+
+class ProcessPoolBackend(PoolBackend):
+    """
+    Runs jobs on a pool of worker processes.
+
+    Jobs and their arguments must be picklable.
+    """
+
+    def get_executor(self, options):
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=init_worker_process
+        )
+
+
+class DatabaseJobBackend(BaseJobBackend):
+    """
+    Stores jobs in the database, to be run by one or more `localize_worker` processes.
+
+    Jobs and their arguments must be picklable.
+    """
+
+    # The number of seconds a worker's claim on a job lasts for. Workers extend their claims while
+    # the job is running, so this only delays retrying jobs whose worker has died
+    visibility_timeout = 300
+
+    # The number of times a job is attempted before it's marked as failed
+    max_attempts = 3
+
+    # The number of seconds to wait before retrying a failed job. This is doubled after each attempt
+    retry_delay = 10
+
+    # The number of jobs each worker runs at once
+    concurrency = 1
+
+    # The number of jobs to try to claim at once on databases that can't skip locked rows
+    claim_candidates = 10
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.queue = options.get("QUEUE", "default")
+        self.visibility_timeout = options.get(
+            "VISIBILITY_TIMEOUT", self.visibility_timeout
+        )
+        self.max_attempts = options.get("MAX_ATTEMPTS", self.max_attempts)
+        self.retry_delay = options.get("RETRY_DELAY", self.retry_delay)
+        self.concurrency = options.get("CONCURRENCY", self.concurrency)
+
+    def enqueue(self, func: Callable[P, Any], args: P.args, kwargs: P.kwargs):
+        self.enqueue_in(0, func, args, kwargs)
+
+    def enqueue_in(
+        self, delay: float, func: Callable[P, Any], args: P.args, kwargs: P.kwargs
+    ):
+        from .models import QueuedJob
+
+        QueuedJob.objects.create(
+            queue=self.queue,
+            func=f"{func.__module__}.{func.__qualname__}"[:255],
+            payload=pickle.dumps((func, list(args), dict(kwargs))),
+            run_at=timezone.now() + timedelta(seconds=delay),
+        )
+
+    def get_available_jobs(self, now):
+        """
+        Returns a queryset of the jobs that are due to run and aren't claimed by a worker.
+        """
+        from .models import QueuedJob
+
+        return QueuedJob.objects.filter(
+            Q(locked_until__isnull=True) | Q(locked_until__lte=now),
+            queue=self.queue,
+            failed_at__isnull=True,
+            run_at__lte=now,
+            attempts__lt=self.max_attempts,
+        )
+
+    def fail_abandoned_jobs(self, now):
+        """
+        Marks the jobs whose claims expired on their last attempt as failed, as their worker died
+        before it could retry or fail them.
+        """
+        from .models import QueuedJob
+
+        QueuedJob.objects.filter(
+            queue=self.queue,
+            failed_at__isnull=True,
+            locked_until__lte=now,
+            attempts__gte=self.max_attempts,
+        ).update(
+            locked_by="",
+            locked_until=None,
+            error="The worker running the job stopped before it finished.",
+            failed_at=now,
+        )
+
+    def claim(self, worker_name):
+        """
+        Claims the next job that is due to run.
+
+        Args:
+            worker_name (str): A name that uniquely identifies the worker.
+
+        Returns:
+            QueuedJob: The claimed job.
+            None: If there are no jobs to run.
+        """
+        from .models import QueuedJob
+
+        now = timezone.now()
+        using = router.db_for_write(QueuedJob)
+        self.fail_abandoned_jobs(now)
+        candidates = self.get_available_jobs(now).order_by("run_at", "pk")
+
+        with transaction.atomic(using=using):
+            if connections[using].features.has_select_for_update_skip_locked:
+                # Lock the next job, skipping any that other workers are claiming
+                candidates = candidates.select_for_update(skip_locked=True)[:1]
+            else:
+                # Without row locks, several workers may see the same jobs. The conditional update
+                # below is atomic, so only one of them can claim each job
+                candidates = candidates[: self.claim_candidates]
+
+            for job_id in list(candidates.values_list("pk", flat=True)):
+                claimed = (
+                    self.get_available_jobs(now)
+                    .filter(pk=job_id)
+                    .update(
+                        locked_by=worker_name,
+                        locked_until=now + timedelta(seconds=self.visibility_timeout),
+                        attempts=F("attempts") + 1,
+                    )
+                )
+                if claimed:
+                    return QueuedJob.objects.get(pk=job_id)
+
+    def extend_claims(self, job_ids, worker_name):
+        """
+        Extends a worker's claims on the jobs it's still running.
+        """
+        from .models import QueuedJob
+
+        QueuedJob.objects.filter(pk__in=job_ids, locked_by=worker_name).update(
+            locked_until=timezone.now() + timedelta(seconds=self.visibility_timeout)
+        )
+
+    def complete(self, job):
+        job.delete()
+
+    def retry_or_fail(self, job, error):
+        """
+        Releases a job that raised an exception, to be retried after a delay that doubles with
+        each attempt. Once it has been attempted `max_attempts` times, it's marked as failed instead.
+        """
+        from .models import QueuedJob
+
+        now = timezone.now()
+        updates = {"locked_by": "", "locked_until": None, "error": error}
+        if job.attempts < self.max_attempts:
+            updates["run_at"] = now + timedelta(
+                seconds=self.retry_delay * 2 ** (job.attempts - 1)
+            )
+        else:
+            updates["failed_at"] = now
+
+        QueuedJob.objects.filter(pk=job.pk).update(**updates)
+
+
+def run_queued_job(job):
+    """
+    Runs a job that was claimed from a `DatabaseJobBackend`.
+    """
+    # The payload was pickled by `DatabaseJobBackend.enqueue_in`, so it's as trusted as the database
+    func, args, kwargs = pickle.loads(job.payload)  # noqa: S301
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+class DatabaseWorker:
+    """
+    Claims and runs jobs from a `DatabaseJobBackend`.
+
+    Up to `concurrency` jobs are run at once, on a pool of threads. Claims are made, extended and
+    released from the calling thread, so the threads only run the jobs themselves.
+    """
+
+    def __init__(self, backend, *, concurrency=None, poll_interval=1, name=None):
+        self.backend = backend
+        self.concurrency = concurrency or backend.concurrency
+        self.poll_interval = poll_interval
+        self.name = (
+            name or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.stopping = threading.Event()
+
+    def stop(self):
+        """
+        Stops claiming new jobs. The worker exits once the jobs it's running have finished.
+        """
+        self.stopping.set()
+
+    def run(self, burst=False):
+        """
+        Runs jobs until `stop` is called.
+
+        Args:
+            burst (bool, optional): Exit once there are no more jobs to run.
+        """
+        running = {}
+        last_extended_at = time.monotonic()
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="wagtail_localize_worker"
+        ) as executor:
+            while running or not self.stopping.is_set():
+                for future in [future for future in running if future.done()]:
+                    self.finish(running.pop(future), future)
+
+                if (
+                    running
+                    and time.monotonic() - last_extended_at
+                    >= self.backend.visibility_timeout / 3
+                ):
+                    self.backend.extend_claims(
+                        [job.pk for job in running.values()], self.name
+                    )
+                    last_extended_at = time.monotonic()
+
+                if not self.stopping.is_set() and len(running) < self.concurrency:
+                    job = self.backend.claim(self.name)
+                    if job is not None:
+                        logger.info("Running job %s (%s)", job.pk, job.func)
+                        running[executor.submit(run_queued_job, job)] = job
+                        continue
+
+                    if burst and not running:
+                        self.stop()
+                        continue
+
+                if running:
+                    wait(
+                        running, timeout=self.poll_interval, return_when=FIRST_COMPLETED
+                    )
+                else:
+                    self.stopping.wait(self.poll_interval)
+
+    def finish(self, job, future):
+        exception = future.exception()
+        if exception is None:
+            self.backend.complete(job)
+        else:
+            logger.error("Job %s (%s) failed", job.pk, job.func, exc_info=exception)
+            self.backend.retry_or_fail(
+                job, "".join(traceback.format_exception(exception))
+            )
+
 
 def get_backend():
     config = getattr(
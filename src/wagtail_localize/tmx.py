@@ -0,0 +1,668 @@
+"""
+TMX export and import of the translation memory.
+
+The translation memory is made of the translations of strings. It is exported as a TMX 1.4 file
+with a translation unit for each distinct translation of a string into a locale. Translations
+made in several contexts are only exported once.
+
+Imported translations aren't tied to any context. They're found by the same lookups as the other
+translations of their strings, so they're used to pre-fill new translations, by machine
+translation and for suggestions.
+
+The inline tags in strings are written as TMX inline codes, containing the original tags. Files
+are written and read a translation unit at a time, so the translation memory never needs to be
+held in memory.
+"""
+
+import datetime
+import io
+import xml.etree.ElementTree as ET
+
+from xml.sax.saxutils import XMLGenerator
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.translation import gettext as _
+from wagtail.models import Locale
+
+from . import __version__
+from .inline_codes import read_inline_codes, walk_inline_tags
+from .models import String, StringTranslation
+from .translation_memory import update_index_on_commit
+from .validation import translation_validator
+
+
+TMX_DATE_FORMAT = "%Y%m%dT%H%M%SZ"
+
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+TOOL_NAME = "TMX File"
+
+# The number of translations that are read from the database at a time while exporting
+EXPORT_CHUNK_SIZE = 2000
+
+# The number of translation units that are imported together
+IMPORT_BATCH_SIZE = 1000
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class InvalidTMXFile(ValueError):
+    """
+    Raised when a TMX file can't be read.
+    """
+
+
+def parse_date_filter(value):
+    """
+    Parses the date or date and time of a ``--since`` or ``--until`` option. Times without a time
+    zone are in the current time zone.
+
+    Raises:
+        ValueError: If the value isn't an ISO 8601 date or date and time.
+    """
+    date_time = parse_datetime(value)
+    if date_time is None:
+        date = parse_date(value)
+        if date is None:
+            raise ValueError(f"'{value}' isn't a date")
+        date_time = datetime.datetime.combine(date, datetime.time())
+
+    if timezone.is_naive(date_time):
+        date_time = timezone.make_aware(date_time)
+
+    return date_time
+
+
+def format_tmx_date(value):
+    return value.astimezone(datetime.timezone.utc).strftime(TMX_DATE_FORMAT)
+
+
+def parse_tmx_date(value):
+    try:
+        return datetime.datetime.strptime(value, TMX_DATE_FORMAT).replace(
+            tzinfo=datetime.timezone.utc
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def get_translation_memory(
+    source_locale=None, target_locale=None, since=None, until=None
+):
+    """
+    Yields each distinct translation of a string, read with a database cursor.
+
+    Translations with errors are left out.
+
+    Args:
+        source_locale (Locale, optional): Only yield translations of strings in this locale.
+        target_locale (Locale, optional): Only yield translations into this locale.
+        since (datetime, optional): Only yield translations that were updated at or after this time.
+        until (datetime, optional): Only yield translations that were updated before this time.
+
+    Yields:
+        tuple: The language codes of the string and the translation, the string, the
+        translation, the translation type, and when the translation was created and last updated.
+    """
+    string_translations = StringTranslation.objects.filter(
+        has_error=False, field_error=""
+    )
+    if source_locale is not None:
+        string_translations = string_translations.filter(
+            translation_of__locale=source_locale
+        )
+    if target_locale is not None:
+        string_translations = string_translations.filter(locale=target_locale)
+    if since is not None:
+        string_translations = string_translations.filter(updated_at__gte=since)
+    if until is not None:
+        string_translations = string_translations.filter(updated_at__lt=until)
+
+    # The translations of a string into a locale are next to each other, so the ones that have
+    # already been yielded don't need to be remembered for long
+    current_key = None
+    seen = set()
+    for (
+        string_id,
+        locale_id,
+        source_language,
+        target_language,
+        source,
+        translation,
+        translation_type,
+        created_at,
+        updated_at,
+    ) in (
+        string_translations.order_by(
+            "translation_of_id", "locale_id", "-updated_at", "-pk"
+        )
+        .values_list(
+            "translation_of_id",
+            "locale_id",
+            "translation_of__locale__language_code",
+            "locale__language_code",
+            "translation_of__data",
+            "data",
+            "translation_type",
+            "created_at",
+            "updated_at",
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    ):
+        if (string_id, locale_id) != current_key:
+            current_key = (string_id, locale_id)
+            seen.clear()
+        elif translation in seen:
+            continue
+
+        seen.add(translation)
+        yield (
+            source_language,
+            target_language,
+            source,
+            translation,
+            translation_type,
+            created_at,
+            updated_at,
+        )
+
+
+class SegmentWriter:
+    """
+    Writes a string as the contents of a ``<seg>`` element, with its tags as inline codes that
+    contain the original tags. Passed to `walk_inline_tags`.
+    """
+
+    def __init__(self, xml):
+        self.xml = xml
+        self.code_count = 0
+
+        # The ids and end tags of the codes that have been started but not ended yet
+        self.open_codes = []
+
+    def text(self, text):
+        self.xml.characters(text)
+
+    def empty(self, tag):
+        self.xml.startElement("ph", {})
+        self.xml.characters(tag)
+        self.xml.endElement("ph")
+
+    def start(self, start_tag, end_tag, name):
+        self.code_count += 1
+        code_id = str(self.code_count)
+        self.open_codes.append((code_id, end_tag))
+        self.xml.startElement("bpt", {"i": code_id})
+        self.xml.characters(start_tag)
+        self.xml.endElement("bpt")
+
+    def end(self):
+        code_id, end_tag = self.open_codes.pop()
+        self.xml.startElement("ept", {"i": code_id})
+        self.xml.characters(end_tag)
+        self.xml.endElement("ept")
+
+
+def write_seg(xml, data):
+    """
+    Writes a string as the contents of a ``<seg>`` element, with its tags as inline codes.
+    """
+    walk_inline_tags(data, SegmentWriter(xml))
+
+
+def export_tmx(source_locale=None, target_locale=None, since=None, until=None):
+    """
+    Exports the translation memory as the text of a TMX 1.4 file, which is generated while it's
+    being read.
+
+    Takes the same arguments as ``get_translation_memory``.
+
+    Yields:
+        str: Parts of the TMX file.
+    """
+    out = io.StringIO()
+    xml = XMLGenerator(out, encoding="utf-8", short_empty_elements=True)
+
+    def flush():
+        value = out.getvalue()
+        out.seek(0)
+        out.truncate()
+        return value
+
+    xml.startDocument()
+    xml.startElement("tmx", {"version": "1.4"})
+    xml.ignorableWhitespace("\n  ")
+    xml.startElement(
+        "header",
+        {
+            "creationtool": "Wagtail Localize",
+            "creationtoolversion": __version__,
+            "segtype": "sentence",
+            "o-tmf": "wagtail-localize",
+            "adminlang": "en",
+            "srclang": source_locale.language_code if source_locale else "*all*",
+            "datatype": "html",
+        },
+    )
+    xml.endElement("header")
+    xml.ignorableWhitespace("\n  ")
+    xml.startElement("body", {})
+    yield flush()
+
+    for (
+        source_language,
+        target_language,
+        source,
+        translation,
+        translation_type,
+        created_at,
+        updated_at,
+    ) in get_translation_memory(
+        source_locale=source_locale,
+        target_locale=target_locale,
+        since=since,
+        until=until,
+    ):
+        xml.ignorableWhitespace("\n    ")
+        xml.startElement(
+            "tu",
+            {
+                "srclang": source_language,
+                "creationdate": format_tmx_date(created_at),
+                "changedate": format_tmx_date(updated_at),
+            },
+        )
+        xml.startElement("prop", {"type": "x-translation-type"})
+        xml.characters(translation_type)
+        xml.endElement("prop")
+        for language, data in [
+            (source_language, source),
+            (target_language, translation),
+        ]:
+            xml.startElement("tuv", {"xml:lang": language})
+            xml.startElement("seg", {})
+            write_seg(xml, data)
+            xml.endElement("seg")
+            xml.endElement("tuv")
+        xml.endElement("tu")
+        yield flush()
+
+    xml.ignorableWhitespace("\n  ")
+    xml.endElement("body")
+    xml.ignorableWhitespace("\n")
+    xml.endElement("tmx")
+    xml.ignorableWhitespace("\n")
+    xml.endDocument()
+    yield flush()
+
+
+def read_seg(element):
+    """
+    Returns the contents of a ``<seg>`` element as the HTML of a string. Inline codes contain the
+    original tags, so they're kept as they are.
+    """
+
+    def read_code(child):
+        if child.tag == "hi":
+            # Highlighted text, which doesn't stand for any tags
+            return None
+
+        # <bpt>, <ept>, <ph>, <it> and <ut> codes
+        return "".join(child.itertext())
+
+    return read_inline_codes(element, read_code)
+
+
+def read_tmx(file):
+    """
+    Reads a TMX file a translation unit at a time.
+
+    The file is parsed with ElementTree, which doesn't fetch external entities, and the version
+    of Expat it uses limits the expansion of internal ones.
+
+    Args:
+        file (bytes | file): The contents of the file, or a file object to read them from.
+
+    Yields:
+        tuple: The source language of the translation unit, a dict of the text of each of its
+        variants by language code, its translation type, and when it was last changed.
+
+    Raises:
+        InvalidTMXFile: If the file isn't a valid TMX file.
+    """
+    if isinstance(file, bytes):
+        file = io.BytesIO(file)
+
+    parser = ET.XMLPullParser(events=["start", "end"])
+    source_language = None
+    is_tmx = False
+    parents = []
+
+    def read_events():
+        while chunk := file.read(READ_CHUNK_SIZE):
+            parser.feed(chunk)
+            yield from parser.read_events()
+
+        parser.close()
+        yield from parser.read_events()
+
+    try:
+        for event, element in read_events():
+            if event == "start":
+                if not parents and element.tag != "tmx":
+                    break
+                is_tmx = True
+                parents.append(element)
+                continue
+
+            parents.pop()
+            if element.tag == "header":
+                source_language = element.get("srclang")
+
+            elif element.tag == "tu":
+                variants = {}
+                translation_type = None
+                for child in element:
+                    if child.tag == "tuv":
+                        # TMX 1.1 used a lang attribute instead of xml:lang
+                        language = child.get(XML_LANG) or child.get("lang")
+                        seg = child.find("seg")
+                        if language and seg is not None:
+                            variants[language] = read_seg(seg)
+                    elif child.tag == "prop" and child.get("type") == (
+                        "x-translation-type"
+                    ):
+                        translation_type = child.text
+
+                yield (
+                    element.get("srclang", source_language),
+                    variants,
+                    translation_type,
+                    parse_tmx_date(
+                        element.get("changedate") or element.get("creationdate")
+                    ),
+                )
+
+                # Translation units are removed once they've been read, so the file isn't
+                # built up in memory
+                if parents:
+                    parents[-1].remove(element)
+
+    except ET.ParseError as e:
+        raise InvalidTMXFile(_("Please upload a valid TMX file.")) from e
+
+    if not is_tmx:
+        raise InvalidTMXFile(_("Please upload a valid TMX file."))
+
+
+class TMXImportResult:
+    """
+    The outcome of importing a TMX file.
+
+    Attributes:
+        created (int): The number of translations that were added.
+        updated (int): The number of translations that were changed.
+        unchanged (int): The number of translations that were already in the translation memory.
+        skipped (int): The number of translation units that weren't imported, because they
+            didn't have a variant in a locale of the site for both the source string and the
+            translation, or were filtered out.
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.skipped = 0
+
+
+class LocaleMatcher:
+    """
+    Finds the locales of the site that TMX language codes refer to. Codes are matched without
+    regard to case, and regional codes, such as "fr-FR", fall back to their language.
+    """
+
+    def __init__(self):
+        self.locale_ids = {
+            language_code.lower(): locale_id
+            for locale_id, language_code in Locale.objects.values_list(
+                "id", "language_code"
+            )
+        }
+
+    def get_locale_id(self, language):
+        if not language:
+            return None
+
+        language = language.lower()
+        if language in self.locale_ids:
+            return self.locale_ids[language]
+
+        return self.locale_ids.get(language.split("-")[0])
+
+
+@transaction.atomic
+def import_tmx_batch(units, user=None):
+    """
+    Adds a batch of translations to the translation memory, along with the strings they're
+    translations of. A translation replaces any other translation of its string into its locale
+    that was imported before.
+
+    Args:
+        units (dict): The translation and translation type of each translation unit, by the
+            locale ID of the string, the string and the locale ID of the translation.
+        user (User, optional): The user to record as the translator.
+
+    Returns:
+        tuple[int, int, int]: The number of translations that were added, changed and unchanged.
+    """
+    # Upsert the strings, matching them up with the existing ones by their hash
+    strings = {
+        (source_locale_id, String._get_data_hash(data)): data
+        for source_locale_id, data, _target_locale_id in units
+    }
+
+    def get_string_ids():
+        return {
+            (locale_id, data_hash): string_id
+            for string_id, locale_id, data_hash in String.objects.filter(
+                locale_id__in={locale_id for locale_id, _data_hash in strings},
+                data_hash__in={data_hash for _locale_id, data_hash in strings},
+            ).values_list("id", "locale_id", "data_hash")
+        }
+
+    string_ids = get_string_ids()
+    if any(key not in string_ids for key in strings):
+        String.objects.bulk_create(
+            [
+                String(locale_id=locale_id, data_hash=data_hash, data=data)
+                for (locale_id, data_hash), data in strings.items()
+                if (locale_id, data_hash) not in string_ids
+            ],
+            ignore_conflicts=True,
+        )
+        string_ids = get_string_ids()
+
+    # Translations that aren't in any context, which were imported before
+    string_translations = {
+        (string_translation.translation_of_id, string_translation.locale_id): (
+            string_translation
+        )
+        for string_translation in StringTranslation.objects.filter(
+            translation_of_id__in=set(string_ids.values()), context__isnull=True
+        )
+    }
+
+    now = timezone.now()
+    created = []
+    updated = []
+    changed = []
+    unchanged = 0
+    for (source_locale_id, data, target_locale_id), (
+        translation,
+        translation_type,
+    ) in units.items():
+        string_id = string_ids[source_locale_id, String._get_data_hash(data)]
+        string_translation = string_translations.get((string_id, target_locale_id))
+        if string_translation is None:
+            string_translation = StringTranslation(
+                translation_of_id=string_id,
+                locale_id=target_locale_id,
+                context=None,
+                data=translation,
+                translation_type=translation_type,
+                tool_name=TOOL_NAME,
+                last_translated_by=user,
+                field_error="",
+            )
+            created.append(string_translation)
+        elif (
+            string_translation.data != translation
+            or string_translation.translation_type != translation_type
+        ):
+            string_translation.data = translation
+            string_translation.translation_type = translation_type
+            string_translation.tool_name = TOOL_NAME
+            string_translation.last_translated_by = user
+            string_translation.updated_at = now
+            updated.append(string_translation)
+        else:
+            unchanged += 1
+            continue
+
+        changed.append((data, string_translation))
+
+    # Flag invalid translations, as StringTranslation.save() does
+    verdicts = translation_validator.validate_many(
+        (data, string_translation.data) for data, string_translation in changed
+    )
+    for (_data, string_translation), is_valid in zip(changed, verdicts, strict=True):
+        string_translation.has_error = not is_valid
+
+    StringTranslation.objects.bulk_create(created)
+    StringTranslation.objects.bulk_update(
+        updated,
+        [
+            "data",
+            "translation_type",
+            "tool_name",
+            "last_translated_by",
+            "updated_at",
+            "has_error",
+        ],
+    )
+
+    update_index_on_commit(
+        indexed=[
+            (string_translation.translation_of_id, string_translation.locale_id)
+            for _data, string_translation in changed
+        ]
+    )
+
+    return len(created), len(updated), unchanged
+
+
+def import_tmx(
+    file,
+    source_locale=None,
+    target_locale=None,
+    since=None,
+    until=None,
+    user=None,
+    batch_size=IMPORT_BATCH_SIZE,
+):
+    """
+    Imports the translation units of a TMX file into the translation memory, a batch at a time.
+
+    Each translation unit is imported as a translation of its source variant into each of its
+    other variants that are in a locale of the site. Strings that aren't in the translation
+    memory yet are added, and their translations are matched up with the existing ones by the
+    hash of the string, as with PO files.
+
+    Args:
+        file (bytes | file): The TMX file.
+        source_locale (Locale, optional): Only import translations of strings in this locale. This
+            is also the locale of the strings of translation units with no source language.
+        target_locale (Locale, optional): Only import translations into this locale.
+        since (datetime, optional): Only import translation units that were changed at or after
+            this time.
+        until (datetime, optional): Only import translation units that were changed before this time.
+        user (User, optional): The user to record as the translator.
+        batch_size (int, optional): The number of translation units to import together.
+
+    Returns:
+        TMXImportResult: The number of translations that were imported.
+
+    Raises:
+        InvalidTMXFile: If the file isn't a valid TMX file. The batches before the invalid part
+            of the file have already been imported.
+    """
+    locales = LocaleMatcher()
+    result = TMXImportResult()
+    translation_types = {
+        choice for choice, _label in StringTranslation.TRANSLATION_TYPE_CHOICES
+    }
+    units = {}
+
+    def import_batch():
+        created, updated, unchanged = import_tmx_batch(units, user=user)
+        result.created += created
+        result.updated += updated
+        result.unchanged += unchanged
+        units.clear()
+
+    for language, variants, translation_type, changed_at in read_tmx(file):
+        if changed_at is not None and (
+            (since is not None and changed_at < since)
+            or (until is not None and changed_at >= until)
+        ):
+            result.skipped += 1
+            continue
+
+        if language == "*all*":
+            language = None
+
+        if language is None and source_locale is not None:
+            language = source_locale.language_code
+
+        source_locale_id = locales.get_locale_id(language)
+        if (
+            source_locale_id is None
+            or language not in variants
+            or (source_locale is not None and source_locale_id != source_locale.id)
+        ):
+            result.skipped += 1
+            continue
+
+        data = variants.pop(language)
+        if translation_type not in translation_types:
+            translation_type = StringTranslation.TRANSLATION_TYPE_MANUAL
+
+        imported = False
+        for target_language, translation in variants.items():
+            target_locale_id = locales.get_locale_id(target_language)
+            if (
+                target_locale_id is None
+                or target_locale_id == source_locale_id
+                or (target_locale is not None and target_locale_id != target_locale.id)
+                or not translation
+            ):
+                continue
+
+            units[source_locale_id, data, target_locale_id] = (
+                translation,
+                translation_type,
+            )
+            imported = True
+
+        if not imported:
+            result.skipped += 1
+
+        if len(units) >= batch_size:
+            import_batch()
+
+    if units:
+        import_batch()
+
+    return result
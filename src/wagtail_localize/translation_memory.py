@@ -0,0 +1,316 @@
+"""
+A fuzzy index over the translation memory, for suggesting translations of similar strings.
+
+Strings are indexed with MinHash locality-sensitive hashing: each string is split into
+character n-grams, which are reduced to a signature of ``NUM_BANDS * ROWS_PER_BAND`` minimum
+hashes. The signature is then split into bands and each band is hashed into a single key. Strings
+that share a band key are likely to be similar, so a lookup only needs to fetch the strings that
+share one of the ``NUM_BANDS`` keys of the string being looked up, using an index.
+
+The index has an entry for each string that has a translation into a locale, so lookups only find
+strings with a translation into the locale that is being translated into.
+"""
+
+import difflib
+import hashlib
+import html
+import re
+
+from django.db.models import Count, OuterRef, Subquery
+
+from .tasks import background, pending_callbacks
+
+
+# The number of bands, and of hashes in each band. Strings that are about 50% similar have an even
+# chance of sharing a band, and the chance rises steeply above that
+NUM_BANDS = 16
+ROWS_PER_BAND = 4
+
+# The length of the character n-grams that strings are split into
+SHINGLE_SIZE = 3
+
+# The number of candidates to score for each suggestion that is asked for
+CANDIDATES_PER_SUGGESTION = 5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def _hash(value, *, signed=False):
+    return int.from_bytes(
+        hashlib.blake2b(value, digest_size=8).digest(), "big", signed=signed
+    )
+
+
+# The parameters of the hash functions (a * x + b) % p that make up the signature
+_PERMUTATIONS = [
+    (
+        _hash(f"a{i}".encode()) % _MERSENNE_PRIME | 1,
+        _hash(f"b{i}".encode()) % _MERSENNE_PRIME,
+    )
+    for i in range(NUM_BANDS * ROWS_PER_BAND)
+]
+
+
+def normalize(data):
+    """
+    Strips the HTML tags, case and extra whitespace from a string, so they don't affect how
+    similar it is to other strings.
+    """
+    text = html.unescape(re.sub(r"<[^>]*>", " ", data))
+    return " ".join(text.lower().split())
+
+
+def get_shingles(text):
+    """
+    Returns the set of character n-grams of a normalized string.
+    """
+    text = f" {text} "
+    if len(text) <= SHINGLE_SIZE:
+        return {text}
+
+    return {text[i : i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def get_band_keys(data):
+    """
+    Returns the keys of the bands of a string's MinHash signature.
+
+    Args:
+        data (str): The string, as in `String.data`.
+
+    Returns:
+        list[int]: The key of each band, or an empty list if the string has no text to compare.
+    """
+    text = normalize(data)
+    if not text:
+        return []
+
+    hashes = [_hash(shingle.encode()) for shingle in get_shingles(text)]
+    signature = [
+        min((a * x + b) % _MERSENNE_PRIME for x in hashes) for a, b in _PERMUTATIONS
+    ]
+
+    return [
+        _hash(
+            b"%d:" % band
+            + b",".join(
+                b"%d" % value
+                for value in signature[
+                    band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND
+                ]
+            ),
+            signed=True,
+        )
+        for band in range(NUM_BANDS)
+    ]
+
+
+def get_similarity(a, b):
+    """
+    Returns how similar two strings are, from 0 to 1.
+    """
+    return difflib.SequenceMatcher(None, normalize(a), normalize(b)).ratio()
+
+
+def index_translations(strings_and_locales):
+    """
+    Adds strings to the index for the locales they have been translated into.
+
+    Strings that are already indexed for a locale are skipped, so this is safe to call whenever a
+    translation is saved.
+
+    Args:
+        strings_and_locales (iterable of tuple[int, int]): The IDs of the Strings, and the IDs of
+            the Locales they were translated into.
+    """
+    from wagtail_localize.models import String, TranslationMemoryIndexEntry
+
+    strings_and_locales = set(strings_and_locales)
+    if not strings_and_locales:
+        return
+
+    string_ids = {string_id for string_id, _locale_id in strings_and_locales}
+    already_indexed = set(
+        TranslationMemoryIndexEntry.objects.filter(
+            string_id__in=string_ids, band=0
+        ).values_list("string_id", "locale_id")
+    )
+    strings_and_locales -= already_indexed
+    if not strings_and_locales:
+        return
+
+    band_keys = {
+        string_id: get_band_keys(data)
+        for string_id, data in String.objects.filter(
+            pk__in={string_id for string_id, _locale_id in strings_and_locales}
+        ).values_list("pk", "data")
+    }
+
+    TranslationMemoryIndexEntry.objects.bulk_create(
+        [
+            TranslationMemoryIndexEntry(
+                string_id=string_id, locale_id=locale_id, band=band, key=key
+            )
+            for string_id, locale_id in strings_and_locales
+            for band, key in enumerate(band_keys.get(string_id, []))
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def unindex_translations(strings_and_locales):
+    """
+    Removes strings from the index for the locales they no longer have any translations into.
+
+    Args:
+        strings_and_locales (iterable of tuple[int, int]): The IDs of the Strings, and the IDs of
+            the Locales that translations of them were deleted from.
+    """
+    from wagtail_localize.models import StringTranslation, TranslationMemoryIndexEntry
+
+    strings_and_locales = set(strings_and_locales)
+    if not strings_and_locales:
+        return
+
+    # Strings that are still translated into the locale in another context stay in the index
+    strings_and_locales -= set(
+        StringTranslation.objects.filter(
+            translation_of_id__in={
+                string_id for string_id, _locale_id in strings_and_locales
+            },
+            locale_id__in={locale_id for _string_id, locale_id in strings_and_locales},
+        )
+        .values_list("translation_of_id", "locale_id")
+        .distinct()
+    )
+
+    string_ids_by_locale = {}
+    for string_id, locale_id in strings_and_locales:
+        string_ids_by_locale.setdefault(locale_id, set()).add(string_id)
+
+    for locale_id, string_ids in string_ids_by_locale.items():
+        TranslationMemoryIndexEntry.objects.filter(
+            locale_id=locale_id, string_id__in=string_ids
+        ).delete()
+
+
+def update_index(indexed, unindexed):
+    """
+    Removes strings from the index, then adds strings to it. This is run as a background job by
+    `update_index_on_commit`.
+
+    Args:
+        indexed (list of [int, int]): The IDs of Strings, and the IDs of the Locales they were
+            translated into.
+        unindexed (list of [int, int]): The IDs of Strings, and the IDs of the Locales that
+            translations of them were deleted from.
+    """
+    unindex_translations(tuple(pair) for pair in unindexed)
+    index_translations(tuple(pair) for pair in indexed)
+
+
+def update_index_on_commit(indexed=(), unindexed=()):
+    """
+    Adds strings to the index, and removes them, in a background job that is enqueued once the
+    current transaction is committed.
+
+    Changes made in the same transaction are combined into one job, so the index is updated with a
+    few queries however many translations were saved or deleted, and large imports don't hash
+    their strings while the transaction is open.
+
+    Args:
+        indexed (iterable of tuple[int, int]): The IDs of Strings, and the IDs of the Locales they
+            were translated into.
+        unindexed (iterable of tuple[int, int]): The IDs of Strings, and the IDs of the Locales
+            that translations of them were deleted from. They stay in the index if they still have
+            a translation into the locale.
+    """
+    key = pending_callbacks.get_savepoint_key("translation_memory_index")
+    callback = pending_callbacks.get(key)
+    if callback is not None:
+        callback.indexed.update(indexed)
+        callback.unindexed.update(unindexed)
+        return
+
+    def callback():
+        pending_callbacks.discard(key)
+        if callback.indexed or callback.unindexed:
+            background.enqueue(
+                update_index,
+                [
+                    [list(pair) for pair in sorted(callback.indexed)],
+                    [list(pair) for pair in sorted(callback.unindexed)],
+                ],
+                {},
+            )
+
+    callback.indexed = set(indexed)
+    callback.unindexed = set(unindexed)
+    pending_callbacks.on_commit(key, callback)
+
+
+def get_suggestions(data, source_locale, target_locale, limit=5, min_similarity=0.5):
+    """
+    Finds translations of strings that are similar to the given one.
+
+    Only the strings that share a band key with the given string are compared, so this never
+    scans the whole translation memory.
+
+    Args:
+        data (str): The string to find suggestions for, as in `String.data`.
+        source_locale (Locale): The locale of the string.
+        target_locale (Locale): The locale to find translations in.
+        limit (int, optional): The maximum number of suggestions to return.
+        min_similarity (float, optional): The minimum similarity of the suggestions, from 0 to 1.
+
+    Returns:
+        list[dict]: The suggestions, most similar first. Each has the ``source`` string, its
+            ``translation``, and their ``similarity`` to the given string.
+    """
+    from wagtail_localize.models import (
+        String,
+        StringTranslation,
+        TranslationMemoryIndexEntry,
+    )
+
+    band_keys = get_band_keys(data)
+    if not band_keys:
+        return []
+
+    candidate_ids = list(
+        TranslationMemoryIndexEntry.objects.filter(
+            locale=target_locale,
+            key__in=band_keys,
+            string__locale=source_locale,
+        )
+        .values("string_id")
+        .annotate(matching_bands=Count("pk"))
+        .order_by("-matching_bands")
+        .values_list("string_id", flat=True)[: limit * CANDIDATES_PER_SUGGESTION]
+    )
+
+    suggestions = []
+    for source, translation in (
+        String.objects.filter(pk__in=candidate_ids)
+        .annotate(
+            translation=Subquery(
+                StringTranslation.get_translation_memory_query(
+                    OuterRef("pk"), target_locale
+                )
+            )
+        )
+        .filter(translation__isnull=False)
+        .values_list("data", "translation")
+    ):
+        similarity = get_similarity(data, source)
+        if similarity >= min_similarity:
+            suggestions.append(
+                {
+                    "source": source,
+                    "translation": translation,
+                    "similarity": round(similarity, 3),
+                }
+            )
+
+    suggestions.sort(key=lambda suggestion: suggestion["similarity"], reverse=True)
+    return suggestions[:limit]
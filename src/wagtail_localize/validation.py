@@ -0,0 +1,145 @@
+"""
+Validation of translated strings.
+
+A translation is valid if it's HTML that only contains inline tags, and it doesn't link to
+anywhere its source string doesn't. Checking that means parsing both strings, so the verdicts
+are cached by the hashes of the source string and the translation. The same translation is
+usually checked many times: when it's saved, when it's imported again, and whenever the editor
+shows its error.
+
+Only whether a translation is valid is cached, not why, since the error message depends on the
+language that's active when it's shown.
+"""
+
+import hashlib
+import threading
+
+from collections import OrderedDict
+
+from .strings import StringValue, validate_translation_links
+
+
+# The number of verdicts to keep. Each one takes around 100 bytes.
+VALIDATION_CACHE_SIZE = 10000
+
+
+def get_text_hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def get_validation_error(source_data, data):
+    """
+    Checks a translation without using the cache.
+
+    Args:
+        source_data (str): The source string.
+        data (str): The translation.
+
+    Returns:
+        str: The error message, if the translation is invalid.
+        None: If the translation is valid.
+    """
+    try:
+        StringValue.from_translated_html(data)
+        validate_translation_links(source_data, data)
+    except ValueError as e:
+        return e.args[0]
+
+
+class TranslationValidator:
+    """
+    Checks translations, remembering the most recent verdicts.
+
+    The verdicts are kept in memory in each process. They never go stale, as they're keyed by the
+    contents of the strings they're about.
+
+    Args:
+        cache_size (int, optional): The number of verdicts to keep.
+    """
+
+    def __init__(self, cache_size=VALIDATION_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._verdicts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_cached(self, key):
+        with self._lock:
+            verdict = self._verdicts.get(key)
+            if verdict is not None:
+                self._verdicts.move_to_end(key)
+            return verdict
+
+    def _set_cached(self, key, verdict):
+        with self._lock:
+            self._verdicts[key] = verdict
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self.cache_size:
+                self._verdicts.popitem(last=False)
+
+    def validate_many(self, translations):
+        """
+        Checks many translations at once. Each distinct translation is only parsed once, and only
+        if there's no verdict for it yet.
+
+        Args:
+            translations (iterable of (str, str)): The source string and translation of each
+                translation to check.
+
+        Returns:
+            list[bool]: Whether each translation is valid, in the same order.
+        """
+        verdicts = {}
+        results = []
+        for source_data, data in translations:
+            key = (get_text_hash(source_data), get_text_hash(data))
+            if key not in verdicts:
+                verdict = self._get_cached(key)
+                if verdict is None:
+                    verdict = get_validation_error(source_data, data) is None
+                    self._set_cached(key, verdict)
+                verdicts[key] = verdict
+
+            results.append(verdicts[key])
+
+        return results
+
+    def is_valid(self, source_data, data):
+        """
+        Checks a translation.
+
+        Args:
+            source_data (str): The source string.
+            data (str): The translation.
+
+        Returns:
+            bool: Whether the translation is valid.
+        """
+        return self.validate_many([(source_data, data)])[0]
+
+    def get_error(self, source_data, data):
+        """
+        Returns why a translation is invalid. Translations that are known to be valid aren't
+        parsed again.
+
+        Args:
+            source_data (str): The source string.
+            data (str): The translation.
+
+        Returns:
+            str: The error message, if the translation is invalid.
+            None: If the translation is valid.
+        """
+        key = (get_text_hash(source_data), get_text_hash(data))
+        if self._get_cached(key):
+            return
+
+        error = get_validation_error(source_data, data)
+        self._set_cached(key, error is None)
+        return error
+
+    def clear(self):
+        with self._lock:
+            self._verdicts.clear()
+
+
+translation_validator = TranslationValidator()
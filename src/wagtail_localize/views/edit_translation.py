@@ -1,11 +1,9 @@
 import contextlib
+import enum
 import json
-import os
-import tempfile
 
 from collections import defaultdict
-
-import polib
+from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
 from django.contrib.admin.utils import quote
@@ -13,9 +11,11 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models, transaction
-from django.http import Http404, HttpResponse
+from django.db.models import Exists, OuterRef
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property
 from django.utils.text import capfirst, slugify
@@ -53,6 +53,7 @@ from wagtail.utils.decorators import xframe_options_sameorigin_override
 
 from wagtail_localize.compat import DATE_FORMAT
 from wagtail_localize.machine_translators import get_machine_translator
+from wagtail_localize.machine_translators.base import MachineTranslationError
 from wagtail_localize.models import (
     OverridableSegment,
     SegmentOverride,
@@ -60,8 +61,17 @@ from wagtail_localize.models import (
     StringTranslation,
     Translation,
     TranslationSource,
+    update_page_draft_titles,
 )
-from wagtail_localize.segments import StringSegmentValue
+from wagtail_localize.pofiles import InvalidPOFile, read_po
+from wagtail_localize.strings import StringValue
+from wagtail_localize.translation_memory import get_suggestions, update_index_on_commit
+from wagtail_localize.validation import translation_validator
+from wagtail_localize.xliff import InvalidXLIFFFile, XLIFFFile
+
+
+# The maximum number of suggestions that can be requested for a segment
+MAX_SUGGESTIONS = 20
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -976,6 +986,12 @@ def edit_translation(request, translation: Translation, instance):
                     "uploadPofile": reverse(
                         "wagtail_localize:upload_pofile", args=[translation.id]
                     ),
+                    "downloadXliff": reverse(
+                        "wagtail_localize:download_xliff", args=[translation.id]
+                    ),
+                    "uploadXliff": reverse(
+                        "wagtail_localize:upload_xliff", args=[translation.id]
+                    ),
                     "unpublishUrl": reverse(
                         "wagtailadmin_pages:unpublish", args=[instance.id]
                     )
@@ -1235,6 +1251,48 @@ def edit_string_translation(request, translation_id, string_segment_id):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@authentication_classes([SessionAuthentication])
+def string_translation_suggestions(request, translation_id, string_segment_id):
+    """
+    Suggests translations for a segment from the translations of similar strings.
+
+    The number of suggestions can be set with the ``limit`` query parameter, up to
+    ``MAX_SUGGESTIONS``.
+    """
+    translation = get_object_or_404(Translation, id=translation_id)
+    string_segment = get_object_or_404(
+        StringSegment.objects.select_related("context", "string"), id=string_segment_id
+    )
+
+    if string_segment.context.object_id != translation.source.object_id:
+        raise Http404
+
+    instance = translation.get_target_instance()
+    if not user_can_edit_instance(request.user, instance):
+        raise PermissionDenied
+
+    try:
+        limit = min(int(request.GET.get("limit", 5)), MAX_SUGGESTIONS)
+    except ValueError:
+        return Response(
+            {"limit": ["A valid integer is required."]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return Response(
+        {
+            "suggestions": get_suggestions(
+                string_segment.string.data,
+                translation.source.locale,
+                translation.target_locale,
+                limit=max(limit, 1),
+            )
+        }
+    )
+
+
 @api_view(["PUT", "DELETE"])
 @permission_classes([IsAuthenticated])
 @authentication_classes([SessionAuthentication])
@@ -1296,8 +1354,20 @@ def download_pofile(request, translation_id):
     if not user_can_edit_instance(request.user, instance):
         raise PermissionDenied
 
-    response = HttpResponse(
-        str(translation.export_po()), content_type="text/x-gettext-translation"
+    # Pass delta=1 to only download the strings that have changed since the last delta download,
+    # and the strings that haven't been translated yet
+    delta = request.GET.get("delta") == "1"
+    exported_at = timezone.now()
+
+    def stream_po():
+        yield from translation.stream_po(delta=delta)
+
+        # Only move the delta forward once the whole file has been sent
+        if delta:
+            translation.mark_exported(exported_at)
+
+    response = StreamingHttpResponse(
+        stream_po(), content_type="text/x-gettext-translation"
     )
     response["Content-Disposition"] = (
         f"attachment; filename={slugify(translation.source.object_repr)}-{translation.target_locale.language_code}.po"
@@ -1315,28 +1385,14 @@ def upload_pofile(request, translation_id):
 
     do_import = True
 
-    # Set delete to false. This fixes some windows errors when creating tempfiles.
-    # This is due to the Windows OS locking temporary files when open.
-    # https://github.com/wagtail/wagtail-localize/issues/757
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        # Note: polib.pofile accepts either a filename or contents. We cannot pass the
-        # contents directly into polib.pofile or users could upload a file containing
-        # a filename and this will be read by polib!
-        f.write(request.FILES["file"].read())
-        f.flush()
-
-    # Move indentation back, we should open the file outside of the with statement.
-    # Delete must be set to false, otherwise the file will be deleted before we can open it.
     try:
-        po = polib.pofile(f.name)
-
-    except (OSError, UnicodeDecodeError):
-        # Annoyingly, POLib uses OSError for parser exceptions...
-        messages.error(request, _("Please upload a valid PO file."))
+        po = read_po(request.FILES["file"])
+    except InvalidPOFile as e:
+        messages.error(request, str(e))
         do_import = False
 
     if do_import:
-        translation_id = po.metadata["X-WagtailLocalize-TranslationID"]
+        translation_id = po.metadata.get("X-WagtailLocalize-TranslationID")
         if translation_id != str(translation.uuid):
             messages.error(
                 request,
@@ -1350,10 +1406,6 @@ def upload_pofile(request, translation_id):
         translation.import_po(po, user=request.user, tool_name="PO File")
         messages.success(request, _("Successfully imported translations from PO File."))
 
-    # Delete the created tempfile
-    with contextlib.suppress(OSError):
-        os.unlink(f.name)
-
     # Work out where to redirect to
     next_url = get_valid_next_url_from_request(request)
     if not next_url:
@@ -1363,9 +1415,57 @@ def upload_pofile(request, translation_id):
     return redirect(next_url)
 
 
-def apply_machine_translation(translation_id, user, machine_translator):
+def download_xliff(request, translation_id):
+    translation = get_object_or_404(Translation, id=translation_id)
+
+    instance = translation.get_target_instance()
+    if not user_can_edit_instance(request.user, instance):
+        raise PermissionDenied
+
+    response = StreamingHttpResponse(
+        translation.stream_xliff(), content_type="application/xliff+xml"
+    )
+    response["Content-Disposition"] = (
+        f"attachment; filename={slugify(translation.source.object_repr)}-{translation.target_locale.language_code}.xlf"
+    )
+    return response
+
+
+@require_POST
+def upload_xliff(request, translation_id):
     translation = get_object_or_404(Translation, id=translation_id)
 
+    instance = translation.get_target_instance()
+    if not user_can_edit_instance(request.user, instance):
+        raise PermissionDenied
+
+    try:
+        xliff = XLIFFFile(request.FILES["file"])
+        translation.import_xliff(xliff, user=request.user, tool_name="XLIFF File")
+        messages.success(
+            request, _("Successfully imported translations from XLIFF File.")
+        )
+    except InvalidXLIFFFile as e:
+        messages.error(request, str(e))
+
+    # Work out where to redirect to
+    next_url = get_valid_next_url_from_request(request)
+    if not next_url:
+        # Note: You should always provide a next URL when using this view!
+        next_url = reverse("wagtailadmin_home")
+
+    return redirect(next_url)
+
+
+def get_segments_to_machine_translate(translation, user, machine_translator):
+    """
+    Returns the string segments of a translation that haven't been translated yet, grouped by
+    their source string.
+
+    Raises:
+        PermissionDenied: If the user can't edit the translated object.
+        Http404: If the machine translator can't translate into the translation's locale.
+    """
     instance = translation.get_target_instance()
     if not user_can_edit_instance(user, instance):
         raise PermissionDenied
@@ -1375,58 +1475,302 @@ def apply_machine_translation(translation_id, user, machine_translator):
     ):
         raise Http404
 
-    # Get segments
     segments = defaultdict(list)
-    for string_segment in translation.source.stringsegment_set.all().select_related(
-        "context", "string"
+    for string_segment in (
+        translation.source.stringsegment_set.exclude(
+            Exists(
+                StringTranslation.objects.filter(
+                    translation_of_id=OuterRef("string_id"),
+                    locale=translation.target_locale,
+                    context_id=OuterRef("context_id"),
+                )
+            )
+        )
+        .select_related("context", "string")
+        .order_by("order")
     ):
-        segment = StringSegmentValue(
-            string_segment.context.path, string_segment.string.as_value()
-        ).with_order(string_segment.order)
-        if string_segment.attrs:
-            segment.attrs = json.loads(string_segment.attrs)
-
-        # Don't translate if there already is a translation
-        if StringTranslation.objects.filter(
-            translation_of_id=string_segment.string_id,
-            locale=translation.target_locale,
-            context_id=string_segment.context_id,
-        ).exists():
+        segments[string_segment.string.as_value()].append(string_segment)
+
+    return segments
+
+
+def save_string_translations(
+    translation, user, segments, translations, translation_type, tool_name
+):
+    """
+    Saves translations for the segments returned by `get_segments_to_machine_translate`.
+
+    Args:
+        translation (Translation): The translation the segments belong to.
+        user (User): The user to record as the translator.
+        segments (dict[StringValue, list[StringSegment]]): The segments, grouped by their source
+            string.
+        translations (dict[StringValue, StringValue]): The translations of the source strings.
+            Strings that are missing, or translated to None, are skipped.
+        translation_type (str): The `translation_type` of the new StringTranslations.
+        tool_name (str): The `tool_name` of the new StringTranslations.
+    """
+    string_translations = []
+    for string, string_segments in segments.items():
+        if translations.get(string) is None or translations[string].data is None:
+            # Don't create a translation if the machine can't provide
             continue
 
-        segments[segment.string].append(
-            (string_segment.string_id, string_segment.context_id)
+        data = translations[string].data
+        has_error = not translation_validator.is_valid(string.data, data)
+
+        string_translations.extend(
+            StringTranslation(
+                translation_of=string_segment.string,
+                locale=translation.target_locale,
+                context=string_segment.context,
+                data=data,
+                translation_type=translation_type,
+                tool_name=tool_name,
+                last_translated_by=user,
+                has_error=has_error,
+                field_error="",
+            )
+            for string_segment in string_segments
         )
 
-    if segments:
-        translations = machine_translator.translate(
+    titles = [
+        string_translation
+        for string_translation in string_translations
+        if string_translation.context.path == "title"
+    ]
+
+    with transaction.atomic():
+        # Primary keys aren't set when conflicts are ignored, so look up the page titles that are
+        # already translated first, to find the ones that are inserted
+        existing_titles = set()
+        if titles:
+            existing_titles = set(
+                StringTranslation.objects.filter(
+                    locale=translation.target_locale,
+                    translation_of_id__in={title.translation_of_id for title in titles},
+                    context_id__in={title.context_id for title in titles},
+                ).values_list("translation_of_id", "context_id")
+            )
+
+        # Ignore strings that were translated while waiting for the machine translator
+        StringTranslation.objects.bulk_create(
+            string_translations, ignore_conflicts=True
+        )
+
+        # Strings that were already indexed for the locale are skipped
+        update_index_on_commit(
+            indexed={
+                (string_translation.translation_of_id, string_translation.locale_id)
+                for string_translation in string_translations
+            }
+        )
+
+        update_page_draft_titles(
+            title
+            for title in titles
+            if (title.translation_of_id, title.context_id) not in existing_titles
+        )
+
+
+def save_machine_translations(
+    translation, user, machine_translator, segments, translations
+):
+    """
+    Saves the translations from a machine translator for the segments returned by
+    `get_segments_to_machine_translate`.
+    """
+    save_string_translations(
+        translation,
+        user,
+        segments,
+        translations,
+        translation_type=StringTranslation.TRANSLATION_TYPE_MACHINE,
+        tool_name=machine_translator.display_name,
+    )
+
+
+def apply_translation_memory(translation, user, segments):
+    """
+    Translates segments by reusing the translations their strings already have into the target
+    locale in other contexts, before paying a machine translator for them.
+
+    This can be disabled with the ``WAGTAILLOCALIZE_USE_TRANSLATION_MEMORY`` setting.
+
+    Args:
+        translation (Translation): The translation the segments belong to.
+        user (User): The user to record as the translator.
+        segments (dict[StringValue, list[StringSegment]]): The segments returned by
+            `get_segments_to_machine_translate`.
+
+    Returns:
+        dict[StringValue, list[StringSegment]]: The segments that are still untranslated.
+    """
+    if not segments or not getattr(
+        settings, "WAGTAILLOCALIZE_USE_TRANSLATION_MEMORY", True
+    ):
+        return segments
+
+    translation_memory = StringTranslation.get_translation_memory(
+        (string_segments[0].string_id for string_segments in segments.values()),
+        translation.target_locale,
+    )
+    if not translation_memory:
+        return segments
+
+    translations = {}
+    remaining_segments = {}
+    for string, string_segments in segments.items():
+        string_id = string_segments[0].string_id
+        if string_id in translation_memory:
+            translations[string] = StringValue(translation_memory[string_id])
+        else:
+            remaining_segments[string] = string_segments
+
+    save_string_translations(
+        translation,
+        user,
+        segments,
+        translations,
+        translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+        tool_name=StringTranslation.TOOL_NAME_TRANSLATION_MEMORY,
+    )
+
+    return remaining_segments
+
+
+class MachineTranslationOutcome(enum.IntEnum):
+    """
+    The outcomes of `apply_machine_translation`. Only ``NOTHING_TO_TRANSLATE`` is falsy, so
+    callers that check whether anything was translated keep working.
+    """
+
+    NOTHING_TO_TRANSLATE = 0
+    TRANSLATED_FROM_MEMORY = 1
+    MACHINE_TRANSLATED = 2
+
+
+def apply_machine_translation(translation_id, user, machine_translator):
+    """
+    Machine translates the untranslated segments of a translation.
+
+    Segments are first translated from the translation memory, see `apply_translation_memory`.
+
+    Returns:
+        MachineTranslationOutcome: ``NOTHING_TO_TRANSLATE``, which is falsy, if every segment was
+            already translated, ``TRANSLATED_FROM_MEMORY`` if the translation memory translated
+            all of them, so the machine translator wasn't called, or ``MACHINE_TRANSLATED``
+            otherwise.
+
+    Raises:
+        MachineTranslationError: If any of the requests to the machine translator failed. The
+            strings that could be translated are saved first.
+    """
+    translation = get_object_or_404(Translation, id=translation_id)
+
+    segments = get_segments_to_machine_translate(translation, user, machine_translator)
+    if not segments:
+        return MachineTranslationOutcome.NOTHING_TO_TRANSLATE
+
+    segments = apply_translation_memory(translation, user, segments)
+    if not segments:
+        return MachineTranslationOutcome.TRANSLATED_FROM_MEMORY
+
+    error = None
+    try:
+        translations = machine_translator.get_translations(
             translation.source.locale, translation.target_locale, segments.keys()
         )
+    except MachineTranslationError as e:
+        # Save the strings that were translated before reporting the error
+        translations = e.translations
+        error = e
 
-        with transaction.atomic():
-            for string, contexts in segments.items():
-                if (
-                    translations.get(string) is None
-                    or translations[string].data is None
-                ):
-                    # Don't create a translation if the machine can't provide
-                    continue
-                for string_id, context_id in contexts:
-                    StringTranslation.objects.get_or_create(
-                        translation_of_id=string_id,
-                        locale=translation.target_locale,
-                        context_id=context_id,
-                        defaults={
-                            "data": translations[string].data,
-                            "translation_type": StringTranslation.TRANSLATION_TYPE_MACHINE,
-                            "tool_name": machine_translator.display_name,
-                            "last_translated_by": user,
-                            "has_error": False,
-                            "field_error": "",
-                        },
-                    )
-        return True
-    return False
+    save_machine_translations(
+        translation, user, machine_translator, segments, translations
+    )
+
+    if error is not None:
+        raise error
+
+    return MachineTranslationOutcome.MACHINE_TRANSLATED
+
+
+def apply_machine_translations(translations, user, machine_translator):
+    """
+    Machine translates several translations at once.
+
+    Segments are first translated from the translation memory, see `apply_translation_memory`.
+    The requests to the machine translator for the rest of every translation are sent
+    concurrently from one pool, up to the translator's ``MAX_CONCURRENT_REQUESTS`` option in total. The database,
+    including the translator's cache, is only accessed from the calling thread.
+
+    Args:
+        translations (iterable of Translation): The translations to machine translate.
+        user (User): The user to record as the translator.
+        machine_translator (BaseMachineTranslator): The machine translator to use.
+
+    Returns:
+        dict[Translation, MachineTranslationError]: The translations that failed, with their
+            error. The strings that could be translated are saved either way.
+    """
+    pending = []
+    for translation in translations:
+        segments = get_segments_to_machine_translate(
+            translation, user, machine_translator
+        )
+        segments = apply_translation_memory(translation, user, segments)
+        if not segments:
+            continue
+
+        cached, misses = machine_translator.get_cached_translations(
+            translation.source.locale, translation.target_locale, segments.keys()
+        )
+        pending.append((translation, segments, cached, misses))
+
+    if not pending:
+        return {}
+
+    # The requests for every translation share one pool, so no more than MAX_CONCURRENT_REQUESTS
+    # are sent at once in total
+    with ThreadPoolExecutor(
+        max_workers=machine_translator.get_max_concurrent_requests(),
+        thread_name_prefix="wagtail_localize_mt",
+    ) as executor:
+        submitted = [
+            machine_translator.submit_chunks(
+                executor, translation.source.locale, translation.target_locale, misses
+            )
+            for translation, _segments, _cached, misses in pending
+        ]
+
+    errors = {}
+    for (translation, segments, cached, misses), translation_submitted in zip(
+        pending, submitted, strict=True
+    ):
+        new_translations = {}
+        if misses:
+            try:
+                new_translations = machine_translator.collect_chunks(
+                    translation_submitted
+                )
+            except MachineTranslationError as e:
+                new_translations = e.translations
+                errors[translation] = e
+
+            machine_translator.cache_translations(
+                translation.source.locale, translation.target_locale, new_translations
+            )
+
+        save_machine_translations(
+            translation,
+            user,
+            machine_translator,
+            segments,
+            {**cached, **new_translations},
+        )
+
+    return errors
 
 
 @require_POST
@@ -1435,16 +1779,34 @@ def machine_translate(request, translation_id):
     if machine_translator is None:
         raise Http404
 
-    if apply_machine_translation(translation_id, request.user, machine_translator):
-        messages.success(
+    try:
+        outcome = apply_machine_translation(
+            translation_id, request.user, machine_translator
+        )
+    except MachineTranslationError as e:
+        messages.error(
             request,
-            _("Successfully translated with {}.").format(
-                machine_translator.display_name
-            ),
+            _(
+                "{count} of the requests to {translator} failed. The other strings were translated, please try again to translate the rest."
+            ).format(count=len(e.errors), translator=machine_translator.display_name),
         )
-
     else:
-        messages.warning(request, _("There isn't anything left to translate."))
+        if outcome == MachineTranslationOutcome.MACHINE_TRANSLATED:
+            messages.success(
+                request,
+                _("Successfully translated with {}.").format(
+                    machine_translator.display_name
+                ),
+            )
+        elif outcome == MachineTranslationOutcome.TRANSLATED_FROM_MEMORY:
+            messages.success(
+                request,
+                _(
+                    "Successfully translated from existing translations. Nothing was sent to {}."
+                ).format(machine_translator.display_name),
+            )
+        else:
+            messages.warning(request, _("There isn't anything left to translate."))
 
     # Work out where to redirect to
     next_url = get_valid_next_url_from_request(request)
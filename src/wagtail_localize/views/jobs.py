@@ -0,0 +1,109 @@
+import django_filters
+
+from django.core.exceptions import PermissionDenied
+from django.utils.translation import gettext_lazy
+from rest_framework import serializers
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from wagtail.admin.filters import WagtailFilterSet
+from wagtail.admin.views.reports import ReportView
+
+from wagtail_localize.models import LocalizeJob
+
+
+# The number of finished jobs to include in the API response
+RECENT_JOBS_LIMIT = 20
+
+
+class LocalizeJobSerializer(serializers.ModelSerializer):
+    status_display = serializers.ReadOnlyField(source="get_status_display")
+    progress = serializers.SerializerMethodField("get_progress")
+    duration = serializers.SerializerMethodField("get_duration")
+
+    def get_progress(self, job):
+        done, total = job.get_progress()
+        return {"done": done, "total": total}
+
+    def get_duration(self, job):
+        duration = job.get_duration()
+        if duration is not None:
+            return duration.total_seconds()
+
+    class Meta:
+        model = LocalizeJob
+        fields = [
+            "id",
+            "name",
+            "func",
+            "status",
+            "status_display",
+            "progress",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "duration",
+        ]
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@authentication_classes([SessionAuthentication])
+def jobs_api(request):
+    """
+    Lists the background jobs that are queued or running, and the most recently finished ones.
+    """
+    if not request.user.has_perms(["wagtail_localize.submit_translation"]):
+        raise PermissionDenied
+
+    active_jobs = LocalizeJob.objects.filter(
+        status__in=[LocalizeJob.STATUS_QUEUED, LocalizeJob.STATUS_RUNNING]
+    ).order_by("created_at")
+    recent_jobs = LocalizeJob.objects.filter(
+        status__in=[LocalizeJob.STATUS_COMPLETED, LocalizeJob.STATUS_FAILED]
+    ).order_by("-finished_at")[:RECENT_JOBS_LIMIT]
+
+    return Response(
+        {
+            "active": LocalizeJobSerializer(active_jobs, many=True).data,
+            "recent": LocalizeJobSerializer(recent_jobs, many=True).data,
+        }
+    )
+
+
+class JobsReportFilterSet(WagtailFilterSet):
+    status = django_filters.ChoiceFilter(
+        label=gettext_lazy("Status"),
+        choices=LocalizeJob.STATUS_CHOICES,
+        empty_label=gettext_lazy("All"),
+    )
+
+    class Meta:
+        model = LocalizeJob
+        fields = ["status"]
+
+
+class JobsReportView(ReportView):
+    template_name = "wagtail_localize/admin/jobs_report.html"
+    results_template_name = "wagtail_localize/admin/jobs_report_results.html"
+    index_url_name = "wagtail_localize:jobs_report"
+    index_results_url_name = "wagtail_localize:jobs_report_results"
+    header_icon = "cogs"
+    page_title = gettext_lazy("Translation jobs")
+
+    filterset_class = JobsReportFilterSet
+
+    def get_queryset(self):
+        return LocalizeJob.objects.order_by("-created_at", "-pk")
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.has_perms(["wagtail_localize.submit_translation"]):
+            raise PermissionDenied
+
+        return super().dispatch(request, *args, **kwargs)
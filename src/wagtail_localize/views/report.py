@@ -1,18 +1,39 @@
+import itertools
+import zipfile
+
 import django_filters
 
+from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Exists, OuterRef
+from django.http import StreamingHttpResponse
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.text import capfirst
-from django.utils.translation import gettext_lazy
+from django.utils.translation import gettext as _
+from django.utils.translation import gettext_lazy, ngettext
 from django_filters.constants import EMPTY_VALUES
 from django_filters.fields import ModelChoiceField
 from modelcluster.fields import ParentalKey
 from wagtail.admin.filters import WagtailFilterSet
 from wagtail.admin.views.reports import ReportView
+from wagtail.admin.widgets.button import Button
 from wagtail.coreutils import get_content_languages
 from wagtail.models import get_translatable_models
 
 from wagtail_localize.models import StringSegment, StringTranslation, Translation
+from wagtail_localize.po_archive import export_po_archive, import_po_archive
+from wagtail_localize.views.edit_translation import user_can_edit_instance
+
+
+# The value of the "export" parameter that downloads the translations as PO files
+PO_ARCHIVE_EXPORT_FORMAT = "po"
+
+# The number of translations to check the user's permissions on at once when exporting
+EXPORT_BATCH_SIZE = 100
 
 
 class SourceTitleFilter(django_filters.CharFilter):
@@ -145,6 +166,33 @@ class TranslationsReportFilterSet(WagtailFilterSet):
         ]
 
 
+def get_translations_report_queryset():
+    """
+    Returns all translations, annotated with whether they're waiting for translations.
+    """
+    return Translation.objects.annotate(
+        # Check to see if there is at least one string segment that is not
+        # translated.
+        waiting_for_translation=Exists(
+            StringSegment.objects.filter(source_id=OuterRef("source_id"))
+            .annotate(
+                # Annotate here just to filter in the next subquery, as Django
+                # doesn't have support for nested OuterRefs.
+                _target_locale_id=OuterRef("target_locale_id"),
+                is_translated=Exists(
+                    StringTranslation.objects.filter(
+                        translation_of_id=OuterRef("string_id"),
+                        context_id=OuterRef("context_id"),
+                        locale_id=OuterRef("_target_locale_id"),
+                        has_error=False,
+                    )
+                ),
+            )
+            .filter(is_translated=False)
+        )
+    ).order_by("pk")
+
+
 class TranslationsReportView(ReportView):
     template_name = "wagtail_localize/admin/translations_report.html"
     results_template_name = "wagtail_localize/admin/translations_report_results.html"
@@ -156,24 +204,126 @@ class TranslationsReportView(ReportView):
     filterset_class = TranslationsReportFilterSet
 
     def get_queryset(self):
-        return Translation.objects.annotate(
-            # Check to see if there is at least one string segment that is not
-            # translated.
-            waiting_for_translation=Exists(
-                StringSegment.objects.filter(source_id=OuterRef("source_id"))
-                .annotate(
-                    # Annotate here just to filter in the next subquery, as Django
-                    # doesn't have support for nested OuterRefs.
-                    _target_locale_id=OuterRef("target_locale_id"),
-                    is_translated=Exists(
-                        StringTranslation.objects.filter(
-                            translation_of_id=OuterRef("string_id"),
-                            context_id=OuterRef("context_id"),
-                            locale_id=OuterRef("_target_locale_id"),
-                            has_error=False,
+        return get_translations_report_queryset()
+
+    @cached_property
+    def header_more_buttons(self):
+        buttons = super().header_more_buttons.copy()
+        buttons.append(
+            Button(
+                _("Download PO files"),
+                url=self.get_export_url(PO_ARCHIVE_EXPORT_FORMAT),
+                icon_name="download",
+                priority=110,
+            )
+        )
+        buttons.append(
+            Button(
+                _("Upload PO files"),
+                url=reverse("wagtail_localize:upload_po_archive"),
+                icon_name="upload",
+                priority=120,
+            )
+        )
+        return buttons
+
+    def get(self, request, *args, **kwargs):
+        if request.GET.get("export") == PO_ARCHIVE_EXPORT_FORMAT:
+            return self.po_archive_response()
+
+        return super().get(request, *args, **kwargs)
+
+    def po_archive_response(self):
+        """
+        Returns a ZIP archive of PO files for the enabled translations that match the filters,
+        and that the user can edit. The archive is streamed as it's generated.
+
+        Pass ``delta=1`` to only include the strings that have changed since each translation's
+        last delta export, and the strings that haven't been translated yet.
+        """
+        translations = (
+            self.get_filtered_queryset()
+            .filter(enabled=True)
+            .select_related("source", "target_locale")
+            .iterator()
+        )
+        response = StreamingHttpResponse(
+            export_po_archive(
+                filter_editable_translations(self.request.user, translations),
+                delta=self.request.GET.get("delta") == "1",
+            ),
+            content_type="application/zip",
+        )
+        response["Content-Disposition"] = "attachment; filename=translations.zip"
+        return response
+
+
+def filter_editable_translations(user, translations, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Yields the translations that the user can edit. The translated instances are fetched for a
+    batch of translations at a time, with `Translation.prefetch_target_instances`.
+    """
+    translations = iter(translations)
+    while batch := list(itertools.islice(translations, batch_size)):
+        Translation.prefetch_target_instances(batch)
+        for translation in batch:
+            if user_can_edit_translation(user, translation):
+                yield translation
+
+
+def user_can_edit_translation(user, translation):
+    try:
+        instance = translation.get_target_instance()
+    except ObjectDoesNotExist:
+        # The translated instance hasn't been created yet
+        return False
+
+    return user_can_edit_instance(user, instance)
+
+
+def upload_po_archive(request):
+    """
+    Imports a ZIP archive of PO files, such as one downloaded from the translations report, into
+    the translations the user can edit.
+    """
+    if request.method == "POST" and request.FILES.get("file"):
+        try:
+            result = import_po_archive(
+                request.FILES["file"],
+                user=request.user,
+                can_import=lambda translation: user_can_edit_translation(
+                    request.user, translation
+                ),
+            )
+        except zipfile.BadZipFile:
+            messages.error(request, _("Please upload a valid ZIP file."))
+        else:
+            for filename, error in result.errors:
+                messages.warning(request, f"{filename}: {error}")
+
+            for filename, _translation, warnings in result.imported:
+                if warnings:
+                    messages.warning(
+                        request,
+                        ngettext(
+                            "%(filename)s: %(count)d entry wasn't imported because it doesn't match the source.",
+                            "%(filename)s: %(count)d entries weren't imported because they don't match the source.",
+                            len(warnings),
                         )
-                    ),
+                        % {"filename": filename, "count": len(warnings)},
+                    )
+
+            messages.success(
+                request,
+                ngettext(
+                    "Successfully imported translations from %(count)d PO file.",
+                    "Successfully imported translations from %(count)d PO files.",
+                    len(result.imported),
                 )
-                .filter(is_translated=False)
+                % {"count": len(result.imported)},
             )
-        ).order_by("pk")
+            return redirect("wagtail_localize:translations_report")
+
+    return TemplateResponse(
+        request, "wagtail_localize/admin/upload_po_archive.html", {}
+    )
@@ -133,7 +133,8 @@ class SubmitTranslationView(SingleObjectMixin, TemplateView):
         if isinstance(self.object, Page) and form.cleaned_data["include_subtree"]:
             # Translating a subtree may be a heavy task, so enqueue it into the background
             # (note, we always want to translate the root here so that we have something to redirect to)
-            background.enqueue(
+            locale_ids = sorted(locale.id for locale in form.cleaned_data["locales"])
+            background.enqueue_on_commit(
                 translate_page_subtree,
                 [
                     self.object.id,
@@ -142,6 +143,10 @@ class SubmitTranslationView(SingleObjectMixin, TemplateView):
                     self.request.user,
                 ],
                 {},
+                key=f"translate_page_subtree:{self.object.id}:{','.join(map(str, locale_ids))}",
+                name=_("Translate the subtree of '{title}'").format(
+                    title=self.object.get_admin_display_title()
+                ),
             )
 
         single_translated_object = None
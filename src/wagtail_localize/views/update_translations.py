@@ -19,7 +19,7 @@ from wagtail.utils.version import get_main_version
 
 from wagtail_localize.machine_translators import get_machine_translator
 from wagtail_localize.models import TranslationSource
-from wagtail_localize.views.edit_translation import apply_machine_translation
+from wagtail_localize.views.edit_translation import apply_machine_translations
 from wagtail_localize.views.submit_translations import TranslationComponentManager
 
 
@@ -158,9 +158,23 @@ class UpdateTranslationsView(SingleObjectMixin, TemplateView):
         enabled_translations = self.object.translations.filter(enabled=True)
         if form.cleaned_data.get("use_machine_translation"):
             machine_translator = get_machine_translator()
-            for translation in enabled_translations.select_related("target_locale"):
-                apply_machine_translation(
-                    translation.id, self.request.user, machine_translator
+            errors = apply_machine_translations(
+                enabled_translations.select_related("source__locale", "target_locale"),
+                self.request.user,
+                machine_translator,
+            )
+            if errors:
+                messages.warning(
+                    self.request,
+                    _(
+                        "{translator} couldn't translate some of the changes into {locales}. Please translate them in the editor."
+                    ).format(
+                        translator=machine_translator.display_name,
+                        locales=", ".join(
+                            translation.target_locale.get_display_name()
+                            for translation in errors
+                        ),
+                    ),
                 )
 
         if form.cleaned_data["publish_translations"]:
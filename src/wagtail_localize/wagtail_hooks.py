@@ -25,6 +25,7 @@ from .models import Translation, TranslationSource
 from .views import (
     convert,
     edit_translation,
+    jobs,
     report,
     snippets_api,
     submit_translations,
@@ -60,6 +61,11 @@ def register_admin_urls():
             edit_translation.edit_string_translation,
             name="edit_string_translation",
         ),
+        path(
+            "translate/<int:translation_id>/strings/<int:string_segment_id>/suggestions/",
+            edit_translation.string_translation_suggestions,
+            name="string_translation_suggestions",
+        ),
         path(
             "translate/<int:translation_id>/overrides/<int:overridable_segment_id>/edit/",
             edit_translation.edit_override,
@@ -75,6 +81,16 @@ def register_admin_urls():
             edit_translation.upload_pofile,
             name="upload_pofile",
         ),
+        path(
+            "translate/<int:translation_id>/xliff/download/",
+            edit_translation.download_xliff,
+            name="download_xliff",
+        ),
+        path(
+            "translate/<int:translation_id>/xliff/upload/",
+            edit_translation.upload_xliff,
+            name="upload_xliff",
+        ),
         path(
             "translate/<int:translation_id>/machine_translate/",
             edit_translation.machine_translate,
@@ -120,6 +136,26 @@ def register_admin_urls():
             report.TranslationsReportView.as_view(results_only=True),
             name="translations_report_results",
         ),
+        path(
+            "reports/translations/pofiles/upload/",
+            report.upload_po_archive,
+            name="upload_po_archive",
+        ),
+        path(
+            "reports/jobs/",
+            jobs.JobsReportView.as_view(),
+            name="jobs_report",
+        ),
+        path(
+            "reports/jobs/results/",
+            jobs.JobsReportView.as_view(results_only=True),
+            name="jobs_report_results",
+        ),
+        path(
+            "api/jobs/",
+            jobs.jobs_api,
+            name="jobs_api",
+        ),
     ]
 
     return [
@@ -393,6 +429,21 @@ def register_wagtail_localize2_report_menu_item():
     )
 
 
+class JobsReportMenuItem(MenuItem):
+    def is_shown(self, request):
+        return request.user.has_perm("wagtail_localize.submit_translation")
+
+
+@hooks.register("register_reports_menu_item")
+def register_jobs_report_menu_item():
+    return JobsReportMenuItem(
+        _("Translation jobs"),
+        reverse("wagtail_localize:jobs_report"),
+        icon_name="cogs",
+        order=9010,
+    )
+
+
 @hooks.register("register_log_actions")
 def wagtail_localize_log_actions(actions):
     @actions.register_action("wagtail_localize.convert_to_alias")
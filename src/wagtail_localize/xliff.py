@@ -0,0 +1,354 @@
+"""
+XLIFF 2.0 export and import.
+
+Each translatable string is written as a unit, named after the path of its context. The inline
+tags in strings, such as the ``<a id="a1">`` placeholders of links, are written as XLIFF inline
+codes that refer to the original tags, so CAT tools can show them as placeholders and keep them
+in the translation. They're turned back into the same tags when the file is imported.
+
+Files are written and parsed a unit at a time, so the XML of large files doesn't need to be held
+in memory. Uploaded files are limited by the same settings as PO files.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+
+from xml.sax.saxutils import XMLGenerator
+
+from django.utils.translation import gettext as _
+
+from .inline_codes import read_inline_codes, walk_inline_tags
+from .pofiles import get_po_limits
+
+
+XLIFF_NAMESPACE = "urn:oasis:names:tc:xliff:document:2.0"
+
+# The id of the <file> element of XLIFF files that are exported from a translation source rather
+# than a translation. These can be imported into any translation of the source.
+SOURCE_FILE_ID = "source"
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class InvalidXLIFFFile(ValueError):
+    """
+    Raised when an XLIFF file can't be read.
+    """
+
+
+class InlineCodes:
+    """
+    Converts the inline tags of the strings in a unit to XLIFF inline codes.
+
+    The tags are kept in the ``<originalData>`` of the unit. The codes in the target are given
+    the ids of the matching codes in the source, so that CAT tools can tell they're the same.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.source_codes = {}
+        self.code_count = 0
+
+    def get_data_ref(self, text):
+        if text not in self.data:
+            self.data[text] = f"d{len(self.data) + 1}"
+
+        return self.data[text]
+
+    def get_code_id(self, start, is_target):
+        if is_target and self.source_codes.get(start):
+            return self.source_codes[start].pop(0)
+
+        self.code_count += 1
+        code_id = str(self.code_count)
+        if not is_target:
+            self.source_codes.setdefault(start, []).append(code_id)
+
+        return code_id
+
+    def convert(self, data, is_target=False):
+        """
+        Returns the contents of a string as a list of operations to write it with.
+        """
+        self.operations = []
+        self.is_target = is_target
+        walk_inline_tags(data, self)
+        return self.operations
+
+    def text(self, text):
+        self.operations.append(("text", text))
+
+    def empty(self, tag):
+        self.operations.append(
+            (
+                "ph",
+                {
+                    "id": self.get_code_id(tag, self.is_target),
+                    "dataRef": self.get_data_ref(tag),
+                },
+            )
+        )
+
+    def start(self, start_tag, end_tag, name):
+        self.operations.append(
+            (
+                "start",
+                {
+                    "id": self.get_code_id(start_tag, self.is_target),
+                    "dataRefStart": self.get_data_ref(start_tag),
+                    "dataRefEnd": self.get_data_ref(end_tag),
+                    "type": "link" if name == "a" else "fmt",
+                },
+            )
+        )
+
+    def end(self):
+        self.operations.append(("end", None))
+
+
+def write_inline(xml, operations):
+    for operation, value in operations:
+        if operation == "text":
+            xml.characters(value)
+        elif operation == "ph":
+            xml.startElement("ph", value)
+            xml.endElement("ph")
+        elif operation == "start":
+            xml.startElement("pc", value)
+        elif operation == "end":
+            xml.endElement("pc")
+
+
+def stream_xliff(file_id, source_language, target_language, entries, original=""):
+    """
+    Yields the text of an XLIFF 2.0 file a unit at a time, so the entries don't need to be held
+    in memory.
+
+    Args:
+        file_id (str): The id of the ``<file>`` element.
+        source_language (str): The language code of the source strings.
+        target_language (str, optional): The language code of the translations.
+        entries (iterable of tuple[str, str, str]): The source string, context path and
+            translation of each unit. The translation may be blank.
+        original (str, optional): The name of the translated object.
+
+    Yields:
+        str: The header of the file, each unit, then the end of the file.
+    """
+    out = io.StringIO()
+    xml = XMLGenerator(out, encoding="utf-8", short_empty_elements=True)
+
+    def flush():
+        value = out.getvalue()
+        out.seek(0)
+        out.truncate()
+        return value
+
+    xml.startDocument()
+    xliff_attrs = {
+        "xmlns": XLIFF_NAMESPACE,
+        "version": "2.0",
+        "srcLang": source_language,
+    }
+    if target_language:
+        xliff_attrs["trgLang"] = target_language
+    xml.startElement("xliff", xliff_attrs)
+    xml.ignorableWhitespace("\n  ")
+    file_attrs = {"id": file_id}
+    if original:
+        file_attrs["original"] = original
+    xml.startElement("file", file_attrs)
+    yield flush()
+
+    for index, (source, context, target) in enumerate(entries, 1):
+        codes = InlineCodes()
+        source_operations = codes.convert(source)
+        target_operations = codes.convert(target, is_target=True) if target else None
+
+        xml.ignorableWhitespace("\n    ")
+        xml.startElement("unit", {"id": f"u{index}", "name": context})
+
+        if codes.data:
+            xml.startElement("originalData", {})
+            for text, data_id in codes.data.items():
+                xml.startElement("data", {"id": data_id})
+                xml.characters(text)
+                xml.endElement("data")
+            xml.endElement("originalData")
+
+        xml.startElement(
+            "segment", {"state": "translated" if target_operations else "initial"}
+        )
+        xml.startElement("source", {})
+        write_inline(xml, source_operations)
+        xml.endElement("source")
+        if target_operations:
+            xml.startElement("target", {})
+            write_inline(xml, target_operations)
+            xml.endElement("target")
+        xml.endElement("segment")
+
+        xml.endElement("unit")
+        yield flush()
+
+    xml.ignorableWhitespace("\n  ")
+    xml.endElement("file")
+    xml.ignorableWhitespace("\n")
+    xml.endElement("xliff")
+    xml.ignorableWhitespace("\n")
+    xml.endDocument()
+    yield flush()
+
+
+def get_tag_name(element):
+    # Strip the namespace, which ElementTree puts in braces before the name
+    return element.tag.rpartition("}")[2]
+
+
+def read_inline(element, data):
+    """
+    Returns the contents of a ``<source>`` or ``<target>`` element as the HTML of a string,
+    turning the inline codes back into the tags they refer to.
+    """
+
+    def read_code(child):
+        if get_tag_name(child) == "pc":
+            return (
+                data.get(child.get("dataRefStart"), "")
+                + read_inline(child, data)
+                + data.get(child.get("dataRefEnd"), "")
+            )
+
+        if child.get("dataRef") is not None:
+            # <ph>, <sc> and <ec> codes
+            return data.get(child.get("dataRef"), "")
+
+        # Annotations, such as <mrk>, that don't stand for any tags
+        return None
+
+    return read_inline_codes(element, read_code)
+
+
+def read_unit(unit):
+    """
+    Returns the source string, context path and translation of a ``<unit>`` element.
+    """
+    data = {}
+    source = []
+    target = []
+
+    for child in unit:
+        name = get_tag_name(child)
+        if name == "originalData":
+            data = {element.get("id"): element.text or "" for element in child}
+        elif name in ["segment", "ignorable"]:
+            for element in child:
+                if get_tag_name(element) == "source":
+                    source.append(read_inline(element, data))
+                elif get_tag_name(element) == "target":
+                    target.append(read_inline(element, data))
+
+    return "".join(source), unit.get("name", ""), "".join(target)
+
+
+class XLIFFFile:
+    """
+    An XLIFF 2.0 file that is being read.
+
+    The header of the file is read straight away. The units are read while iterating over the
+    file, so it can only be iterated over once.
+
+    The file is parsed with ElementTree, which doesn't fetch external entities, and the version
+    of Expat it uses limits the expansion of internal ones.
+
+    Args:
+        file (bytes | file): The contents of the file, or a file object to read them from, such as
+            an UploadedFile.
+        max_size (int, optional): The maximum size of the file in bytes. Defaults to the
+            WAGTAILLOCALIZE_PO_MAX_SIZE setting.
+        max_units (int, optional): The maximum number of units in the file. Defaults to the
+            WAGTAILLOCALIZE_PO_MAX_ENTRIES setting.
+
+    Raises:
+        InvalidXLIFFFile: If the file isn't a valid XLIFF 2.0 file. Files that are over the limits
+            raise it while they're being read.
+    """
+
+    def __init__(self, file, max_size=None, max_units=None):
+        if isinstance(file, bytes):
+            file = io.BytesIO(file)
+
+        default_max_size, default_max_units = get_po_limits()
+        self.max_size = default_max_size if max_size is None else max_size
+        self.max_units = default_max_units if max_units is None else max_units
+
+        self.file = file
+        self.source_language = None
+        self.target_language = None
+        self.file_id = None
+        self._events = self._read_events()
+
+        # The elements that have been started but not ended yet
+        self._parents = []
+
+        for event, element in self._events:
+            if event != "start":
+                self._parents.pop()
+                continue
+
+            self._parents.append(element)
+            if element.tag == f"{{{XLIFF_NAMESPACE}}}xliff":
+                self.source_language = element.get("srcLang")
+                self.target_language = element.get("trgLang")
+            elif element.tag == f"{{{XLIFF_NAMESPACE}}}file":
+                self.file_id = element.get("id")
+                break
+            else:
+                break
+
+        if self.source_language is None or self.file_id is None:
+            raise InvalidXLIFFFile(_("Please upload a valid XLIFF file."))
+
+    def _read_events(self):
+        parser = ET.XMLPullParser(events=["start", "end"])
+        size = 0
+        try:
+            while chunk := self.file.read(READ_CHUNK_SIZE):
+                size += len(chunk)
+                if size > self.max_size:
+                    raise InvalidXLIFFFile(_("The XLIFF file is too large."))
+
+                parser.feed(chunk)
+                yield from parser.read_events()
+
+            parser.close()
+            yield from parser.read_events()
+        except ET.ParseError as e:
+            raise InvalidXLIFFFile(_("Please upload a valid XLIFF file.")) from e
+
+    def __iter__(self):
+        """
+        Yields the source string, context path and translation of each unit.
+        """
+        parents = self._parents
+        units = 0
+        for event, element in self._events:
+            if event == "start":
+                parents.append(element)
+                continue
+
+            parents.pop()
+            if element.tag == f"{{{XLIFF_NAMESPACE}}}unit":
+                units += 1
+                if units > self.max_units:
+                    raise InvalidXLIFFFile(_("The XLIFF file has too many units."))
+
+                yield read_unit(element)
+
+                # Units are removed once they've been read, so the file isn't built up in memory
+                if parents:
+                    parents[-1].remove(element)
+
+            elif element.tag == f"{{{XLIFF_NAMESPACE}}}file":
+                # Only the first file is imported
+                break
@@ -0,0 +1,170 @@
+import threading
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from wagtail.models import Locale
+
+from wagtail_localize.machine_translators import get_machine_translator
+from wagtail_localize.machine_translators.base import MachineTranslationError
+from wagtail_localize.machine_translators.deepl import DeepLTranslator
+from wagtail_localize.machine_translators.dummy import DummyTranslator
+from wagtail_localize.models import CachedMachineTranslation
+from wagtail_localize.strings import StringValue
+
+
+class TestChunking(TestCase):
+    def setUp(self):
+        self.english_locale = Locale.objects.get()
+        self.french_locale = Locale.objects.create(language_code="fr")
+
+    def get_chunks(self, translator, strings):
+        return [
+            [string.data for string in chunk]
+            for chunk in translator.get_chunks([StringValue(s) for s in strings])
+        ]
+
+    def test_unlimited(self):
+        self.assertEqual(
+            self.get_chunks(DummyTranslator({}), ["a", "b", "c"]), [["a", "b", "c"]]
+        )
+        self.assertEqual(self.get_chunks(DummyTranslator({}), []), [])
+
+    def test_max_strings_per_request(self):
+        translator = DummyTranslator({})
+        translator.max_strings_per_request = 2
+
+        self.assertEqual(
+            self.get_chunks(translator, ["a", "b", "c", "d", "e"]),
+            [["a", "b"], ["c", "d"], ["e"]],
+        )
+
+        # Limits can be overridden with options
+        translator.options = {"MAX_STRINGS_PER_REQUEST": 3}
+        self.assertEqual(
+            self.get_chunks(translator, ["a", "b", "c", "d", "e"]),
+            [["a", "b", "c"], ["d", "e"]],
+        )
+
+    def test_max_bytes_per_request(self):
+        translator = DummyTranslator({"MAX_BYTES_PER_REQUEST": 6})
+
+        self.assertEqual(
+            self.get_chunks(translator, ["aa", "bb", "cc", "dd", "ééé", "eeeeeeeeee"]),
+            [["aa", "bb", "cc"], ["dd"], ["ééé"], ["eeeeeeeeee"]],
+        )
+
+    def test_translate_in_chunks(self):
+        translator = DummyTranslator({"MAX_STRINGS_PER_REQUEST": 1})
+        thread_names = set()
+        barrier = threading.Barrier(3, timeout=10)
+
+        def translate(source_locale, target_locale, strings):
+            # Wait until all the requests are in progress
+            barrier.wait()
+            thread_names.add(threading.current_thread().name)
+            return {string: StringValue(string.data.upper()) for string in strings}
+
+        with mock.patch.object(translator, "translate", side_effect=translate):
+            translations = translator.translate_in_chunks(
+                self.english_locale,
+                self.french_locale,
+                [StringValue("a"), StringValue("b"), StringValue("c")],
+            )
+
+        self.assertEqual(
+            list(translations.items()),
+            [
+                (StringValue("a"), StringValue("A")),
+                (StringValue("b"), StringValue("B")),
+                (StringValue("c"), StringValue("C")),
+            ],
+        )
+        self.assertEqual(len(thread_names), 3)
+
+    def test_single_chunk_is_translated_in_the_calling_thread(self):
+        translator = DummyTranslator({})
+
+        with mock.patch.object(
+            translator, "translate", wraps=translator.translate
+        ) as translate:
+            translator.translate_in_chunks(
+                self.english_locale, self.french_locale, [StringValue("Hello world!")]
+            )
+
+        translate.assert_called_once_with(
+            self.english_locale, self.french_locale, [StringValue("Hello world!")]
+        )
+
+    def test_errors_are_reported_per_chunk(self):
+        translator = DummyTranslator({"MAX_STRINGS_PER_REQUEST": 1, "CACHE": {}})
+        error = ConnectionError("Connection reset")
+
+        def translate(source_locale, target_locale, strings):
+            if strings[0].data == "b":
+                raise error
+            return {string: StringValue(string.data.upper()) for string in strings}
+
+        with (
+            mock.patch.object(translator, "translate", side_effect=translate),
+            self.assertLogs("wagtail_localize.machine_translators.base", "WARNING"),
+            self.assertRaises(MachineTranslationError) as context,
+        ):
+            translator.get_translations(
+                self.english_locale,
+                self.french_locale,
+                [StringValue("a"), StringValue("b"), StringValue("c")],
+            )
+
+        self.assertEqual(context.exception.errors, [([StringValue("b")], error)])
+        self.assertEqual(
+            context.exception.translations,
+            {StringValue("a"): StringValue("A"), StringValue("c"): StringValue("C")},
+        )
+
+        # The translations from the requests that succeeded are cached
+        self.assertEqual(
+            set(CachedMachineTranslation.objects.values_list("data", flat=True)),
+            {"A", "C"},
+        )
+
+
+class TestGetMachineTranslator(TestCase):
+    def test_translator_is_reused(self):
+        translator = get_machine_translator()
+
+        self.assertIsInstance(translator, DummyTranslator)
+        self.assertIs(get_machine_translator(), translator)
+
+    def test_translator_is_recreated_when_settings_change(self):
+        translator = get_machine_translator()
+
+        with override_settings(
+            WAGTAILLOCALIZE_MACHINE_TRANSLATOR={
+                "CLASS": "wagtail_localize.machine_translators.dummy.DummyTranslator",
+                "OPTIONS": {"CACHE": {}},
+            }
+        ):
+            other_translator = get_machine_translator()
+            self.assertIsNot(other_translator, translator)
+            self.assertEqual(other_translator.options, {"CACHE": {}})
+
+        self.assertIsNot(get_machine_translator(), other_translator)
+
+    @override_settings(WAGTAILLOCALIZE_MACHINE_TRANSLATOR=None)
+    def test_no_translator(self):
+        self.assertIsNone(get_machine_translator())
+
+
+class TestHTTPSession(TestCase):
+    def test_session_is_pooled(self):
+        translator = DeepLTranslator({"AUTH_KEY": "key"})
+
+        adapter = translator.session.get_adapter("https://api.deepl.com/v2/translate")
+        self.assertEqual(adapter._pool_maxsize, 10)
+
+    def test_pool_size_option(self):
+        translator = DeepLTranslator({"AUTH_KEY": "key", "POOL_SIZE": 20})
+
+        adapter = translator.session.get_adapter("https://api.deepl.com/v2/translate")
+        self.assertEqual(adapter._pool_maxsize, 20)
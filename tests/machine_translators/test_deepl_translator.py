@@ -72,7 +72,7 @@ class TestDeeplTranslator(TestCase):
         self.assertEqual(paid_api_endpoint, "https://api.deepl.com/v2/translate")
 
     @override_settings(WAGTAILLOCALIZE_MACHINE_TRANSLATOR=DEEPL_SETTINGS_WITH_FORMALITY)
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_with_formality_option(self, mock_post):
         # Mock the response
         mock_response = Mock()
@@ -92,7 +92,7 @@ class TestDeeplTranslator(TestCase):
         self.assertEqual(called_args[1]["formality"], "prefer_less")
 
     @override_settings(WAGTAILLOCALIZE_MACHINE_TRANSLATOR=DEEPL_SETTINGS_PAID_ENDPOINT)
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_without_formality_option(self, mock_post):
         # Mock the response
         mock_response = Mock()
@@ -113,7 +113,7 @@ class TestDeeplTranslator(TestCase):
     @override_settings(
         WAGTAILLOCALIZE_MACHINE_TRANSLATOR=DEEPL_SETTINGS_WITH_UNSUPPORTED_FORMALITY
     )
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("warnings.warn")
     def test_translate_with_non_supported_formality_option(self, mock_warn, mock_post):
         # Mock the response
@@ -161,7 +161,7 @@ class TestDeeplTranslator(TestCase):
     @override_settings(
         WAGTAILLOCALIZE_MACHINE_TRANSLATOR=DEEPL_SETTINGS_WITH_GLOSSARY_IDS
     )
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_with_glossary_ids(self, mock_post):
         # Mock the response
         mock_response = Mock()
@@ -183,7 +183,7 @@ class TestDeeplTranslator(TestCase):
     @override_settings(
         WAGTAILLOCALIZE_MACHINE_TRANSLATOR=DEEPL_SETTINGS_WITH_MISSING_GLOSSARY_IDS
     )
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_with_missing_glossary_ids(self, mock_post):
         # Mock the response
         mock_response = Mock()
@@ -200,3 +200,33 @@ class TestDeeplTranslator(TestCase):
         mock_post.assert_called_once()
         called_args, called_kwargs = mock_post.call_args
         self.assertNotIn("glossary_id", called_args[1])
+
+    @override_settings(WAGTAILLOCALIZE_MACHINE_TRANSLATOR=DEEPL_SETTINGS_PAID_ENDPOINT)
+    @patch("requests.Session.post")
+    def test_large_batches_are_split_up(self, mock_post):
+        def post(url, parameters, **kwargs):
+            response = Mock()
+            response.json.return_value = {
+                "translations": [{"text": text.upper()} for text in parameters["text"]]
+            }
+            return response
+
+        mock_post.side_effect = post
+
+        translator = get_machine_translator()
+        source_locale = Mock(language_code="en")
+        target_locale = Mock(language_code="de")
+        strings = [StringValue(f"String {i}") for i in range(120)]
+
+        translations = translator.get_translations(
+            source_locale, target_locale, strings
+        )
+
+        self.assertEqual(
+            sorted(len(call.args[1]["text"]) for call in mock_post.call_args_list),
+            [20, 50, 50],
+        )
+        self.assertEqual(
+            list(translations.values()),
+            [StringValue(f"STRING {i}") for i in range(120)],
+        )
@@ -42,9 +42,9 @@ class TestLibreTranslator(TestCase):
         )
         self.assertEqual(self.translator.language_code("foo-bar-baz"), "foo")
 
-    @mock.patch("wagtail_localize.machine_translators.libretranslate.requests.post")
+    @mock.patch("requests.Session.post")
     def test_translate_text(self, mock_post):
-        # Mock the response of requests.post
+        # Mock the response of the session
         mock_response = mock.Mock()
         mock_response.json.return_value = {
             "translatedText": [
@@ -74,7 +74,7 @@ class TestLibreTranslator(TestCase):
         # Assertions to check if the translation is as expected
         self.assertEqual(translations, expected_translations)
 
-        # Assert that requests.post was called with the correct arguments
+        # Assert that the request was sent with the correct arguments
         mock_post.assert_called_once_with(
             LIBRETRANSLATE_SETTINGS_ENDPOINT["OPTIONS"]["LIBRETRANSLATE_URL"]
             + "/translate",
@@ -94,9 +94,9 @@ class TestLibreTranslator(TestCase):
             timeout=10,
         )
 
-    @mock.patch("wagtail_localize.machine_translators.libretranslate.requests.post")
+    @mock.patch("requests.Session.post")
     def test_translate_html(self, mock_post):
-        # Mock the response of requests.post
+        # Mock the response of the session
         mock_response = mock.Mock()
         mock_response.json.return_value = {
             "translatedText": ["""<a id="a1">Bonjour !</a>. <b>C'est un test</b>."""]
@@ -128,7 +128,7 @@ class TestLibreTranslator(TestCase):
 
         self.assertEqual(rendered_html, expected_rendered_html)
 
-        # Assert that requests.post was called with the correct arguments
+        # Assert that the request was sent with the correct arguments
         mock_post.assert_called_once_with(
             LIBRETRANSLATE_SETTINGS_ENDPOINT["OPTIONS"]["LIBRETRANSLATE_URL"]
             + "/translate",
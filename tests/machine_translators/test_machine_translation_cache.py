@@ -0,0 +1,226 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from wagtail.models import Locale
+
+from wagtail_localize.machine_translators.deepl import DeepLTranslator
+from wagtail_localize.machine_translators.dummy import DummyTranslator
+from wagtail_localize.models import CachedMachineTranslation
+from wagtail_localize.strings import StringValue
+
+
+class TestMachineTranslationCache(TestCase):
+    def setUp(self):
+        self.english_locale = Locale.objects.get()
+        self.french_locale = Locale.objects.create(language_code="fr")
+
+    def get_translations(self, translator, strings):
+        with mock.patch.object(
+            translator, "translate", wraps=translator.translate
+        ) as translate:
+            translations = translator.get_translations(
+                self.english_locale,
+                self.french_locale,
+                [StringValue(string) for string in strings],
+            )
+
+        if translate.called:
+            sent = [string.data for string in translate.call_args.args[2]]
+        else:
+            sent = []
+
+        return {
+            string.data: translation.data
+            for string, translation in translations.items()
+        }, sent
+
+    def test_without_cache(self):
+        translator = DummyTranslator({})
+
+        self.get_translations(translator, ["Hello world!"])
+        translations, sent = self.get_translations(translator, ["Hello world!"])
+
+        self.assertEqual(translations, {"Hello world!": "world! Hello"})
+        self.assertEqual(sent, ["Hello world!"])
+        self.assertFalse(CachedMachineTranslation.objects.exists())
+
+    def test_only_misses_are_translated(self):
+        translator = DummyTranslator({"CACHE": {}})
+
+        translations, sent = self.get_translations(translator, ["Hello world!"])
+        self.assertEqual(translations, {"Hello world!": "world! Hello"})
+        self.assertEqual(sent, ["Hello world!"])
+
+        with self.assertNumQueries(3):
+            # Look up, mark the hits as used, then store the new translation
+            translations, sent = self.get_translations(
+                translator, ["Hello world!", "Good morning"]
+            )
+
+        self.assertEqual(
+            translations,
+            {"Hello world!": "world! Hello", "Good morning": "morning Good"},
+        )
+        self.assertEqual(sent, ["Good morning"])
+
+        entry = CachedMachineTranslation.objects.get(data="world! Hello")
+        self.assertEqual(
+            entry.translator,
+            "wagtail_localize.machine_translators.dummy.DummyTranslator",
+        )
+        self.assertEqual(entry.source_locale, self.english_locale)
+        self.assertEqual(entry.target_locale, self.french_locale)
+
+    def test_all_hits(self):
+        translator = DummyTranslator({"CACHE": {}})
+        self.get_translations(translator, ["Hello world!"])
+
+        translations, sent = self.get_translations(translator, ["Hello world!"])
+
+        self.assertEqual(translations, {"Hello world!": "world! Hello"})
+        self.assertEqual(sent, [])
+
+    def test_options_are_part_of_the_key(self):
+        self.get_translations(DummyTranslator({"CACHE": {}}), ["Hello world!"])
+
+        # Options that don't affect the translations are ignored
+        _translations, sent = self.get_translations(
+            DummyTranslator({"CACHE": {"TTL": 60}, "TIMEOUT": 5}), ["Hello world!"]
+        )
+        self.assertEqual(sent, [])
+
+        _translations, sent = self.get_translations(
+            DummyTranslator({"CACHE": {}, "FORMALITY": "prefer_less"}),
+            ["Hello world!"],
+        )
+        self.assertEqual(sent, ["Hello world!"])
+
+    def test_options_fingerprint(self):
+        options = {
+            "AUTH_KEY": "key",
+            "GLOSSARY_IDS": {("EN", "DE"): "test-id-de", ("EN", "FR"): "test-id-fr"},
+        }
+        fingerprint = DeepLTranslator(options).get_options_fingerprint()
+
+        # Auth keys can be rotated without invalidating the cache
+        self.assertEqual(
+            DeepLTranslator(
+                {**options, "AUTH_KEY": "new-key"}
+            ).get_options_fingerprint(),
+            fingerprint,
+        )
+        self.assertNotEqual(
+            DeepLTranslator(
+                {**options, "GLOSSARY_IDS": {("EN", "FR"): "test-id-fr"}}
+            ).get_options_fingerprint(),
+            fingerprint,
+        )
+
+    def test_ttl(self):
+        translator = DummyTranslator({"CACHE": {"TTL": 3600}})
+        self.get_translations(translator, ["Hello world!", "Good morning"])
+        CachedMachineTranslation.objects.filter(data="world! Hello").update(
+            created_at=timezone.now() - timedelta(hours=2)
+        )
+
+        _translations, sent = self.get_translations(
+            translator, ["Hello world!", "Good morning"]
+        )
+
+        self.assertEqual(sent, ["Hello world!"])
+        entry = CachedMachineTranslation.objects.get(data="world! Hello")
+        self.assertGreater(entry.created_at, timezone.now() - timedelta(minutes=1))
+
+    def test_max_entries(self):
+        translator = DummyTranslator(
+            {"CACHE": {"MAX_ENTRIES": 2, "EVICTION_INTERVAL": 0}}
+        )
+        self.get_translations(translator, ["One"])
+        CachedMachineTranslation.objects.update(
+            last_used_at=timezone.now() - timedelta(hours=1)
+        )
+        self.get_translations(translator, ["Two"])
+
+        self.get_translations(translator, ["Three"])
+
+        self.assertEqual(
+            set(CachedMachineTranslation.objects.values_list("data", flat=True)),
+            {"Two", "Three"},
+        )
+
+    def test_missing_translations_arent_cached(self):
+        translator = DummyTranslator({"CACHE": {}})
+
+        with mock.patch.object(
+            translator,
+            "translate",
+            return_value={StringValue("Hello world!"): StringValue(None)},
+        ):
+            translator.get_translations(
+                self.english_locale, self.french_locale, [StringValue("Hello world!")]
+            )
+
+        self.assertFalse(CachedMachineTranslation.objects.exists())
+
+    def test_eviction_is_occasional(self):
+        translator = DummyTranslator({"CACHE": {"MAX_ENTRIES": 1}})
+
+        with mock.patch.object(
+            translator,
+            "evict_cached_translations",
+            wraps=translator.evict_cached_translations,
+        ) as evict_cached_translations:
+            self.get_translations(translator, ["One"])
+            self.get_translations(translator, ["Two"])
+
+        self.assertEqual(evict_cached_translations.call_count, 1)
+        self.assertEqual(CachedMachineTranslation.objects.count(), 2)
+
+    def test_update_conflicts_without_unique_fields(self):
+        # MySQL and MariaDB can't be told which unique fields to match on
+        translator = DummyTranslator({"CACHE": {}})
+
+        with (
+            mock.patch.object(
+                connection.features, "supports_update_conflicts_with_target", False
+            ),
+            mock.patch.object(
+                CachedMachineTranslation.objects, "bulk_create"
+            ) as bulk_create,
+        ):
+            self.get_translations(translator, ["Hello world!"])
+
+        self.assertTrue(bulk_create.call_args.kwargs["update_conflicts"])
+        self.assertNotIn("unique_fields", bulk_create.call_args.kwargs)
+
+    def test_update_or_create_without_update_conflicts(self):
+        translator = DummyTranslator({"CACHE": {}})
+        self.get_translations(translator, ["Hello world!"])
+        CachedMachineTranslation.objects.update(
+            data="Stale", created_at=timezone.now() - timedelta(hours=1)
+        )
+
+        with (
+            mock.patch.object(
+                connection.features, "supports_update_conflicts_with_target", False
+            ),
+            mock.patch.object(connection.features, "supports_update_conflicts", False),
+        ):
+            translator.cache_translations(
+                self.english_locale,
+                self.french_locale,
+                {
+                    StringValue("Hello world!"): StringValue("world! Hello"),
+                    StringValue("Good morning"): StringValue("morning Good"),
+                },
+            )
+
+        self.assertEqual(
+            set(CachedMachineTranslation.objects.values_list("data", flat=True)),
+            {"world! Hello", "morning Good"},
+        )
+        entry = CachedMachineTranslation.objects.get(data="world! Hello")
+        self.assertGreater(entry.created_at, timezone.now() - timedelta(minutes=1))
@@ -0,0 +1,271 @@
+from unittest import mock
+
+import requests
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from freezegun import freeze_time
+from wagtail.models import Locale
+
+from wagtail_localize.machine_translators.base import MachineTranslationError
+from wagtail_localize.machine_translators.deepl import DeepLTranslator
+from wagtail_localize.machine_translators.dummy import DummyTranslator
+from wagtail_localize.machine_translators.resilience import (
+    MachineTranslatorUnavailable,
+    TokenBucket,
+)
+from wagtail_localize.strings import StringValue
+
+
+def http_error(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+RESILIENCE_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "cache",
+    },
+    "machine_translation": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "wagtail-localize-machine-translation",
+    },
+}
+
+
+@override_settings(CACHES=RESILIENCE_CACHES)
+class ResilienceTestCase(TestCase):
+    def setUp(self):
+        self.english_locale = Locale.objects.get()
+        self.french_locale = Locale.objects.create(language_code="fr")
+        self.strings = [StringValue("Hello world")]
+
+        caches["machine_translation"].clear()
+
+        sleep_patcher = mock.patch("time.sleep")
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def send_request(self, translator):
+        return translator.send_request(
+            self.english_locale, self.french_locale, self.strings
+        )
+
+
+class TestRetry(ResilienceTestCase):
+    def test_transient_errors_are_retried(self):
+        translator = DummyTranslator({})
+        with mock.patch.object(
+            translator,
+            "translate",
+            side_effect=[
+                http_error(503),
+                requests.ConnectionError(),
+                {self.strings[0]: StringValue("Bonjour le monde")},
+            ],
+        ) as mock_translate:
+            translations = self.send_request(translator)
+
+        self.assertEqual(
+            translations, {self.strings[0]: StringValue("Bonjour le monde")}
+        )
+        self.assertEqual(mock_translate.call_count, 3)
+
+        # The delay doubles after each attempt, with some jitter
+        first_delay, second_delay = (
+            call.args[0] for call in self.mock_sleep.call_args_list
+        )
+        self.assertTrue(0.5 <= first_delay <= 1)
+        self.assertTrue(1 <= second_delay <= 2)
+
+    def test_retries_give_up(self):
+        translator = DummyTranslator({"RETRY_ATTEMPTS": 2})
+        with (
+            mock.patch.object(
+                translator, "translate", side_effect=http_error(429)
+            ) as mock_translate,
+            self.assertRaises(requests.HTTPError),
+        ):
+            self.send_request(translator)
+
+        self.assertEqual(mock_translate.call_count, 3)
+
+    def test_other_errors_arent_retried(self):
+        translator = DummyTranslator({})
+        with (
+            mock.patch.object(
+                translator, "translate", side_effect=http_error(403)
+            ) as mock_translate,
+            self.assertRaises(requests.HTTPError),
+        ):
+            self.send_request(translator)
+
+        self.assertEqual(mock_translate.call_count, 1)
+        self.mock_sleep.assert_not_called()
+
+    def test_retry_after_header(self):
+        translator = DummyTranslator({"RETRY_ATTEMPTS": 1})
+        with mock.patch.object(
+            translator,
+            "translate",
+            side_effect=[
+                http_error(429, {"Retry-After": "12"}),
+                {self.strings[0]: StringValue("Bonjour le monde")},
+            ],
+        ):
+            self.send_request(translator)
+
+        self.mock_sleep.assert_called_once_with(12)
+
+    def test_chunks_are_retried(self):
+        translator = DummyTranslator({"MAX_STRINGS_PER_REQUEST": 1})
+        strings = [StringValue("Hello"), StringValue("world")]
+        with mock.patch.object(
+            translator,
+            "translate",
+            side_effect=[http_error(502), *[{string: string} for string in strings]],
+        ):
+            translations = translator.translate_in_chunks(
+                self.english_locale, self.french_locale, strings
+            )
+
+        self.assertEqual(set(translations), set(strings))
+
+    def test_deepl_checks_the_status(self):
+        translator = DeepLTranslator({"AUTH_KEY": "key", "RETRY_ATTEMPTS": 0})
+        response = requests.Response()
+        response.status_code = 503
+        with (
+            mock.patch("requests.Session.post", return_value=response),
+            self.assertRaises(MachineTranslationError) as e,
+            self.assertLogs("wagtail_localize.machine_translators.base", "WARNING"),
+        ):
+            translator.translate_in_chunks(
+                self.english_locale, self.french_locale, self.strings
+            )
+
+        self.assertIsInstance(e.exception.errors[0][1], requests.HTTPError)
+
+
+class TestCircuitBreaker(ResilienceTestCase):
+    def get_translator(self):
+        return DummyTranslator(
+            {
+                "RETRY_ATTEMPTS": 0,
+                "CIRCUIT_BREAKER": {
+                    "FAILURES": 2,
+                    "RESET_TIMEOUT": 60,
+                    "CACHE": "machine_translation",
+                },
+            }
+        )
+
+    def test_circuit_breaker_opens_after_failures(self):
+        translator = self.get_translator()
+        with mock.patch.object(
+            translator, "translate", side_effect=requests.Timeout()
+        ) as mock_translate:
+            for _i in range(2):
+                with self.assertRaises(requests.Timeout):
+                    self.send_request(translator)
+
+            # Requests fail fast while the breaker is open
+            with self.assertRaises(MachineTranslatorUnavailable):
+                self.send_request(translator)
+
+        self.assertEqual(mock_translate.call_count, 2)
+
+        # The breaker is shared with other instances of the translator
+        with self.assertRaises(MachineTranslatorUnavailable):
+            self.send_request(self.get_translator())
+
+    def test_circuit_breaker_closes_after_success(self):
+        translator = self.get_translator()
+        with (
+            freeze_time("2026-01-01 12:00:00"),
+            mock.patch.object(translator, "translate", side_effect=requests.Timeout()),
+        ):
+            for _i in range(2):
+                with self.assertRaises(requests.Timeout):
+                    self.send_request(translator)
+
+        with freeze_time("2026-01-01 12:01:01"):
+            # A request is let through after the reset timeout
+            self.assertEqual(
+                self.send_request(translator),
+                {self.strings[0]: StringValue("world Hello")},
+            )
+
+            with (
+                mock.patch.object(
+                    translator, "translate", side_effect=requests.Timeout()
+                ),
+                self.assertRaises(requests.Timeout),
+            ):
+                self.send_request(translator)
+
+            # One failure isn't enough to open the breaker again
+            self.send_request(translator)
+
+    def test_other_errors_dont_open_circuit_breaker(self):
+        translator = self.get_translator()
+        with mock.patch.object(translator, "translate", side_effect=ValueError):
+            for _i in range(3):
+                with self.assertRaises(ValueError):
+                    self.send_request(translator)
+
+        translator.circuit_breaker.check()
+
+
+class TestRateLimit(ResilienceTestCase):
+    def test_token_bucket(self):
+        bucket = TokenBucket("test", requests=2, period=10, cache="machine_translation")
+
+        with freeze_time("2026-01-01 12:00:00"):
+            self.assertEqual(bucket.try_acquire(), 0)
+            self.assertEqual(bucket.try_acquire(), 0)
+            self.assertEqual(bucket.try_acquire(), 5)
+
+        # The bucket refills at 2 requests per 10 seconds
+        with freeze_time("2026-01-01 12:00:05"):
+            self.assertEqual(bucket.try_acquire(), 0)
+            self.assertEqual(bucket.try_acquire(), 5)
+
+    def test_rate_limit_waits_for_token(self):
+        translator = DummyTranslator(
+            {
+                "RATE_LIMIT": {
+                    "REQUESTS": 1,
+                    "PERIOD": 1,
+                    "CACHE": "machine_translation",
+                }
+            }
+        )
+
+        with freeze_time("2026-01-01 12:00:00") as frozen_time:
+            self.mock_sleep.side_effect = frozen_time.tick
+            self.send_request(translator)
+            self.send_request(translator)
+
+        self.mock_sleep.assert_called_once_with(1)
+
+    def test_rate_limit_max_wait(self):
+        translator = DummyTranslator(
+            {
+                "RATE_LIMIT": {
+                    "REQUESTS": 1,
+                    "PERIOD": 60,
+                    "MAX_WAIT": 10,
+                    "CACHE": "machine_translation",
+                }
+            }
+        )
+
+        with freeze_time("2026-01-01 12:00:00"):
+            self.send_request(translator)
+
+            with self.assertRaises(MachineTranslatorUnavailable):
+                self.send_request(translator)
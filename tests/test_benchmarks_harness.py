@@ -141,8 +141,8 @@ class TestCatalogIntegrity(SimpleTestCase):
 
     def test_the_catalog_expands_to_the_executions_it_claims(self):
         expanded = catalog.executions()
-        self.assertEqual(len(catalog.CATALOG), 8)
-        self.assertEqual(len(expanded), 15)
+        self.assertEqual(len(catalog.CATALOG), 11)
+        self.assertEqual(len(expanded), 21)
         self.assertEqual(
             len(expanded), sum(len(flow.sizes()) for flow in catalog.CATALOG)
         )
@@ -397,6 +397,7 @@ class TestOrchestration(SimpleTestCase):
                 "workload_unit": None,
                 "expected_workload": None,
                 "observed_workload": None,
+                "counters": {},
             }
 
         with (
@@ -478,7 +479,7 @@ class TestUnusableChildResult(SimpleTestCase):
         payload = (
             '{"pid": 1, "database": "d", "queries": 7, "seconds": 0.5, '
             '"observed_workload": null, "expected_workload": null, '
-            '"workload_unit": null}'
+            '"workload_unit": null, "counters": {}}'
         )
         result = self._execute_with_stdout(run.RESULT_PREFIX + payload)
         self.assertNotIn("error", result)
@@ -523,7 +524,13 @@ class TestCatalogOrder(SimpleTestCase):
                 self.assertLess(order.index(name), editor)
 
         # Updating an existing translation only makes sense once one exists.
-        for name in ("update_translations_get", "update_translations_post_publish"):
+        for name in (
+            "machine_translate_post",
+            "machine_translate_post_cached",
+            "update_translations_get",
+            "update_translations_post_publish",
+            "update_translations_post_machine_translate",
+        ):
             with self.subTest(flow=name):
                 self.assertGreater(order.index(name), editor)
 
@@ -536,6 +543,17 @@ class TestCatalogOrder(SimpleTestCase):
                 self.assertEqual(run._executions_for(name, None), [(flow, None)])
 
 
+class TestCounters(SimpleTestCase):
+    def test_the_machine_translation_flows_count_provider_requests(self):
+        for name in (
+            "machine_translate_post",
+            "machine_translate_post_cached",
+            "update_translations_post_machine_translate",
+        ):
+            with self.subTest(flow=name):
+                self.assertIsNotNone(catalog.BY_NAME[name].counters)
+
+
 class TestPublicResult(SimpleTestCase):
     """The JSON is shared and archived, so it carries what a reader needs and
     nothing that belongs to one run on one machine."""
@@ -549,6 +567,7 @@ class TestPublicResult(SimpleTestCase):
             "workload_unit": "things",
             "expected_workload": 7,
             "observed_workload": 7,
+            "counters": {"provider_requests": 2},
             "seconds_median": 0.5,
             "seconds_min": 0.5,
             "seconds_max": 0.5,
@@ -568,6 +587,7 @@ class TestPublicResult(SimpleTestCase):
         self.assertEqual(public["workload_unit"], "things")
         self.assertEqual(public["expected_workload"], 7)
         self.assertEqual(public["observed_workload"], 7)
+        self.assertEqual(public["counters"], {"provider_requests": 2})
         self.assertEqual(public["status"], "ok")
         self.assertEqual(public["repeats"], 1)
         self.assertEqual(public["seconds_median"], 0.5)
@@ -582,6 +602,7 @@ class TestPublicResult(SimpleTestCase):
         for field in (
             "queries",
             "observed_workload",
+            "counters",
             "seconds_median",
             "seconds_min",
             "seconds_max",
@@ -609,6 +630,7 @@ class TestJsonDocument(SimpleTestCase):
                     "workload_unit": None,
                     "expected_workload": None,
                     "observed_workload": None,
+                    "counters": {},
                     "seconds_median": 0.0,
                     "seconds_min": 0.0,
                     "seconds_max": 0.0,
@@ -631,6 +653,7 @@ class TestJsonDocument(SimpleTestCase):
                     "workload_unit": None,
                     "expected_workload": None,
                     "observed_workload": None,
+                    "counters": {},
                     "seconds_median": 0.0,
                     "seconds_min": 0.0,
                     "seconds_max": 0.0,
@@ -660,6 +683,7 @@ class TestJsonRun(SimpleTestCase):
                 "workload_unit": None,
                 "expected_workload": None,
                 "observed_workload": None,
+                "counters": {},
                 "pid": 100 + index,
                 "database": f"/tmp/x/run-{index}.sqlite3",  # noqa: S108
             }
@@ -709,7 +733,7 @@ class TestJsonRun(SimpleTestCase):
         code, document = self._run([run.ALL, "--repeat", "3"], stable=True)
         self.assertEqual(code, 0)
         self.assertEqual(document["status"], "complete")
-        self.assertEqual(document["schema_version"], 2)
+        self.assertEqual(document["schema_version"], 3)
         for execution in document["executions"]:
             with self.subTest(flow=execution["flow"], size=execution["size"]):
                 self.assertEqual(execution["repeats"], 3)
@@ -857,6 +881,7 @@ class TestRepeatedExecutions(SimpleTestCase):
             "workload_unit": "things",
             "expected_workload": 7,
             "observed_workload": 7,
+            "counters": {},
         }
         result.update(overrides)
         return result
@@ -932,6 +957,7 @@ class TestRepeatedExecutions(SimpleTestCase):
             ("workload_unit", "others"),
             ("expected_workload", 8),
             ("observed_workload", 8),
+            ("counters", {"provider_requests": 1}),
         ):
             with self.subTest(field=field):
                 aggregate = run._aggregate(
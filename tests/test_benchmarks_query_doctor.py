@@ -470,6 +470,7 @@ class TestTheBenchmarkRunnerIsUnaffected(SimpleTestCase):
                 "workload_unit": None,
                 "expected_workload": None,
                 "observed_workload": None,
+                "counters": {},
             }
 
         with (
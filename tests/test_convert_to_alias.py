@@ -22,10 +22,11 @@ class ConvertToAliasTestBase(WagtailTestUtils, TestCase):
             )
         )
 
-        LocaleSynchronization.objects.create(
-            locale=cls.fr_locale,
-            sync_from=cls.en_locale,
-        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            LocaleSynchronization.objects.create(
+                locale=cls.fr_locale,
+                sync_from=cls.en_locale,
+            )
         cls.fr_page = cls.page.get_translation(cls.fr_locale)
 
     def setUp(self):
@@ -1,5 +1,7 @@
 import json
 import tempfile
+import threading
+import time
 import uuid
 
 from unittest.mock import patch
@@ -11,8 +13,9 @@ from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.messages import get_messages
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import transaction
+from django.db import connection, transaction
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy
@@ -44,22 +47,28 @@ from tests.testapp.models import (
     TestSnippet,
     TestSnippetOrderable,
 )
-from wagtail_localize.machine_translators.dummy import translate_html
+from wagtail_localize.machine_translators.dummy import DummyTranslator, translate_html
 from wagtail_localize.models import (
     OverridableSegment,
     SegmentOverride,
     String,
+    StringSegment,
     StringTranslation,
     Translation,
     TranslationContext,
     TranslationLog,
+    TranslationMemoryIndexEntry,
     TranslationSource,
 )
 from wagtail_localize.strings import StringValue
 from wagtail_localize.views.edit_translation import (
+    MachineTranslationOutcome,
+    apply_machine_translation,
+    apply_machine_translations,
     edit_override,
     edit_string_translation,
 )
+from wagtail_localize.xliff import XLIFFFile, stream_xliff
 
 from .utils import assert_permission_denied
 
@@ -2622,6 +2631,105 @@ class TestEditStringTranslationAPIView(EditTranslationTestData, APITestCase):
 
 
 @freeze_time("2020-08-21")
+class TestStringTranslationSuggestionsAPIView(EditTranslationTestData, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        # Translate a similar string on another page
+        other_page = self.home_page.add_child(
+            instance=TestPage(
+                title="Other page", slug="other-page", test_charfield="A char fields"
+            )
+        )
+        other_source, _created = TranslationSource.get_or_create_from_instance(
+            other_page
+        )
+        other_segment = other_source.stringsegment_set.get(
+            context__path="test_charfield"
+        )
+        # The translation is indexed once the transaction is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            StringTranslation.objects.create(
+                translation_of=other_segment.string,
+                locale=self.fr_locale,
+                context=other_segment.context,
+                data="Des champs de caractères",
+                translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+            )
+
+        self.string_segment = self.page_source.stringsegment_set.get(
+            context__path="test_charfield"
+        )
+
+    def test_get_suggestions(self):
+        response = self.client.get(
+            reverse(
+                "wagtail_localize:string_translation_suggestions",
+                args=[self.page_translation.id, self.string_segment.id],
+            )
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "suggestions": [
+                    {
+                        "source": "A char fields",
+                        "translation": "Des champs de caractères",
+                        "similarity": 0.96,
+                    }
+                ]
+            },
+        )
+
+    def test_get_suggestions_with_limit(self):
+        response = self.client.get(
+            reverse(
+                "wagtail_localize:string_translation_suggestions",
+                args=[self.page_translation.id, self.string_segment.id],
+            ),
+            {"limit": "0"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["suggestions"]), 1)
+
+    def test_get_suggestions_with_invalid_limit(self):
+        response = self.client.get(
+            reverse(
+                "wagtail_localize:string_translation_suggestions",
+                args=[self.page_translation.id, self.string_segment.id],
+            ),
+            {"limit": "lots"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_suggestions_for_segment_of_another_translation(self):
+        response = self.client.get(
+            reverse(
+                "wagtail_localize:string_translation_suggestions",
+                args=[self.snippet_translation.id, self.string_segment.id],
+            ),
+            follow=True,
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_suggestions_without_page_perms(self):
+        self.moderators_group.page_permissions.all().delete()
+
+        response = self.client.get(
+            reverse(
+                "wagtail_localize:string_translation_suggestions",
+                args=[self.page_translation.id, self.string_segment.id],
+            )
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+
 class TestEditOverrideAPIView(EditTranslationTestData, APITestCase):
     def test_create_override(self):
         self.segment_override.delete()
@@ -2792,66 +2900,66 @@ class TestEditOverrideAPIView(EditTranslationTestData, APITestCase):
 
 
 class TestDownloadPOFileView(EditTranslationTestData, TestCase):
-    def test_download_pofile_page(self):
+    def download_pofile(self, translation, query=""):
         response = self.client.get(
-            reverse("wagtail_localize:download_pofile", args=[self.page_translation.id])
+            reverse("wagtail_localize:download_pofile", args=[translation.id]) + query
         )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
 
-        self.assertContains(
-            response,
+    def test_download_pofile_page(self):
+        content = self.download_pofile(self.page_translation)
+
+        self.assertIn(
             f"X-WagtailLocalize-TranslationID: {str(self.page_translation.uuid)}",
+            content,
         )
-        self.assertContains(
-            response, 'msgctxt "test_charfield"\nmsgid "A char field"\nmsgstr ""'
+        self.assertIn(
+            'msgctxt "test_charfield"\nmsgid "A char field"\nmsgstr ""', content
         )
-        self.assertContains(
-            response, 'msgctxt "test_textfield"\nmsgid "A text field"\nmsgstr ""'
+        self.assertIn(
+            'msgctxt "test_textfield"\nmsgid "A text field"\nmsgstr ""', content
         )
-        self.assertContains(
-            response, 'msgctxt "test_emailfield"\nmsgid "email@example.com"\nmsgstr ""'
+        self.assertIn(
+            'msgctxt "test_emailfield"\nmsgid "email@example.com"\nmsgstr ""', content
         )
-        self.assertContains(
-            response, 'msgctxt "test_slugfield"\nmsgid "a-slug-field"\nmsgstr ""'
+        self.assertIn(
+            'msgctxt "test_slugfield"\nmsgid "a-slug-field"\nmsgstr ""', content
         )
-        self.assertContains(
-            response,
+        self.assertIn(
             'msgctxt "test_urlfield"\nmsgid "https://www.example.com"\nmsgstr ""',
+            content,
         )
-        self.assertContains(
-            response,
+        self.assertIn(
             'msgctxt "test_richtextfield"\nmsgid "This is a heading"\nmsgstr ""',
+            content,
         )
-        self.assertContains(
-            response,
+        self.assertIn(
             'msgctxt "test_richtextfield"\nmsgid "This is a paragraph. &lt;foo&gt; <b>Bold text</b>"\nmsgstr ""',
+            content,
         )
-        self.assertContains(
-            response,
+        self.assertIn(
             'msgctxt "test_richtextfield"\nmsgid "<a id=\\"a1\\">This is a link</a>."\nmsgstr ""',
+            content,
         )
-        self.assertContains(
-            response,
+        self.assertIn(
             'msgctxt "test_richtextfield"\nmsgid "Special characters: \'\\"!? セキレイ"\nmsgstr ""',
+            content,
         )
-        self.assertContains(
-            response,
+        self.assertIn(
             f'msgctxt "test_streamfield.{STREAM_TEXT_BLOCK_ID}"\nmsgid "This is a text block"\nmsgstr ""',
+            content,
         )
 
     def test_download_pofile_snippet(self):
-        response = self.client.get(
-            reverse(
-                "wagtail_localize:download_pofile", args=[self.snippet_translation.id]
-            )
-        )
+        content = self.download_pofile(self.snippet_translation)
 
-        self.assertContains(
-            response,
+        self.assertIn(
             f"X-WagtailLocalize-TranslationID: {str(self.snippet_translation.uuid)}",
+            content,
         )
-        self.assertContains(
-            response, 'msgctxt "field"\nmsgid "Test snippet"\nmsgstr ""'
-        )
+        self.assertIn('msgctxt "field"\nmsgid "Test snippet"\nmsgstr ""', content)
 
     def test_includes_existing_translations(self):
         string = String.objects.get(data="Test snippet")
@@ -2863,13 +2971,9 @@ class TestDownloadPOFileView(EditTranslationTestData, TestCase):
             data="Extrait de test",
         )
 
-        response = self.client.get(
-            reverse(
-                "wagtail_localize:download_pofile", args=[self.snippet_translation.id]
-            )
-        )
-        self.assertContains(
-            response, 'msgctxt "field"\nmsgid "Test snippet"\nmsgstr "Extrait de test"'
+        content = self.download_pofile(self.snippet_translation)
+        self.assertIn(
+            'msgctxt "field"\nmsgid "Test snippet"\nmsgstr "Extrait de test"', content
         )
 
     def test_includes_obsolete_translations(self):
@@ -2885,19 +2989,59 @@ class TestDownloadPOFileView(EditTranslationTestData, TestCase):
             data="Une chaîne qui n'est plus utilisée sur l'extrait",
         )
 
+        content = self.download_pofile(self.snippet_translation)
+
+        self.assertIn('msgctxt "field"\nmsgid "Test snippet"\nmsgstr ""', content)
+        self.assertIn(
+            'msgctxt "field"\n#~ msgid "A string that is no longer used on the snippet"\n#~ msgstr "Une chaîne qui n\'est plus utilisée sur l\'extrait"',
+            content,
+        )
+
+    def test_download_pofile_delta(self):
+        # Full downloads don't move the delta forward
+        self.download_pofile(self.snippet_translation)
+        self.snippet_translation.refresh_from_db()
+        self.assertIsNone(self.snippet_translation.last_exported_at)
+
+        content = self.download_pofile(self.snippet_translation, "?delta=1")
+        self.assertIn('msgid "Test snippet"', content)
+        self.snippet_translation.refresh_from_db()
+        self.assertIsNotNone(self.snippet_translation.last_exported_at)
+
+        StringTranslation.objects.create(
+            translation_of=String.objects.get(data="Test snippet"),
+            context=TranslationContext.objects.get(path="field"),
+            locale=self.fr_locale,
+            data="Extrait de test",
+        )
+
+        # The string has been translated since the last download
+        content = self.download_pofile(self.snippet_translation, "?delta=1")
+        self.assertNotIn('msgid "Test snippet"', content)
+
+        # The full file still has it
+        content = self.download_pofile(self.snippet_translation)
+        self.assertIn(
+            'msgctxt "field"\nmsgid "Test snippet"\nmsgstr "Extrait de test"', content
+        )
+
+    def test_download_pofile_delta_marked_exported_once_sent(self):
         response = self.client.get(
             reverse(
                 "wagtail_localize:download_pofile", args=[self.snippet_translation.id]
             )
+            + "?delta=1"
         )
+        content = iter(response.streaming_content)
+        next(content)
 
-        self.assertContains(
-            response, 'msgctxt "field"\nmsgid "Test snippet"\nmsgstr ""'
-        )
-        self.assertContains(
-            response,
-            'msgctxt "field"\n#~ msgid "A string that is no longer used on the snippet"\n#~ msgstr "Une chaîne qui n\'est plus utilisée sur l\'extrait"',
-        )
+        # The download hasn't finished yet
+        self.snippet_translation.refresh_from_db()
+        self.assertIsNone(self.snippet_translation.last_exported_at)
+
+        list(content)
+        self.snippet_translation.refresh_from_db()
+        self.assertIsNotNone(self.snippet_translation.last_exported_at)
 
     def test_cant_download_pofile_without_page_perms(self):
         self.moderators_group.page_permissions.all().delete()
@@ -3224,13 +3368,13 @@ class TestUploadPOFileView(EditTranslationTestData, TestCase):
         self.assertFalse(StringTranslation.objects.exists())
 
     def test_upload_pofile_snippet_filename_instead_of_file(self):
-        # POLib checks if the string passed to it is a file before parsing.So always pass
-        # it a file so that users can't upload filenames and read data off the disk.
+        # POLib checks if the string passed to it is a file before parsing. So uploads that
+        # are the path to a file must be refused, so that users can't read data off the disk.
         # This test makes sure that filenames are treated as an error, even if there is a
         # valid file there.
 
-        # It's very easy to make this test fail by changing the view to parse the incoming
-        # string directly without using a temporary file.
+        # It's very easy to make this test fail by changing the view to pass the incoming
+        # string directly to polib.pofile without using read_po.
 
         po = polib.POFile(wrapwidth=200)
         po.metadata = {
@@ -3398,6 +3542,136 @@ class TestUploadPOFileView(EditTranslationTestData, TestCase):
         assert_permission_denied(self, response)
 
 
+class TestDownloadXLIFFView(EditTranslationTestData, TestCase):
+    def test_download_xliff_page(self):
+        response = self.client.get(
+            reverse("wagtail_localize:download_xliff", args=[self.page_translation.id])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/xliff+xml")
+        self.assertEqual(
+            response["Content-Disposition"], "attachment; filename=the-title-fr.xlf"
+        )
+
+        xliff = XLIFFFile(b"".join(response.streaming_content))
+        self.assertEqual(xliff.file_id, str(self.page_translation.uuid))
+        units = list(xliff)
+        self.assertIn(("A char field", "test_charfield", ""), units)
+        self.assertIn(
+            ('<a id="a1">This is a link</a>.', "test_richtextfield", ""), units
+        )
+
+    def test_cant_download_xliff_without_page_perms(self):
+        self.moderators_group.page_permissions.all().delete()
+
+        response = self.client.get(
+            reverse("wagtail_localize:download_xliff", args=[self.page_translation.id])
+        )
+
+        assert_permission_denied(self, response)
+
+
+class TestUploadXLIFFView(EditTranslationTestData, TestCase):
+    def upload_xliff(self, data):
+        return self.client.post(
+            reverse("wagtail_localize:upload_xliff", args=[self.page_translation.id]),
+            {
+                "file": SimpleUploadedFile(
+                    "translations.xlf", data, content_type="application/xliff+xml"
+                ),
+                "next": reverse("wagtailadmin_pages:edit", args=[self.fr_page.id]),
+            },
+        )
+
+    def test_upload_xliff_page(self):
+        data = "".join(
+            stream_xliff(
+                str(self.page_translation.uuid),
+                "en",
+                "fr",
+                [
+                    ("A char field", "test_charfield", "Un champ de caractères"),
+                    (
+                        '<a id="a1">This is a link</a>.',
+                        "test_richtextfield",
+                        '<a id="a1">Ceci est un lien</a>.',
+                    ),
+                ],
+            )
+        ).encode("utf-8")
+
+        response = self.upload_xliff(data)
+
+        self.assertRedirects(
+            response, reverse("wagtailadmin_pages:edit", args=[self.fr_page.id])
+        )
+        self.assertEqual(
+            set(
+                StringTranslation.objects.values_list(
+                    "data", "tool_name", "last_translated_by"
+                )
+            ),
+            {
+                ("Un champ de caractères", "XLIFF File", self.user.id),
+                ('<a id="a1">Ceci est un lien</a>.', "XLIFF File", self.user.id),
+            },
+        )
+
+    def test_upload_xliff_for_different_translation(self):
+        data = "".join(
+            stream_xliff(
+                str(self.snippet_translation.uuid),
+                "en",
+                "fr",
+                [("A char field", "test_charfield", "Un champ de caractères")],
+            )
+        ).encode("utf-8")
+
+        response = self.upload_xliff(data)
+
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(messages[0].level_tag, "error")
+        self.assertEqual(
+            messages[0].message.strip(),
+            "Cannot import XLIFF file that was created for a different translation.",
+        )
+        self.assertFalse(StringTranslation.objects.exists())
+
+    @override_settings(WAGTAILLOCALIZE_PO_MAX_SIZE=100)
+    def test_upload_xliff_too_large(self):
+        data = "".join(self.page_translation.stream_xliff()).encode("utf-8")
+
+        response = self.upload_xliff(data)
+
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(messages[0].level_tag, "error")
+        self.assertEqual(messages[0].message.strip(), "The XLIFF file is too large.")
+        self.assertFalse(StringTranslation.objects.exists())
+
+    def test_upload_invalid_xliff(self):
+        response = self.upload_xliff(b"<xliff>")
+
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(messages[0].level_tag, "error")
+        self.assertEqual(
+            messages[0].message.strip(), "Please upload a valid XLIFF file."
+        )
+        self.assertFalse(StringTranslation.objects.exists())
+
+    def test_cant_upload_xliff_without_page_perms(self):
+        self.moderators_group.page_permissions.all().delete()
+
+        response = self.upload_xliff(
+            "".join(
+                stream_xliff(str(self.page_translation.uuid), "en", "fr", [])
+            ).encode("utf-8")
+        )
+
+        assert_permission_denied(self, response)
+
+
 class TestMachineTranslateView(EditTranslationTestData, TestCase):
     def test_machine_translate_page(self):
         response = self.client.post(
@@ -3600,6 +3874,386 @@ class TestMachineTranslateView(EditTranslationTestData, TestCase):
         )
         self.assertRedirects(response, reverse("wagtailadmin_home"))
 
+    @override_settings(
+        WAGTAILLOCALIZE_MACHINE_TRANSLATOR={
+            "CLASS": "wagtail_localize.machine_translators.dummy.DummyTranslator",
+            "OPTIONS": {"MAX_STRINGS_PER_REQUEST": 1},
+        }
+    )
+    def test_machine_translate_page_with_failed_request(self):
+        def translate(source_locale, target_locale, strings):
+            if strings[0].data == "A char field":
+                raise ConnectionError("Connection reset")
+            return patched_translate(source_locale, target_locale, strings)
+
+        with (
+            patch(
+                "wagtail_localize.machine_translators.dummy.DummyTranslator.translate",
+                side_effect=translate,
+            ),
+            self.assertLogs("wagtail_localize.machine_translators.base", "WARNING"),
+        ):
+            response = self.client.post(
+                reverse(
+                    "wagtail_localize:machine_translate",
+                    args=[self.page_translation.id],
+                ),
+                {
+                    "next": reverse("wagtailadmin_pages:edit", args=[self.fr_page.id]),
+                },
+            )
+
+        self.assertRedirects(
+            response, reverse("wagtailadmin_pages:edit", args=[self.fr_page.id])
+        )
+        self.assertEqual(
+            [
+                message.message.strip()
+                for message in get_messages(response.wsgi_request)
+            ],
+            [
+                "1 of the requests to Dummy translator failed. The other strings were translated, please try again to translate the rest."
+            ],
+        )
+
+        # The strings from the other requests were translated
+        self.assertFalse(
+            StringTranslation.objects.filter(
+                translation_of__data="A char field", locale=self.fr_locale
+            ).exists()
+        )
+        self.assertTrue(
+            StringTranslation.objects.filter(
+                translation_of__data='<a id="a1">This is a link</a>.',
+                locale=self.fr_locale,
+            ).exists()
+        )
+
+    def test_machine_translate_page_updates_draft_title(self):
+        StringSegment.objects.create(
+            source=self.page_source,
+            context=TranslationContext.objects.create(
+                object_id=self.page.translation_key, path="title", field_path="title"
+            ),
+            string=String.from_value(
+                self.page.locale, StringValue.from_plaintext("The title")
+            ),
+            order=100,
+        )
+
+        apply_machine_translation(
+            self.page_translation.id, self.user, DummyTranslator({})
+        )
+
+        self.fr_page.refresh_from_db()
+        self.assertEqual(self.fr_page.draft_title, "title The")
+
+    # Both translations of the title are created at the same time, so they can only be told apart
+    # by whether the title was translated before the machine translations were saved
+    @freeze_time("2026-10-19 12:00:00")
+    def test_machine_translate_page_keeps_title_translated_meanwhile(self):
+        title_context = TranslationContext.objects.create(
+            object_id=self.page.translation_key, path="title", field_path="title"
+        )
+        title_string = String.from_value(
+            self.page.locale, StringValue.from_plaintext("The title")
+        )
+        StringSegment.objects.create(
+            source=self.page_source,
+            context=title_context,
+            string=title_string,
+            order=100,
+        )
+
+        translator = DummyTranslator({})
+        translate = translator.translate
+
+        def translate_after_someone_else(source_locale, target_locale, strings):
+            # Someone translates the title while the machine translator is working
+            StringTranslation.objects.create(
+                translation_of=title_string,
+                locale=self.fr_locale,
+                context=title_context,
+                data="Le titre",
+            )
+            return translate(source_locale, target_locale, strings)
+
+        with (
+            patch.object(translator, "translate", translate_after_someone_else),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            apply_machine_translation(self.page_translation.id, self.user, translator)
+
+        # The machine translation of the title was skipped, so it doesn't change the draft title
+        self.fr_page.refresh_from_db()
+        self.assertEqual(self.fr_page.draft_title, "Le titre")
+
+    def test_machine_translate_several_translations_shares_request_limit(self):
+        de_translation = Translation.objects.create(
+            source=self.page_source,
+            target_locale=Locale.objects.create(language_code="de"),
+        )
+        de_translation.save_target()
+        translator = DummyTranslator(
+            {"MAX_STRINGS_PER_REQUEST": 1, "MAX_CONCURRENT_REQUESTS": 2}
+        )
+        lock = threading.Lock()
+        running = 0
+        most_running = 0
+
+        def translate(source_locale, target_locale, strings):
+            nonlocal running, most_running
+            with lock:
+                running += 1
+                most_running = max(most_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return {string: StringValue(string.data) for string in strings}
+
+        with patch.object(translator, "translate", side_effect=translate) as mock:
+            errors = apply_machine_translations(
+                [self.page_translation, de_translation], self.user, translator
+            )
+
+        self.assertEqual(errors, {})
+        self.assertGreater(mock.call_count, 4)
+
+        # Both translations are limited by MAX_CONCURRENT_REQUESTS together
+        self.assertEqual(most_running, 2)
+
+    def test_machine_translations_are_indexed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_machine_translation(
+                self.page_translation.id, self.user, DummyTranslator({})
+            )
+
+        self.assertEqual(
+            set(
+                TranslationMemoryIndexEntry.objects.filter(
+                    locale=self.fr_locale
+                ).values_list("string_id", flat=True)
+            ),
+            set(
+                StringTranslation.objects.filter(
+                    locale=self.fr_locale, tool_name="Dummy translator"
+                )
+                .exclude(translation_of__data="")
+                .values_list("translation_of_id", flat=True)
+            ),
+        )
+
+    def test_machine_translate_page_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            apply_machine_translation(
+                self.page_translation.id, self.user, DummyTranslator({})
+            )
+
+        # The segments that need translating are fetched with one query, the translation
+        # memory is looked up with another, and the translations are inserted with a third
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries.captured_queries
+                    if "wagtail_localize_stringtranslation" in query["sql"]
+                ]
+            ),
+            3,
+        )
+        self.assertEqual(
+            StringTranslation.objects.filter(locale=self.fr_locale).count(),
+            self.page_source.stringsegment_set.count(),
+        )
+
+    def make_translation_memory(self, data, path="another_field", **kwargs):
+        # Translate the char field's string in another context
+        return StringTranslation.objects.create(
+            translation_of=String.objects.get(data="A char field"),
+            locale=self.fr_locale,
+            context=TranslationContext.objects.create(
+                object_id=self.page.translation_key,
+                path=path,
+                field_path=path,
+            ),
+            data=data,
+            translation_type=kwargs.pop(
+                "translation_type", StringTranslation.TRANSLATION_TYPE_MANUAL
+            ),
+            **kwargs,
+        )
+
+    def test_machine_translate_page_uses_translation_memory(self):
+        self.make_translation_memory("Un champ de caractères")
+
+        translator = DummyTranslator({})
+        with patch.object(
+            translator, "translate", wraps=translator.translate
+        ) as mock_translate:
+            apply_machine_translation(self.page_translation.id, self.user, translator)
+
+        translation = StringTranslation.objects.get(
+            translation_of__data="A char field",
+            context__path="test_charfield",
+            locale=self.fr_locale,
+        )
+        self.assertEqual(translation.data, "Un champ de caractères")
+        self.assertEqual(
+            translation.translation_type, StringTranslation.TRANSLATION_TYPE_MANUAL
+        )
+        self.assertEqual(translation.tool_name, "Translation memory")
+        self.assertEqual(translation.last_translated_by, self.user)
+
+        # The string isn't sent to the machine translator, but the others are
+        self.assertEqual(mock_translate.call_count, 1)
+        strings = mock_translate.call_args.args[2]
+        self.assertNotIn(StringValue("A char field"), strings)
+        self.assertIn(StringValue("A text field"), strings)
+
+    def test_machine_translate_page_only_from_translation_memory(self):
+        # Translate every string of the page in another context
+        context = TranslationContext.objects.create(
+            object_id=self.page.translation_key,
+            path="another_field",
+            field_path="another_field",
+        )
+        for string_segment in self.page_source.stringsegment_set.select_related(
+            "string"
+        ):
+            StringTranslation.objects.get_or_create(
+                translation_of=string_segment.string,
+                locale=self.fr_locale,
+                context=context,
+                defaults={
+                    "data": f"Memory: {string_segment.string.data}",
+                    "translation_type": StringTranslation.TRANSLATION_TYPE_MANUAL,
+                },
+            )
+
+        with patch(
+            "wagtail_localize.machine_translators.dummy.DummyTranslator.translate"
+        ) as mock_translate:
+            response = self.client.post(
+                reverse(
+                    "wagtail_localize:machine_translate",
+                    args=[self.page_translation.id],
+                ),
+                {"next": reverse("wagtailadmin_pages:edit", args=[self.fr_page.id])},
+            )
+
+        mock_translate.assert_not_called()
+        self.assertEqual(
+            [
+                message.message.strip()
+                for message in get_messages(response.wsgi_request)
+            ],
+            [
+                "Successfully translated from existing translations. Nothing was sent to Dummy translator."
+            ],
+        )
+
+    def test_apply_machine_translation_outcomes(self):
+        translator = DummyTranslator({})
+
+        outcome = apply_machine_translation(
+            self.page_translation.id, self.user, translator
+        )
+        self.assertEqual(outcome, MachineTranslationOutcome.MACHINE_TRANSLATED)
+        self.assertTrue(outcome)
+
+        # Only "nothing to translate" is falsy, like the False that used to be returned
+        outcome = apply_machine_translation(
+            self.page_translation.id, self.user, translator
+        )
+        self.assertEqual(outcome, MachineTranslationOutcome.NOTHING_TO_TRANSLATE)
+        self.assertFalse(outcome)
+
+        # Move the translations to another context, so they're only in the translation memory
+        context = TranslationContext.objects.create(
+            object_id=self.page.translation_key,
+            path="another_field",
+            field_path="another_field",
+        )
+        for string_translation in StringTranslation.objects.filter(
+            locale=self.fr_locale
+        ):
+            StringTranslation.objects.get_or_create(
+                translation_of_id=string_translation.translation_of_id,
+                locale=self.fr_locale,
+                context=context,
+                defaults={
+                    "data": string_translation.data,
+                    "translation_type": StringTranslation.TRANSLATION_TYPE_MANUAL,
+                },
+            )
+        StringTranslation.objects.exclude(context=context).delete()
+
+        outcome = apply_machine_translation(
+            self.page_translation.id, self.user, translator
+        )
+        self.assertEqual(outcome, MachineTranslationOutcome.TRANSLATED_FROM_MEMORY)
+        self.assertTrue(outcome)
+
+    def test_machine_translate_page_ignores_unusable_translation_memory(self):
+        self.make_translation_memory(
+            "field char A (machine)",
+            translation_type=StringTranslation.TRANSLATION_TYPE_MACHINE,
+        )
+        self.make_translation_memory(
+            "Un champ de caractères (error)", path="third_field", has_error=True
+        )
+
+        apply_machine_translation(
+            self.page_translation.id, self.user, DummyTranslator({})
+        )
+
+        translation = StringTranslation.objects.get(
+            translation_of__data="A char field",
+            context__path="test_charfield",
+            locale=self.fr_locale,
+        )
+        self.assertEqual(translation.data, "field char A")
+        self.assertEqual(translation.tool_name, "Dummy translator")
+
+    @override_settings(WAGTAILLOCALIZE_USE_TRANSLATION_MEMORY=False)
+    def test_machine_translate_page_with_translation_memory_disabled(self):
+        self.make_translation_memory("Un champ de caractères")
+
+        apply_machine_translation(
+            self.page_translation.id, self.user, DummyTranslator({})
+        )
+
+        translation = StringTranslation.objects.get(
+            translation_of__data="A char field",
+            context__path="test_charfield",
+            locale=self.fr_locale,
+        )
+        self.assertEqual(translation.data, "field char A")
+        self.assertEqual(translation.tool_name, "Dummy translator")
+
+    def test_machine_translate_page_with_invalid_translation(self):
+        def translate(source_locale, target_locale, strings):
+            return {
+                string: StringValue('<a id="a2">This is a link</a>.')
+                if string.data == '<a id="a1">This is a link</a>.'
+                else StringValue(translate_html(string.data))
+                for string in strings
+            }
+
+        translator = DummyTranslator({})
+        with patch.object(translator, "translate", side_effect=translate):
+            apply_machine_translation(self.page_translation.id, self.user, translator)
+
+        # Translations with errors are still saved, so they can be fixed in the editor
+        self.assertEqual(
+            set(
+                StringTranslation.objects.filter(
+                    locale=self.fr_locale, has_error=True
+                ).values_list("translation_of__data", flat=True)
+            ),
+            {'<a id="a1">This is a link</a>.'},
+        )
+
     def test_machine_translate_page_with_existing_translation(self):
         StringTranslation.objects.create(
             translation_of=String.objects.get(data="A char field"),
@@ -0,0 +1,67 @@
+import xml.etree.ElementTree as ET
+
+from django.test import SimpleTestCase
+
+from wagtail_localize.inline_codes import read_inline_codes, walk_inline_tags
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.calls = []
+
+    def text(self, text):
+        self.calls.append(("text", text))
+
+    def empty(self, tag):
+        self.calls.append(("empty", tag))
+
+    def start(self, start_tag, end_tag, name):
+        self.calls.append(("start", start_tag, end_tag, name))
+
+    def end(self):
+        self.calls.append(("end",))
+
+
+class TestInlineCodes(SimpleTestCase):
+    def test_walk_inline_tags(self):
+        handler = RecordingHandler()
+
+        walk_inline_tags(
+            'Read <a id="a1">the <b>docs</b></a>!<br/>&lt;foo&gt;', handler
+        )
+
+        self.assertEqual(
+            handler.calls,
+            [
+                ("text", "Read "),
+                ("start", '<a id="a1">', "</a>", "a"),
+                ("text", "the "),
+                ("start", "<b>", "</b>", "b"),
+                ("text", "docs"),
+                ("end",),
+                ("end",),
+                ("text", "!"),
+                ("empty", "<br/>"),
+                ("text", "<foo>"),
+            ],
+        )
+
+    def test_read_inline_codes(self):
+        # <seg>Read <code tag='<a id="a1">'>the <mark>docs</mark></code>! &lt;foo&gt;</seg>
+        element = ET.Element("seg")
+        element.text = "Read "
+        code = ET.SubElement(element, "code", {"tag": '<a id="a1">'})
+        code.text = "the "
+        code.tail = "! <foo>"
+        ET.SubElement(code, "mark").text = "docs"
+
+        def read_code(child):
+            if child.tag == "mark":
+                return None
+
+            return child.get("tag") + read_inline_codes(child, read_code) + "</a>"
+
+        self.assertEqual(
+            read_inline_codes(element, read_code),
+            'Read <a id="a1">the docs</a>! &lt;foo&gt;',
+        )
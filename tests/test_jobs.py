@@ -0,0 +1,293 @@
+import json
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from wagtail.models import Locale, Page
+from wagtail.test.utils import WagtailTestUtils
+
+from tests.testapp.models import TestPage
+from wagtail_localize.models import LocaleSynchronization, LocalizeJob, QueuedJob
+from wagtail_localize.synctree import after_create_page
+from wagtail_localize.tasks import ImmediateBackend, JobProgress, report_progress
+
+
+def report_three_steps():
+    for done in range(3):
+        report_progress(done + 1, 3)
+
+
+def fail():
+    report_progress(1, 2)
+    raise ValueError("Something went wrong")
+
+
+class TestTrackedJobs(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.backend = ImmediateBackend({})
+
+    def test_completed_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.backend.enqueue_on_commit(
+                report_three_steps, [], {}, name="Report three steps"
+            )
+
+        job = LocalizeJob.objects.get()
+        self.assertEqual(job.name, "Report three steps")
+        self.assertEqual(job.func, "tests.test_jobs.report_three_steps")
+        self.assertEqual(job.status, LocalizeJob.STATUS_COMPLETED)
+        self.assertEqual(job.get_progress(), (3, 3))
+        self.assertEqual(job.error, "")
+        self.assertIsNotNone(job.started_at)
+        self.assertIsNotNone(job.finished_at)
+        self.assertIsNotNone(job.get_duration())
+
+    def test_failed_job(self):
+        with (
+            self.assertRaises(ValueError),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.backend.enqueue_on_commit(fail, [], {}, name="Fail")
+
+        job = LocalizeJob.objects.get()
+        self.assertEqual(job.status, LocalizeJob.STATUS_FAILED)
+        self.assertEqual(job.get_progress(), (1, 2))
+        self.assertIn("ValueError: Something went wrong", job.error)
+
+    def test_collapsed_job_is_recorded_once(self):
+        with (
+            mock.patch.object(self.backend, "enqueue_in"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.backend.enqueue_on_commit(
+                report_three_steps, [], {}, key="report", name="Report"
+            )
+            self.backend.enqueue_on_commit(
+                report_three_steps, [], {}, key="report", name="Report"
+            )
+
+        job = LocalizeJob.objects.get()
+        self.assertEqual(job.key, "report")
+        self.assertEqual(job.status, LocalizeJob.STATUS_QUEUED)
+
+    def test_running_job_progress_is_read_from_cache(self):
+        job = LocalizeJob.objects.create(
+            name="Running", func="", status=LocalizeJob.STATUS_RUNNING
+        )
+        JobProgress("default", job.id).update(5, 10)
+
+        self.assertEqual(job.get_progress(), (5, 10))
+
+        # The job's transaction may still be open, so progress is only written to the cache
+        job.refresh_from_db()
+        self.assertEqual((job.progress_done, job.progress_total), (0, None))
+
+    def test_report_progress_outside_a_job_does_nothing(self):
+        report_progress(1, 2)
+
+
+class TestJobProgressOutsideTransactions(TransactionTestCase):
+    def test_progress_is_written_to_the_job(self):
+        job = LocalizeJob.objects.create(
+            name="Running", func="", status=LocalizeJob.STATUS_RUNNING
+        )
+        JobProgress("default", job.id).update(5, 10)
+
+        # Processes that don't share the cache can still see the progress
+        cache.clear()
+        job.refresh_from_db()
+        self.assertEqual(job.get_progress(), (5, 10))
+
+
+class TestSynchronizeTreeJob(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.en_locale = Locale.objects.get(language_code="en")
+        self.fr_locale = Locale.objects.create(language_code="fr")
+
+        home_page = Page.objects.get(depth=2)
+        home_page.add_child(instance=TestPage(title="About", slug="about"))
+
+    def test_synchronize_tree_is_recorded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            LocaleSynchronization.objects.create(
+                locale=self.fr_locale, sync_from=self.en_locale
+            )
+
+        job = LocalizeJob.objects.get()
+        self.assertEqual(job.name, "Synchronise French from English")
+        self.assertEqual(job.func, "wagtail_localize.synctree.synchronize_tree")
+        self.assertEqual(
+            job.key, f"synchronize_tree:{self.en_locale.id}:{self.fr_locale.id}"
+        )
+        self.assertEqual(job.status, LocalizeJob.STATUS_COMPLETED)
+        self.assertEqual(job.get_progress(), (2, 2))
+
+
+class TestCreateAliasesJob(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.en_locale = Locale.objects.get(language_code="en")
+        self.fr_locale = Locale.objects.create(language_code="fr")
+        self.home_page = Page.objects.get(depth=2)
+
+    def test_create_aliases_is_recorded(self):
+        LocaleSynchronization.objects.create(
+            locale=self.fr_locale, sync_from=self.en_locale
+        )
+        LocalizeJob.objects.all().delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page = self.home_page.add_child(instance=TestPage(title="New", slug="new"))
+            after_create_page(None, page)
+
+        job = LocalizeJob.objects.get()
+        self.assertEqual(job.name, "Create aliases for 1 new page")
+        self.assertEqual(job.status, LocalizeJob.STATUS_COMPLETED)
+
+    def test_create_aliases_is_not_recorded_without_synchronised_locales(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            page = self.home_page.add_child(instance=TestPage(title="New", slug="new"))
+            after_create_page(None, page)
+
+        self.assertFalse(LocalizeJob.objects.exists())
+
+
+class TestPurgeLocalizeJobsCommand(TestCase):
+    def test_purge_localize_jobs(self):
+        now = timezone.now()
+        old_completed = LocalizeJob.objects.create(
+            name="Old",
+            func="",
+            status=LocalizeJob.STATUS_COMPLETED,
+            finished_at=now - timedelta(days=31),
+        )
+        old_failed = LocalizeJob.objects.create(
+            name="Old failed",
+            func="",
+            status=LocalizeJob.STATUS_FAILED,
+            finished_at=now - timedelta(days=31),
+        )
+        recent = LocalizeJob.objects.create(
+            name="Recent",
+            func="",
+            status=LocalizeJob.STATUS_COMPLETED,
+            finished_at=now - timedelta(days=1),
+        )
+        running = LocalizeJob.objects.create(
+            name="Running", func="", status=LocalizeJob.STATUS_RUNNING
+        )
+
+        stdout = StringIO()
+        call_command("purge_localize_jobs", stdout=stdout)
+
+        self.assertEqual(
+            stdout.getvalue(),
+            "Deleted 2 job(s).\nDeleted 0 failed queued job(s).\n",
+        )
+        self.assertQuerySetEqual(LocalizeJob.objects.order_by("pk"), [recent, running])
+        self.assertFalse(
+            LocalizeJob.objects.filter(
+                pk__in=[old_completed.pk, old_failed.pk]
+            ).exists()
+        )
+
+    def test_purge_failed_queued_jobs(self):
+        now = timezone.now()
+        QueuedJob.objects.create(
+            func="", payload=b"", failed_at=now - timedelta(days=31)
+        )
+        recent = QueuedJob.objects.create(
+            func="", payload=b"", failed_at=now - timedelta(days=1)
+        )
+        waiting = QueuedJob.objects.create(func="", payload=b"")
+
+        stdout = StringIO()
+        call_command("purge_localize_jobs", stdout=stdout)
+
+        self.assertIn("Deleted 1 failed queued job(s).", stdout.getvalue())
+        self.assertQuerySetEqual(QueuedJob.objects.order_by("pk"), [recent, waiting])
+
+    def test_purge_localize_jobs_days(self):
+        LocalizeJob.objects.create(
+            name="Recent",
+            func="",
+            status=LocalizeJob.STATUS_COMPLETED,
+            finished_at=timezone.now() - timedelta(days=2),
+        )
+
+        call_command("purge_localize_jobs", days=1, stdout=StringIO())
+
+        self.assertFalse(LocalizeJob.objects.exists())
+
+
+class TestJobsViews(WagtailTestUtils, TestCase):
+    def setUp(self):
+        self.user = self.login()
+
+        self.running_job = LocalizeJob.objects.create(
+            name="Running job", func="", status=LocalizeJob.STATUS_RUNNING
+        )
+        self.failed_job = LocalizeJob.objects.create(
+            name="Failed job",
+            func="",
+            status=LocalizeJob.STATUS_FAILED,
+            error="Traceback",
+        )
+
+    def test_jobs_api(self):
+        response = self.client.get(reverse("wagtail_localize:jobs_api"))
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+
+        self.assertEqual([job["name"] for job in data["active"]], ["Running job"])
+        self.assertEqual(data["active"][0]["status"], "running")
+        self.assertEqual(data["active"][0]["progress"], {"done": 0, "total": None})
+        self.assertEqual([job["name"] for job in data["recent"]], ["Failed job"])
+        self.assertEqual(data["recent"][0]["error"], "Traceback")
+
+    def test_jobs_report(self):
+        response = self.client.get(reverse("wagtail_localize:jobs_report"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Running job")
+        self.assertContains(response, "Failed job")
+
+    def test_jobs_report_filter_by_status(self):
+        response = self.client.get(
+            reverse("wagtail_localize:jobs_report"), {"status": "failed"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Running job")
+        self.assertContains(response, "Failed job")
+
+    def test_requires_submit_translation_permission(self):
+        self.user.is_superuser = False
+        self.user.save()
+        editors_group = Group.objects.get(name="Editors")
+        submit_translation = Permission.objects.get(
+            content_type__app_label="wagtail_localize", codename="submit_translation"
+        )
+        editors_group.permissions.remove(submit_translation)
+        self.user.groups.add(editors_group)
+
+        response = self.client.get(reverse("wagtail_localize:jobs_api"))
+        self.assertEqual(response.status_code, 403)
+
+        response = self.client.get(reverse("wagtail_localize:jobs_report"))
+        self.assertRedirects(response, reverse("wagtailadmin_home"))
+
+        self.user.user_permissions.add(submit_translation)
+
+        response = self.client.get(reverse("wagtail_localize:jobs_api"))
+        self.assertEqual(response.status_code, 200)
@@ -1,9 +1,19 @@
+from unittest import mock, skipUnless
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from wagtail.models import Locale, Page
 
 from tests.testapp.models import TestPage
-from wagtail_localize.models import Translation, TranslationSource
+from wagtail_localize.models import (
+    StringSegment,
+    StringTranslation,
+    Translation,
+    TranslationMemoryIndexEntry,
+    TranslationSource,
+)
 from wagtail_localize.operations import TranslationCreator
 from wagtail_localize.segments import RelatedObjectSegmentValue
 
@@ -82,3 +92,173 @@ class TranslationOperationsTest(TestCase):
             0,
             "No Translation object should be created for the default locale",
         )
+
+
+class TranslationMemoryFillTest(TestCase):
+    def setUp(self):
+        self.be_locale = Locale.objects.create(language_code="be")
+        self.user = get_user_model().objects.create(username="testuser")
+
+        # Translate the content of another page by hand
+        other_page = create_test_page(
+            title="Other page",
+            slug="other-page",
+            test_charfield="This is some test content",
+        )
+        other_source = TranslationSource.objects.get_for_instance(other_page)
+        other_segment = StringSegment.objects.get(
+            source=other_source, context__path="test_charfield"
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            StringTranslation.objects.create(
+                translation_of_id=other_segment.string_id,
+                locale=self.be_locale,
+                context_id=other_segment.context_id,
+                data="Гэта тэставы кантэнт",
+                translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+            )
+
+        self.page = create_test_page(
+            title="Test page",
+            slug="test-page",
+            test_charfield="This is some test content",
+        )
+
+    def get_string_translation(self):
+        source = TranslationSource.objects.get_for_instance(self.page)
+        segment = StringSegment.objects.get(
+            source=source, context__path="test_charfield"
+        )
+        return StringTranslation.objects.get(
+            translation_of_id=segment.string_id,
+            locale=self.be_locale,
+            context_id=segment.context_id,
+        )
+
+    def test_create_translations_fills_from_translation_memory(self):
+        TranslationCreator(
+            self.user, [self.be_locale], fill_from_translation_memory=True
+        ).create_translations(self.page)
+
+        string_translation = self.get_string_translation()
+        self.assertEqual(string_translation.data, "Гэта тэставы кантэнт")
+        self.assertEqual(
+            string_translation.translation_type,
+            StringTranslation.TRANSLATION_TYPE_MANUAL,
+        )
+        self.assertEqual(string_translation.tool_name, "Translation memory")
+        self.assertEqual(string_translation.last_translated_by, self.user)
+        self.assertFalse(string_translation.has_error)
+
+        # The translated page is created with the translation
+        be_page = self.page.get_translation(self.be_locale)
+        self.assertEqual(be_page.test_charfield, "Гэта тэставы кантэнт")
+
+    def test_create_translations_fills_from_translation_memory_with_bulk_insert(self):
+        with mock.patch.object(Translation, "INSERT_SELECT_VENDORS", set()):
+            TranslationCreator(
+                self.user, [self.be_locale], fill_from_translation_memory=True
+            ).create_translations(self.page)
+
+        string_translation = self.get_string_translation()
+        self.assertEqual(string_translation.data, "Гэта тэставы кантэнт")
+        self.assertEqual(string_translation.tool_name, "Translation memory")
+        self.assertEqual(string_translation.last_translated_by, self.user)
+
+    @skipUnless(
+        connection.vendor in Translation.INSERT_SELECT_VENDORS,
+        "The database doesn't support copying translations with INSERT ... SELECT",
+    )
+    def test_fill_from_translation_memory_with_insert_select(self):
+        translation = Translation.objects.create(
+            source=TranslationSource.objects.get_for_instance(self.page),
+            target_locale=self.be_locale,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(translation.fill_from_translation_memory(self.user), 1)
+
+        # The translations are copied with one query, which ignores conflicting rows
+        inserts = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("INSERT")
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertIn("SELECT", inserts[0])
+        self.assertIn(
+            "ON CONFLICT DO NOTHING"
+            if connection.vendor == "postgresql"
+            else "INSERT OR IGNORE",
+            inserts[0],
+        )
+
+        string_translation = self.get_string_translation()
+        self.assertEqual(string_translation.data, "Гэта тэставы кантэнт")
+        self.assertEqual(string_translation.tool_name, "Translation memory")
+        self.assertEqual(string_translation.last_translated_by, self.user)
+
+    def assert_fill_from_translation_memory_indexes_translations(self):
+        # Translations made in bulk before the index existed aren't indexed yet
+        TranslationMemoryIndexEntry.objects.all().delete()
+        translation = Translation.objects.create(
+            source=TranslationSource.objects.get_for_instance(self.page),
+            target_locale=self.be_locale,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(translation.fill_from_translation_memory(), 1)
+
+        self.assertEqual(
+            set(
+                TranslationMemoryIndexEntry.objects.values_list(
+                    "string_id", "locale_id"
+                )
+            ),
+            {(self.get_string_translation().translation_of_id, self.be_locale.id)},
+        )
+
+    def test_fill_from_translation_memory_indexes_translations(self):
+        self.assert_fill_from_translation_memory_indexes_translations()
+
+    def test_fill_from_translation_memory_with_bulk_insert_indexes_translations(
+        self,
+    ):
+        with mock.patch.object(Translation, "INSERT_SELECT_VENDORS", set()):
+            self.assert_fill_from_translation_memory_indexes_translations()
+
+    @override_settings(WAGTAILLOCALIZE_FILL_FROM_TRANSLATION_MEMORY=True)
+    def test_create_translations_fills_from_translation_memory_with_setting(self):
+        TranslationCreator(self.user, [self.be_locale]).create_translations(self.page)
+
+        self.assertEqual(self.get_string_translation().data, "Гэта тэставы кантэнт")
+
+    def test_create_translations_doesnt_fill_from_translation_memory_by_default(self):
+        TranslationCreator(self.user, [self.be_locale]).create_translations(self.page)
+
+        with self.assertRaises(StringTranslation.DoesNotExist):
+            self.get_string_translation()
+
+    def test_fill_from_translation_memory_keeps_existing_translations(self):
+        source = TranslationSource.objects.get_for_instance(self.page)
+        translation = Translation.objects.create(
+            source=source, target_locale=self.be_locale
+        )
+        segment = StringSegment.objects.get(
+            source=source, context__path="test_charfield"
+        )
+        StringTranslation.objects.create(
+            translation_of_id=segment.string_id,
+            locale=self.be_locale,
+            context_id=segment.context_id,
+            data="Існуючы пераклад",
+            translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+        )
+
+        for vendors in [Translation.INSERT_SELECT_VENDORS, set()]:
+            with (
+                self.subTest(vendors=vendors),
+                mock.patch.object(Translation, "INSERT_SELECT_VENDORS", vendors),
+            ):
+                self.assertEqual(translation.fill_from_translation_memory(), 0)
+                self.assertEqual(self.get_string_translation().data, "Існуючы пераклад")
@@ -0,0 +1,526 @@
+import io
+import os
+import tempfile
+import zipfile
+
+from unittest import mock
+
+import polib
+
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from freezegun import freeze_time
+from wagtail.models import Locale, Page
+from wagtail.test.utils import WagtailTestUtils
+
+from tests.testapp.models import TestSnippet
+from wagtail_localize.models import (
+    StringTranslation,
+    Translation,
+    TranslationSource,
+)
+from wagtail_localize.po_archive import (
+    export_po_archive,
+    get_po_archive_filename,
+    import_po_archive,
+)
+from wagtail_localize.views.report import filter_editable_translations
+
+from .utils import make_test_page
+
+
+def make_po(translation_id, entries):
+    po = polib.POFile(wrapwidth=200)
+    po.metadata = {
+        "POT-Creation-Date": str(timezone.now()),
+        "MIME-Version": "1.0",
+        "Content-Type": "text/plain; charset=utf-8",
+    }
+    if translation_id is not None:
+        po.metadata["X-WagtailLocalize-TranslationID"] = str(translation_id)
+
+    for msgid, msgctxt, msgstr in entries:
+        po.append(polib.POEntry(msgid=msgid, msgctxt=msgctxt, msgstr=msgstr))
+
+    return po
+
+
+def make_archive(files):
+    archive_file = io.BytesIO()
+    with zipfile.ZipFile(archive_file, "w") as archive:
+        for filename, contents in files.items():
+            archive.writestr(filename, str(contents))
+
+    archive_file.seek(0)
+    return archive_file
+
+
+@override_settings(
+    LANGUAGES=[
+        ("en", "English"),
+        ("fr", "French"),
+        ("de", "German"),
+    ],
+    WAGTAIL_CONTENT_LANGUAGES=[
+        ("en", "English"),
+        ("fr", "French"),
+        ("de", "German"),
+    ],
+)
+class POArchiveTestCase(TestCase, WagtailTestUtils):
+    def setUp(self):
+        self.en_locale = Locale.objects.get()
+        self.fr_locale = Locale.objects.create(language_code="fr")
+        self.de_locale = Locale.objects.create(language_code="de")
+
+        self.snippet = TestSnippet.objects.create(field="Test snippet")
+        self.page = make_test_page(
+            Page.objects.get(depth=1),
+            title="Test page",
+            slug="test-page",
+            test_charfield="Test content",
+        )
+
+        self.snippet_translation = self.translate(self.snippet, self.fr_locale)
+        self.page_translation = self.translate(self.page, self.fr_locale)
+        self.de_page_translation = self.translate(self.page, self.de_locale)
+
+    def translate(self, instance, locale):
+        translation = Translation.objects.create(
+            source=TranslationSource.get_or_create_from_instance(instance)[0],
+            target_locale=locale,
+        )
+        translation.save_target()
+        return translation
+
+    def read_archive(self, data):
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            return {
+                filename: archive.read(filename).decode()
+                for filename in archive.namelist()
+            }
+
+
+class TestExportPOArchive(POArchiveTestCase):
+    @freeze_time("2020-08-21")
+    def test_export_po_archive(self):
+        translations = [self.snippet_translation, self.page_translation]
+
+        data = b"".join(export_po_archive(translations))
+
+        self.assertEqual(
+            self.read_archive(data),
+            {
+                f"fr/testsnippet-object-{self.snippet.id}-{self.snippet_translation.id}.po": "".join(
+                    self.snippet_translation.stream_po()
+                ),
+                f"fr/test-page-{self.page_translation.id}.po": "".join(
+                    self.page_translation.stream_po()
+                ),
+            },
+        )
+
+    def test_export_po_archive_delta(self):
+        StringTranslation.objects.create(
+            translation_of=self.page_translation.source.stringsegment_set.get().string,
+            context=self.page_translation.source.stringsegment_set.get().context,
+            locale=self.fr_locale,
+            data="Contenu de test",
+        )
+        translations = [self.snippet_translation, self.page_translation]
+
+        # Full exports don't move the delta forward
+        self.read_archive(b"".join(export_po_archive(translations)))
+        for translation in translations:
+            translation.refresh_from_db()
+            self.assertIsNone(translation.last_exported_at)
+
+        self.read_archive(b"".join(export_po_archive(translations, delta=True)))
+        for translation in translations:
+            translation.refresh_from_db()
+            self.assertIsNotNone(translation.last_exported_at)
+
+        files = self.read_archive(b"".join(export_po_archive(translations, delta=True)))
+
+        # Only the snippet has a string left to translate
+        self.assertEqual(
+            {
+                filename: [entry.msgid for entry in polib.pofile(contents)]
+                for filename, contents in files.items()
+            },
+            {
+                get_po_archive_filename(self.snippet_translation): ["Test snippet"],
+                get_po_archive_filename(self.page_translation): [],
+            },
+        )
+
+    def test_export_po_archive_delta_marked_exported_once_read(self):
+        translations = [self.snippet_translation, self.page_translation]
+        archive = export_po_archive(translations, delta=True)
+        data = [next(archive)]
+
+        # The archive hasn't been read to the end yet
+        self.assertFalse(
+            Translation.objects.filter(last_exported_at__isnull=False).exists()
+        )
+
+        data.extend(archive)
+        self.read_archive(b"".join(data))
+        self.assertEqual(
+            Translation.objects.filter(last_exported_at__isnull=False).count(), 2
+        )
+
+    def test_export_empty_archive(self):
+        self.assertEqual(self.read_archive(b"".join(export_po_archive([]))), {})
+
+    def test_export_po_files_command(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "translations.zip")
+            call_command(
+                "export_po_files",
+                path,
+                target_locale="fr",
+                content_type="wagtailcore.page",
+                verbosity=0,
+            )
+
+            with open(path, "rb") as f:
+                filenames = set(self.read_archive(f.read()))
+
+        self.assertEqual(filenames, {get_po_archive_filename(self.page_translation)})
+
+    def test_export_po_files_command_skips_disabled_translations(self):
+        self.page_translation.enabled = False
+        self.page_translation.save()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "translations.zip")
+            call_command("export_po_files", path, target_locale="fr", verbosity=0)
+
+            with open(path, "rb") as f:
+                filenames = set(self.read_archive(f.read()))
+
+        self.assertEqual(filenames, {get_po_archive_filename(self.snippet_translation)})
+
+
+class TestImportPOArchive(POArchiveTestCase):
+    def test_import_po_archive(self):
+        archive_file = make_archive(
+            {
+                "snippet.po": make_po(
+                    self.snippet_translation.uuid,
+                    [("Test snippet", "field", "Extrait de test")],
+                ),
+                "page/fr.po": make_po(
+                    self.page_translation.uuid,
+                    [("Test content", "test_charfield", "Contenu de test")],
+                ),
+                "page/de.po": make_po(
+                    self.de_page_translation.uuid,
+                    [("Test content", "test_charfield", "Testinhalt")],
+                ),
+                "README.txt": "Not a PO file",
+            }
+        )
+
+        result = import_po_archive(archive_file, batch_size=2)
+
+        self.assertEqual(
+            [(filename, translation) for filename, translation, _ in result.imported],
+            [
+                ("snippet.po", self.snippet_translation),
+                ("page/fr.po", self.page_translation),
+                ("page/de.po", self.de_page_translation),
+            ],
+        )
+        self.assertEqual(result.errors, [])
+        self.assertEqual(
+            set(
+                StringTranslation.objects.values_list(
+                    "locale__language_code", "context__path", "data", "tool_name"
+                )
+            ),
+            {
+                ("fr", "field", "Extrait de test", "PO File"),
+                ("fr", "test_charfield", "Contenu de test", "PO File"),
+                ("de", "test_charfield", "Testinhalt", "PO File"),
+            },
+        )
+
+    def test_import_po_archive_errors(self):
+        archive_file = make_archive(
+            {
+                "invalid.po": 'msgid "Unterminated',
+                "no-id.po": make_po(None, [("Test snippet", "field", "Extrait")]),
+                "unknown.po": make_po(
+                    "00000000-0000-0000-0000-000000000000",
+                    [("Test snippet", "field", "Extrait")],
+                ),
+                "not-allowed.po": make_po(
+                    self.page_translation.uuid,
+                    [("Test content", "test_charfield", "Contenu de test")],
+                ),
+            }
+        )
+
+        result = import_po_archive(
+            archive_file,
+            can_import=lambda translation: translation != self.page_translation,
+        )
+
+        self.assertEqual(result.imported, [])
+        self.assertEqual(
+            [filename for filename, error in result.errors],
+            ["invalid.po", "no-id.po", "unknown.po", "not-allowed.po"],
+        )
+        self.assertFalse(StringTranslation.objects.exists())
+
+    def test_import_po_archive_is_atomic(self):
+        archive_file = make_archive(
+            {
+                "snippet.po": make_po(
+                    self.snippet_translation.uuid,
+                    [("Test snippet", "field", "Extrait de test")],
+                ),
+                "page.po": make_po(
+                    self.page_translation.uuid,
+                    [("Test content", "test_charfield", "Contenu de test")],
+                ),
+            }
+        )
+
+        import_po = Translation.import_po
+        calls = []
+
+        def import_po_then_fail(translation, *args, **kwargs):
+            calls.append(translation)
+            if len(calls) == 2:
+                raise RuntimeError("Import failed")
+            return import_po(translation, *args, **kwargs)
+
+        with (
+            mock.patch.object(Translation, "import_po", import_po_then_fail),
+            self.assertRaises(RuntimeError),
+        ):
+            import_po_archive(archive_file)
+
+        # The file imported before the failure was rolled back
+        self.assertFalse(StringTranslation.objects.exists())
+
+    def test_import_po_archive_prefetches_target_instances(self):
+        archive_file = make_archive(
+            {
+                "snippet.po": make_po(self.snippet_translation.uuid, []),
+                "page/fr.po": make_po(self.page_translation.uuid, []),
+                "page/de.po": make_po(self.de_page_translation.uuid, []),
+            }
+        )
+        targets = []
+
+        def can_import(translation):
+            with self.assertNumQueries(0):
+                targets.append(translation.get_target_instance())
+            return True
+
+        result = import_po_archive(archive_file, can_import=can_import)
+
+        self.assertEqual(len(result.imported), 3)
+        self.assertEqual(
+            targets,
+            [
+                self.snippet.get_translation(self.fr_locale),
+                self.page.get_translation(self.fr_locale).specific,
+                self.page.get_translation(self.de_locale).specific,
+            ],
+        )
+
+    def test_prefetch_missing_target_instance(self):
+        self.page.get_translation(self.de_locale).delete()
+
+        Translation.prefetch_target_instances([self.de_page_translation])
+
+        with self.assertRaises(Page.DoesNotExist):
+            self.de_page_translation.get_target_instance()
+
+    @override_settings(WAGTAILLOCALIZE_PO_MAX_SIZE=100)
+    def test_import_po_archive_size_limit(self):
+        archive_file = make_archive(
+            {
+                "snippet.po": make_po(
+                    self.snippet_translation.uuid,
+                    [("Test snippet", "field", "Extrait de test")],
+                ),
+            }
+        )
+
+        result = import_po_archive(archive_file)
+
+        self.assertEqual(result.imported, [])
+        self.assertEqual(result.errors, [("snippet.po", "The PO file is too large.")])
+
+    def test_import_po_files_command(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "translations.zip")
+            with open(path, "wb") as f:
+                f.write(
+                    make_archive(
+                        {
+                            "snippet.po": make_po(
+                                self.snippet_translation.uuid,
+                                [("Test snippet", "field", "Extrait de test")],
+                            ),
+                        }
+                    ).read()
+                )
+
+            stdout = io.StringIO()
+            call_command("import_po_files", path, stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Imported 1 PO files\n")
+        self.assertTrue(
+            StringTranslation.objects.filter(data="Extrait de test").exists()
+        )
+
+
+class TestPOArchiveViews(POArchiveTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = self.login()
+
+    def test_report_has_buttons(self):
+        response = self.client.get(reverse("wagtail_localize:translations_report"))
+
+        self.assertContains(response, "Download PO files")
+        self.assertContains(response, reverse("wagtail_localize:upload_po_archive"))
+
+    def test_download_po_archive(self):
+        response = self.client.get(
+            reverse("wagtail_localize:translations_report")
+            + "?export=po&target_locale=fr"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        self.assertEqual(
+            set(self.read_archive(b"".join(response.streaming_content))),
+            {
+                get_po_archive_filename(self.snippet_translation),
+                get_po_archive_filename(self.page_translation),
+            },
+        )
+
+    def test_download_po_archive_only_includes_editable_translations(self):
+        # Make the user an editor of snippets, but not pages
+        moderators_group = Group.objects.get(name="Moderators")
+        moderators_group.page_permissions.all().delete()
+        moderators_group.permissions.add(
+            *Permission.objects.filter(
+                content_type=ContentType.objects.get_for_model(TestSnippet)
+            )
+        )
+        self.user.groups.add(moderators_group)
+        self.user.is_superuser = False
+        self.user.save()
+
+        response = self.client.get(
+            reverse("wagtail_localize:translations_report") + "?export=po"
+        )
+
+        self.assertEqual(
+            set(self.read_archive(b"".join(response.streaming_content))),
+            {get_po_archive_filename(self.snippet_translation)},
+        )
+
+    def test_filter_editable_translations_prefetches_target_instances(self):
+        translations = list(
+            Translation.objects.select_related("source", "target_locale").order_by("pk")
+        )
+        for translation in translations:
+            ContentType.objects.get_for_id(translation.source.specific_content_type_id)
+
+        # One query for the snippets and one for the pages, for all three translations
+        with self.assertNumQueries(2):
+            editable = list(filter_editable_translations(self.user, translations))
+
+        self.assertEqual(editable, translations)
+
+        # And the same for each batch
+        with self.assertNumQueries(3):
+            editable = list(
+                filter_editable_translations(self.user, translations, batch_size=2)
+            )
+
+        self.assertEqual(editable, translations)
+
+    def test_upload_po_archive(self):
+        response = self.client.get(reverse("wagtail_localize:upload_po_archive"))
+        self.assertEqual(response.status_code, 200)
+
+        archive_file = make_archive(
+            {
+                "snippet.po": make_po(
+                    self.snippet_translation.uuid,
+                    [("Test snippet", "field", "Extrait de test")],
+                ),
+                "unknown.po": make_po(
+                    "00000000-0000-0000-0000-000000000000",
+                    [("Test snippet", "field", "Extrait")],
+                ),
+            }
+        )
+        response = self.client.post(
+            reverse("wagtail_localize:upload_po_archive"),
+            {"file": SimpleUploadedFile("translations.zip", archive_file.read())},
+            follow=True,
+        )
+
+        self.assertRedirects(response, reverse("wagtail_localize:translations_report"))
+        self.assertContains(response, "unknown.po: The translation doesn&#x27;t exist.")
+        self.assertContains(
+            response, "Successfully imported translations from 1 PO file."
+        )
+        string_translation = StringTranslation.objects.get()
+        self.assertEqual(string_translation.data, "Extrait de test")
+        self.assertEqual(string_translation.last_translated_by, self.user)
+
+    def test_upload_po_archive_shows_warnings(self):
+        archive_file = make_archive(
+            {
+                "snippet.po": make_po(
+                    self.snippet_translation.uuid,
+                    [
+                        ("Test snippet", "field", "Extrait de test"),
+                        ("Unknown string", "field", "Chaîne inconnue"),
+                        ("Test snippet", "unknown_field", "Extrait"),
+                    ],
+                ),
+            }
+        )
+        response = self.client.post(
+            reverse("wagtail_localize:upload_po_archive"),
+            {"file": SimpleUploadedFile("translations.zip", archive_file.read())},
+            follow=True,
+        )
+
+        self.assertContains(
+            response,
+            "snippet.po: 2 entries weren&#x27;t imported because they don&#x27;t match the source.",
+        )
+        self.assertContains(
+            response, "Successfully imported translations from 1 PO file."
+        )
+
+    def test_upload_invalid_archive(self):
+        response = self.client.post(
+            reverse("wagtail_localize:upload_po_archive"),
+            {"file": SimpleUploadedFile("translations.zip", b"Not a ZIP file")},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Please upload a valid ZIP file.")
@@ -0,0 +1,90 @@
+import io
+import tempfile
+
+import polib
+
+from django.test import TestCase, override_settings
+
+from wagtail_localize.pofiles import InvalidPOFile, read_po
+
+
+def make_po(count=1, charset="utf-8"):
+    po = polib.POFile(wrapwidth=200)
+    po.metadata = {
+        "MIME-Version": "1.0",
+        "Content-Type": f"text/plain; charset={charset}",
+        "X-WagtailLocalize-TranslationID": "6f0ae5ca-0b5d-4e1c-8d0f-1c2b8e7b5a3d",
+    }
+    for i in range(count):
+        po.append(
+            polib.POEntry(msgid=f"String {i}", msgctxt="field", msgstr=f"Chaîne {i}")
+        )
+
+    return po
+
+
+class TestReadPO(TestCase):
+    def test_read_po(self):
+        po = read_po(str(make_po(2)).encode("utf-8"))
+
+        self.assertEqual(
+            po.metadata["X-WagtailLocalize-TranslationID"],
+            "6f0ae5ca-0b5d-4e1c-8d0f-1c2b8e7b5a3d",
+        )
+        self.assertEqual(
+            [(entry.msgid, entry.msgctxt, entry.msgstr) for entry in po],
+            [("String 0", "field", "Chaîne 0"), ("String 1", "field", "Chaîne 1")],
+        )
+
+    def test_read_po_from_file(self):
+        po = read_po(io.BytesIO(str(make_po()).encode("utf-8")))
+
+        self.assertEqual(po[0].msgstr, "Chaîne 0")
+
+    def test_read_po_uses_charset(self):
+        po = read_po(str(make_po(charset="iso-8859-1")).encode("iso-8859-1"))
+
+        self.assertEqual(po[0].msgstr, "Chaîne 0")
+
+    def test_invalid_file(self):
+        for data in [b"Foo", b'msgid "Unescaped " quote"', b"\xff\xfe\xfa"]:
+            with self.subTest(data=data), self.assertRaises(InvalidPOFile):
+                read_po(data)
+
+    def test_filename_is_refused(self):
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(str(make_po()).encode("utf-8"))
+            f.flush()
+
+            with self.assertRaisesMessage(
+                InvalidPOFile, "Please upload a valid PO file."
+            ):
+                read_po(f.name.encode("utf-8"))
+
+    def test_size_limit(self):
+        data = str(make_po()).encode("utf-8")
+
+        read_po(data, max_size=len(data))
+        with self.assertRaisesMessage(InvalidPOFile, "The PO file is too large."):
+            read_po(io.BytesIO(data), max_size=len(data) - 1)
+
+    def test_entry_limit(self):
+        data = str(make_po(3)).encode("utf-8")
+
+        read_po(data, max_entries=3)
+        with self.assertRaisesMessage(
+            InvalidPOFile, "The PO file has too many entries."
+        ):
+            read_po(data, max_entries=2)
+
+    @override_settings(
+        WAGTAILLOCALIZE_PO_MAX_SIZE=100, WAGTAILLOCALIZE_PO_MAX_ENTRIES=1
+    )
+    def test_limits_from_settings(self):
+        with self.assertRaisesMessage(InvalidPOFile, "The PO file is too large."):
+            read_po(str(make_po()).encode("utf-8"))
+
+        with self.assertRaisesMessage(
+            InvalidPOFile, "The PO file has too many entries."
+        ):
+            read_po(str(make_po(2)).encode("utf-8"), max_size=1000)
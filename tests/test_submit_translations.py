@@ -363,13 +363,14 @@ class TestSubmitPageTranslation(WagtailTestUtils, TestCase):
         self.assertTrue(de_translation.created_at)
 
     def test_post_submit_page_translation_including_subtree(self):
-        response = self.client.post(
-            reverse(
-                "wagtail_localize:submit_page_translation",
-                args=[self.en_blog_index.id],
-            ),
-            {"locales": [self.fr_locale.id], "include_subtree": "on"},
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse(
+                    "wagtail_localize:submit_page_translation",
+                    args=[self.en_blog_index.id],
+                ),
+                {"locales": [self.fr_locale.id], "include_subtree": "on"},
+            )
 
         translated_page = self.en_blog_index.get_translation(self.fr_locale)
 
@@ -1,4 +1,7 @@
+from unittest import mock
+
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.test import TestCase
 from django.urls import reverse
 from wagtail.models import Locale, Page
@@ -6,7 +9,11 @@ from wagtail.test.utils import WagtailTestUtils
 
 from tests.testapp.models import TestHomePage, TestPage
 from wagtail_localize.models import LocaleSynchronization
-from wagtail_localize.synctree import PageIndex
+from wagtail_localize.synctree import (
+    PageIndex,
+    after_create_page,
+    create_aliases_for_new_pages,
+)
 
 
 class TestPageIndex(TestCase):
@@ -158,13 +165,14 @@ class TestSignalsAndHooks(TestCase, WagtailTestUtils):
             "test_synchronized_childobjects-TOTAL_FORMS": "0",
             "test_synchronized_childobjects-INITIAL_FORMS": "0",
         }
-        response = self.client.post(
-            reverse(
-                "wagtailadmin_pages:add",
-                args=["wagtail_localize_test", "testpage", self.en_homepage.id],
-            ),
-            post_data,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse(
+                    "wagtailadmin_pages:add",
+                    args=["wagtail_localize_test", "testpage", self.en_homepage.id],
+                ),
+                post_data,
+            )
 
         self.assertEqual(response.status_code, 302)
 
@@ -206,10 +214,11 @@ class TestSignalsAndHooks(TestCase, WagtailTestUtils):
         )
 
         # Creating the locale synchronisation should create the page in Spanish
-        LocaleSynchronization.objects.create(
-            locale=self.es_locale,
-            sync_from=self.en_locale,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            LocaleSynchronization.objects.create(
+                locale=self.es_locale,
+                sync_from=self.en_locale,
+            )
 
         es_new_page = TestPage.objects.get(
             translation_key=new_page.translation_key, locale=self.es_locale
@@ -246,13 +255,14 @@ class TestSignalsAndHooks(TestCase, WagtailTestUtils):
             "test_synchronized_childobjects-TOTAL_FORMS": "0",
             "test_synchronized_childobjects-INITIAL_FORMS": "0",
         }
-        response = self.client.post(
-            reverse(
-                "wagtailadmin_pages:add",
-                args=["wagtail_localize_test", "testpage", root.id],
-            ),
-            post_data,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse(
+                    "wagtailadmin_pages:add",
+                    args=["wagtail_localize_test", "testpage", root.id],
+                ),
+                post_data,
+            )
 
         self.assertEqual(response.status_code, 302)
 
@@ -263,3 +273,196 @@ class TestSignalsAndHooks(TestCase, WagtailTestUtils):
         self.assertTrue(new_en_homepage.has_translation(self.fr_locale))
         self.assertTrue(new_en_homepage.has_translation(self.fr_ca_locale))
         self.assertTrue(new_en_homepage.has_translation(self.es_locale))
+
+    def test_create_new_page_defers_aliases_until_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            new_page = self.en_homepage.add_child(
+                instance=TestPage(title="Foo", slug="foo")
+            )
+            after_create_page(None, new_page)
+
+            # Nothing is aliased until the transaction commits
+            self.assertFalse(
+                TestPage.objects.filter(
+                    translation_key=new_page.translation_key, locale=self.fr_locale
+                ).exists()
+            )
+
+        self.assertEqual(len(callbacks), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            callbacks[0]()
+
+        fr_new_page = TestPage.objects.get(
+            translation_key=new_page.translation_key, locale=self.fr_locale
+        )
+        self.assertEqual(fr_new_page.alias_of, new_page.page_ptr)
+        self.assertTrue(
+            TestPage.objects.filter(
+                translation_key=new_page.translation_key,
+                locale=self.fr_ca_locale,
+                alias_of=fr_new_page,
+            ).exists()
+        )
+
+    @mock.patch("wagtail_localize.synctree.background")
+    def test_pages_created_in_one_transaction_are_coalesced(self, background):
+        with self.captureOnCommitCallbacks(execute=True), transaction.atomic():
+            parent_page = self.en_homepage.add_child(
+                instance=TestPage(title="Parent", slug="parent")
+            )
+            after_create_page(None, parent_page)
+
+            child_page = parent_page.add_child(
+                instance=TestPage(title="Child", slug="child")
+            )
+            after_create_page(None, child_page)
+
+        background.enqueue_on_commit.assert_called_once_with(
+            create_aliases_for_new_pages,
+            [[parent_page.id, child_page.id]],
+            {},
+            name="Create aliases for 2 new pages",
+        )
+
+    @mock.patch("wagtail_localize.synctree.background")
+    def test_pages_of_rolled_back_savepoints_are_dropped(self, background):
+        with self.captureOnCommitCallbacks(execute=True):
+            page = self.en_homepage.add_child(
+                instance=TestPage(title="Kept", slug="kept")
+            )
+            after_create_page(None, page)
+
+            try:
+                with transaction.atomic():
+                    rolled_back_page = self.en_homepage.add_child(
+                        instance=TestPage(title="Rolled back", slug="rolled-back")
+                    )
+                    after_create_page(None, rolled_back_page)
+                    raise ValueError
+            except ValueError:
+                pass
+
+        background.enqueue_on_commit.assert_called_once_with(
+            create_aliases_for_new_pages,
+            [[page.id]],
+            {},
+            name="Create aliases for 1 new page",
+        )
+
+    @mock.patch("wagtail_localize.synctree.background")
+    def test_pages_created_in_blocks_without_savepoints(self, background):
+        with self.captureOnCommitCallbacks(execute=True), transaction.atomic():
+            page = self.en_homepage.add_child(
+                instance=TestPage(title="Parent", slug="parent")
+            )
+            after_create_page(None, page)
+
+            with transaction.atomic(savepoint=False):
+                other_page = self.en_homepage.add_child(
+                    instance=TestPage(title="Other", slug="other")
+                )
+                after_create_page(None, other_page)
+
+        background.enqueue_on_commit.assert_called_once_with(
+            create_aliases_for_new_pages,
+            [[page.id, other_page.id]],
+            {},
+            name="Create aliases for 2 new pages",
+        )
+
+    @mock.patch("wagtail_localize.synctree.background")
+    def test_pages_of_rolled_back_transactions_are_dropped(self, background):
+        try:
+            with transaction.atomic():
+                rolled_back_page = self.en_homepage.add_child(
+                    instance=TestPage(title="Rolled back", slug="rolled-back")
+                )
+                after_create_page(None, rolled_back_page)
+                raise ValueError
+        except ValueError:
+            pass
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page = self.en_homepage.add_child(
+                instance=TestPage(title="Kept", slug="kept")
+            )
+            after_create_page(None, page)
+
+        background.enqueue_on_commit.assert_called_once_with(
+            create_aliases_for_new_pages,
+            [[page.id]],
+            {},
+            name="Create aliases for 1 new page",
+        )
+
+    def test_create_aliases_for_new_pages(self):
+        LocaleSynchronization.objects.create(
+            locale=self.es_locale,
+            sync_from=self.en_locale,
+        )
+
+        parent_page = self.en_homepage.add_child(
+            instance=TestPage(title="Parent", slug="parent")
+        )
+        child_page = parent_page.add_child(
+            instance=TestPage(title="Child", slug="child")
+        )
+
+        # Pass the child first, the parent must still be aliased before it
+        create_aliases_for_new_pages([child_page.id, parent_page.id])
+
+        for page in [parent_page, child_page]:
+            self.assertEqual(
+                set(
+                    Page.objects.filter(
+                        translation_key=page.translation_key
+                    ).values_list("locale_id", flat=True)
+                ),
+                {
+                    self.en_locale.id,
+                    self.fr_locale.id,
+                    self.fr_ca_locale.id,
+                    self.es_locale.id,
+                },
+            )
+
+        es_child_page = TestPage.objects.get(
+            translation_key=child_page.translation_key, locale=self.es_locale
+        )
+        self.assertEqual(es_child_page.alias_of, child_page.page_ptr)
+        self.assertEqual(
+            es_child_page.get_parent().specific.alias_of, parent_page.page_ptr
+        )
+
+    def test_create_aliases_for_new_pages_follows_existing_translations(self):
+        new_page = self.en_homepage.add_child(
+            instance=TestPage(title="Foo", slug="foo")
+        )
+        fr_new_page = new_page.copy_for_translation(self.fr_locale)
+
+        create_aliases_for_new_pages([new_page.id])
+
+        # fr-CA is synchronised from fr, which already has the page
+        self.assertEqual(
+            TestPage.objects.get(
+                translation_key=new_page.translation_key, locale=self.fr_ca_locale
+            ).alias_of,
+            fr_new_page.page_ptr,
+        )
+
+    def test_create_aliases_for_new_pages_skips_existing_translations(self):
+        new_page = self.en_homepage.add_child(
+            instance=TestPage(title="Foo", slug="foo")
+        )
+        fr_new_page = new_page.copy_for_translation(self.fr_locale)
+
+        create_aliases_for_new_pages([new_page.id])
+
+        fr_new_page.refresh_from_db()
+        self.assertIsNone(fr_new_page.alias_of)
+        self.assertEqual(
+            Page.objects.filter(
+                translation_key=new_page.translation_key, locale=self.fr_locale
+            ).count(),
+            1,
+        )
@@ -1,8 +1,26 @@
+import threading
+
+from datetime import timedelta
 from unittest import mock
 
-from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from freezegun import freeze_time
 
-from wagtail_localize.tasks import get_backend
+from wagtail_localize.models import QueuedJob
+from wagtail_localize.tasks import (
+    DatabaseJobBackend,
+    ImmediateBackend,
+    ProcessPoolBackend,
+    ThreadPoolBackend,
+    get_backend,
+    run_job,
+    run_queued_job,
+)
 
 
 @override_settings(
@@ -19,3 +37,419 @@ class TestDjangoRQBackend(TestCase):
 
         get_queue.assert_called_with("default")
         get_queue().enqueue.assert_called_with(print, "Hello world!", end="\r\n")
+
+    def test_enqueue_in_with_django_rq(self, get_queue):
+        backend = get_backend()
+        backend.enqueue_in(30, print, ["Hello world!"], {"end": "\r\n"})
+
+        get_queue().enqueue_in.assert_called_with(
+            timedelta(seconds=30), print, "Hello world!", end="\r\n"
+        )
+
+
+class DelayingBackend(ImmediateBackend):
+    """
+    Records the jobs that are delayed, instead of running them.
+    """
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.delayed = []
+
+    def enqueue_in(self, delay, func, args, kwargs):
+        self.delayed.append((delay, func, args, kwargs))
+
+
+class TestEnqueueOnCommit(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.backend = ImmediateBackend({})
+        self.results = []
+
+    def test_enqueue_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.backend.enqueue_on_commit(self.results.append, ["Hello"], {})
+            self.backend.enqueue_on_commit(self.results.append, ["Hello"], {})
+            self.assertEqual(self.results, [])
+
+        # Jobs without a key are never collapsed
+        self.assertEqual(self.results, ["Hello", "Hello"])
+
+    def test_jobs_with_the_same_key_are_collapsed_in_a_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.backend.enqueue_on_commit(
+                self.results.append, ["Hello"], {}, key="hello"
+            )
+            self.backend.enqueue_on_commit(
+                self.results.append, ["Hello"], {}, key="hello"
+            )
+            self.backend.enqueue_on_commit(
+                self.results.append, ["world!"], {}, key="world"
+            )
+
+        self.assertEqual(len(callbacks), 2)
+        self.assertEqual(self.results, ["Hello", "world!"])
+
+        # The job has run, so it can be enqueued again
+        with self.captureOnCommitCallbacks(execute=True):
+            self.backend.enqueue_on_commit(
+                self.results.append, ["Hello"], {}, key="hello"
+            )
+
+        self.assertEqual(self.results, ["Hello", "world!", "Hello"])
+
+    def test_rolled_back_job_does_not_suppress_later_ones(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    self.backend.enqueue_on_commit(
+                        self.results.append, ["Hello"], {}, key="hello"
+                    )
+                    raise ValueError
+            except ValueError:
+                pass
+
+            self.backend.enqueue_on_commit(
+                self.results.append, ["Hello"], {}, key="hello"
+            )
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.results, ["Hello"])
+
+    def test_held_job_suppresses_identical_jobs(self):
+        backend = DelayingBackend({"DEBOUNCE": 60})
+
+        with freeze_time("2026-01-01 12:00:00") as frozen_time:
+            with self.captureOnCommitCallbacks(execute=True):
+                backend.enqueue_on_commit(
+                    self.results.append, ["Hello"], {}, key="hello"
+                )
+
+            # Triggered again in another transaction while the first is held back
+            with self.captureOnCommitCallbacks(execute=True):
+                backend.enqueue_on_commit(
+                    self.results.append, ["Hello"], {}, key="hello"
+                )
+
+            self.assertEqual(len(backend.delayed), 1)
+
+            # Once the held job is due, identical jobs are enqueued again
+            frozen_time.tick(61)
+            with self.captureOnCommitCallbacks(execute=True):
+                backend.enqueue_on_commit(
+                    self.results.append, ["Hello"], {}, key="hello"
+                )
+
+            self.assertEqual(len(backend.delayed), 2)
+
+        delay, func, args, kwargs = backend.delayed[0]
+        self.assertEqual(delay, 60)
+        func(*args, **kwargs)
+        self.assertEqual(self.results, ["Hello"])
+
+    def test_failed_enqueue_does_not_suppress_identical_jobs(self):
+        backend = DelayingBackend({"DEBOUNCE": 60})
+
+        with (
+            mock.patch.object(backend, "enqueue_in", side_effect=ConnectionError),
+            self.assertRaises(ConnectionError),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            backend.enqueue_on_commit(self.results.append, ["Hello"], {}, key="hello")
+
+        self.assertIsNone(cache.get("wagtail_localize:job:hello"))
+
+    def test_debounce_is_ignored_by_backends_that_cannot_delay_jobs(self):
+        backend = ImmediateBackend({"DEBOUNCE": 60})
+
+        for _i in range(2):
+            with self.captureOnCommitCallbacks(execute=True):
+                backend.enqueue_on_commit(
+                    self.results.append, ["Hello"], {}, key="hello"
+                )
+
+        # The first job has already run, so the second one isn't collapsed into it
+        self.assertEqual(self.results, ["Hello", "Hello"])
+
+
+@override_settings(
+    WAGTAILLOCALIZE_JOBS={
+        "BACKEND": "wagtail_localize.tasks.ThreadPoolBackend",
+        "OPTIONS": {"MAX_WORKERS": 3},
+    }
+)
+class TestThreadPoolBackend(TestCase):
+    def test_get_backend(self):
+        backend = get_backend()
+
+        self.assertIsInstance(backend, ThreadPoolBackend)
+        self.assertEqual(backend.executor._max_workers, 3)
+
+    def test_enqueue(self):
+        backend = get_backend()
+        results = []
+
+        backend.enqueue(results.append, ["Hello world!"], {})
+
+        # Shutting down waits for submitted jobs to finish
+        backend.shutdown()
+        self.assertEqual(results, ["Hello world!"])
+
+    def test_enqueue_in(self):
+        backend = get_backend()
+        results = []
+
+        with mock.patch("threading.Timer") as timer:
+            backend.enqueue_in(5, results.append, ["Hello world!"], {})
+
+        timer.assert_called_once_with(
+            5, backend.enqueue, [results.append, ["Hello world!"], {}]
+        )
+        timer().start.assert_called_once_with()
+
+    @mock.patch("wagtail_localize.tasks.close_old_connections")
+    def test_connections_are_cleaned_up_around_each_job(self, close_old_connections):
+        backend = get_backend()
+
+        results = []
+
+        backend.enqueue(results.append, ["Hello"], {})
+        backend.enqueue(results.append, ["world!"], {})
+
+        backend.shutdown()
+        self.assertEqual(sorted(results), ["Hello", "world!"])
+        self.assertEqual(close_old_connections.call_count, 4)
+
+
+class TestRunJob(TestCase):
+    @mock.patch("wagtail_localize.tasks.close_old_connections")
+    def test_errors_are_logged(self, close_old_connections):
+        with (
+            self.assertLogs("wagtail_localize.tasks", level="ERROR"),
+            self.assertRaises(ZeroDivisionError),
+        ):
+            run_job(divmod, [1, 0], {})
+
+        self.assertEqual(close_old_connections.call_count, 2)
+
+
+@override_settings(
+    WAGTAILLOCALIZE_JOBS={
+        "BACKEND": "wagtail_localize.tasks.ProcessPoolBackend",
+        "OPTIONS": {"MAX_WORKERS": 1},
+    }
+)
+class TestProcessPoolBackend(TestCase):
+    def test_get_backend(self):
+        backend = get_backend()
+
+        self.assertIsInstance(backend, ProcessPoolBackend)
+        self.assertEqual(backend.executor._max_workers, 1)
+
+    def test_run_job_in_worker_process(self):
+        backend = get_backend()
+
+        future = backend.executor.submit(run_job, pow, [2, 3], {})
+        self.assertEqual(future.result(timeout=30), 8)
+
+        backend.shutdown()
+
+
+@override_settings(
+    WAGTAILLOCALIZE_JOBS={
+        "BACKEND": "wagtail_localize.tasks.DatabaseJobBackend",
+        "OPTIONS": {"QUEUE": "test_queue", "VISIBILITY_TIMEOUT": 60},
+    }
+)
+class TestDatabaseJobBackend(TestCase):
+    def setUp(self):
+        self.backend = get_backend()
+
+    def test_get_backend(self):
+        self.assertIsInstance(self.backend, DatabaseJobBackend)
+        self.assertEqual(self.backend.queue, "test_queue")
+        self.assertEqual(self.backend.visibility_timeout, 60)
+
+    def test_enqueue(self):
+        self.backend.enqueue(pow, [2, 3], {})
+
+        job = QueuedJob.objects.get()
+        self.assertEqual(job.queue, "test_queue")
+        self.assertEqual(job.func, "builtins.pow")
+        self.assertLessEqual(job.run_at, timezone.now())
+
+    def test_enqueue_in(self):
+        self.backend.enqueue_in(30, pow, [2, 3], {})
+
+        job = QueuedJob.objects.get()
+        self.assertGreater(job.run_at, timezone.now() + timedelta(seconds=25))
+
+        # The job isn't due yet
+        self.assertIsNone(self.backend.claim("worker"))
+
+    def test_claim(self):
+        self.backend.enqueue(pow, [2, 3], {})
+
+        job = self.backend.claim("worker")
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(job.locked_by, "worker")
+        self.assertGreater(job.locked_until, timezone.now())
+
+        # Claimed jobs aren't visible to other workers
+        self.assertIsNone(self.backend.claim("other-worker"))
+
+    def test_claim_with_skip_locked(self):
+        self.backend.enqueue(pow, [2, 3], {})
+
+        with mock.patch.object(
+            connection.features, "has_select_for_update_skip_locked", True
+        ):
+            job = self.backend.claim("worker")
+
+        self.assertEqual(job.locked_by, "worker")
+
+    def test_claim_ignores_other_queues(self):
+        self.backend.queue = "other_queue"
+        self.backend.enqueue(pow, [2, 3], {})
+        self.backend.queue = "test_queue"
+
+        self.assertIsNone(self.backend.claim("worker"))
+
+    def test_expired_claim_is_claimed_again(self):
+        self.backend.enqueue(pow, [2, 3], {})
+        job = self.backend.claim("worker")
+        QueuedJob.objects.filter(pk=job.pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        job = self.backend.claim("other-worker")
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(job.locked_by, "other-worker")
+
+    def test_expired_claim_on_last_attempt_fails(self):
+        self.backend.enqueue(pow, [2, 3], {})
+        QueuedJob.objects.update(attempts=self.backend.max_attempts - 1)
+        job = self.backend.claim("worker")
+        self.assertEqual(job.attempts, self.backend.max_attempts)
+        QueuedJob.objects.filter(pk=job.pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        # The worker died on the last attempt, so the job isn't claimed again
+        self.assertIsNone(self.backend.claim("other-worker"))
+
+        job.refresh_from_db()
+        self.assertEqual(job.attempts, self.backend.max_attempts)
+        self.assertIsNotNone(job.failed_at)
+        self.assertEqual(job.locked_by, "")
+        self.assertIsNone(job.locked_until)
+        self.assertEqual(
+            job.error, "The worker running the job stopped before it finished."
+        )
+
+    def test_extend_claims(self):
+        self.backend.enqueue(pow, [2, 3], {})
+        job = self.backend.claim("worker")
+        QueuedJob.objects.filter(pk=job.pk).update(
+            locked_until=timezone.now() + timedelta(seconds=1)
+        )
+
+        self.backend.extend_claims([job.pk], "other-worker")
+        job.refresh_from_db()
+        self.assertLess(job.locked_until, timezone.now() + timedelta(seconds=30))
+
+        self.backend.extend_claims([job.pk], "worker")
+        job.refresh_from_db()
+        self.assertGreater(job.locked_until, timezone.now() + timedelta(seconds=30))
+
+    def test_retry_with_backoff(self):
+        self.backend.enqueue(divmod, [1, 0], {})
+
+        for attempt, delay in [(1, 10), (2, 20)]:
+            QueuedJob.objects.update(run_at=timezone.now())
+            job = self.backend.claim("worker")
+            self.assertEqual(job.attempts, attempt)
+
+            self.backend.retry_or_fail(job, "ZeroDivisionError")
+
+            job.refresh_from_db()
+            self.assertEqual(job.locked_by, "")
+            self.assertIsNone(job.locked_until)
+            self.assertIsNone(job.failed_at)
+            self.assertEqual(job.error, "ZeroDivisionError")
+            self.assertAlmostEqual(
+                job.run_at,
+                timezone.now() + timedelta(seconds=delay),
+                delta=timedelta(seconds=5),
+            )
+
+        QueuedJob.objects.update(run_at=timezone.now())
+        job = self.backend.claim("worker")
+        self.backend.retry_or_fail(job, "ZeroDivisionError")
+
+        job.refresh_from_db()
+        self.assertIsNotNone(job.failed_at)
+
+        # Failed jobs aren't claimed again
+        self.assertIsNone(self.backend.claim("worker"))
+
+    @mock.patch("wagtail_localize.tasks.close_old_connections")
+    def test_run_queued_job(self, close_old_connections):
+        self.backend.enqueue(pow, [2, 3], {})
+
+        self.assertEqual(run_queued_job(self.backend.claim("worker")), 8)
+        self.assertEqual(close_old_connections.call_count, 2)
+
+    def test_worker_requires_database_backend(self):
+        with (
+            override_settings(
+                WAGTAILLOCALIZE_JOBS={
+                    "BACKEND": "wagtail_localize.tasks.ImmediateBackend"
+                }
+            ),
+            self.assertRaises(CommandError),
+        ):
+            call_command("localize_worker", burst=True, verbosity=0)
+
+
+_worker_results = []
+_worker_results_lock = threading.Lock()
+
+
+def record_result(value):
+    with _worker_results_lock:
+        _worker_results.append(value)
+
+
+@override_settings(
+    WAGTAILLOCALIZE_JOBS={
+        "BACKEND": "wagtail_localize.tasks.DatabaseJobBackend",
+        "OPTIONS": {"MAX_ATTEMPTS": 1},
+    }
+)
+class TestLocalizeWorkerCommand(TransactionTestCase):
+    def setUp(self):
+        _worker_results.clear()
+
+    def test_run_jobs(self):
+        backend = get_backend()
+        for value in range(5):
+            backend.enqueue(record_result, [value], {})
+        backend.enqueue(divmod, [1, 0], {})
+
+        with self.assertLogs("wagtail_localize.tasks", level="ERROR"):
+            call_command(
+                "localize_worker",
+                burst=True,
+                concurrency=2,
+                poll_interval=0.01,
+                verbosity=0,
+            )
+
+        self.assertEqual(sorted(_worker_results), [0, 1, 2, 3, 4])
+
+        # Completed jobs are deleted, and the job that raised an exception is marked as failed
+        job = QueuedJob.objects.get()
+        self.assertEqual(job.func, "builtins.divmod")
+        self.assertIsNotNone(job.failed_at)
+        self.assertIn("ZeroDivisionError", job.error)
@@ -0,0 +1,349 @@
+import datetime
+import io
+import os
+import tempfile
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from freezegun import freeze_time
+from wagtail.models import Locale, Page
+
+from wagtail_localize.models import (
+    String,
+    StringTranslation,
+    TranslatableObject,
+    TranslationContext,
+)
+from wagtail_localize.strings import StringValue
+from wagtail_localize.tmx import (
+    InvalidTMXFile,
+    export_tmx,
+    get_translation_memory,
+    import_tmx,
+    read_tmx,
+)
+from wagtail_localize.translation_memory import get_suggestions
+
+
+def make_tmx(units, srclang="en"):
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><tmx version="1.4">'
+        f'<header creationtool="Test" creationtoolversion="1" segtype="sentence" o-tmf="test" adminlang="en" srclang="{srclang}" datatype="html"/>'
+        f"<body>{units}</body></tmx>"
+    ).encode()
+
+
+class TMXTestCase(TestCase):
+    def setUp(self):
+        self.en_locale = Locale.objects.get(language_code="en")
+        self.fr_locale = Locale.objects.create(language_code="fr")
+        self.de_locale = Locale.objects.create(language_code="de")
+        self.object = TranslatableObject.objects.create(
+            translation_key=uuid.uuid4(),
+            content_type=ContentType.objects.get_for_model(Page),
+        )
+
+    def translate(self, source, locale, data, path="test_charfield", **kwargs):
+        return StringTranslation.objects.create(
+            translation_of=String.from_value(self.en_locale, StringValue(source)),
+            locale=locale,
+            context=TranslationContext.objects.get_or_create(
+                object=self.object, path=path
+            )[0],
+            data=data,
+            **kwargs,
+        )
+
+
+class TestExportTMX(TMXTestCase):
+    def test_get_translation_memory(self):
+        with freeze_time("2020-08-21"):
+            self.translate("Hello world", self.fr_locale, "Bonjour le monde")
+            self.translate("Hello world", self.fr_locale, "Salut", path="title")
+            self.translate(
+                "Hello world", self.fr_locale, "Bonjour le monde", path="seo_title"
+            )
+            self.translate("Hello world", self.de_locale, "Hallo Welt")
+            self.translate('<a id="a1">Link</a>', self.fr_locale, '<a id="a2">Lien</a>')
+
+        self.assertEqual(
+            sorted(
+                (source_language, target_language, source, translation)
+                for source_language, target_language, source, translation, *_ in (
+                    get_translation_memory()
+                )
+            ),
+            [
+                ("en", "de", "Hello world", "Hallo Welt"),
+                ("en", "fr", "Hello world", "Bonjour le monde"),
+                ("en", "fr", "Hello world", "Salut"),
+            ],
+        )
+
+    def test_get_translation_memory_filters(self):
+        with freeze_time("2020-08-21"):
+            self.translate("Hello world", self.fr_locale, "Bonjour le monde")
+        with freeze_time("2020-08-23"):
+            self.translate("Goodbye", self.fr_locale, "Au revoir")
+            self.translate("Goodbye", self.de_locale, "Auf Wiedersehen")
+
+        def get_translations(**kwargs):
+            return sorted(
+                translation
+                for _source_language, _target_language, _source, translation, *_ in (
+                    get_translation_memory(**kwargs)
+                )
+            )
+
+        self.assertEqual(
+            get_translations(target_locale=self.fr_locale),
+            ["Au revoir", "Bonjour le monde"],
+        )
+        self.assertEqual(get_translations(source_locale=self.fr_locale), [])
+        since = datetime.datetime(2020, 8, 22, tzinfo=datetime.timezone.utc)
+        self.assertEqual(
+            get_translations(since=since), ["Au revoir", "Auf Wiedersehen"]
+        )
+        self.assertEqual(get_translations(until=since), ["Bonjour le monde"])
+
+    def test_export_tmx(self):
+        with freeze_time("2020-08-21 12:30"):
+            self.translate(
+                'Read <b>the</b> <a id="a1">docs</a><br/>&amp; more',
+                self.fr_locale,
+                'Lisez <a id="a1">la doc</a> <b>et</b> plus',
+                translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+            )
+
+        data = "".join(export_tmx(source_locale=self.en_locale))
+
+        self.assertIn('srclang="en"', data)
+        self.assertIn(
+            '<tu srclang="en" creationdate="20200821T123000Z" changedate="20200821T123000Z">'
+            '<prop type="x-translation-type">manual</prop>'
+            '<tuv xml:lang="en"><seg>Read <bpt i="1">&lt;b&gt;</bpt>the<ept i="1">&lt;/b&gt;</ept> '
+            '<bpt i="2">&lt;a id="a1"&gt;</bpt>docs<ept i="2">&lt;/a&gt;</ept>'
+            "<ph>&lt;br/&gt;</ph>&amp; more</seg></tuv>"
+            '<tuv xml:lang="fr"><seg>Lisez <bpt i="1">&lt;a id="a1"&gt;</bpt>la doc<ept i="1">&lt;/a&gt;</ept> '
+            '<bpt i="2">&lt;b&gt;</bpt>et<ept i="2">&lt;/b&gt;</ept> plus</seg></tuv></tu>',
+            data,
+        )
+
+    def test_export_translation_memory_command(self):
+        self.translate("Hello world", self.fr_locale, "Bonjour le monde")
+        self.translate("Hello world", self.de_locale, "Hallo Welt")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "memory.tmx")
+            call_command(
+                "export_translation_memory", path, target_locale="de", verbosity=0
+            )
+
+            with open(path, "rb") as f:
+                units = list(read_tmx(f))
+
+        self.assertEqual(
+            [(language, variants) for language, variants, *_ in units],
+            [("en", {"en": "Hello world", "de": "Hallo Welt"})],
+        )
+
+    def test_export_translation_memory_command_unknown_locale(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "memory.tmx")
+            with self.assertRaisesMessage(CommandError, "Unknown locale 'es'"):
+                call_command("export_translation_memory", path, target_locale="es")
+
+            self.assertFalse(os.path.exists(path))
+
+
+class TestImportTMX(TMXTestCase):
+    def test_round_trip(self):
+        data = 'Read <b>the</b> <a id="a1">docs</a><br/>&amp; more'
+        translation = 'Lisez <a id="a1">la doc</a> <b>et</b> plus'
+        self.translate(data, self.fr_locale, translation)
+        tmx = "".join(export_tmx()).encode()
+        StringTranslation.objects.all().delete()
+        String.objects.all().delete()
+
+        result = import_tmx(tmx)
+
+        self.assertEqual((result.created, result.updated, result.skipped), (1, 0, 0))
+        string_translation = StringTranslation.objects.get()
+        self.assertEqual(string_translation.translation_of.data, data)
+        self.assertEqual(string_translation.translation_of.locale, self.en_locale)
+        self.assertEqual(string_translation.locale, self.fr_locale)
+        self.assertIsNone(string_translation.context)
+        self.assertEqual(string_translation.data, translation)
+        self.assertEqual(string_translation.tool_name, "TMX File")
+        self.assertFalse(string_translation.has_error)
+
+    def test_import_upserts_by_string(self):
+        string_translation = self.translate(
+            "Hello world", self.fr_locale, "Bonjour le monde"
+        )
+        tmx = make_tmx(
+            '<tu><tuv xml:lang="en"><seg>Hello world</seg></tuv>'
+            '<tuv xml:lang="fr-FR"><seg>Salut le monde</seg></tuv>'
+            '<tuv xml:lang="DE"><seg>Hallo Welt</seg></tuv></tu>'
+            '<tu><tuv xml:lang="en"><seg>Goodbye</seg></tuv>'
+            '<tuv xml:lang="fr"><seg>Au revoir</seg></tuv></tu>'
+        )
+
+        result = import_tmx(tmx, batch_size=2)
+
+        self.assertEqual((result.created, result.updated, result.unchanged), (3, 0, 0))
+        # Existing strings are reused, and translations in contexts are left alone
+        self.assertEqual(String.objects.count(), 2)
+        string_translation.refresh_from_db()
+        self.assertEqual(string_translation.data, "Bonjour le monde")
+        self.assertEqual(
+            set(
+                StringTranslation.objects.filter(context__isnull=True).values_list(
+                    "translation_of__data", "locale__language_code", "data"
+                )
+            ),
+            {
+                ("Hello world", "fr", "Salut le monde"),
+                ("Hello world", "de", "Hallo Welt"),
+                ("Goodbye", "fr", "Au revoir"),
+            },
+        )
+
+        # Importing again updates the translations that were imported before
+        result = import_tmx(
+            make_tmx(
+                '<tu><tuv xml:lang="en"><seg>Hello world</seg></tuv>'
+                '<tuv xml:lang="fr"><seg>Bonjour tout le monde</seg></tuv>'
+                '<tuv xml:lang="de"><seg>Hallo Welt</seg></tuv></tu>'
+            )
+        )
+
+        self.assertEqual((result.created, result.updated, result.unchanged), (0, 1, 1))
+        self.assertEqual(
+            StringTranslation.objects.get(
+                context__isnull=True,
+                locale=self.fr_locale,
+                translation_of__data="Hello world",
+            ).data,
+            "Bonjour tout le monde",
+        )
+
+    def test_import_number_of_queries_doesnt_grow_with_units(self):
+        def make_units(count):
+            return make_tmx(
+                "".join(
+                    f'<tu><tuv xml:lang="en"><seg>String {i}</seg></tuv>'
+                    f'<tuv xml:lang="fr"><seg>Chaîne {i}</seg></tuv></tu>'
+                    for i in range(count)
+                )
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            import_tmx(make_units(2))
+        StringTranslation.objects.all().delete()
+        String.objects.all().delete()
+
+        with self.assertNumQueries(len(queries)):
+            import_tmx(make_units(10))
+
+    def test_import_filters(self):
+        tmx = make_tmx(
+            '<tu changedate="20200821T000000Z"><tuv xml:lang="en"><seg>Hello world</seg></tuv>'
+            '<tuv xml:lang="fr"><seg>Bonjour le monde</seg></tuv>'
+            '<tuv xml:lang="de"><seg>Hallo Welt</seg></tuv></tu>'
+            '<tu changedate="20200823T000000Z"><tuv xml:lang="en"><seg>Goodbye</seg></tuv>'
+            '<tuv xml:lang="fr"><seg>Au revoir</seg></tuv></tu>'
+            '<tu><tuv xml:lang="en"><seg>Unknown locale</seg></tuv>'
+            '<tuv xml:lang="es"><seg>Configuración regional desconocida</seg></tuv></tu>'
+        )
+
+        result = import_tmx(
+            tmx,
+            target_locale=self.fr_locale,
+            since=datetime.datetime(2020, 8, 22, tzinfo=datetime.timezone.utc),
+        )
+
+        self.assertEqual((result.created, result.skipped), (1, 2))
+        self.assertEqual(
+            list(StringTranslation.objects.values_list("data", flat=True)),
+            ["Au revoir"],
+        )
+
+    def test_import_with_all_source_languages(self):
+        tmx = make_tmx(
+            '<tu><tuv xml:lang="en"><seg>Hello world</seg></tuv>'
+            '<tuv xml:lang="fr"><seg>Bonjour le monde</seg></tuv></tu>',
+            srclang="*all*",
+        )
+
+        self.assertEqual(import_tmx(tmx).skipped, 1)
+        self.assertEqual(import_tmx(tmx, source_locale=self.en_locale).created, 1)
+
+    def test_import_flags_invalid_translations(self):
+        import_tmx(
+            make_tmx(
+                '<tu><tuv xml:lang="en"><seg>Read <bpt i="1">&lt;a id="a1"&gt;</bpt>more'
+                '<ept i="1">&lt;/a&gt;</ept></seg></tuv>'
+                '<tuv xml:lang="fr"><seg><bpt i="1">&lt;a id="a2"&gt;</bpt>Lire la suite'
+                '<ept i="1">&lt;/a&gt;</ept></seg></tuv></tu>'
+            )
+        )
+
+        string_translation = StringTranslation.objects.get()
+        self.assertEqual(string_translation.data, '<a id="a2">Lire la suite</a>')
+        self.assertTrue(string_translation.has_error)
+
+    def test_imported_translations_are_suggested(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            import_tmx(
+                make_tmx(
+                    '<tu><tuv xml:lang="en"><seg>The quick brown fox</seg></tuv>'
+                    '<tuv xml:lang="fr"><seg>Le rapide renard brun</seg></tuv></tu>'
+                )
+            )
+
+        self.assertEqual(
+            [
+                suggestion["translation"]
+                for suggestion in get_suggestions(
+                    "The quick brown fox!", self.en_locale, self.fr_locale
+                )
+            ],
+            ["Le rapide renard brun"],
+        )
+
+    def test_invalid_file(self):
+        for data in [b"Not XML", b"<html></html>", make_tmx("<tu>")[:-20]]:
+            with (
+                self.subTest(data=data),
+                self.assertRaisesMessage(
+                    InvalidTMXFile, "Please upload a valid TMX file."
+                ),
+            ):
+                import_tmx(data)
+
+    def test_import_translation_memory_command(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "memory.tmx")
+            with open(path, "wb") as f:
+                f.write(
+                    make_tmx(
+                        '<tu><tuv xml:lang="en"><seg>Hello world</seg></tuv>'
+                        '<tuv xml:lang="fr"><seg>Bonjour le monde</seg></tuv></tu>'
+                    )
+                )
+
+            stdout = io.StringIO()
+            call_command("import_translation_memory", path, stdout=stdout)
+
+        self.assertEqual(
+            stdout.getvalue(),
+            "Imported 1 new and 0 changed translations (0 unchanged, 0 skipped)\n",
+        )
+        self.assertTrue(
+            StringTranslation.objects.filter(data="Bonjour le monde").exists()
+        )
@@ -109,20 +109,21 @@ class TestSubmitPageTranslationWithComponents(TestCase, WagtailTestUtils):
     def test_post_submit_page_translation_with_include_children_creates_corresponding_component_instances(
         self,
     ):
-        self.client.post(
-            reverse(
-                "wagtail_localize:submit_page_translation",
-                args=[self.en_blog_index.id],
-            ),
-            {
-                "locales": [self.fr_locale.id],
-                "include_subtree": "true",
-                "component-wagtail_localize_test_customtranslationdata-enabled": True,
-                "component-wagtail_localize_test_customtranslationdata-custom_text_field": "foo",
-                "component-wagtail_localize_test_custombutsimpletranslationdata-enabled": True,
-                "component-wagtail_localize_test_custombutsimpletranslationdata-notes": "Here be dragons",
-            },
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse(
+                    "wagtail_localize:submit_page_translation",
+                    args=[self.en_blog_index.id],
+                ),
+                {
+                    "locales": [self.fr_locale.id],
+                    "include_subtree": "true",
+                    "component-wagtail_localize_test_customtranslationdata-enabled": True,
+                    "component-wagtail_localize_test_customtranslationdata-custom_text_field": "foo",
+                    "component-wagtail_localize_test_custombutsimpletranslationdata-enabled": True,
+                    "component-wagtail_localize_test_custombutsimpletranslationdata-notes": "Here be dragons",
+                },
+            )
         self.assertEqual(
             CustomTranslationData.objects.count(), 3
         )  # 1 for each translation source
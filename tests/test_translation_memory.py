@@ -0,0 +1,304 @@
+import uuid
+
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from wagtail.models import Locale, Page
+
+from wagtail_localize.models import (
+    String,
+    StringTranslation,
+    TranslatableObject,
+    TranslationContext,
+    TranslationMemoryIndexEntry,
+)
+from wagtail_localize.strings import StringValue
+from wagtail_localize.translation_memory import (
+    NUM_BANDS,
+    get_band_keys,
+    get_similarity,
+    get_suggestions,
+    update_index,
+)
+
+
+class TestBandKeys(TestCase):
+    def test_band_keys(self):
+        keys = get_band_keys("The quick brown fox jumps over the lazy dog")
+
+        self.assertEqual(len(keys), NUM_BANDS)
+        self.assertEqual(
+            keys, get_band_keys("The quick brown fox jumps over the lazy dog")
+        )
+
+    def test_markup_and_case_are_ignored(self):
+        self.assertEqual(
+            get_band_keys('<a id="a1">The quick brown fox</a>  jumps'),
+            get_band_keys("the quick brown fox jumps"),
+        )
+
+    def test_similar_strings_share_bands(self):
+        keys = set(get_band_keys("The quick brown fox jumps over the lazy dog"))
+
+        self.assertTrue(
+            keys & set(get_band_keys("The quick brown fox jumped over the lazy dog"))
+        )
+        self.assertFalse(
+            keys & set(get_band_keys("Lorem ipsum dolor sit amet, consectetur"))
+        )
+
+    def test_empty_string(self):
+        self.assertEqual(get_band_keys("<br/> "), [])
+
+    def test_similarity(self):
+        self.assertEqual(get_similarity("<b>Hello</b> world", "hello world"), 1)
+        self.assertEqual(get_similarity("abcd", "wxyz"), 0)
+
+
+class TestTranslationMemoryIndex(TestCase):
+    def setUp(self):
+        self.en_locale = Locale.objects.get(language_code="en")
+        self.fr_locale = Locale.objects.create(language_code="fr")
+        self.de_locale = Locale.objects.create(language_code="de")
+
+        self.context = TranslationContext.objects.create(
+            object=TranslatableObject.objects.create(
+                translation_key=uuid.uuid4(),
+                content_type=ContentType.objects.get_for_model(Page),
+            ),
+            path="test_charfield",
+        )
+
+    def translate(self, source, translation, locale=None, **kwargs):
+        # Translations are indexed once the transaction is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            return StringTranslation.objects.create(
+                translation_of=String.from_value(
+                    self.en_locale, StringValue.from_plaintext(source)
+                ),
+                locale=locale or self.fr_locale,
+                context=kwargs.pop("context", self.context),
+                data=translation,
+                translation_type=kwargs.pop(
+                    "translation_type", StringTranslation.TRANSLATION_TYPE_MANUAL
+                ),
+                **kwargs,
+            )
+
+    def test_translations_are_indexed_when_saved(self):
+        string_translation = self.translate("Read the latest news", "Lisez les news")
+
+        self.assertEqual(
+            TranslationMemoryIndexEntry.objects.filter(
+                string=string_translation.translation_of, locale=self.fr_locale
+            ).count(),
+            NUM_BANDS,
+        )
+
+        # Saving again doesn't add more entries
+        with self.captureOnCommitCallbacks(execute=True):
+            string_translation.save()
+        self.assertEqual(TranslationMemoryIndexEntry.objects.count(), NUM_BANDS)
+
+    def test_translations_saved_in_one_transaction_are_indexed_together(self):
+        with (
+            self.captureOnCommitCallbacks() as callbacks,
+            transaction.atomic(),
+        ):
+            for source in ["Read the latest news", "Contact us", "About us"]:
+                StringTranslation.objects.create(
+                    translation_of=String.from_value(
+                        self.en_locale, StringValue.from_plaintext(source)
+                    ),
+                    locale=self.fr_locale,
+                    context=self.context,
+                    data="Traduit",
+                    translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+                )
+
+            # Nothing is indexed until the transaction is committed
+            self.assertFalse(TranslationMemoryIndexEntry.objects.exists())
+
+        self.assertEqual(len(callbacks), 1)
+
+        # Look up the indexed strings, their data, then insert the entries
+        with self.assertNumQueries(3):
+            callbacks[0]()
+
+        self.assertEqual(TranslationMemoryIndexEntry.objects.count(), 3 * NUM_BANDS)
+
+    def test_index_is_updated_in_a_background_job(self):
+        string = String.from_value(
+            self.en_locale, StringValue.from_plaintext("Contact us")
+        )
+
+        with (
+            mock.patch(
+                "wagtail_localize.translation_memory.background.enqueue"
+            ) as enqueue,
+            self.captureOnCommitCallbacks(execute=True),
+            transaction.atomic(),
+        ):
+            StringTranslation.objects.create(
+                translation_of=string,
+                locale=self.fr_locale,
+                context=self.context,
+                data="Contactez-nous",
+                translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+            )
+
+        enqueue.assert_called_once_with(
+            update_index, [[[string.id, self.fr_locale.id]], []], {}
+        )
+        self.assertFalse(TranslationMemoryIndexEntry.objects.exists())
+
+        # The job's arguments only use lists, so any backend can serialise them
+        update_index(*enqueue.call_args.args[1])
+        self.assertEqual(TranslationMemoryIndexEntry.objects.count(), NUM_BANDS)
+
+    def test_translations_are_unindexed_when_deleted(self):
+        string_translation = self.translate("Read the latest news", "Lisez les news")
+        other_context = TranslationContext.objects.create(
+            object=self.context.object, path="other_field"
+        )
+        other_string_translation = self.translate(
+            "Read the latest news", "Lisez les news", context=other_context
+        )
+
+        # The string is still translated in the other context
+        with self.captureOnCommitCallbacks(execute=True):
+            string_translation.delete()
+        self.assertEqual(TranslationMemoryIndexEntry.objects.count(), NUM_BANDS)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other_string_translation.delete()
+        self.assertFalse(TranslationMemoryIndexEntry.objects.exists())
+
+    def test_get_suggestions(self):
+        self.translate(
+            "Read the latest news from our team",
+            "Lisez les dernières nouvelles de notre équipe",
+        )
+        self.translate(
+            "Read the latest news from our partners",
+            "Lisez les dernières nouvelles de nos partenaires",
+        )
+        self.translate("Contact us", "Contactez-nous")
+
+        with self.assertNumQueries(2):
+            suggestions = get_suggestions(
+                "Read the latest news from our teams",
+                self.en_locale,
+                self.fr_locale,
+            )
+
+        self.assertEqual(
+            suggestions,
+            [
+                {
+                    "source": "Read the latest news from our team",
+                    "translation": "Lisez les dernières nouvelles de notre équipe",
+                    "similarity": 0.986,
+                },
+                {
+                    "source": "Read the latest news from our partners",
+                    "translation": "Lisez les dernières nouvelles de nos partenaires",
+                    "similarity": 0.904,
+                },
+            ],
+        )
+
+    def test_get_suggestions_with_limit(self):
+        self.translate("Read the latest news from our team", "Équipe")
+        self.translate("Read the latest news from our partners", "Partenaires")
+
+        suggestions = get_suggestions(
+            "Read the latest news from our teams",
+            self.en_locale,
+            self.fr_locale,
+            limit=1,
+        )
+
+        self.assertEqual(
+            [suggestion["translation"] for suggestion in suggestions], ["Équipe"]
+        )
+
+    def test_get_suggestions_only_finds_translations_into_target_locale(self):
+        self.translate(
+            "Read the latest news from our team",
+            "Lesen Sie die neuesten Nachrichten",
+            locale=self.de_locale,
+        )
+
+        self.assertEqual(
+            get_suggestions(
+                "Read the latest news from our teams",
+                self.en_locale,
+                self.fr_locale,
+            ),
+            [],
+        )
+
+    def test_get_suggestions_ignores_machine_translations_and_errors(self):
+        self.translate(
+            "Read the latest news from our team",
+            "Lisez les dernières nouvelles",
+            translation_type=StringTranslation.TRANSLATION_TYPE_MACHINE,
+        )
+        self.translate(
+            "Read the latest news from our partners",
+            "Lisez les dernières nouvelles",
+            has_error=True,
+        )
+
+        self.assertEqual(
+            get_suggestions(
+                "Read the latest news from our teams",
+                self.en_locale,
+                self.fr_locale,
+            ),
+            [],
+        )
+
+    def test_index_translation_memory_command(self):
+        string = String.from_value(
+            self.en_locale,
+            StringValue.from_plaintext("Read the latest news from our team"),
+        )
+        StringTranslation.objects.bulk_create(
+            [
+                StringTranslation(
+                    translation_of=string,
+                    locale=locale,
+                    context=self.context,
+                    data="Translated",
+                    translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+                )
+                for locale in [self.fr_locale, self.de_locale]
+            ]
+        )
+        self.assertFalse(TranslationMemoryIndexEntry.objects.exists())
+
+        call_command("index_translation_memory", batch_size=1, verbosity=0)
+
+        self.assertEqual(
+            set(
+                TranslationMemoryIndexEntry.objects.values_list(
+                    "string_id", "locale_id"
+                ).distinct()
+            ),
+            {(string.id, self.fr_locale.id), (string.id, self.de_locale.id)},
+        )
+        self.assertEqual(
+            len(
+                get_suggestions(
+                    "Read the latest news from our teams",
+                    self.en_locale,
+                    self.de_locale,
+                )
+            ),
+            1,
+        )
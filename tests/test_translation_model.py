@@ -1,13 +1,16 @@
+from datetime import timedelta
 from unittest import mock
 from unittest.mock import patch
 
 import polib
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import OperationalError, transaction
 from django.db.migrations.recorder import MigrationRecorder
 from django.test import TestCase, override_settings
 from django.utils import timezone
+from freezegun import freeze_time
 from wagtail.models import Locale, Page
 
 from tests.testapp.models import (
@@ -27,6 +30,7 @@ from wagtail_localize.models import (
     SegmentOverride,
     String,
     StringNotUsedInContext,
+    StringSegment,
     StringTranslation,
     TemplateSegment,
     TranslatableObject,
@@ -37,6 +41,7 @@ from wagtail_localize.models import (
     UnknownContext,
     UnknownString,
     get_schema_version,
+    sync_page_draft_titles,
 )
 from wagtail_localize.segments import RelatedObjectSegmentValue
 from wagtail_localize.strings import StringValue
@@ -310,6 +315,145 @@ class TestExportPO(TestCase):
 
         # Obsolete strings that never had a translation don't get exported
 
+    @freeze_time("2020-08-21")
+    def test_stream_po(self):
+        obsolete_string = String.from_value(
+            self.en_locale, StringValue("This is an obsolete string")
+        )
+        StringTranslation.objects.create(
+            translation_of=obsolete_string,
+            context=TranslationContext.objects.get(path="test_charfield"),
+            locale=self.fr_locale,
+            data="Ceci est une chaîne obsolète",
+        )
+        StringTranslation.objects.create(
+            translation_of=String.objects.get(data="This is some test content"),
+            context=TranslationContext.objects.get(path="test_textfield"),
+            locale=self.fr_locale,
+            data="Contenu de test",
+        )
+
+        with self.assertNumQueries(0):
+            stream = self.translation.stream_po()
+
+        self.assertEqual("".join(stream), str(self.translation.export_po()))
+
+    def test_export_po_delta(self):
+        StringTranslation.objects.create(
+            translation_of=String.objects.get(data="This is some test content"),
+            context=TranslationContext.objects.get(path="test_charfield"),
+            locale=self.fr_locale,
+            data="Contenu de test",
+        )
+        obsolete_string = String.from_value(
+            self.en_locale, StringValue("This is an obsolete string")
+        )
+        StringTranslation.objects.create(
+            translation_of=obsolete_string,
+            context=TranslationContext.objects.get(path="test_charfield"),
+            locale=self.fr_locale,
+            data="Ceci est une chaîne obsolète",
+        )
+        self.translation.mark_exported()
+
+        with self.assertNumQueries(1):
+            po = self.translation.export_po(delta=True)
+
+        self.assertEqual(
+            po.metadata["X-WagtailLocalize-ChangedSince"],
+            str(self.translation.last_exported_at),
+        )
+
+        # Only the untranslated string is exported, and obsolete strings are left out
+        self.assertEqual(
+            [(entry.msgctxt, entry.msgstr) for entry in po],
+            [("test_textfield", "")],
+        )
+
+    def test_export_po_delta_includes_translations_with_errors(self):
+        for path in ["test_charfield", "test_textfield"]:
+            StringTranslation.objects.create(
+                translation_of=String.objects.get(data="This is some test content"),
+                context=TranslationContext.objects.get(path=path),
+                locale=self.fr_locale,
+                data="Contenu de test",
+                has_error=path == "test_textfield",
+            )
+        self.translation.mark_exported()
+
+        po = self.translation.export_po(delta=True)
+
+        self.assertEqual(
+            [(entry.msgctxt, entry.msgstr) for entry in po],
+            [("test_textfield", "Contenu de test")],
+        )
+
+    def test_export_po_delta_includes_changed_strings(self):
+        for path in ["test_charfield", "test_textfield"]:
+            StringTranslation.objects.create(
+                translation_of=String.objects.get(data="This is some test content"),
+                context=TranslationContext.objects.get(path=path),
+                locale=self.fr_locale,
+                data="Contenu de test",
+            )
+        self.translation.mark_exported()
+        self.assertEqual(len(self.translation.export_po(delta=True)), 0)
+
+        # Change the source string of one of the fields
+        self.page.test_charfield = "This is some changed test content"
+        self.page.save()
+        self.source.update_from_db()
+
+        po = self.translation.export_po(delta=True)
+
+        self.assertEqual(
+            [(entry.msgid, entry.msgctxt) for entry in po],
+            [("This is some changed test content", "test_charfield")],
+        )
+
+        # Strings that changed after a given time can be exported too
+        po = self.translation.export_po(
+            delta=True, since=timezone.now() - timedelta(days=1)
+        )
+        self.assertEqual(len(po), 2)
+
+    def test_export_po_delta_without_previous_export(self):
+        StringTranslation.objects.create(
+            translation_of=String.objects.get(data="This is some test content"),
+            context=TranslationContext.objects.get(path="test_charfield"),
+            locale=self.fr_locale,
+            data="Contenu de test",
+        )
+
+        po = self.translation.export_po(delta=True)
+
+        self.assertNotIn("X-WagtailLocalize-ChangedSince", po.metadata)
+        self.assertEqual(len(po), 2)
+
+    @freeze_time("2020-08-21")
+    def test_stream_po_delta(self):
+        self.translation.mark_exported()
+        StringTranslation.objects.create(
+            translation_of=String.objects.get(data="This is some test content"),
+            context=TranslationContext.objects.get(path="test_textfield"),
+            locale=self.fr_locale,
+            data="Contenu de test",
+        )
+
+        self.assertEqual(
+            "".join(self.translation.stream_po(delta=True)),
+            str(self.translation.export_po(delta=True)),
+        )
+
+    def test_mark_exported(self):
+        exported_at = timezone.now()
+
+        self.translation.mark_exported(exported_at)
+
+        self.assertEqual(self.translation.last_exported_at, exported_at)
+        self.translation.refresh_from_db()
+        self.assertEqual(self.translation.last_exported_at, exported_at)
+
 
 class TestImportPO(TestCase):
     def setUp(self):
@@ -541,6 +685,93 @@ class TestImportPO(TestCase):
             ],
         )
 
+    def make_po(self, entries):
+        po = polib.POFile(wrapwidth=200)
+        po.metadata = {
+            "POT-Creation-Date": str(timezone.now()),
+            "MIME-Version": "1.0",
+            "Content-Type": "text/plain; charset=utf-8",
+            "X-WagtailLocalize-TranslationID": str(self.translation.uuid),
+        }
+        for msgid, msgctxt, msgstr in entries:
+            po.append(polib.POEntry(msgid=msgid, msgctxt=msgctxt, msgstr=msgstr))
+        return po
+
+    def test_import_po_number_of_queries_doesnt_grow_with_entries(self):
+        page = create_test_page(
+            title="Streamfield page",
+            slug="streamfield-page",
+            test_streamfield=[
+                {"type": "test_charblock", "value": f"Block {i}"} for i in range(20)
+            ],
+        )
+        source, _created = TranslationSource.get_or_create_from_instance(page)
+        translation = Translation.objects.create(
+            source=source, target_locale=self.fr_locale
+        )
+        po = translation.export_po()
+        for entry in po:
+            entry.msgstr = f"{entry.msgid} (fr)"
+
+        # The translation memory is indexed by a background job once the transaction is committed
+        with self.assertNumQueries(8):
+            warnings = translation.import_po(po)
+
+        self.assertEqual(warnings, [])
+        self.assertEqual(
+            StringTranslation.objects.filter(
+                context__object_id=source.object_id, locale=self.fr_locale
+            ).count(),
+            len(po),
+        )
+
+        # Changed translations are updated in bulk too
+        for entry in po:
+            entry.msgstr = f"{entry.msgid} (fr, updated)"
+
+        with self.assertNumQueries(8):
+            translation.import_po(po)
+
+        self.assertEqual(
+            StringTranslation.objects.get(
+                translation_of__data="Block 19", locale=self.fr_locale
+            ).data,
+            "Block 19 (fr, updated)",
+        )
+
+    def test_import_po_with_repeated_entries(self):
+        warnings = self.translation.import_po(
+            self.make_po(
+                [
+                    ("This is some test content", "test_charfield", "Contenu"),
+                    ("This is some test content", "test_charfield", ""),
+                    ("This is some test content", "test_charfield", "Contenu de test"),
+                ]
+            )
+        )
+
+        self.assertEqual(warnings, [])
+
+        # The last translation wins
+        translation = StringTranslation.objects.get()
+        self.assertEqual(translation.data, "Contenu de test")
+        self.assertFalse(translation.has_error)
+
+    def test_import_po_flags_invalid_translations(self):
+        self.translation.import_po(
+            self.make_po(
+                [
+                    (
+                        "This is some test content",
+                        "test_charfield",
+                        '<a href="https://www.example.com">Contenu de test</a>',
+                    ),
+                ]
+            )
+        )
+
+        self.assertTrue(StringTranslation.objects.get().has_error)
+
 
 class TestGetStatus(TestCase):
     def setUp(self):
@@ -1274,3 +1505,157 @@ class TestHelpers(TestCase):
         databases["TEST"] = {"MIGRATE": False}
         with override_settings(DATABASES=databases):
             self.assertEqual(get_schema_version("test.TestSnippet"), "")
+
+
+class TestPageDraftTitleSync(TestCase):
+    def setUp(self):
+        self.en_locale = Locale.objects.get(language_code="en")
+        self.fr_locale = Locale.objects.create(language_code="fr")
+
+        self.page = create_test_page(title="Test page", slug="test-page")
+        self.fr_page = self.page.copy_for_translation(self.fr_locale)
+        self.title_context = TranslationContext.objects.create(
+            object_id=self.page.translation_key, path="title"
+        )
+        self.other_context = TranslationContext.objects.create(
+            object_id=self.page.translation_key, path="test_charfield"
+        )
+        self.string = String.from_value(
+            self.en_locale, StringValue.from_plaintext("Test page")
+        )
+
+    def get_draft_title(self):
+        self.fr_page.refresh_from_db()
+        return self.fr_page.draft_title
+
+    def test_save_updates_draft_title(self):
+        with transaction.atomic():
+            StringTranslation.objects.create(
+                translation_of=self.string,
+                context=self.title_context,
+                locale=self.fr_locale,
+                data="Page de test",
+            )
+
+            # The page is updated straight away, within the same transaction
+            self.assertEqual(self.get_draft_title(), "Page de test")
+
+    def test_delete_resets_draft_title(self):
+        string_translation = StringTranslation.objects.create(
+            translation_of=self.string,
+            context=self.title_context,
+            locale=self.fr_locale,
+            data="Page de test",
+        )
+        self.assertEqual(self.get_draft_title(), "Page de test")
+
+        StringTranslation.objects.get(id=string_translation.id).delete()
+
+        self.assertEqual(self.get_draft_title(), "Test page")
+
+    def test_save_other_field_doesnt_update_pages(self):
+        with (
+            mock.patch("wagtail_localize.models.update_index_on_commit"),
+            mock.patch.object(Page.objects, "filter") as page_filter,
+        ):
+            StringTranslation.objects.create(
+                translation_of=self.string,
+                context=self.other_context,
+                locale=self.fr_locale,
+                data="Page de test",
+            )
+
+        # The context was already loaded, so there's nothing to look up or update
+        page_filter.assert_not_called()
+        self.assertEqual(self.get_draft_title(), "Test page")
+
+    def test_set_field_error_doesnt_update_title(self):
+        string_translation = StringTranslation.objects.create(
+            translation_of=self.string,
+            context=self.title_context,
+            locale=self.fr_locale,
+            data="Page de test",
+        )
+
+        with mock.patch(
+            "wagtail_localize.models.update_page_draft_titles"
+        ) as update_page_draft_titles:
+            string_translation.set_field_error(
+                [ValidationError("This field is required.")]
+            )
+
+        update_page_draft_titles.assert_not_called()
+
+    def test_saves_in_a_block_update_titles_at_the_end(self):
+        with sync_page_draft_titles():
+            StringTranslation.objects.create(
+                translation_of=self.string,
+                context=self.title_context,
+                locale=self.fr_locale,
+                data="Page de test",
+            )
+
+            self.assertEqual(self.get_draft_title(), "Test page")
+
+        self.assertEqual(self.get_draft_title(), "Page de test")
+
+    def test_block_that_raises_doesnt_update_titles(self):
+        with self.assertRaises(ValueError), sync_page_draft_titles():
+            StringTranslation.objects.create(
+                translation_of=self.string,
+                context=self.title_context,
+                locale=self.fr_locale,
+                data="Page de test",
+            )
+            raise ValueError
+
+        self.assertEqual(self.get_draft_title(), "Test page")
+
+    def test_bulk_delete_updates_titles_with_one_statement(self):
+        other_page = create_test_page(title="Other page", slug="other-page")
+        other_fr_page = other_page.copy_for_translation(self.fr_locale)
+        contexts = [
+            self.title_context,
+            self.other_context,
+            TranslationContext.objects.create(
+                object_id=other_page.translation_key, path="title"
+            ),
+        ]
+        for context in contexts:
+            StringTranslation.objects.create(
+                translation_of=self.string,
+                context=context,
+                locale=self.fr_locale,
+                data="Page de test",
+            )
+
+        # The contexts aren't looked up for each translation. Two queries to delete the
+        # translations, one to look up the contexts, and one to update the pages
+        with (
+            mock.patch("wagtail_localize.models.update_index_on_commit"),
+            self.assertNumQueries(4),
+            sync_page_draft_titles(),
+        ):
+            StringTranslation.objects.all().delete()
+
+        self.assertEqual(self.get_draft_title(), "Test page")
+        other_fr_page.refresh_from_db()
+        self.assertEqual(other_fr_page.draft_title, "Other page")
+
+    def test_import_po_updates_title(self):
+        self.source = TranslationSource.objects.get()
+        StringSegment.objects.create(
+            source=self.source,
+            context=self.title_context,
+            string=self.string,
+            order=100,
+        )
+        translation = Translation.objects.create(
+            source=self.source, target_locale=self.fr_locale
+        )
+        po = translation.export_po()
+        po[-1].msgstr = "Page de test"
+
+        translation.import_po(po)
+
+        self.assertEqual(self.get_draft_title(), "Page de test")
@@ -1,9 +1,12 @@
 import json
 
+from unittest import mock
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.test import TestCase, TransactionTestCase, override_settings
 from django.utils import timezone
+from freezegun import freeze_time
 from wagtail.blocks import StreamValue
 from wagtail.models import Locale, Page, PageLogEntry
 
@@ -18,6 +21,7 @@ from tests.testapp.models import (
 from wagtail_localize.models import (
     MissingRelatedObjectError,
     MissingTranslationError,
+    SegmentOverride,
     SourceDeletedError,
     String,
     StringTranslation,
@@ -374,6 +378,10 @@ class TestExportPO(TestCase):
         self.assertEqual(po[1].msgstr, "")
         self.assertFalse(po[1].obsolete)
 
+    @freeze_time("2020-08-21")
+    def test_stream_po(self):
+        self.assertEqual("".join(self.source.stream_po()), str(self.source.export_po()))
+
 
 class TestCreateOrUpdateTranslationForPage(TestCase):
     def setUp(self):
@@ -804,6 +812,46 @@ class TestCreateOrUpdateTranslationForSnippet(TestCase):
             self.source.translation_logs.filter(locale=self.dest_locale).exists()
         )
 
+    def test_validation_errors_are_recorded_on_translations(self):
+        override = SegmentOverride.objects.create(
+            locale=self.dest_locale,
+            context=TranslationContext.objects.get(
+                object_id=self.snippet.translation_key, path="small_charfield"
+            ),
+            data_json='"Remplacé"',
+        )
+
+        with (
+            mock.patch.object(
+                TestSnippet,
+                "full_clean",
+                side_effect=ValidationError(
+                    {
+                        "field": ["The field is invalid."],
+                        "small_charfield": ["The small field is invalid.", "Other"],
+                        "unknown": ["Not a translatable field."],
+                    }
+                ),
+            ),
+            self.assertRaises(ValidationError),
+        ):
+            self.source.create_or_update_translation(self.dest_locale)
+
+        # The first error of each field is recorded on its translation and override
+        self.translation.refresh_from_db()
+        self.assertTrue(self.translation.has_error)
+        self.assertEqual(self.translation.field_error, "The field is invalid.")
+
+        self.small_translation.refresh_from_db()
+        self.assertTrue(self.small_translation.has_error)
+        self.assertEqual(
+            self.small_translation.field_error, "The small field is invalid."
+        )
+
+        override.refresh_from_db()
+        self.assertTrue(override.has_error)
+        self.assertEqual(override.field_error, "The small field is invalid.")
+
     def test_update_validates_fields(self):
         self.snippet.copy_for_translation(self.dest_locale).save()
 
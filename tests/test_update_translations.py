@@ -19,6 +19,7 @@ from wagtail_localize.models import (
     Translation,
     TranslationSource,
 )
+from wagtail_localize.strings import StringValue
 
 from .utils import assert_permission_denied, make_test_page
 
@@ -729,3 +730,116 @@ class TestUpdateTranslations(TestCase, WagtailTestUtils):
             context_id=string_segment.context_id,
         )
         self.assertEqual(string_translation.data, "post blog Edited")
+
+    def add_de_page_translation(self):
+        de_translation = Translation.objects.create(
+            source=self.page_source, target_locale=self.de_locale
+        )
+        de_translation.save_target(publish=True)
+        return de_translation
+
+    def test_post_update_page_translation_with_use_machine_translation_into_several_locales(
+        self,
+    ):
+        de_translation = self.add_de_page_translation()
+        self.en_blog_post.test_charfield = "Edited blog post"
+        self.en_blog_post.save_revision().publish()
+
+        with mock.patch(
+            "wagtail_localize.machine_translators.dummy.DummyTranslator.translate",
+            autospec=True,
+            side_effect=lambda translator, source_locale, target_locale, strings: {
+                string: StringValue(f"{target_locale.language_code}: {string.data}")
+                for string in strings
+            },
+        ) as mock_translate:
+            response = self.client.post(
+                reverse(
+                    "wagtail_localize:update_translations",
+                    args=[self.page_source.id],
+                ),
+                {
+                    "use_machine_translation": "on",
+                },
+            )
+
+        self.assertRedirects(
+            response, reverse("wagtailadmin_explore", args=[self.en_blog_index.id])
+        )
+
+        # One request is sent for each locale
+        self.assertEqual(
+            {call.args[2] for call in mock_translate.call_args_list},
+            {self.fr_locale, self.de_locale},
+        )
+
+        string_segment = self.page_source.stringsegment_set.get(
+            string__data="Edited blog post"
+        )
+        for translation in [self.page_translation, de_translation]:
+            language_code = translation.target_locale.language_code
+            self.assertEqual(
+                StringTranslation.objects.get(
+                    translation_of_id=string_segment.string_id,
+                    locale=translation.target_locale,
+                    context_id=string_segment.context_id,
+                ).data,
+                f"{language_code}: Edited blog post",
+            )
+
+    def test_post_update_page_translation_with_use_machine_translation_failing_for_one_locale(
+        self,
+    ):
+        de_translation = self.add_de_page_translation()
+        self.en_blog_post.test_charfield = "Edited blog post"
+        self.en_blog_post.save_revision().publish()
+
+        def translate(translator, source_locale, target_locale, strings):
+            if target_locale == self.de_locale:
+                raise ValueError("Service unavailable")
+
+            return {string: StringValue(string.data.upper()) for string in strings}
+
+        with (
+            mock.patch(
+                "wagtail_localize.machine_translators.dummy.DummyTranslator.translate",
+                autospec=True,
+                side_effect=translate,
+            ),
+            self.assertLogs("wagtail_localize.machine_translators.base", "WARNING"),
+        ):
+            response = self.client.post(
+                reverse(
+                    "wagtail_localize:update_translations",
+                    args=[self.page_source.id],
+                ),
+                {
+                    "use_machine_translation": "on",
+                },
+                follow=True,
+            )
+
+        self.assertIn(
+            "Dummy translator couldn't translate some of the changes into German. "
+            "Please translate them in the editor.",
+            [message.message.strip() for message in response.context["messages"]],
+        )
+
+        # The French translation is still saved
+        string_segment = self.page_source.stringsegment_set.get(
+            string__data="Edited blog post"
+        )
+        self.assertEqual(
+            StringTranslation.objects.get(
+                translation_of_id=string_segment.string_id,
+                locale=self.fr_locale,
+                context_id=string_segment.context_id,
+            ).data,
+            "EDITED BLOG POST",
+        )
+        self.assertFalse(
+            StringTranslation.objects.filter(
+                translation_of_id=string_segment.string_id,
+                locale=de_translation.target_locale,
+            ).exists()
+        )
@@ -0,0 +1,151 @@
+import uuid
+
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from wagtail.models import Locale, Page
+
+from wagtail_localize import validation
+from wagtail_localize.models import (
+    String,
+    StringTranslation,
+    TranslatableObject,
+    TranslationContext,
+)
+from wagtail_localize.strings import StringValue
+from wagtail_localize.validation import TranslationValidator
+
+
+class TestTranslationValidator(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            validation,
+            "get_validation_error",
+            wraps=validation.get_validation_error,
+        )
+        self.get_validation_error = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_validate_many(self):
+        validator = TranslationValidator()
+
+        verdicts = validator.validate_many(
+            [
+                ("Hello world", "Bonjour le monde"),
+                ('<a id="a1">Read more</a>', '<a id="a2">Lire la suite</a>'),
+                ("Hello", "<p>Bonjour</p>"),
+                ("Hello world", "Bonjour le monde"),
+            ]
+        )
+
+        self.assertEqual(verdicts, [True, False, False, True])
+
+        # Each distinct translation is only parsed once
+        self.assertEqual(self.get_validation_error.call_count, 3)
+
+    def test_verdicts_are_cached(self):
+        validator = TranslationValidator()
+        self.assertTrue(validator.is_valid("Hello world", "Bonjour le monde"))
+        self.assertFalse(validator.is_valid("Hello", "<p>Bonjour</p>"))
+
+        self.assertTrue(validator.is_valid("Hello world", "Bonjour le monde"))
+        self.assertFalse(validator.is_valid("Hello", "<p>Bonjour</p>"))
+        self.assertEqual(self.get_validation_error.call_count, 2)
+
+        # The verdict depends on the source string too
+        self.assertFalse(
+            validator.is_valid("Hello world", '<a id="a1">Bonjour le monde</a>')
+        )
+        self.assertTrue(
+            validator.is_valid(
+                '<a id="a1">Hello world</a>', '<a id="a1">Bonjour le monde</a>'
+            )
+        )
+
+    def test_least_recently_used_verdicts_are_dropped(self):
+        validator = TranslationValidator(cache_size=2)
+        validator.is_valid("One", "Un")
+        validator.is_valid("Two", "Deux")
+        validator.is_valid("One", "Un")
+        validator.is_valid("Three", "Trois")
+        self.get_validation_error.reset_mock()
+
+        validator.is_valid("One", "Un")
+        self.get_validation_error.assert_not_called()
+
+        validator.is_valid("Two", "Deux")
+        self.get_validation_error.assert_called_once_with("Two", "Deux")
+
+    def test_get_error(self):
+        validator = TranslationValidator()
+
+        self.assertIsNone(validator.get_error("Hello world", "Bonjour le monde"))
+        self.assertEqual(
+            validator.get_error(
+                '<a id="a1">Read more</a>', '<a id="a2">Lire la suite</a>'
+            ),
+            "Unrecognised id found in an <a> tag: a2",
+        )
+
+        # Valid translations aren't parsed again
+        self.get_validation_error.reset_mock()
+        self.assertIsNone(validator.get_error("Hello world", "Bonjour le monde"))
+        self.get_validation_error.assert_not_called()
+
+
+class TestStringTranslationSave(TestCase):
+    def setUp(self):
+        self.en_locale = Locale.objects.get(language_code="en")
+        self.fr_locale = Locale.objects.create(language_code="fr")
+        self.string = String.from_value(
+            self.en_locale, StringValue('<a id="a1">Read more</a>')
+        )
+        self.context = TranslationContext.objects.create(
+            object=TranslatableObject.objects.create(
+                translation_key=uuid.uuid4(),
+                content_type=ContentType.objects.get_for_model(Page),
+            ),
+            path="test_charfield",
+        )
+
+    def get_writes(self, queries):
+        table = StringTranslation._meta.db_table
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith(("INSERT", "UPDATE")) and table in query["sql"]
+        ]
+
+    def test_invalid_translation_is_written_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            string_translation = StringTranslation.objects.create(
+                translation_of=self.string,
+                locale=self.fr_locale,
+                context=self.context,
+                data='<a id="a2">Lire la suite</a>',
+            )
+
+        self.assertEqual(len(self.get_writes(queries)), 1)
+        string_translation.refresh_from_db()
+        self.assertTrue(string_translation.has_error)
+
+    def test_has_error_is_saved_with_update_fields(self):
+        string_translation = StringTranslation.objects.create(
+            translation_of=self.string,
+            locale=self.fr_locale,
+            context=self.context,
+            data='<a id="a1">Lire la suite</a>',
+        )
+        self.assertFalse(string_translation.has_error)
+
+        string_translation.data = '<a id="a2">Lire la suite</a>'
+        string_translation.save(update_fields=["data"])
+
+        string_translation.refresh_from_db()
+        self.assertTrue(string_translation.has_error)
+        self.assertEqual(
+            string_translation.get_error(), "Unrecognised id found in an <a> tag: a2"
+        )
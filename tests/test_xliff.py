@@ -0,0 +1,279 @@
+from django.test import TestCase, override_settings
+from wagtail.models import Locale, Page
+
+from wagtail_localize.models import (
+    StringTranslation,
+    Translation,
+    TranslationSource,
+    UnknownContext,
+    UnknownString,
+)
+from wagtail_localize.xliff import (
+    SOURCE_FILE_ID,
+    InvalidXLIFFFile,
+    XLIFFFile,
+    stream_xliff,
+)
+
+from .utils import make_test_page
+
+
+def make_xliff(file_id, units):
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<xliff xmlns="urn:oasis:names:tc:xliff:document:2.0" version="2.0" srcLang="en" trgLang="fr">'
+        f'<file id="{file_id}">{units}</file>'
+        "</xliff>"
+    ).encode()
+
+
+class TestXLIFF(TestCase):
+    def test_round_trip(self):
+        entries = [
+            ("Plain text", "test_charfield", "Texte"),
+            (
+                'Read <b>the</b> <a id="a1">docs <i>now</i></a>!<br/>&lt;foo&gt; &amp;',
+                "test_richtextfield",
+                '<a id="a1">Lisez <i>la</i></a> <b>doc</b>&nbsp;!<br/>&lt;foo&gt; &amp;',
+            ),
+            ("Special characters: '\"!? セキレイ", "test_richtextfield", ""),
+        ]
+
+        xliff = XLIFFFile(
+            "".join(stream_xliff("file", "en", "fr", entries)).encode("utf-8")
+        )
+
+        self.assertEqual(xliff.file_id, "file")
+        self.assertEqual(xliff.source_language, "en")
+        self.assertEqual(xliff.target_language, "fr")
+        self.assertEqual(
+            list(xliff),
+            [
+                ("Plain text", "test_charfield", "Texte"),
+                (
+                    'Read <b>the</b> <a id="a1">docs <i>now</i></a>!<br/>&lt;foo&gt; &amp;',
+                    "test_richtextfield",
+                    '<a id="a1">Lisez <i>la</i></a> <b>doc</b>\xa0!<br/>&lt;foo&gt; &amp;',
+                ),
+                ("Special characters: '\"!? セキレイ", "test_richtextfield", ""),
+            ],
+        )
+
+    def test_inline_codes(self):
+        data = "".join(
+            stream_xliff(
+                "file",
+                "en",
+                "fr",
+                [
+                    (
+                        '<b>Bold</b> <a id="a1">link</a>',
+                        "field",
+                        '<a id="a1">lien</a> <b>gras</b>',
+                    )
+                ],
+            )
+        )
+
+        self.assertIn(
+            '<originalData><data id="d1">&lt;b&gt;</data><data id="d2">&lt;/b&gt;</data>'
+            '<data id="d3">&lt;a id="a1"&gt;</data><data id="d4">&lt;/a&gt;</data></originalData>',
+            data,
+        )
+        self.assertIn(
+            '<source><pc id="1" dataRefStart="d1" dataRefEnd="d2" type="fmt">Bold</pc> '
+            '<pc id="2" dataRefStart="d3" dataRefEnd="d4" type="link">link</pc></source>',
+            data,
+        )
+        # The codes in the target have the same ids as the matching codes in the source
+        self.assertIn(
+            '<target><pc id="2" dataRefStart="d3" dataRefEnd="d4" type="link">lien</pc> '
+            '<pc id="1" dataRefStart="d1" dataRefEnd="d2" type="fmt">gras</pc></target>',
+            data,
+        )
+
+    def test_read_segmented_units(self):
+        xliff = XLIFFFile(
+            make_xliff(
+                "file",
+                '<group id="g1"><unit id="u1" name="field">'
+                '<originalData><data id="d1">&lt;br/&gt;</data></originalData>'
+                "<segment><source>One.</source><target>Un.</target></segment>"
+                '<ignorable><source> <ph id="1" dataRef="d1"/></source></ignorable>'
+                '<segment><source>Two.</source><target><mrk id="m1">Deux.</mrk></target></segment>'
+                "</unit></group>",
+            )
+        )
+
+        self.assertEqual(list(xliff), [("One. <br/>Two.", "field", "Un.Deux.")])
+
+    def test_invalid_file(self):
+        for data in [
+            b"Not XML",
+            b"<html></html>",
+            b'<xliff xmlns="urn:oasis:names:tc:xliff:document:2.0" srcLang="en"></xliff>',
+        ]:
+            with (
+                self.subTest(data=data),
+                self.assertRaisesMessage(
+                    InvalidXLIFFFile, "Please upload a valid XLIFF file."
+                ),
+            ):
+                XLIFFFile(data)
+
+    def test_invalid_units(self):
+        xliff = XLIFFFile(make_xliff("file", '<unit id="u1"><segment>')[:-20])
+
+        with self.assertRaisesMessage(
+            InvalidXLIFFFile, "Please upload a valid XLIFF file."
+        ):
+            list(xliff)
+
+
+class TestTranslationXLIFF(TestCase):
+    def setUp(self):
+        self.fr_locale = Locale.objects.create(language_code="fr")
+        self.page = make_test_page(
+            Page.objects.get(depth=1),
+            title="Test page",
+            slug="test-page",
+            test_charfield="Test content",
+        )
+        self.source, _created = TranslationSource.get_or_create_from_instance(self.page)
+        self.translation = Translation.objects.create(
+            source=self.source, target_locale=self.fr_locale
+        )
+
+    def test_stream_xliff(self):
+        StringTranslation.objects.create(
+            translation_of=self.source.stringsegment_set.get(
+                context__path="test_charfield"
+            ).string,
+            locale=self.fr_locale,
+            context=self.source.stringsegment_set.get(
+                context__path="test_charfield"
+            ).context,
+            data="Contenu de test",
+        )
+
+        xliff = XLIFFFile("".join(self.translation.stream_xliff()).encode("utf-8"))
+
+        self.assertEqual(xliff.file_id, str(self.translation.uuid))
+        self.assertEqual(xliff.source_language, "en")
+        self.assertEqual(xliff.target_language, "fr")
+        self.assertEqual(
+            list(xliff),
+            [
+                ("Test content", "test_charfield", "Contenu de test"),
+            ],
+        )
+
+    def test_source_stream_xliff(self):
+        xliff = XLIFFFile("".join(self.source.stream_xliff()).encode("utf-8"))
+
+        self.assertEqual(xliff.file_id, SOURCE_FILE_ID)
+        self.assertIsNone(xliff.target_language)
+        self.assertEqual(
+            list(xliff),
+            [
+                ("Test content", "test_charfield", ""),
+            ],
+        )
+
+    def test_import_xliff(self):
+        xliff = XLIFFFile(
+            make_xliff(
+                self.translation.uuid,
+                '<unit id="u1" name="test_charfield"><segment>'
+                "<source>Test content</source><target>Contenu de test</target>"
+                "</segment></unit>"
+                '<unit id="u2" name="test_charfield"><segment>'
+                "<source>Unknown</source><target>Inconnu</target>"
+                "</segment></unit>"
+                '<unit id="u3" name="unknown"><segment>'
+                "<source>Test content</source><target>Contenu de test</target>"
+                "</segment></unit>",
+            )
+        )
+
+        warnings = self.translation.import_xliff(xliff, tool_name="XLIFF File")
+
+        self.assertEqual(
+            warnings, [UnknownString(1, "Unknown"), UnknownContext(2, "unknown")]
+        )
+        string_translation = StringTranslation.objects.get()
+        self.assertEqual(string_translation.context.path, "test_charfield")
+        self.assertEqual(string_translation.data, "Contenu de test")
+        self.assertEqual(string_translation.tool_name, "XLIFF File")
+
+    def test_import_xliff_from_source(self):
+        xliff = XLIFFFile(
+            make_xliff(
+                SOURCE_FILE_ID,
+                '<unit id="u1" name="test_charfield"><segment>'
+                "<source>Test content</source><target>Contenu de test</target>"
+                "</segment></unit>",
+            )
+        )
+
+        self.translation.import_xliff(xliff)
+
+        self.assertEqual(StringTranslation.objects.get().data, "Contenu de test")
+
+    def test_import_xliff_with_invalid_translation_id(self):
+        xliff = XLIFFFile(
+            make_xliff(
+                "00000000-0000-0000-0000-000000000000",
+                '<unit id="u1" name="test_charfield"><segment>'
+                "<source>Test content</source><target>Contenu de test</target>"
+                "</segment></unit>",
+            )
+        )
+
+        with self.assertRaisesMessage(
+            InvalidXLIFFFile,
+            "Cannot import XLIFF file that was created for a different translation.",
+        ):
+            self.translation.import_xliff(xliff)
+
+        self.assertFalse(StringTranslation.objects.exists())
+
+    @override_settings(WAGTAILLOCALIZE_PO_MAX_SIZE=200)
+    def test_import_xliff_size_limit(self):
+        data = make_xliff(
+            self.translation.uuid,
+            '<unit id="u1" name="test_charfield"><segment>'
+            "<source>Test content</source><target>Contenu de test</target>"
+            "</segment></unit>",
+        )
+
+        with self.assertRaisesMessage(InvalidXLIFFFile, "The XLIFF file is too large."):
+            self.translation.import_xliff(XLIFFFile(data))
+
+        self.assertFalse(StringTranslation.objects.exists())
+
+        # The limit can also be passed in
+        self.translation.import_xliff(XLIFFFile(data, max_size=len(data)))
+        self.assertEqual(StringTranslation.objects.get().data, "Contenu de test")
+
+    @override_settings(WAGTAILLOCALIZE_PO_MAX_ENTRIES=1)
+    def test_import_xliff_unit_limit(self):
+        xliff = XLIFFFile(
+            make_xliff(
+                self.translation.uuid,
+                '<unit id="u1" name="test_charfield"><segment>'
+                "<source>Test content</source><target>Contenu de test</target>"
+                "</segment></unit>"
+                '<unit id="u2" name="test_charfield"><segment>'
+                "<source>Unknown</source><target>Inconnu</target>"
+                "</segment></unit>",
+            )
+        )
+
+        with self.assertRaisesMessage(
+            InvalidXLIFFFile, "The XLIFF file has too many units."
+        ):
+            self.translation.import_xliff(xliff)
+
+        # The first unit isn't imported either
+        self.assertFalse(StringTranslation.objects.exists())